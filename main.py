@@ -6,7 +6,7 @@ Budget App - Desktop application for tracking expenses, bills, savings, and inco
 import sys
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QTabWidget, QVBoxLayout,
                              QWidget, QMenuBar, QMenu, QToolBar, QPushButton, QDialog, QHBoxLayout)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QAction
 
 from utils.error_handler import handle_exception, show_error, is_testing_mode
@@ -37,8 +37,11 @@ except ImportError as e:
 from services.transaction_manager import TransactionManager
 from services.analytics import AnalyticsEngine
 from services.paycheck_processor import PaycheckProcessor
+from services.change_events import DataChange, change_bus
+from services.background_loader import BackgroundLoader
 from themes import theme_manager
 from widgets import ThemeSelector
+from widgets.chart_renderer import chart_renderer
 
 
 class BudgetApp(QMainWindow):
@@ -56,9 +59,20 @@ class BudgetApp(QMainWindow):
         self.transaction_manager = TransactionManager()
         self.analytics_engine = AnalyticsEngine()
         self.paycheck_processor = PaycheckProcessor()
+
+        # Lazy refresh scheduler: tab view -> merged DataChange it hasn't drawn yet.
+        # Only the visible tab is refreshed; the others catch up when first shown.
+        self._dirty_tabs = {}
+        self._refresh_scheduled = False
+
+        # Views with gather_data() load on a worker thread first and only paint on
+        # the UI thread; view -> DataChange its in-flight load will apply
+        self.background_loader = BackgroundLoader(parent=self)
+        self._loading_changes = {}
         
         self.init_ui()
         self.apply_theme()
+        change_bus.subscribe(self.on_data_changed)
         
         # Connect to theme changes
         theme_manager.theme_changed.connect(self.on_theme_changed)
@@ -469,69 +483,128 @@ class BudgetApp(QMainWindow):
                     }}
                 """)
         
-    def refresh_all_views(self):
-        """Refresh all tabs - called after any data change"""
+    # ============================================================
+    # REFRESH SCHEDULER
+    # ============================================================
+
+    def on_data_changed(self, change):
+        """Mark every tab dirty with a committed DataChange and schedule the visible one"""
+        self.mark_tabs_dirty(change)
+
+    def mark_tabs_dirty(self, change):
+        """Record a change for every refreshable tab, then schedule a refresh of the visible tab"""
+        for view, _display_name in self.tab_widgets.values():
+            if hasattr(view, "apply_change"):
+                self._dirty_tabs.setdefault(view, DataChange()).merge(change)
+        self.schedule_refresh()
+
+    def schedule_refresh(self):
+        """
+        Refresh the visible tab once control returns to the event loop
+
+        Repeated calls in the same event-loop turn (e.g. a paycheck committing
+        income, savings and rollovers one after another) coalesce into one refresh.
+        """
+        if not self._refresh_scheduled:
+            self._refresh_scheduled = True
+            QTimer.singleShot(0, self.refresh_visible_tab)
+
+    def refresh_visible_tab(self):
+        """Bring the visible tab up to date (no-op when it is clean)"""
+        self._refresh_scheduled = False
+        self.refresh_tab(self.tabs.currentWidget())
+
+    def refresh_tab(self, view):
+        """Redraw a dirty tab - only its invalidated panels, or everything after a full refresh request"""
+        change = self._dirty_tabs.pop(view, None)
+        if change is None or change.is_empty():
+            return
+
+        if hasattr(view, "gather_data"):
+            self.load_tab(view, change)
+        else:
+            self.paint_tab(view, change)
+
+    def load_tab(self, view, change):
+        """
+        Run the view's gather_data() on the background loader, then paint the result
+
+        A load still running for the view is cancelled and its change folded into
+        this one, so a stale result is never painted and no change is lost.
+        """
+        in_flight = self._loading_changes.pop(view, None)
+        if in_flight is not None:
+            change = in_flight.merge(change)
+        self._loading_changes[view] = change
+
+        self.background_loader.load(
+            view, view.gather_data,
+            on_result=lambda data: self.on_tab_loaded(view, data),
+            on_error=lambda error: self.on_tab_load_failed(view, error)
+        )
+
+    def on_tab_loaded(self, view, data):
+        """Paint freshly gathered data - or keep the tab dirty if the user has moved on"""
+        change = self._loading_changes.pop(view, None)
+        if change is None:
+            return
+        if view is not self.tabs.currentWidget():
+            self._dirty_tabs.setdefault(view, DataChange()).merge(change)
+            return
+        self.paint_tab(view, change, data)
+
+    def on_tab_load_failed(self, view, error):
+        """A background load raised - keep the change so the next visit retries"""
+        change = self._loading_changes.pop(view, None)
+        if change is not None:
+            self._dirty_tabs.setdefault(view, DataChange()).merge(change)
+        show_error(self, "Refresh Error", error, "loading data for the view")
+
+    def cancel_hidden_loads(self):
+        """Cancel loads for tabs that are no longer visible (they reload when shown)"""
+        current = self.tabs.currentWidget()
+        for view in list(self._loading_changes):
+            if view is not current:
+                self.background_loader.cancel(view)
+                self._dirty_tabs.setdefault(view, DataChange()).merge(self._loading_changes.pop(view))
+
+    def paint_tab(self, view, change, data=None):
+        """Apply a change to a view on the UI thread (data = its gather_data() result, if any)"""
+        kwargs = {} if data is None else {"data": data}
         try:
-            # Old rollover system removed - live rollover system handles everything now
-            # self.paycheck_processor.check_and_process_rollovers()
-
-            self.dashboard.refresh()
-            self.bills_view.refresh()
-            self.savings_view.refresh()
-            self.weekly_view.refresh()
-            self.categories_view.refresh()
-            self.year_overview_view.refresh()
-
-            # Refresh transactions view if enabled
-            if self.transactions_tab_index >= 0:
-                self.transactions_view.refresh()
-
-            # Refresh taxes view if enabled
-            if self.taxes_tab_index >= 0:
-                self.taxes_view.refresh()
+            if change.everything:
+                view.refresh(**kwargs)
+            else:
+                view.apply_change(change, **kwargs)
         except Exception as e:
             show_error(self, "Refresh Error", e, "refreshing application views")
 
-    def on_tab_changed(self, index):
+    def refresh_all_views(self):
         """
-        Handle tab change - refresh the newly selected tab
+        Mark all tabs fully stale and refresh the visible one now
 
-        ADDED: Nov 3, 2024
-        Purpose: Ensure tabs always show latest data after changes in other tabs
-        Example: Edit transaction in Transactions tab → switch to Bills tab → see updated line plot
+        Used when the changes aren't known (startup, settings, import, reset);
+        the other tabs refresh when they are first shown.
+        """
+        self.mark_tabs_dirty(DataChange.everything_changed())
+        self.refresh_visible_tab()
 
-        Performance Note: This triggers a full refresh on every tab switch.
-        For optimization ideas, see Feature 4.4 in PROJECT_PLAN.md
+    def on_tab_changed(self, index):
         """
-        try:
-            # Map index to view and refresh it
-            if index == 0:  # Dashboard
-                self.dashboard.refresh()
-            elif index == 1:  # Bills
-                self.bills_view.refresh()
-            elif index == 2:  # Savings
-                self.savings_view.refresh()
-            elif index == 3:  # Weekly
-                self.weekly_view.refresh()
-            elif index == 4:  # Categories
-                self.categories_view.refresh()
-            elif index == 5:  # Yearly
-                self.year_overview_view.refresh()
-            elif index == self.reimbursements_tab_index:  # Reimbursements
-                self.reimbursements_view.refresh()
-            elif index == self.transactions_tab_index and self.transactions_tab_index >= 0:
-                self.transactions_view.refresh()
-            elif index == self.taxes_tab_index and self.taxes_tab_index >= 0:
-                self.taxes_view.refresh()
-        except Exception as e:
-            print(f"Error refreshing tab {index}: {e}")
+        Handle tab change - refresh the newly selected tab only if data changed since it was drawn
+
+        Switching between clean tabs costs nothing; dirty tabs redraw just the
+        panels their pending DataChange invalidated.
+        """
+        self.cancel_hidden_loads()
+        self.refresh_tab(self.tabs.widget(index))
 
     def open_add_transaction_dialog(self):
         """Open dialog to add new transaction"""
         try:
             dialog = AddTransactionDialog(self.transaction_manager, self)
             if dialog.exec() == QDialog.DialogCode.Accepted:
-                self.refresh_all_views()
+                self.refresh_visible_tab()
         except Exception as e:
             show_error(self, "Dialog Error", e, "opening Add Transaction dialog")
     
@@ -540,7 +613,7 @@ class BudgetApp(QMainWindow):
         try:
             dialog = AddPaycheckDialog(self.paycheck_processor, self.transaction_manager, self)
             if dialog.exec() == QDialog.DialogCode.Accepted:
-                self.refresh_all_views()
+                self.refresh_visible_tab()
         except Exception as e:
             show_error(self, "Dialog Error", e, "opening Add Paycheck dialog")
     
@@ -549,7 +622,7 @@ class BudgetApp(QMainWindow):
         try:
             dialog = PayBillDialog(self.transaction_manager, self)
             if dialog.exec() == QDialog.DialogCode.Accepted:
-                self.refresh_all_views()
+                self.refresh_visible_tab()
         except Exception as e:
             show_error(self, "Dialog Error", e, "opening Pay Bill dialog")
 
@@ -558,7 +631,7 @@ class BudgetApp(QMainWindow):
         try:
             dialog = TransferDialog(self.transaction_manager, self)
             if dialog.exec() == QDialog.DialogCode.Accepted:
-                self.refresh_all_views()
+                self.refresh_visible_tab()
         except Exception as e:
             show_error(self, "Dialog Error", e, "opening Transfer dialog")
 
@@ -567,7 +640,7 @@ class BudgetApp(QMainWindow):
         try:
             dialog = AddAccountDialog(self.transaction_manager, self)
             if dialog.exec() == QDialog.DialogCode.Accepted:
-                self.refresh_all_views()
+                self.refresh_visible_tab()
         except Exception as e:
             show_error(self, "Dialog Error", e, "opening Add Account dialog")
     
@@ -576,7 +649,7 @@ class BudgetApp(QMainWindow):
         try:
             dialog = AddBillDialog(self.transaction_manager, self)
             if dialog.exec() == QDialog.DialogCode.Accepted:
-                self.refresh_all_views()
+                self.refresh_visible_tab()
         except Exception as e:
             show_error(self, "Dialog Error", e, "opening Add Bill dialog")
     
@@ -827,6 +900,10 @@ class BudgetApp(QMainWindow):
     def closeEvent(self, event):
         """Clean up resources when closing the application"""
         try:
+            change_bus.unsubscribe(self.on_data_changed)
+            self.scratch_pad_view.flush_workspace()  # Write edits still waiting on the save timer
+            self.background_loader.shutdown()  # Workers must finish before the sessions close
+            chart_renderer.shutdown()
             self.transaction_manager.close()
             self.analytics_engine.close()
             self.paycheck_processor.close()
@@ -0,0 +1,200 @@
+"""
+Migration: Add balance_checkpoints table and account_history indexes
+
+This migration adds month-end balance checkpoints so "every account and bill
+balance as of a date" no longer needs a scan of account_history. It:
+- Creates the balance_checkpoints table (one row per account per month end)
+- Adds (account_type, account_id, transaction_date, id) and transaction_date
+  indexes to account_history
+- Builds checkpoints for every existing account and bill
+
+After this, AccountHistoryManager keeps the checkpoints up to date whenever
+history changes (including back-dated edits).
+
+USAGE (run from BudgetApp directory):
+============================================================================
+
+    python migrations/add_balance_checkpoints.py
+
+============================================================================
+
+FOR PRODUCTION MACHINE (with real data):
+============================================================================
+
+1. BEFORE running, make sure:
+   - Close the BudgetApp if it's running
+   - Pull latest code from GitHub (git pull)
+
+2. Run the migration:
+
+   cd path/to/BudgetApp
+   python migrations/add_balance_checkpoints.py
+
+3. Verify output shows:
+   - [OK] Database backed up to: backups/budget_app_backup_YYYYMMDD_HHMMSS.db
+   - [OK] balance_checkpoints table ready
+   - [OK] account_history indexes ready
+   - [OK] Built X checkpoints for Y accounts/bills
+   - [OK] Checkpoints match account_history
+
+4. Test the app:
+   - Launch the app (python main.py)
+   - Check the Weekly tab starting/final savings values look the same as before
+
+5. If something goes wrong, restore from backup:
+
+   python migrations/backup_database.py restore backups/budget_app_backup_YYYYMMDD_HHMMSS.db
+
+============================================================================
+
+This script is IDEMPOTENT - safe to run multiple times. Checkpoints are
+rebuilt from scratch each run.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from models.database import get_db, engine
+from models import AccountHistory, BalanceCheckpoint
+from models.account_history import rebuild_all_balance_checkpoints
+from sqlalchemy import text
+
+
+def create_checkpoints_table():
+    """Create the balance_checkpoints table (and its indexes) if missing"""
+    try:
+        BalanceCheckpoint.__table__.create(bind=engine, checkfirst=True)
+        print("[OK] balance_checkpoints table ready")
+        return True
+
+    except Exception as e:
+        print(f"[ERROR] Failed to create balance_checkpoints table: {e}")
+        return False
+
+
+def add_account_history_indexes():
+    """Add the chronological per-account indexes to account_history"""
+    try:
+        for index in AccountHistory.__table__.indexes:
+            index.create(bind=engine, checkfirst=True)
+        print("[OK] account_history indexes ready")
+        return True
+
+    except Exception as e:
+        print(f"[ERROR] Failed to add account_history indexes: {e}")
+        return False
+
+
+def build_checkpoints():
+    """Build month-end checkpoints for every account and bill"""
+    db = get_db()
+
+    try:
+        rebuild_all_balance_checkpoints(db.connection())
+        db.commit()
+
+        checkpoint_count = db.execute(text("SELECT COUNT(*) FROM balance_checkpoints")).fetchone()[0]
+        account_count = db.execute(text(
+            "SELECT COUNT(DISTINCT account_type || ':' || account_id) FROM balance_checkpoints"
+        )).fetchone()[0]
+
+        print(f"[OK] Built {checkpoint_count} checkpoints for {account_count} accounts/bills")
+        return True
+
+    except Exception as e:
+        print(f"[ERROR] Failed to build checkpoints: {e}")
+        import traceback
+        traceback.print_exc()
+        db.rollback()
+        return False
+    finally:
+        db.close()
+
+
+def verify_migration():
+    """Spot-check every checkpoint against the latest running total at its month end"""
+    db = get_db()
+
+    try:
+        print("\nVerifying migration...")
+
+        mismatches = db.execute(text("""
+            SELECT c.account_type, c.account_id, c.checkpoint_date, c.balance,
+                   (SELECT h.running_total FROM account_history h
+                    WHERE h.account_type = c.account_type
+                      AND h.account_id = c.account_id
+                      AND h.transaction_date <= c.checkpoint_date
+                    ORDER BY h.transaction_date DESC, h.id DESC
+                    LIMIT 1) AS expected
+            FROM balance_checkpoints c
+        """)).fetchall()
+
+        bad = [row for row in mismatches if abs((row[3] or 0.0) - (row[4] or 0.0)) > 0.005]
+        if bad:
+            print(f"[ERROR] {len(bad)} checkpoints don't match account_history")
+            for account_type, account_id, checkpoint_date, balance, expected in bad[:5]:
+                print(f"   {account_type} {account_id} @ {checkpoint_date}: {balance} != {expected}")
+            return False
+
+        print("[OK] Checkpoints match account_history")
+        return True
+
+    except Exception as e:
+        print(f"[ERROR] Verification failed: {e}")
+        return False
+    finally:
+        db.close()
+
+
+def run_migration():
+    """Run the complete migration"""
+    print("=" * 70)
+    print("Migration: Add balance_checkpoints table and account_history indexes")
+    print("=" * 70)
+
+    # Step 1: Backup
+    print("\nStep 1: Creating backup...")
+    from migrations.backup_database import backup_database
+    backup_path = backup_database()
+    if not backup_path:
+        print("[ERROR] Backup failed - aborting migration")
+        print("\nNo changes were made to the database.")
+        return False
+
+    # Step 2: Create table
+    print("\nStep 2: Creating balance_checkpoints table...")
+    if not create_checkpoints_table():
+        print(f"\nRestore from backup if needed: python migrations/backup_database.py restore {backup_path}")
+        return False
+
+    # Step 3: Indexes
+    print("\nStep 3: Adding account_history indexes...")
+    if not add_account_history_indexes():
+        print("[WARN] Failed to add indexes - checkpoints still work, just slower")
+
+    # Step 4: Build checkpoints
+    print("\nStep 4: Building checkpoints...")
+    if not build_checkpoints():
+        print(f"\nRestore from backup if needed: python migrations/backup_database.py restore {backup_path}")
+        return False
+
+    # Step 5: Verify
+    print("\nStep 5: Verifying migration...")
+    if not verify_migration():
+        print("[WARN] Verification found issues - check output above")
+
+    print("\n" + "=" * 70)
+    print("Migration complete!")
+    print("=" * 70)
+    print("\nNext steps:")
+    print("1. Launch the app and check the Weekly tab savings values")
+    print(f"2. If issues occur, restore: python migrations/backup_database.py restore {backup_path}")
+
+    return True
+
+
+if __name__ == "__main__":
+    run_migration()
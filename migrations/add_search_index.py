@@ -0,0 +1,145 @@
+"""
+Migration: Add full-text search indexes (SQLite FTS5)
+
+This migration adds FTS5 indexes over transactions.description/category and
+reimbursements.notes/location/category, used by
+TransactionManager.search_transactions() and
+ReimbursementManager.search_reimbursements(). It:
+- Creates the transactions_fts and reimbursements_fts tables
+- Creates the triggers that keep them in sync with their source tables
+- Indexes the existing transactions and reimbursements
+
+The app also creates the indexes on its first search if they are missing, so
+running this is optional - it just moves that one-time cost out of the app.
+
+Also the RECOVERY COMMAND: if search results ever look wrong (e.g. after
+editing the database by hand with triggers disabled), run this script again
+to rebuild both indexes from scratch.
+
+USAGE (run from BudgetApp directory):
+============================================================================
+
+    python migrations/add_search_index.py
+
+============================================================================
+
+FOR PRODUCTION MACHINE (with real data):
+============================================================================
+
+1. BEFORE running, make sure:
+   - Close the BudgetApp if it's running
+   - Pull latest code from GitHub (git pull)
+
+2. Run the migration:
+
+   cd path/to/BudgetApp
+   python migrations/add_search_index.py
+
+3. Verify output shows:
+   - [OK] Database backed up to: backups/budget_app_backup_YYYYMMDD_HHMMSS.db
+   - [OK] transactions_fts ready (X rows indexed)
+   - [OK] reimbursements_fts ready (Y rows indexed)
+   - [OK] Indexes match their tables
+
+4. If something goes wrong, restore from backup:
+
+   python migrations/backup_database.py restore backups/budget_app_backup_YYYYMMDD_HHMMSS.db
+
+============================================================================
+
+This script is IDEMPOTENT - safe to run multiple times. Indexes are
+rebuilt from scratch each run.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from models.database import get_db
+from models.search_index import SEARCH_INDEXES, create_search_index, rebuild_search_index
+from sqlalchemy import text
+
+
+def build_indexes():
+    """Create any missing FTS tables/triggers and rebuild every index"""
+    db = get_db()
+
+    try:
+        connection = db.connection()
+        for source_table, (fts_table, _columns) in SEARCH_INDEXES.items():
+            create_search_index(connection, source_table)
+            rebuild_search_index(connection, source_table)
+            indexed = connection.execute(text(f"SELECT COUNT(*) FROM {source_table}")).scalar()
+            print(f"[OK] {fts_table} ready ({indexed} rows indexed)")
+        db.commit()
+        return True
+
+    except Exception as e:
+        print(f"[ERROR] Failed to build search indexes: {e}")
+        import traceback
+        traceback.print_exc()
+        db.rollback()
+        return False
+    finally:
+        db.close()
+
+
+def verify_migration():
+    """Run FTS5's integrity check against each source table"""
+    db = get_db()
+
+    try:
+        print("\nVerifying migration...")
+        for source_table, (fts_table, _columns) in SEARCH_INDEXES.items():
+            # Raises if the index doesn't match the content table
+            db.execute(text(f"INSERT INTO {fts_table}({fts_table}, rank) VALUES ('integrity-check', 1)"))
+
+        print("[OK] Indexes match their tables")
+        return True
+
+    except Exception as e:
+        print(f"[ERROR] Verification failed: {e}")
+        return False
+    finally:
+        db.rollback()
+        db.close()
+
+
+def run_migration():
+    """Run the complete migration"""
+    print("=" * 70)
+    print("Migration: Add full-text search indexes")
+    print("=" * 70)
+
+    # Step 1: Backup
+    print("\nStep 1: Creating backup...")
+    from migrations.backup_database import backup_database
+    backup_path = backup_database()
+    if not backup_path:
+        print("[ERROR] Backup failed - aborting migration")
+        print("\nNo changes were made to the database.")
+        return False
+
+    # Step 2: Create and build indexes
+    print("\nStep 2: Building search indexes...")
+    if not build_indexes():
+        print(f"\nRestore from backup if needed: python migrations/backup_database.py restore {backup_path}")
+        return False
+
+    # Step 3: Verify
+    print("\nStep 3: Verifying migration...")
+    if not verify_migration():
+        print("[WARN] Verification found issues - check output above")
+
+    print("\n" + "=" * 70)
+    print("Migration complete!")
+    print("=" * 70)
+    print(f"\nIf issues occur, restore: python migrations/backup_database.py restore {backup_path}")
+
+    return True
+
+
+if __name__ == "__main__":
+    run_migration()
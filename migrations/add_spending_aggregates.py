@@ -0,0 +1,179 @@
+"""
+Migration: Add spending_aggregates table
+
+This migration adds a materialized per (week_number, category, include_in_analytics)
+table of spending sum/count/min/max. Category pies and weekly trend charts read it
+instead of loading and summing every spending transaction. It:
+- Creates the spending_aggregates table
+- Builds the aggregates from the existing transactions
+
+After this, every flush that touches a spending transaction recomputes the
+aggregates of the weeks it touched.
+
+Also the RECOVERY COMMAND: if the aggregates ever look wrong (e.g. after editing
+the database by hand), run this script again to rebuild them from scratch.
+
+USAGE (run from BudgetApp directory):
+============================================================================
+
+    python migrations/add_spending_aggregates.py
+
+============================================================================
+
+FOR PRODUCTION MACHINE (with real data):
+============================================================================
+
+1. BEFORE running, make sure:
+   - Close the BudgetApp if it's running
+   - Pull latest code from GitHub (git pull)
+
+2. Run the migration:
+
+   cd path/to/BudgetApp
+   python migrations/add_spending_aggregates.py
+
+3. Verify output shows:
+   - [OK] Database backed up to: backups/budget_app_backup_YYYYMMDD_HHMMSS.db
+   - [OK] spending_aggregates table ready
+   - [OK] Built X aggregate rows covering Y transactions
+   - [OK] Aggregates match transactions
+
+4. Test the app:
+   - Launch the app (python main.py)
+   - Check the Dashboard category pie and weekly trend look the same as before
+
+5. If something goes wrong, restore from backup:
+
+   python migrations/backup_database.py restore backups/budget_app_backup_YYYYMMDD_HHMMSS.db
+
+============================================================================
+
+This script is IDEMPOTENT - safe to run multiple times. Aggregates are
+rebuilt from scratch each run.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from models.database import get_db, engine
+from models import SpendingAggregate
+from models.spending_aggregates import rebuild_spending_aggregates
+from sqlalchemy import text
+
+
+def create_aggregates_table():
+    """Create the spending_aggregates table (and its indexes) if missing"""
+    try:
+        SpendingAggregate.__table__.create(bind=engine, checkfirst=True)
+        print("[OK] spending_aggregates table ready")
+        return True
+
+    except Exception as e:
+        print(f"[ERROR] Failed to create spending_aggregates table: {e}")
+        return False
+
+
+def build_aggregates():
+    """Rebuild every aggregate row from the transactions table"""
+    db = get_db()
+
+    try:
+        rebuild_spending_aggregates(db.connection())
+        db.commit()
+
+        row_count, transaction_count = db.execute(text(
+            "SELECT COUNT(*), COALESCE(SUM(count), 0) FROM spending_aggregates"
+        )).fetchone()
+
+        print(f"[OK] Built {row_count} aggregate rows covering {transaction_count} transactions")
+        return True
+
+    except Exception as e:
+        print(f"[ERROR] Failed to build aggregates: {e}")
+        import traceback
+        traceback.print_exc()
+        db.rollback()
+        return False
+    finally:
+        db.close()
+
+
+def verify_migration():
+    """Compare per-week aggregate totals against a direct sum of the transactions"""
+    db = get_db()
+
+    try:
+        print("\nVerifying migration...")
+
+        expected = dict(db.execute(text("""
+            SELECT week_number, SUM(amount) FROM transactions
+            WHERE transaction_type = 'spending' AND amount > 0
+            GROUP BY week_number
+        """)).fetchall())
+        actual = dict(db.execute(text("""
+            SELECT week_number, SUM(total) FROM spending_aggregates GROUP BY week_number
+        """)).fetchall())
+
+        bad = [week for week in set(expected) | set(actual)
+               if abs((expected.get(week) or 0.0) - (actual.get(week) or 0.0)) > 0.005]
+        if bad:
+            print(f"[ERROR] {len(bad)} weeks don't match transactions: {sorted(bad)[:10]}")
+            return False
+
+        print("[OK] Aggregates match transactions")
+        return True
+
+    except Exception as e:
+        print(f"[ERROR] Verification failed: {e}")
+        return False
+    finally:
+        db.close()
+
+
+def run_migration():
+    """Run the complete migration"""
+    print("=" * 70)
+    print("Migration: Add spending_aggregates table")
+    print("=" * 70)
+
+    # Step 1: Backup
+    print("\nStep 1: Creating backup...")
+    from migrations.backup_database import backup_database
+    backup_path = backup_database()
+    if not backup_path:
+        print("[ERROR] Backup failed - aborting migration")
+        print("\nNo changes were made to the database.")
+        return False
+
+    # Step 2: Create table
+    print("\nStep 2: Creating spending_aggregates table...")
+    if not create_aggregates_table():
+        print(f"\nRestore from backup if needed: python migrations/backup_database.py restore {backup_path}")
+        return False
+
+    # Step 3: Build aggregates
+    print("\nStep 3: Building aggregates...")
+    if not build_aggregates():
+        print(f"\nRestore from backup if needed: python migrations/backup_database.py restore {backup_path}")
+        return False
+
+    # Step 4: Verify
+    print("\nStep 4: Verifying migration...")
+    if not verify_migration():
+        print("[WARN] Verification found issues - check output above")
+
+    print("\n" + "=" * 70)
+    print("Migration complete!")
+    print("=" * 70)
+    print("\nNext steps:")
+    print("1. Launch the app and check the Dashboard category/weekly charts")
+    print(f"2. If issues occur, restore: python migrations/backup_database.py restore {backup_path}")
+
+    return True
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,129 @@
+"""
+Migration: Add (transaction_type, date, category, amount) index to transactions
+
+This migration adds the covering index behind the Scratch Pad's date-range
+functions (SPENT, INCOME): their totals are read straight from the index
+instead of scanning the transactions table. It:
+- Adds ix_transactions_type_date to transactions
+
+New databases get the index from create_tables(); existing ones need this
+script. Without it the functions still work, just slower on large histories.
+
+USAGE (run from BudgetApp directory):
+============================================================================
+
+    python migrations/add_transaction_type_date_index.py
+
+============================================================================
+
+FOR PRODUCTION MACHINE (with real data):
+============================================================================
+
+1. BEFORE running, make sure:
+   - Close the BudgetApp if it's running
+   - Pull latest code from GitHub (git pull)
+
+2. Run the migration:
+
+   cd path/to/BudgetApp
+   python migrations/add_transaction_type_date_index.py
+
+3. Verify output shows:
+   - [OK] Database backed up to: backups/budget_app_backup_YYYYMMDD_HHMMSS.db
+   - [OK] transactions indexes ready
+   - [OK] Date-range totals use ix_transactions_type_date
+
+4. If something goes wrong, restore from backup:
+
+   python migrations/backup_database.py restore backups/budget_app_backup_YYYYMMDD_HHMMSS.db
+
+============================================================================
+
+This script is IDEMPOTENT - safe to run multiple times.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from models.database import get_db, engine
+from models import Transaction
+from sqlalchemy import text
+
+
+def add_transaction_indexes():
+    """Create any transactions index that is missing"""
+    try:
+        for index in Transaction.__table__.indexes:
+            index.create(bind=engine, checkfirst=True)
+        print("[OK] transactions indexes ready")
+        return True
+
+    except Exception as e:
+        print(f"[ERROR] Failed to add transactions indexes: {e}")
+        return False
+
+
+def verify_migration():
+    """Check SQLite plans the range-aggregate query on the new index"""
+    db = get_db()
+
+    try:
+        print("\nVerifying migration...")
+        plan = db.execute(text(
+            "EXPLAIN QUERY PLAN SELECT date, category, SUM(amount) FROM transactions "
+            "WHERE transaction_type = 'spending' GROUP BY date, category"
+        )).fetchall()
+
+        if not any("ix_transactions_type_date" in str(row[-1]) for row in plan):
+            print("[ERROR] Query plan doesn't use ix_transactions_type_date")
+            return False
+
+        print("[OK] Date-range totals use ix_transactions_type_date")
+        return True
+
+    except Exception as e:
+        print(f"[ERROR] Verification failed: {e}")
+        return False
+    finally:
+        db.close()
+
+
+def run_migration():
+    """Run the complete migration"""
+    print("=" * 70)
+    print("Migration: Add transactions (type, date) index")
+    print("=" * 70)
+
+    # Step 1: Backup
+    print("\nStep 1: Creating backup...")
+    from migrations.backup_database import backup_database
+    backup_path = backup_database()
+    if not backup_path:
+        print("[ERROR] Backup failed - aborting migration")
+        print("\nNo changes were made to the database.")
+        return False
+
+    # Step 2: Index
+    print("\nStep 2: Adding transactions index...")
+    if not add_transaction_indexes():
+        print(f"\nRestore from backup if needed: python migrations/backup_database.py restore {backup_path}")
+        return False
+
+    # Step 3: Verify
+    print("\nStep 3: Verifying migration...")
+    if not verify_migration():
+        print("[WARN] Verification found issues - check output above")
+
+    print("\n" + "=" * 70)
+    print("Migration complete!")
+    print("=" * 70)
+    print(f"\nIf issues occur, restore: python migrations/backup_database.py restore {backup_path}")
+
+    return True
+
+
+if __name__ == "__main__":
+    run_migration()
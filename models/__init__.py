@@ -1,16 +1,18 @@
 # Models package
 
-from .database import Base, engine, SessionLocal, get_db, create_tables, drop_tables
+from .database import Base, engine, SessionLocal, get_db, create_tables, drop_tables, get_data_version
 from .accounts import Account
 from .bills import Bill
 from .weeks import Week
 from .transactions import Transaction, TransactionType
 from .account_history import AccountHistory, AccountHistoryManager
+from .balance_checkpoints import BalanceCheckpoint
+from .spending_aggregates import SpendingAggregate
 from .reimbursements import Reimbursement, ReimbursementState
 
 __all__ = [
-    "Base", "engine", "SessionLocal", "get_db", "create_tables", "drop_tables",
+    "Base", "engine", "SessionLocal", "get_db", "create_tables", "drop_tables", "get_data_version",
     "Account", "Bill", "Week", "Transaction", "TransactionType",
-    "AccountHistory", "AccountHistoryManager",
+    "AccountHistory", "AccountHistoryManager", "BalanceCheckpoint", "SpendingAggregate",
     "Reimbursement", "ReimbursementState"
 ]
\ No newline at end of file
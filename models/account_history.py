@@ -2,10 +2,17 @@
 Account History models for tracking all account balance changes
 """
 
-from sqlalchemy import Column, Integer, String, Float, Date, DateTime, ForeignKey
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from array import array
+from bisect import bisect_left, bisect_right
+from calendar import monthrange
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+from sqlalchemy import (Column, Integer, String, Float, Date, DateTime, ForeignKey, Index, event,
+                        and_, or_, not_, func, select, insert, update, delete, inspect, bindparam)
+from sqlalchemy.orm import relationship, Session
 from models.database import Base
+from models.balance_checkpoints import BalanceCheckpoint
 
 
 class AccountHistory(Base):
@@ -37,6 +44,12 @@ class AccountHistory(Base):
     # Relationships
     transaction = relationship("Transaction", foreign_keys=[transaction_id], back_populates="history_entries")
 
+    # Chronological per-account scans (running-total recalculation, checkpoints, as-of-date lookups)
+    __table_args__ = (
+        Index("ix_account_history_account_date", "account_type", "account_id", "transaction_date", "id"),
+        Index("ix_account_history_transaction_date", "transaction_date"),
+    )
+
     def __repr__(self):
         tx_info = f"tx_id={self.transaction_id}" if self.transaction_id else "no_tx"
         return f"<AccountHistory({self.account_type}:{self.account_id}, change=${self.change_amount:.2f}, total=${self.running_total:.2f}, {tx_info})>"
@@ -98,6 +111,186 @@ class AccountHistory(Base):
         )
 
 
+def _history_sort_key(entry_date, entry_id: int) -> int:
+    """
+    Pack (transaction_date, id) into one integer that sorts in chronological order
+
+    The date ordinal goes in the high bits and the history id in the low 32 bits,
+    so comparing keys gives the same order as ORDER BY transaction_date, id.
+    """
+    return (entry_date.toordinal() << 32) | entry_id
+
+
+class _AccountSeries:
+    """Chronological history of one account stored as compact parallel arrays"""
+    __slots__ = ("keys", "changes", "totals")
+
+    def __init__(self):
+        self.keys = array("q")     # _history_sort_key(transaction_date, id)
+        self.changes = array("d")  # change_amount
+        self.totals = array("d")   # running_total
+
+    def recalculate_from(self, position: int):
+        """Same formula as the database path: running_total = previous running_total + change"""
+        totals = self.totals
+        changes = self.changes
+        previous = totals[position - 1] if position > 0 else 0.0
+        for i in range(position, len(totals)):
+            previous += changes[i]
+            totals[i] = previous
+
+
+class BalanceIndex:
+    """
+    In-memory "balance as of date" index shared by every AccountHistoryManager
+
+    Each account's history is kept as sorted sort keys plus running totals, so
+    an as-of-date lookup is a bisection instead of an ORDER BY ... LIMIT 1 query.
+    Series are loaded lazily (one query per account, or one query for all
+    accounts via prime()) and then kept current by AccountHistoryManager's
+    add/update/delete methods.
+
+    Writes that bypass the manager (dialogs editing starting balances, bulk
+    deletes from the reset tools) are picked up by the session event hooks at
+    the bottom of this module, which drop the affected series so they reload
+    (and rebuild the affected balance checkpoints).
+    """
+
+    def __init__(self):
+        self._series = {}  # (account_id, account_type) -> _AccountSeries
+        self._primed = False  # Every account with history was loaded by prime() and none dropped since...
+        self._dropped = set()  # ...except these keys
+
+    def invalidate(self, account_id: int = None, account_type: str = None):
+        """Forget one account's series, or every series when called without arguments"""
+        if account_id is None:
+            self._series.clear()
+            self._primed = False
+            self._dropped.clear()
+        else:
+            self._series.pop((account_id, account_type), None)
+            if self._primed:
+                self._dropped.add((account_id, account_type))
+
+    def is_loaded(self, account_id: int, account_type: str) -> bool:
+        return (account_id, account_type) in self._series
+
+    def prime(self, db_session):
+        """
+        Load every account that is not indexed yet
+
+        The first call loads the whole history in a single query. Once primed, only
+        the series dropped since are reloaded (one query each), so calling this after
+        every commit doesn't rescan the table.
+        """
+        if self._primed:
+            dropped, self._dropped = self._dropped, set()
+            for account_id, account_type in dropped:
+                self._get_series(db_session, account_id, account_type)
+            return
+
+        rows = db_session.query(
+            AccountHistory.account_id,
+            AccountHistory.account_type,
+            AccountHistory.transaction_date,
+            AccountHistory.id,
+            AccountHistory.change_amount,
+            AccountHistory.running_total
+        ).order_by(
+            AccountHistory.account_type, AccountHistory.account_id,
+            AccountHistory.transaction_date, AccountHistory.id
+        ).all()
+
+        loaded = {}
+        for account_id, account_type, entry_date, entry_id, change, total in rows:
+            key = (account_id, account_type)
+            if key in self._series:
+                continue
+            series = loaded.get(key)
+            if series is None:
+                series = loaded[key] = _AccountSeries()
+            series.keys.append(_history_sort_key(entry_date, entry_id))
+            series.changes.append(change)
+            series.totals.append(total)
+
+        self._series.update(loaded)
+        self._primed = True
+        self._dropped.clear()
+
+    def _get_series(self, db_session, account_id: int, account_type: str) -> _AccountSeries:
+        series = self._series.get((account_id, account_type))
+        if series is not None:
+            return series
+
+        rows = db_session.query(
+            AccountHistory.transaction_date,
+            AccountHistory.id,
+            AccountHistory.change_amount,
+            AccountHistory.running_total
+        ).filter(
+            AccountHistory.account_id == account_id,
+            AccountHistory.account_type == account_type
+        ).order_by(AccountHistory.transaction_date, AccountHistory.id).all()
+
+        series = _AccountSeries()
+        for entry_date, entry_id, change, total in rows:
+            series.keys.append(_history_sort_key(entry_date, entry_id))
+            series.changes.append(change)
+            series.totals.append(total)
+
+        self._series[(account_id, account_type)] = series
+        return series
+
+    def balance_at(self, db_session, account_id: int, account_type: str, target_date) -> float:
+        """Running total of the latest entry on or before target_date (0.0 if none)"""
+        series = self._get_series(db_session, account_id, account_type)
+        # Largest possible key for target_date = after every entry dated that day
+        position = bisect_right(series.keys, (target_date.toordinal() << 32) | 0xFFFFFFFF)
+        return series.totals[position - 1] if position > 0 else 0.0
+
+    def current_balance(self, db_session, account_id: int, account_type: str) -> float:
+        """Running total of the chronologically last entry (0.0 if none)"""
+        series = self._get_series(db_session, account_id, account_type)
+        return series.totals[-1] if series.totals else 0.0
+
+    def insert(self, account_id: int, account_type: str, entry_date, entry_id: int, change_amount: float):
+        """Insert an entry and recompute the totals after it (no-op if the account isn't loaded)"""
+        series = self._series.get((account_id, account_type))
+        if series is None:
+            return
+
+        key = _history_sort_key(entry_date, entry_id)
+        position = bisect_left(series.keys, key)
+        series.keys.insert(position, key)
+        series.changes.insert(position, change_amount)
+        series.totals.insert(position, 0.0)
+        series.recalculate_from(position)
+
+    def remove(self, account_id: int, account_type: str, entry_date, entry_id: int):
+        """Remove an entry and recompute the totals after it (no-op if the account isn't loaded)"""
+        series = self._series.get((account_id, account_type))
+        if series is None:
+            return
+
+        key = _history_sort_key(entry_date, entry_id)
+        position = bisect_left(series.keys, key)
+        if position >= len(series.keys) or series.keys[position] != key:
+            # Out of sync with the database - reload on next lookup
+            self.invalidate(account_id, account_type)
+            return
+
+        del series.keys[position]
+        del series.changes[position]
+        del series.totals[position]
+        if position < len(series.totals):
+            series.recalculate_from(position)
+
+
+# Process-wide index: Account/Bill.get_current_balance() open a fresh session per call,
+# so the index has to outlive any single AccountHistoryManager
+balance_index = BalanceIndex()
+
+
 class AccountHistoryManager:
     """
     Helper class for managing account history operations
@@ -106,6 +299,54 @@ class AccountHistoryManager:
 
     def __init__(self, db_session):
         self.db = db_session
+        # (account_id, account_type) -> earliest (transaction_date, id) awaiting recalculation
+        # None when running totals are recalculated immediately (the normal case)
+        self._deferred_positions = None
+
+    @contextmanager
+    def deferred_recalculation(self):
+        """
+        Defer running-total propagation until the block exits
+
+        Inserts, edits and deletes still write their own history rows, but instead of
+        recalculating the rest of the account each time, the earliest touched position
+        per account is remembered. On exit every touched account is recalculated once
+        from that position. Running totals (and balance lookups) are stale inside the block.
+
+        If the block raises, nothing is recalculated - the caller is expected to roll back.
+        """
+        if self._deferred_positions is not None:
+            yield  # Nested - the outermost block recalculates
+            return
+
+        self._deferred_positions = {}
+        try:
+            yield
+            deferred, self._deferred_positions = self._deferred_positions, None
+            for (account_id, account_type), (from_date, from_id) in deferred.items():
+                with self._managed_writes((account_id, account_type)):
+                    self._recalculate_running_totals_from(account_id, account_type, from_date, from_id)
+                    self.db.flush()
+                    balance_index.invalidate(account_id, account_type)
+        finally:
+            self._deferred_positions = None
+
+    @contextmanager
+    def _managed_writes(self, *accounts):
+        """
+        Mark history writes as maintained by this manager
+
+        While active, the session hooks leave the balance index alone because the
+        manager updates it itself. The touched accounts are remembered on the
+        session so a rollback can drop them from the index.
+        """
+        info = self.db.info
+        info["balance_index_managed"] = info.get("balance_index_managed", 0) + 1
+        info.setdefault("balance_index_touched", set()).update(accounts)
+        try:
+            yield
+        finally:
+            info["balance_index_managed"] -= 1
 
     def get_account_history(self, account_id: int, account_type: str):
         """Get all history entries for an account, ordered by date"""
@@ -116,22 +357,74 @@ class AccountHistoryManager:
 
     def get_current_balance(self, account_id: int, account_type: str) -> float:
         """Get the current balance for an account from history"""
-        latest_entry = self.db.query(AccountHistory).filter(
-            AccountHistory.account_id == account_id,
-            AccountHistory.account_type == account_type
-        ).order_by(AccountHistory.transaction_date.desc(), AccountHistory.id.desc()).first()
+        return balance_index.current_balance(self.db, account_id, account_type)
+
+    def get_balance_as_of(self, account_id: int, account_type: str, target_date) -> float:
+        """
+        Get the balance as of a specific date (latest entry on or before that date)
+
+        Answered from the in-memory balance index by bisection - no query once
+        the account is loaded. Call prime_balance_index() first when looking up
+        many accounts so they load in one query.
+        """
+        return balance_index.balance_at(self.db, account_id, account_type, target_date)
+
+    def prime_balance_index(self):
+        """Load every account's history into the balance index with one query"""
+        balance_index.prime(self.db)
+
+    def balances_as_of(self, target_date) -> dict:
+        """
+        Get every account and bill balance as of a date in two bounded queries
 
-        return latest_entry.running_total if latest_entry else 0.0
+        Returns:
+            Dict of (account_id, account_type) -> balance for every account with history
+            on or before target_date, e.g. balances[(account.id, "savings")]
+
+        Reads the latest month-end checkpoint before target_date's month and adds
+        only the changes dated inside that month, so the cost doesn't grow with
+        the length of the history.
+        """
+        ensure_balance_checkpoints(self.db.connection())
+        checkpoints = BalanceCheckpoint.__table__
+        history = AccountHistory.__table__
+
+        # Checkpoints exist for every month end an account has history, so the end of
+        # the previous month is either checkpointed or past the account's last entry
+        previous_month_end = target_date.replace(day=1) - timedelta(days=1)
+
+        latest = select(
+            checkpoints.c.account_id,
+            checkpoints.c.account_type,
+            func.max(checkpoints.c.checkpoint_date).label("checkpoint_date")
+        ).where(
+            checkpoints.c.checkpoint_date <= previous_month_end
+        ).group_by(checkpoints.c.account_id, checkpoints.c.account_type).subquery()
+
+        base_rows = self.db.execute(
+            select(checkpoints.c.account_id, checkpoints.c.account_type, checkpoints.c.balance)
+            .join(latest, and_(
+                checkpoints.c.account_id == latest.c.account_id,
+                checkpoints.c.account_type == latest.c.account_type,
+                checkpoints.c.checkpoint_date == latest.c.checkpoint_date
+            ))
+        ).all()
+
+        delta_rows = self.db.execute(
+            select(history.c.account_id, history.c.account_type, func.sum(history.c.change_amount))
+            .where(history.c.transaction_date > previous_month_end, history.c.transaction_date <= target_date)
+            .group_by(history.c.account_id, history.c.account_type)
+        ).all()
+
+        balances = {(account_id, account_type): balance for account_id, account_type, balance in base_rows}
+        for account_id, account_type, delta in delta_rows:
+            key = (account_id, account_type)
+            balances[key] = balances.get(key, 0.0) + delta
+        return balances
 
     def _get_balance_at_date(self, account_id: int, account_type: str, target_date) -> float:
         """Get the balance as of a specific date (latest entry on or before that date)"""
-        latest_entry = self.db.query(AccountHistory).filter(
-            AccountHistory.account_id == account_id,
-            AccountHistory.account_type == account_type,
-            AccountHistory.transaction_date <= target_date
-        ).order_by(AccountHistory.transaction_date.desc(), AccountHistory.id.desc()).first()
-
-        return latest_entry.running_total if latest_entry else 0.0
+        return self.get_balance_as_of(account_id, account_type, target_date)
 
     def add_transaction_change(self, account_id: int, account_type: str,
                              transaction_id: int, change_amount: float, transaction_date):
@@ -158,49 +451,55 @@ class AccountHistoryManager:
         #
         # Example: Starting balance set to 2024-01-01, then import transaction from 2024-09-21
         # Solution: Auto-move starting balance to 2024-09-20, recalculate all running totals
-        from datetime import timedelta
-
-        starting_balance_entry = self.db.query(AccountHistory).filter(
-            AccountHistory.account_id == account_id,
-            AccountHistory.account_type == account_type,
-            AccountHistory.transaction_id.is_(None)  # Starting balance has no transaction_id
-        ).first()
-
-        if starting_balance_entry and transaction_date <= starting_balance_entry.transaction_date:
-            # Transaction is older than or same date as starting balance
-            # Move starting balance to day before this transaction
-            new_starting_date = transaction_date - timedelta(days=1)
-            print(f"Moving starting balance from {starting_balance_entry.transaction_date} to {new_starting_date}")
-            starting_balance_entry.transaction_date = new_starting_date
+        with self._managed_writes((account_id, account_type)):
+            from datetime import timedelta
+
+            starting_balance_entry = self.db.query(AccountHistory).filter(
+                AccountHistory.account_id == account_id,
+                AccountHistory.account_type == account_type,
+                AccountHistory.transaction_id.is_(None)  # Starting balance has no transaction_id
+            ).first()
+
+            if starting_balance_entry and transaction_date <= starting_balance_entry.transaction_date:
+                # Transaction is older than or same date as starting balance
+                # Move starting balance to day before this transaction
+                new_starting_date = transaction_date - timedelta(days=1)
+                print(f"Moving starting balance from {starting_balance_entry.transaction_date} to {new_starting_date}")
+                starting_balance_entry.transaction_date = new_starting_date
+                self.db.flush()
+                balance_index.invalidate(account_id, account_type)
+
+            # Get balance as of the transaction date (not the absolute latest)
+            # This finds the balance BEFORE this transaction, accounting for chronological order
+            balance_at_date = self._get_balance_at_date(account_id, account_type, transaction_date)
+
+            # Create new history entry with calculated running_total
+            history_entry = AccountHistory.create_transaction_entry(
+                account_id=account_id,
+                account_type=account_type,
+                transaction_id=transaction_id,
+                change_amount=change_amount,
+                previous_total=balance_at_date,
+                transaction_date=transaction_date
+            )
+
+            self.db.add(history_entry)
+            self.db.flush()  # Get the ID without committing
+            balance_index.insert(account_id, account_type, transaction_date, history_entry.id, change_amount)
+
+            # CRITICAL: Update all subsequent entries' running totals
+            # This is what makes historical edits work automatically
+            # If we moved the starting balance, we need to recalculate from the beginning
+            if starting_balance_entry and transaction_date <= starting_balance_entry.transaction_date + timedelta(days=1):
+                # Recalculate everything from scratch since starting balance moved
+                self.recalculate_account_history(account_id, account_type)
+            else:
+                # Normal case: just update from this entry forward
+                self._recalculate_running_totals_from(account_id, account_type, transaction_date, history_entry.id)
+
+            # Flush while still marked as managed so the session hooks keep the index
             self.db.flush()
 
-        # Get balance as of the transaction date (not the absolute latest)
-        # This finds the balance BEFORE this transaction, accounting for chronological order
-        balance_at_date = self._get_balance_at_date(account_id, account_type, transaction_date)
-
-        # Create new history entry with calculated running_total
-        history_entry = AccountHistory.create_transaction_entry(
-            account_id=account_id,
-            account_type=account_type,
-            transaction_id=transaction_id,
-            change_amount=change_amount,
-            previous_total=balance_at_date,
-            transaction_date=transaction_date
-        )
-
-        self.db.add(history_entry)
-        self.db.flush()  # Get the ID without committing
-
-        # CRITICAL: Update all subsequent entries' running totals
-        # This is what makes historical edits work automatically
-        # If we moved the starting balance, we need to recalculate from the beginning
-        if starting_balance_entry and transaction_date <= starting_balance_entry.transaction_date + timedelta(days=1):
-            # Recalculate everything from scratch since starting balance moved
-            self.recalculate_account_history(account_id, account_type)
-        else:
-            # Normal case: just update from this entry forward
-            self._update_running_totals_from_entry(history_entry, change_amount)
-
         return history_entry
 
     def update_transaction_change(self, transaction_id: int, new_change_amount: float, new_date):
@@ -220,13 +519,24 @@ class AccountHistoryManager:
         if not history_entry:
             raise ValueError(f"No history entry found for transaction {transaction_id}")
 
-        # CRITICAL: Update the entry's change_amount and date FIRST
-        # before recalculating running totals, so the recalculation uses the new values
-        history_entry.change_amount = new_change_amount
-        history_entry.transaction_date = new_date
+        account = (history_entry.account_id, history_entry.account_type)
+        with self._managed_writes(account):
+            old_date = history_entry.transaction_date
+
+            # CRITICAL: Update the entry's change_amount and date FIRST
+            # before recalculating running totals, so the recalculation uses the new values
+            history_entry.change_amount = new_change_amount
+            history_entry.transaction_date = new_date
+            self.db.flush()
+
+            # Now recalculate running totals using the updated change_amount
+            # Start from whichever position comes first - if the date moved later, the
+            # entries between the old and new position lost this change too
+            self._recalculate_running_totals_from(*account, min(old_date, new_date), history_entry.id)
+            self.db.flush()
 
-        # Now recalculate running totals from this entry forward using the updated change_amount
-        self._update_running_totals_from_entry(history_entry, 0)  # change_difference unused
+            balance_index.remove(*account, old_date, history_entry.id)
+            balance_index.insert(*account, new_date, history_entry.id, new_change_amount)
 
     def delete_transaction_change(self, transaction_id: int):
         """Remove a history entry when its transaction is deleted"""
@@ -237,25 +547,23 @@ class AccountHistoryManager:
         if not history_entry:
             return  # Already deleted or never existed
 
-        # Update all subsequent entries to remove this change
-        change_to_remove = -history_entry.change_amount  # Reverse the change
-        self._update_running_totals_from_entry(history_entry, change_to_remove, skip_current=True)
+        account = (history_entry.account_id, history_entry.account_type)
+        with self._managed_writes(account):
+            # Delete the entry
+            self.db.delete(history_entry)
+            self.db.flush()
 
-        # Delete the entry
-        self.db.delete(history_entry)
+            # Update all subsequent entries to remove this change
+            self._recalculate_running_totals_from(*account, history_entry.transaction_date, history_entry.id)
+            self.db.flush()
+            balance_index.remove(*account, history_entry.transaction_date, history_entry.id)
 
-    def _update_running_totals_from_entry(self, start_entry: AccountHistory,
-                                        change_difference: float, skip_current: bool = False):
+    def _recalculate_running_totals_from(self, account_id: int, account_type: str, from_date, from_id: int):
         """
-        Update running totals for all entries after (and including) the start entry
+        Update running totals for all entries at or after the (from_date, from_id) position
 
         CRITICAL: This is the AUTO-UPDATE mechanism that makes historical edits work!
 
-        How it works:
-        1. Get ALL entries for the account in chronological order (by date, then ID)
-        2. Find where start_entry is in that chronological list
-        3. Recalculate running_total for start_entry and ALL subsequent entries
-
         The magic formula: running_total = previous_entry.running_total + current_entry.change_amount
 
         This ensures:
@@ -263,6 +571,90 @@ class AccountHistoryManager:
         - Every subsequent entry adds its change to the previous running_total
         - When you insert/edit/delete in the middle, all future entries update automatically
 
+        Pending changes (new, edited or deleted entries) must be flushed before calling.
+        Inside deferred_recalculation() only the position is recorded. Otherwise runs as a single UPDATE with a window-function cumulative sum when the database
+        supports it, otherwise falls back to walking the entries through the ORM.
+        """
+        if self._deferred_positions is not None:
+            account = (account_id, account_type)
+            position = (from_date, from_id)
+            earliest = self._deferred_positions.get(account)
+            if earliest is None or position < earliest:
+                self._deferred_positions[account] = position
+            return
+
+        if _supports_set_based_recalculation(self.db):
+            self._recalculate_running_totals_sql(account_id, account_type, from_date, from_id)
+        else:
+            self._recalculate_running_totals_orm(account_id, account_type, from_date, from_id)
+            self.db.flush()
+
+        # Month-end checkpoints on or after the change now hold stale totals
+        rebuild_balance_checkpoints(self.db.connection(), account_id, account_type, from_date)
+
+    def _recalculate_running_totals_sql(self, account_id: int, account_type: str, from_date, from_id: int):
+        """
+        Rewrite running totals from a position forward in one statement
+
+        UPDATE account_history SET running_total = recomputed.running_total
+        FROM (SELECT id, <total before position> + SUM(change_amount) OVER (ORDER BY transaction_date, id)
+              FROM account_history WHERE <same account> AND <at or after position>) AS recomputed
+        WHERE account_history.id = recomputed.id
+
+        Only the entries from the position forward are read and written - the entry just
+        before the position supplies the base total.
+        """
+        history = AccountHistory.__table__
+        previous = history.alias("previous")
+
+        def same_account(table):
+            return and_(table.c.account_id == account_id, table.c.account_type == account_type)
+
+        def at_or_after_position(table):
+            return or_(
+                table.c.transaction_date > from_date,
+                and_(table.c.transaction_date == from_date, table.c.id >= from_id)
+            )
+
+        # Running total of the last entry before the position (0.0 when the position is the first entry)
+        total_before = select(previous.c.running_total).where(
+            same_account(previous),
+            not_(at_or_after_position(previous))
+        ).order_by(previous.c.transaction_date.desc(), previous.c.id.desc()).limit(1).scalar_subquery()
+
+        recomputed = select(
+            history.c.id,
+            (func.coalesce(total_before, 0.0) + func.sum(history.c.change_amount).over(
+                order_by=(history.c.transaction_date, history.c.id),
+                rows=(None, 0)
+            )).label("running_total")
+        ).where(
+            same_account(history),
+            at_or_after_position(history)
+        ).subquery("recomputed")
+
+        self.db.execute(
+            update(history)
+            .where(history.c.id == recomputed.c.id)
+            .values(running_total=recomputed.c.running_total)
+        )
+
+        # The UPDATE bypasses the ORM - expire any loaded entries so they re-read their new totals
+        for obj in list(self.db.identity_map.values()):
+            if isinstance(obj, AccountHistory):
+                loaded = inspect(obj).dict
+                if loaded.get("account_id") == account_id and loaded.get("account_type") == account_type:
+                    self.db.expire(obj, ["running_total"])
+
+    def _recalculate_running_totals_orm(self, account_id: int, account_type: str, from_date, from_id: int):
+        """
+        Fallback for databases without window functions / UPDATE ... FROM
+
+        How it works:
+        1. Get ALL entries for the account in chronological order (by date, then ID)
+        2. Find where the position is in that chronological list
+        3. Recalculate running_total for that entry and ALL subsequent entries
+
         Example flow:
         - Entries: [Start:$4204, TX1:+$92, TX2:+$100(NEW), TX3:-$64]
         - Start index = 2 (TX2)
@@ -270,37 +662,32 @@ class AccountHistoryManager:
           * TX2: running = TX1.running(4296) + TX2.change(100) = 4396
           * TX3: running = TX2.running(4396) + TX3.change(-64) = 4332
         - All subsequent entries automatically updated!
-
-        IMPORTANT: change_difference parameter is currently unused but kept for compatibility
-        The recalculation is from scratch using prev_total + change_amount, not deltas.
         """
         # Get all entries in the same account, sorted chronologically
         # CRITICAL: Must sort by transaction_date first, then by id for same-date entries
         all_entries = self.db.query(AccountHistory).filter(
-            AccountHistory.account_id == start_entry.account_id,
-            AccountHistory.account_type == start_entry.account_type
+            AccountHistory.account_id == account_id,
+            AccountHistory.account_type == account_type
         ).order_by(AccountHistory.transaction_date, AccountHistory.id).all()
 
-        # Find the position of the start entry in chronological order
+        # Find the first entry at or after the position in chronological order
         start_index = None
         for i, entry in enumerate(all_entries):
-            if entry.id == start_entry.id:
+            if (entry.transaction_date, entry.id) >= (from_date, from_id):
                 start_index = i
                 break
 
         if start_index is None:
-            return  # Entry not found (shouldn't happen)
+            return  # Nothing at or after the position (e.g. the last entry was deleted)
 
         # Recalculate running totals from this point forward
-        # skip_current=True is used when deleting (skip the entry being deleted)
-        for i in range(start_index + (1 if skip_current else 0), len(all_entries)):
-            # Get the previous entry's running total
-            # If this is the first entry (i=0), prev_total = 0.0 (but shouldn't happen with starting balance)
-            prev_total = all_entries[i-1].running_total if i > 0 else 0.0
-
+        # If this is the first entry, prev_total = 0.0 (but shouldn't happen with starting balance)
+        prev_total = all_entries[start_index - 1].running_total if start_index > 0 else 0.0
+        for entry in all_entries[start_index:]:
             # Calculate new running total: previous balance + this change
             # This is the core formula that propagates changes forward
-            all_entries[i].running_total = prev_total + all_entries[i].change_amount
+            prev_total += entry.change_amount
+            entry.running_total = prev_total
 
     def initialize_account_history(self, account_id: int, account_type: str,
                                  starting_balance: float = 0.0, start_date=None):
@@ -318,18 +705,178 @@ class AccountHistoryManager:
             date=start_date
         )
 
-        self.db.add(starting_entry)
-        self.db.flush()
+        with self._managed_writes((account_id, account_type)):
+            self.db.add(starting_entry)
+            self.db.flush()
+            balance_index.insert(account_id, account_type, starting_entry.transaction_date,
+                                 starting_entry.id, starting_balance)
+            rebuild_balance_checkpoints(self.db.connection(), account_id, account_type)
         return starting_entry
 
     def recalculate_account_history(self, account_id: int, account_type: str):
         """Recalculate all running totals for an account (useful for fixing data issues)"""
-        entries = self.get_account_history(account_id, account_type)
+        with self._managed_writes((account_id, account_type)):
+            self.db.flush()
+            self._recalculate_running_totals_from(account_id, account_type, date.min, 0)
+            self.db.flush()
+            # Entries may have been added or moved outside the manager - reload on next lookup
+            balance_index.invalidate(account_id, account_type)
+
+        return self.get_account_history(account_id, account_type)
+
+
+def _month_end(day) -> date:
+    return day.replace(day=monthrange(day.year, day.month)[1])
+
+
+def rebuild_balance_checkpoints(connection, account_id: int, account_type: str, from_date=date.min):
+    """
+    Rewrite an account's month-end checkpoints on or after from_date
+
+    Deletes the stale checkpoints and inserts one per month end from from_date's month
+    (or the account's first month) through the month of its last entry. Each value is
+    the running total of the latest entry on or before the month end - one indexed
+    lookup per month. Running totals must already be correct.
+    """
+    if ensure_balance_checkpoints(connection):
+        return  # Just built for every account
+    checkpoints = BalanceCheckpoint.__table__
+    history = AccountHistory.__table__
+    same_account = and_(history.c.account_id == account_id, history.c.account_type == account_type)
+
+    connection.execute(delete(checkpoints).where(
+        checkpoints.c.account_id == account_id,
+        checkpoints.c.account_type == account_type,
+        checkpoints.c.checkpoint_date >= from_date
+    ))
+
+    first_date, last_date = connection.execute(
+        select(func.min(history.c.transaction_date), func.max(history.c.transaction_date)).where(same_account)
+    ).one()
+    if first_date is None:
+        return  # No history left
+
+    month_ends = []
+    month_end = _month_end(max(from_date, first_date))
+    while month_end <= _month_end(last_date):
+        month_ends.append({"month_end": month_end})
+        month_end = _month_end(month_end + timedelta(days=1))
+
+    if not month_ends:
+        return
+
+    balance_at_month_end = select(history.c.running_total).where(
+        same_account,
+        history.c.transaction_date <= bindparam("month_end")
+    ).order_by(history.c.transaction_date.desc(), history.c.id.desc()).limit(1).scalar_subquery()
+
+    connection.execute(
+        insert(checkpoints).values(
+            account_id=account_id,
+            account_type=account_type,
+            checkpoint_date=bindparam("month_end"),
+            balance=func.coalesce(balance_at_month_end, 0.0)
+        ),
+        month_ends
+    )
+
+
+def rebuild_all_balance_checkpoints(connection):
+    """Rebuild every account's checkpoints from scratch (recovery / migrations)"""
+    if ensure_balance_checkpoints(connection):
+        return
+    _fill_all_balance_checkpoints(connection)
 
-        running_total = 0.0
-        for entry in entries:
-            running_total += entry.change_amount
-            entry.running_total = running_total
 
-        self.db.flush()
-        return entries
\ No newline at end of file
+def _fill_all_balance_checkpoints(connection):
+    history = AccountHistory.__table__
+    connection.execute(delete(BalanceCheckpoint.__table__))
+    accounts = connection.execute(select(history.c.account_id, history.c.account_type).distinct()).all()
+    for account_id, account_type in accounts:
+        rebuild_balance_checkpoints(connection, account_id, account_type)
+
+
+_checkpoints_table_ready = False
+
+
+def ensure_balance_checkpoints(connection) -> bool:
+    """
+    Create and fill the checkpoints table if this database doesn't have one yet
+    (add_balance_checkpoints.py hasn't been run)
+
+    Returns:
+        True if the table had to be created - it already holds every account's checkpoints
+    """
+    global _checkpoints_table_ready
+    if _checkpoints_table_ready:
+        return False
+
+    checkpoints = BalanceCheckpoint.__table__
+    if inspect(connection).has_table(checkpoints.name):
+        _checkpoints_table_ready = True
+        return False
+
+    # Created in the caller's transaction - checked again until that commits
+    checkpoints.create(connection)
+    _checkpoints_table_ready = True  # Lets the fill below write to it
+    try:
+        _fill_all_balance_checkpoints(connection)
+    finally:
+        _checkpoints_table_ready = False
+    return True
+
+
+def _supports_set_based_recalculation(db_session) -> bool:
+    """True if the database can run the window-function UPDATE ... FROM recalculation"""
+    dialect = db_session.get_bind().dialect
+    if dialect.name == "sqlite":
+        # UPDATE ... FROM needs SQLite 3.33+ (window functions arrived in 3.25)
+        return dialect.dbapi.sqlite_version_info >= (3, 33, 0)
+    return dialect.name == "postgresql"
+
+
+# === Balance index / checkpoint maintenance for writes that bypass AccountHistoryManager ===
+
+def _history_accounts(objects):
+    return {(obj.account_id, obj.account_type) for obj in objects if isinstance(obj, AccountHistory)}
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_index_after_flush(session, flush_context):
+    """Drop index series for history rows written directly through the ORM"""
+    if session.info.get("balance_index_managed"):
+        return
+    touched = _history_accounts(session.new) | _history_accounts(session.dirty) | _history_accounts(session.deleted)
+    if touched:
+        session.info.setdefault("balance_index_touched", set()).update(touched)
+        for account_id, account_type in touched:
+            balance_index.invalidate(account_id, account_type)
+            rebuild_balance_checkpoints(session.connection(), account_id, account_type)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_index_on_bulk_write(orm_execute_state):
+    """query(AccountHistory).delete()/update() skip the flush hooks - drop the whole index and checkpoints"""
+    if not (orm_execute_state.is_delete or orm_execute_state.is_update):
+        return
+    if orm_execute_state.session.info.get("balance_index_managed"):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ is AccountHistory:
+        balance_index.invalidate()
+        # Run the bulk statement first, then rebuild checkpoints for whatever history is left
+        result = orm_execute_state.invoke_statement()
+        rebuild_all_balance_checkpoints(orm_execute_state.session.connection())
+        return result
+
+
+@event.listens_for(Session, "after_commit")
+def _forget_touched_after_commit(session):
+    session.info.pop("balance_index_touched", None)
+
+
+@event.listens_for(Session, "after_rollback")
+def _invalidate_index_after_rollback(session):
+    """Index updates made in a rolled-back transaction no longer match the database"""
+    for account_id, account_type in session.info.pop("balance_index_touched", ()):
+        balance_index.invalidate(account_id, account_type)
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""
+Balance checkpoint model - month-end snapshots of AccountHistory running totals
+"""
+
+from sqlalchemy import Column, Integer, String, Float, Date, Index
+from models.database import Base
+
+
+class BalanceCheckpoint(Base):
+    """
+    Running total of one account (bill or savings) at the end of a month
+
+    Every account has a checkpoint for each month end from the month of its first
+    AccountHistory entry through the month of its last one, so "balance as of D" is
+    the checkpoint before D's month plus the changes inside D's month.
+
+    Maintained by AccountHistoryManager - never edit these rows directly.
+    Checkpoints on or after a changed entry's date are rebuilt whenever running
+    totals are recalculated, so back-dated edits keep them valid.
+    """
+    __tablename__ = "balance_checkpoints"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    account_id = Column(Integer, nullable=False)  # bills.id or accounts.id (same as AccountHistory)
+    account_type = Column(String, nullable=False)  # "bill" or "savings"
+    checkpoint_date = Column(Date, nullable=False)  # Last day of the month
+    balance = Column(Float, nullable=False)  # Running total at the end of checkpoint_date
+
+    __table_args__ = (
+        Index("ix_balance_checkpoints_account_date", "account_type", "account_id", "checkpoint_date", unique=True),
+        Index("ix_balance_checkpoints_date", "checkpoint_date"),
+    )
+
+    def __repr__(self):
+        return f"<BalanceCheckpoint({self.account_type}:{self.account_id}, {self.checkpoint_date}, balance=${self.balance:.2f})>"
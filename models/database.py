@@ -2,7 +2,7 @@
 Database setup and configuration
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from pathlib import Path
@@ -36,4 +36,44 @@ def create_tables():
 
 def drop_tables():
     """Drop all tables (for testing)"""
-    Base.metadata.drop_all(bind=engine)
\ No newline at end of file
+    Base.metadata.drop_all(bind=engine)
+
+
+# === Data version ===
+# Bumped every time a session commits changes, so read caches (yearly rollups,
+# snapshots, ...) can tell whether what they hold is still current.
+
+_data_version = 0
+
+
+def get_data_version() -> int:
+    """Get the current data version (changes whenever committed data changes)"""
+    return _data_version
+
+
+def bump_data_version():
+    """Mark all cached reads as stale (for writes made outside a Session)"""
+    global _data_version
+    _data_version += 1
+
+
+@event.listens_for(Session, "after_flush")
+def _note_pending_changes(session, flush_context):
+    session.info["data_changed"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _note_bulk_changes(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["data_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_version_after_commit(session):
+    if session.info.pop("data_changed", False):
+        bump_data_version()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changes_after_rollback(session):
+    session.info.pop("data_changed", None)
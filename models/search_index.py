@@ -0,0 +1,172 @@
+"""
+Full-text search index - SQLite FTS5 tables over transaction and reimbursement text
+
+transactions_fts indexes transactions.description/category and
+reimbursements_fts indexes reimbursements.notes/location/category. Both are
+external-content tables: they store only the index (the text stays in the
+source table) and triggers on the source tables keep them in sync on every
+INSERT, UPDATE and DELETE - including bulk deletes and raw SQL, which the
+session-level hooks of the other derived tables have to special-case.
+
+search() answers a free-text query with ids ranked by BM25 plus date-range
+facets (match counts per year and month) of everything that matched.
+"""
+
+import re
+from collections import Counter
+from datetime import date
+from typing import Dict, List, NamedTuple, Optional
+
+from sqlalchemy import text
+
+
+# Source table -> (FTS table, indexed columns)
+SEARCH_INDEXES = {
+    "transactions": ("transactions_fts", ("description", "category")),
+    "reimbursements": ("reimbursements_fts", ("notes", "location", "category")),
+}
+
+
+class SearchResult(NamedTuple):
+    """Ranked matches of a search() plus facets over all of them"""
+    ids: List[int]  # Best match first (cut to the limit, if one was given)
+    total: int  # Number of matches before the limit
+    first_date: Optional[date]  # Earliest matching date
+    last_date: Optional[date]  # Latest matching date
+    by_year: Dict[int, int]  # Year -> number of matches
+    by_month: Dict[str, int]  # "YYYY-MM" -> number of matches
+
+
+EMPTY_RESULT = SearchResult([], 0, None, None, {}, {})
+
+
+def _index_ddl(source_table: str) -> List[str]:
+    """CREATE statements for one source table's FTS table and sync triggers"""
+    fts_table, columns = SEARCH_INDEXES[source_table]
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+
+    insert_new = f"INSERT INTO {fts_table}(rowid, {column_list}) VALUES (new.id, {new_values});"
+    delete_old = (f"INSERT INTO {fts_table}({fts_table}, rowid, {column_list}) "
+                  f"VALUES ('delete', old.id, {old_values});")
+
+    return [
+        # Prefix indexes make the search-as-you-type "term*" queries index lookups too
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5("
+        f"{column_list}, content='{source_table}', content_rowid='id', "
+        f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT ON {source_table} BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE ON {source_table} BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_au AFTER UPDATE OF {column_list}, id ON {source_table} "
+        f"BEGIN {delete_old} {insert_new} END",
+    ]
+
+
+def _index_objects(source_table: str) -> set:
+    fts_table, _columns = SEARCH_INDEXES[source_table]
+    return {fts_table, f"{fts_table}_ai", f"{fts_table}_ad", f"{fts_table}_au"}
+
+
+def create_search_index(connection, source_table: str) -> bool:
+    """
+    Create a source table's FTS table and triggers if any are missing, then rebuild it
+
+    Returns:
+        True if the index had to be (re)built, False if it was already complete
+    """
+    existing = {name for (name,) in connection.execute(text(
+        "SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')"
+    ))}
+    if source_table not in existing:
+        return False  # Nothing to index yet (create_tables hasn't run)
+    if _index_objects(source_table) <= existing:
+        return False
+
+    # Missing triggers (e.g. the source table was dropped and recreated) mean the index may be stale
+    for statement in _index_ddl(source_table):
+        connection.execute(text(statement))
+    rebuild_search_index(connection, source_table)
+    return True
+
+
+def rebuild_search_index(connection, source_table: str):
+    """Re-read every row of the source table into its index (recovery / migrations)"""
+    fts_table, _columns = SEARCH_INDEXES[source_table]
+    connection.execute(text(f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')"))
+
+
+_ensured_tables = set()
+
+
+def ensure_search_index(db_session, source_table: str):
+    """Make sure the index exists before the first search of this process (commits if it built one)"""
+    if source_table in _ensured_tables:
+        return
+    if create_search_index(db_session.connection(), source_table):
+        db_session.commit()
+    _ensured_tables.add(source_table)
+
+
+def match_expression(query: str) -> str:
+    """
+    FTS5 MATCH expression for free text typed by a user
+
+    Every word must match, as a prefix ("cof sta" finds "Coffee at Starbucks").
+    Words are quoted, so FTS5 operators and punctuation in the input are
+    matched literally instead of being parsed.
+    """
+    words = re.findall(r"\w+", query)
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def search(db_session, source_table: str, query: str, start_date: Optional[date] = None,
+           end_date: Optional[date] = None, limit: Optional[int] = None) -> SearchResult:
+    """
+    Full-text search one source table
+
+    Args:
+        db_session: Session to query with
+        source_table: "transactions" or "reimbursements"
+        query: Free text (see match_expression)
+        start_date: Only rows dated on/after this date
+        end_date: Only rows dated on/before this date
+        limit: Return at most this many ids (facets still count every match)
+
+    Returns:
+        SearchResult with ids ranked best match first (BM25)
+    """
+    expression = match_expression(query)
+    if not expression:
+        return EMPTY_RESULT
+    ensure_search_index(db_session, source_table)
+
+    fts_table, _columns = SEARCH_INDEXES[source_table]
+    conditions = [f"{fts_table} MATCH :expression"]
+    params = {"expression": expression}
+    if start_date is not None:
+        conditions.append("source.date >= :start_date")
+        params["start_date"] = start_date.isoformat()
+    if end_date is not None:
+        conditions.append("source.date <= :end_date")
+        params["end_date"] = end_date.isoformat()
+
+    rows = db_session.execute(text(
+        f"SELECT source.id, source.date FROM {fts_table} "
+        f"JOIN {source_table} AS source ON source.id = {fts_table}.rowid "
+        f"WHERE {' AND '.join(conditions)} "
+        f"ORDER BY {fts_table}.rank, source.date DESC"
+    ), params).fetchall()
+    if not rows:
+        return EMPTY_RESULT
+
+    ids = [row_id for row_id, _row_date in rows]
+    dates = [date.fromisoformat(str(row_date)[:10]) for _row_id, row_date in rows]
+    return SearchResult(
+        ids=ids[:limit] if limit is not None else ids,
+        total=len(ids),
+        first_date=min(dates),
+        last_date=max(dates),
+        by_year=dict(sorted(Counter(d.year for d in dates).items())),
+        by_month=dict(sorted(Counter(f"{d.year:04d}-{d.month:02d}" for d in dates).items())),
+    )
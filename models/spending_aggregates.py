@@ -0,0 +1,195 @@
+"""
+Spending aggregate model - per week/category spending totals kept in sync with Transactions
+"""
+
+from sqlalchemy import Column, Integer, String, Float, Boolean, Index, event, select, insert, delete, func, inspect
+from sqlalchemy.orm import Session, attributes
+from models.database import Base
+from models.transactions import Transaction, TransactionType
+
+
+class SpendingAggregate(Base):
+    """
+    Sum/count/min/max of spending transactions for one (week, category, analytics flag)
+
+    Mirrors what get_spending_by_category()/get_spending_by_week() used to sum in Python:
+    only spending transactions with amount > 0 (no $0 placeholders), with a missing
+    category stored as "Uncategorized" and a NULL include_in_analytics as False.
+
+    Never edit these rows directly - every flush that touches a spending transaction
+    rebuilds the aggregates of the weeks it touched (see the hooks at the bottom of
+    this module). rebuild_spending_aggregates() recomputes everything for recovery.
+    """
+    __tablename__ = "spending_aggregates"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    week_number = Column(Integer, nullable=False)
+    category = Column(String, nullable=False)
+    include_in_analytics = Column(Boolean, nullable=False)
+
+    total = Column(Float, nullable=False, default=0.0)
+    count = Column(Integer, nullable=False, default=0)
+    min_amount = Column(Float, nullable=False)
+    max_amount = Column(Float, nullable=False)
+
+    __table_args__ = (
+        Index("ix_spending_aggregates_key", "week_number", "category", "include_in_analytics", unique=True),
+        Index("ix_spending_aggregates_category", "category"),
+    )
+
+    def __repr__(self):
+        return (f"<SpendingAggregate(week={self.week_number}, category={self.category}, "
+                f"analytics={self.include_in_analytics}, total=${self.total:.2f}, count={self.count})>")
+
+
+def _aggregate_select(week_numbers=None):
+    """INSERT-ready SELECT grouping spending transactions into aggregate rows"""
+    transactions = Transaction.__table__
+    category = func.coalesce(func.nullif(transactions.c.category, ""), "Uncategorized")
+    analytics = func.coalesce(transactions.c.include_in_analytics, False)
+
+    query = select(
+        transactions.c.week_number,
+        category,
+        analytics,
+        func.sum(transactions.c.amount),
+        func.count(transactions.c.id),
+        func.min(transactions.c.amount),
+        func.max(transactions.c.amount)
+    ).where(
+        transactions.c.transaction_type == TransactionType.SPENDING.value,
+        transactions.c.amount > 0  # Exclude $0 placeholder transactions
+    ).group_by(transactions.c.week_number, category, analytics)
+
+    if week_numbers is not None:
+        query = query.where(transactions.c.week_number.in_(week_numbers))
+    return query
+
+
+_AGGREGATE_COLUMNS = ["week_number", "category", "include_in_analytics", "total", "count", "min_amount", "max_amount"]
+
+
+_aggregates_table_ready = False
+
+
+def ensure_spending_aggregates(connection) -> bool:
+    """
+    Create and fill the aggregates table if this database doesn't have one yet
+    (add_spending_aggregates.py hasn't been run)
+
+    Returns:
+        True if the table had to be created - it already holds every transaction
+    """
+    global _aggregates_table_ready
+    if _aggregates_table_ready:
+        return False
+
+    aggregates = SpendingAggregate.__table__
+    if inspect(connection).has_table(aggregates.name):
+        _aggregates_table_ready = True
+        return False
+
+    # Created in the caller's transaction - checked again until that commits
+    aggregates.create(connection)
+    connection.execute(insert(aggregates).from_select(_AGGREGATE_COLUMNS, _aggregate_select()))
+    return True
+
+
+def refresh_spending_aggregates(connection, week_numbers):
+    """Recompute the aggregate rows of the given weeks from their transactions"""
+    week_numbers = sorted(week for week in week_numbers if week is not None)
+    if not week_numbers:
+        return
+    if ensure_spending_aggregates(connection):
+        return  # Just built from every transaction
+
+    aggregates = SpendingAggregate.__table__
+    connection.execute(delete(aggregates).where(aggregates.c.week_number.in_(week_numbers)))
+    connection.execute(insert(aggregates).from_select(_AGGREGATE_COLUMNS, _aggregate_select(week_numbers)))
+
+
+def rebuild_spending_aggregates(connection):
+    """Recompute every aggregate row from scratch (recovery / migrations)"""
+    if ensure_spending_aggregates(connection):
+        return
+    aggregates = SpendingAggregate.__table__
+    connection.execute(delete(aggregates))
+    connection.execute(insert(aggregates).from_select(_AGGREGATE_COLUMNS, _aggregate_select()))
+
+
+def query_spending_totals(db_session, group_by: str, include_analytics_only: bool = True) -> dict:
+    """
+    Sum the aggregate rows by "category" or "week_number"
+
+    Returns:
+        Dict of category (or week number) -> total spending
+    """
+    ensure_spending_aggregates(db_session.connection())
+    aggregates = SpendingAggregate.__table__
+    key = aggregates.c[group_by]
+
+    query = select(key, func.sum(aggregates.c.total)).group_by(key)
+    if include_analytics_only:
+        query = query.where(aggregates.c.include_in_analytics == True)
+
+    return {group: total for group, total in db_session.execute(query)}
+
+
+# === Aggregate maintenance ===
+# Transactions are written from many places (TransactionManager, PaycheckProcessor,
+# dialogs, imports), so the aggregates are kept in sync at the session level rather
+# than in each writer. Only the weeks a flush touched are recomputed.
+
+def _is_spending(transaction_type) -> bool:
+    return transaction_type == TransactionType.SPENDING.value
+
+
+def _touched_spending_weeks(session) -> set:
+    weeks = set()
+    for obj in list(session.new) + list(session.deleted):
+        if isinstance(obj, Transaction) and _is_spending(obj.transaction_type):
+            weeks.add(obj.week_number)
+
+    for obj in session.dirty:
+        if not isinstance(obj, Transaction):
+            continue
+        type_history = attributes.get_history(obj, "transaction_type")
+        if not any(_is_spending(value) for value in type_history.sum()):
+            continue
+        # Both the week it left and the week it is in now
+        weeks.update(attributes.get_history(obj, "week_number").sum())
+    return weeks
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_spending_weeks_before_flush(session, flush_context, instances):
+    """Note touched weeks while deleted rows can still be loaded"""
+    weeks = _touched_spending_weeks(session)
+    if weeks:
+        session.info.setdefault("spending_weeks_touched", set()).update(weeks)
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_aggregates_after_flush(session, flush_context):
+    """Recompute the aggregates of weeks whose spending transactions changed in this flush"""
+    weeks = session.info.pop("spending_weeks_touched", None)
+    if weeks:
+        refresh_spending_aggregates(session.connection(), weeks)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _rebuild_aggregates_on_bulk_write(orm_execute_state):
+    """query(Transaction).delete()/update() skip the flush hooks - rebuild everything"""
+    if not (orm_execute_state.is_delete or orm_execute_state.is_update):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ is Transaction:
+        result = orm_execute_state.invoke_statement()
+        rebuild_spending_aggregates(orm_execute_state.session.connection())
+        return result
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_spending_weeks_after_rollback(session):
+    session.info.pop("spending_weeks_touched", None)
@@ -3,7 +3,7 @@ Unified Transaction model for all types of financial transactions
 All transaction types use the same model - unused fields are left NULL
 """
 
-from sqlalchemy import Column, Integer, String, Float, Date, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, Boolean, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from enum import Enum
@@ -60,6 +60,12 @@ class Transaction(Base):
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
+    # Covers date-range totals by type and category (Scratch Pad SPENT()/INCOME()) -
+    # SQLite answers them from the index without reading the table
+    __table_args__ = (
+        Index("ix_transactions_type_date", "transaction_type", "date", "category", "amount"),
+    )
+
     # === Relationships ===
     week = relationship("Week", foreign_keys=[week_number])
     bill = relationship("Bill", foreign_keys=[bill_id])
@@ -0,0 +1,91 @@
+"""
+Account Properties - name-indexed snapshot of every account and bill for Scratch Pad GET()
+
+GET(name, property) used to open a session, load every Account and then every
+Bill, and run another query for the balance - on every call, so a sheet with
+50 GETs ran hundreds of queries per refresh. This service loads the GET-able
+fields of all accounts and bills plus their current balances in one pass and
+keeps them until committed data changes.
+"""
+
+import threading
+from typing import Any, Dict, NamedTuple, Optional
+
+from models import get_db, Account, Bill
+from models.account_history import AccountHistoryManager
+from models.database import get_data_version
+
+
+class AccountPropertySnapshot(NamedTuple):
+    """Every account and bill at one data version, keyed by lowercase name"""
+    version: int
+    # name.lower() -> {"kind": "savings" | "bill", "name", "balance", plus the model's columns}
+    by_name: Dict[str, Dict[str, Any]]
+
+
+class AccountPropertyService:
+    """
+    Hands out the current AccountPropertySnapshot, reloading only when the data version changes
+
+    Usage:
+        from services.account_properties import account_properties
+        entry = account_properties.lookup("Safety Saving")
+        if entry and entry["kind"] == "savings":
+            goal = entry["goal_amount"]
+    """
+
+    def __init__(self):
+        self._snapshot: Optional[AccountPropertySnapshot] = None
+        self._lock = threading.Lock()  # Background loaders read it too
+
+    def invalidate(self):
+        """Force a reload on the next get()"""
+        self._snapshot = None
+
+    def get(self) -> AccountPropertySnapshot:
+        with self._lock:
+            version = get_data_version()
+            if self._snapshot is not None and self._snapshot.version == version:
+                return self._snapshot
+
+            db = get_db()
+            try:
+                accounts = db.query(
+                    Account.id, Account.name, Account.goal_amount, Account.auto_save_amount
+                ).order_by(Account.id).all()
+                bills = db.query(
+                    Bill.id, Bill.name, Bill.amount_to_save, Bill.typical_amount, Bill.payment_frequency,
+                    Bill.last_payment_date, Bill.bill_type, Bill.is_variable
+                ).order_by(Bill.id).all()
+
+                # Every account's history in one query, then balances are in-memory lookups
+                history_manager = AccountHistoryManager(db)
+                history_manager.prime_balance_index()
+
+                by_name = {}
+                # Accounts win over bills with the same name, and the first bill over later ones
+                for row in accounts:
+                    by_name.setdefault(row.name.lower(), {
+                        "kind": "savings",
+                        "balance": history_manager.get_current_balance(row.id, "savings"),
+                        **row._asdict(),
+                    })
+                for row in bills:
+                    by_name.setdefault(row.name.lower(), {
+                        "kind": "bill",
+                        "balance": history_manager.get_current_balance(row.id, "bill"),
+                        **row._asdict(),
+                    })
+            finally:
+                db.close()
+
+            self._snapshot = AccountPropertySnapshot(version, by_name)
+            return self._snapshot
+
+    def lookup(self, name: str) -> Optional[Dict[str, Any]]:
+        """Properties of the account or bill with this name (case-insensitive), or None"""
+        return self.get().by_name.get(name.strip().lower())
+
+
+# Shared by every Scratch Pad - the snapshot is keyed on the global data version
+account_properties = AccountPropertyService()
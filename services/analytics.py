@@ -3,14 +3,15 @@ Analytics Engine - Generate charts and spending insights with normal vs all spen
 """
 
 from typing import Dict, List, Tuple, Optional
-from datetime import date, datetime, timedelta
-from collections import defaultdict
+from datetime import datetime
+import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
 
 from models import TransactionType
 from services.transaction_manager import TransactionManager
+from services.transaction_frame import get_transaction_frame, DAY_NAMES
 
 
 class AnalyticsEngine:
@@ -24,45 +25,34 @@ class AnalyticsEngine:
     # Core data retrieval methods
     def get_spending_data(self, include_analytics_only: bool = True, days_back: int = 90) -> List[Dict]:
         """Get spending transactions as dictionaries for analysis"""
-        spending_transactions = self.transaction_manager.get_spending_transactions(include_analytics_only)
-        
-        # Filter by date range if specified
-        if days_back > 0:
-            cutoff_date = date.today() - timedelta(days=days_back)
-            spending_transactions = [
-                t for t in spending_transactions 
-                if t.date >= cutoff_date
-            ]
-        
+        frame = get_transaction_frame()
+        rows = np.flatnonzero(frame.spending_mask(include_analytics_only, days_back))
+
         # Convert to dictionaries for easier analysis
+        weekdays = frame.weekdays[rows]
         data = []
-        for tx in spending_transactions:
+        for row, weekday in zip(rows, weekdays):
             data.append({
-                'date': tx.date,
-                'amount': tx.amount,
-                'category': tx.category or 'Uncategorized',
-                'description': tx.description or '',
-                'week_number': tx.week_number,
-                'day_of_week': tx.date.strftime('%A'),
-                'include_in_analytics': tx.include_in_analytics
+                'date': frame.dates[row].item(),
+                'amount': float(frame.amounts[row]),
+                'category': frame.category_labels[frame.category_codes[row]],
+                'description': frame.descriptions[row],
+                'week_number': int(frame.week_numbers[row]),
+                'day_of_week': DAY_NAMES[weekday],
+                'include_in_analytics': bool(frame.include_in_analytics[row])
             })
-        
+
         return data
     
     # Day of week analysis (your favorite feature!)
     def analyze_spending_by_day_of_week(self, include_analytics_only: bool = True) -> Dict[str, float]:
-        """Analyze which days of the week you spend the most money"""
-        spending_data = self.get_spending_data(include_analytics_only)
-        
-        day_totals = defaultdict(float)
-        for transaction in spending_data:
-            day_totals[transaction['day_of_week']] += transaction['amount']
-        
-        # Ensure all days are present and in order
-        days_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        result = {day: day_totals.get(day, 0.0) for day in days_order}
-        
-        return result
+        """Analyze which days of the week you spend the most money (last 90 days)"""
+        frame = get_transaction_frame()
+        mask = frame.spending_mask(include_analytics_only, days_back=90)
+        day_totals = frame.sum_by(frame.weekdays, mask, 7)
+
+        # All days present and in order
+        return {day: float(day_totals[i]) for i, day in enumerate(DAY_NAMES)}
     
     def create_day_of_week_chart(self, include_analytics_only: bool = True) -> go.Figure:
         """Create bar chart showing spending by day of week"""
@@ -91,7 +81,15 @@ class AnalyticsEngine:
     # Category analysis
     def analyze_spending_by_category(self, include_analytics_only: bool = True) -> Dict[str, float]:
         """Analyze spending by category"""
-        return self.transaction_manager.get_spending_by_category(include_analytics_only)
+        frame = get_transaction_frame()
+        mask = frame.spending_mask(include_analytics_only)
+        category_totals = frame.sum_by(frame.category_codes, mask, len(frame.category_labels))
+        present = np.bincount(frame.category_codes[mask], minlength=len(frame.category_labels)) > 0
+
+        return {
+            frame.category_labels[code]: float(category_totals[code])
+            for code in np.flatnonzero(present)
+        }
     
     def create_category_pie_chart(self, include_analytics_only: bool = True) -> go.Figure:
         """Create pie chart showing spending by category"""
@@ -143,19 +141,20 @@ class AnalyticsEngine:
     # Weekly trends
     def analyze_spending_by_week(self, include_analytics_only: bool = True, weeks_back: int = 12) -> Dict[int, float]:
         """Analyze spending trends by week"""
-        week_spending = self.transaction_manager.get_spending_by_week(include_analytics_only)
-        
+        frame = get_transaction_frame()
+        mask = frame.spending_mask(include_analytics_only)
+
         # Filter to recent weeks if specified
         if weeks_back > 0:
             current_week = self.transaction_manager.get_current_week()
             if current_week:
                 min_week = max(1, current_week.week_number - weeks_back + 1)
-                week_spending = {
-                    week: amount for week, amount in week_spending.items() 
-                    if week >= min_week
-                }
-        
-        return week_spending
+                mask &= frame.week_numbers >= min_week
+
+        weeks, week_codes = np.unique(frame.week_numbers[mask], return_inverse=True)
+        week_totals = np.bincount(week_codes, weights=frame.amounts[mask], minlength=len(weeks))
+
+        return {int(week): float(total) for week, total in zip(weeks, week_totals)}
     
     def create_weekly_trend_chart(self, include_analytics_only: bool = True, weeks_back: int = 12) -> go.Figure:
         """Create line chart showing weekly spending trends"""
@@ -189,15 +188,15 @@ class AnalyticsEngine:
     
     # Monthly analysis
     def analyze_spending_by_month(self, include_analytics_only: bool = True) -> Dict[str, float]:
-        """Analyze spending by month"""
-        spending_data = self.get_spending_data(include_analytics_only, days_back=365)
-        
-        month_totals = defaultdict(float)
-        for transaction in spending_data:
-            month_key = transaction['date'].strftime('%Y-%m')
-            month_totals[month_key] += transaction['amount']
-        
-        return dict(month_totals)
+        """Analyze spending by month (last 365 days)"""
+        frame = get_transaction_frame()
+        mask = frame.spending_mask(include_analytics_only, days_back=365)
+
+        months, month_codes = np.unique(frame.dates[mask].astype('datetime64[M]'), return_inverse=True)
+        month_totals = np.bincount(month_codes, weights=frame.amounts[mask], minlength=len(months))
+
+        # datetime64[M] prints as 'YYYY-MM'
+        return {str(month): float(total) for month, total in zip(months, month_totals)}
     
     def create_monthly_trend_chart(self, include_analytics_only: bool = True) -> go.Figure:
         """Create monthly spending trend chart"""
@@ -234,34 +233,31 @@ class AnalyticsEngine:
     
     # Advanced analytics
     def get_spending_statistics(self, include_analytics_only: bool = True) -> Dict[str, float]:
-        """Get statistical summary of spending"""
-        spending_data = self.get_spending_data(include_analytics_only)
-        amounts = [tx['amount'] for tx in spending_data]
+        """Get statistical summary of spending (last 90 days)"""
+        frame = get_transaction_frame()
+        amounts = frame.amounts[frame.spending_mask(include_analytics_only, days_back=90)]
         
-        if not amounts:
+        if not len(amounts):
             return {
                 'total': 0, 'average': 0, 'median': 0, 
                 'min': 0, 'max': 0, 'count': 0
             }
         
-        amounts.sort()
-        n = len(amounts)
-        median = amounts[n//2] if n % 2 == 1 else (amounts[n//2-1] + amounts[n//2]) / 2
-        
         return {
-            'total': sum(amounts),
-            'average': sum(amounts) / len(amounts),
-            'median': median,
-            'min': min(amounts),
-            'max': max(amounts),
-            'count': len(amounts)
+            'total': float(amounts.sum()),
+            'average': float(amounts.mean()),
+            'median': float(np.median(amounts)),
+            'min': float(amounts.min()),
+            'max': float(amounts.max()),
+            'count': int(len(amounts))
         }
     
     def find_spending_patterns(self, include_analytics_only: bool = True) -> Dict[str, any]:
         """Find interesting spending patterns and insights"""
-        spending_data = self.get_spending_data(include_analytics_only)
-        
-        if not spending_data:
+        # Transaction frequency
+        stats = self.get_spending_statistics(include_analytics_only)
+
+        if not stats['count']:
             return {"error": "No spending data available"}
         
         # Day of week analysis
@@ -273,9 +269,6 @@ class AnalyticsEngine:
         category_spending = self.analyze_spending_by_category(include_analytics_only)
         top_category = max(category_spending, key=category_spending.get) if category_spending else "None"
         
-        # Transaction frequency
-        stats = self.get_spending_statistics(include_analytics_only)
-        
         patterns = {
             'highest_spending_day': highest_spending_day,
             'highest_day_amount': day_spending[highest_spending_day],
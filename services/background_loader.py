@@ -0,0 +1,121 @@
+"""
+Background Loader - runs view data gathering on worker threads
+
+A view's data-gathering stage (database queries, aggregations) runs on a
+QThreadPool worker with its own SQLAlchemy session; the immutable result is
+delivered back on the UI thread through a queued Qt signal, where the view
+only paints. Starting a new load for the same key cancels the previous one, and
+results of cancelled loads are dropped, so a slow load can never overwrite a
+newer one.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class LoadTicket:
+    """
+    Handle for one background load
+
+    Gather functions receive their ticket and may check ticket.cancelled
+    between expensive stages to stop early.
+    """
+
+    def __init__(self, key: Hashable):
+        self.key = key
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+
+
+class _LoadTask(QRunnable):
+    """Runs one gather function on a pool thread and reports back through the loader's signal"""
+
+    def __init__(self, loader: "BackgroundLoader", ticket: LoadTicket, gather: Callable[[LoadTicket], Any]):
+        super().__init__()
+        self._loader = loader
+        self._ticket = ticket
+        self._gather = gather
+
+    def run(self):
+        if self._ticket.cancelled:
+            return
+        try:
+            result = self._gather(self._ticket)
+            error = None
+        except Exception as e:
+            result = None
+            error = e
+        if not self._ticket.cancelled:
+            self._loader._delivered.emit(self._ticket, result, error)
+
+
+class BackgroundLoader(QObject):
+    """
+    Runs gather functions off the UI thread, one live load per key
+
+    Usage:
+        loader = BackgroundLoader(parent=self)
+        loader.load(view, view.gather_data, on_result=lambda data: view.refresh(data=data))
+
+    gather(ticket) must not touch widgets and must open its own session
+    (get_db()) - never the UI thread's. on_result/on_error run on the UI thread.
+    """
+
+    # (ticket, result, error) - emitted from a worker, received on the loader's (UI) thread
+    _delivered = pyqtSignal(object, object, object)
+
+    def __init__(self, max_threads: int = 2, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        # SQLite allows one writer and the UI thread writes - keep readers few
+        self._pool.setMaxThreadCount(max_threads)
+        self._loads: Dict[Hashable, tuple] = {}  # key -> (ticket, on_result, on_error)
+        self._delivered.connect(self._on_delivered)
+
+    def load(self, key: Hashable, gather: Callable[[LoadTicket], Any],
+             on_result: Callable[[Any], None],
+             on_error: Optional[Callable[[Exception], None]] = None) -> LoadTicket:
+        """Start gather(ticket) on a worker, cancelling any load already running for key"""
+        self.cancel(key)
+        ticket = LoadTicket(key)
+        self._loads[key] = (ticket, on_result, on_error)
+        self._pool.start(_LoadTask(self, ticket, gather))
+        return ticket
+
+    def cancel(self, key: Hashable):
+        """Cancel the load for key (its result will be dropped)"""
+        load = self._loads.pop(key, None)
+        if load is not None:
+            load[0].cancel()
+
+    def is_loading(self, key: Hashable) -> bool:
+        return key in self._loads
+
+    def shutdown(self, timeout_ms: int = 5000):
+        """Cancel everything and wait for running workers (call before closing sessions)"""
+        for key in list(self._loads):
+            self.cancel(key)
+        self._pool.clear()
+        self._pool.waitForDone(timeout_ms)
+
+    def _on_delivered(self, ticket: LoadTicket, result, error):
+        load = self._loads.get(ticket.key)
+        if load is None or load[0] is not ticket or ticket.cancelled:
+            return  # Stale - a newer load replaced this one, or it was cancelled
+        del self._loads[ticket.key]
+
+        _ticket, on_result, on_error = load
+        if error is not None:
+            if on_error is not None:
+                on_error(error)
+            else:
+                print(f"Error loading data in background: {error}")
+            return
+        on_result(result)
@@ -0,0 +1,313 @@
+"""
+Change Events - typed "what changed" notifications for committed data
+
+Every session commit that wrote to transactions, accounts, bills, weeks,
+account history or reimbursements emits one DataChange on the shared change_bus
+naming the affected weeks, accounts, bills, categories and date range. The
+changes are collected at the session level (like the spending aggregates), so
+TransactionManager, PaycheckProcessor, ReimbursementManager and the dialogs that
+commit through their sessions all report their writes without extra calls.
+
+Views declare which changes invalidate which of their panels in a
+PANEL_DEPENDENCIES dict (panel update method -> list of Depends), and BudgetApp
+hands each view the merged change so only the invalidated panels are redrawn.
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional, Set
+from dataclasses import dataclass, field
+from datetime import date
+from enum import Enum
+from sqlalchemy import event
+from sqlalchemy.orm import Session, attributes
+
+from models import Account, Bill, Week, Transaction, AccountHistory, Reimbursement
+
+
+class ChangeKind(Enum):
+    TRANSACTIONS = "transactions"
+    ACCOUNTS = "accounts"              # Savings account rows or balances
+    BILLS = "bills"                    # Bill rows or balances
+    WEEKS = "weeks"                    # Week rows (dates, allocations)
+    REIMBURSEMENTS = "reimbursements"
+
+
+@dataclass
+class DataChange:
+    """
+    What one commit (or several merged commits) changed
+
+    A transaction that moves money in or out of a savings account or bill also
+    reports ACCOUNTS/BILLS with that id, since it changes the balance.
+    everything=True means a bulk write whose rows aren't known - every panel is stale.
+    """
+    kinds: Set[ChangeKind] = field(default_factory=set)
+    transaction_types: Set[str] = field(default_factory=set)
+    weeks: Set[int] = field(default_factory=set)
+    accounts: Set[int] = field(default_factory=set)
+    bills: Set[int] = field(default_factory=set)
+    categories: Set[str] = field(default_factory=set)
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    everything: bool = False
+    sources: Set[str] = field(default_factory=set)
+
+    @classmethod
+    def everything_changed(cls, source: Optional[str] = None) -> "DataChange":
+        """A change that invalidates every panel (imports, resets, bulk writes)"""
+        return cls(kinds=set(ChangeKind), everything=True, sources={source} if source else set())
+
+    def is_empty(self) -> bool:
+        return not self.kinds and not self.everything
+
+    def add_date(self, value: Optional[date]):
+        """Widen the date range to include value"""
+        if value is None:
+            return
+        if self.start_date is None or value < self.start_date:
+            self.start_date = value
+        if self.end_date is None or value > self.end_date:
+            self.end_date = value
+
+    def merge(self, other: "DataChange") -> "DataChange":
+        """Fold another change into this one (in place) and return self"""
+        self.kinds |= other.kinds
+        self.transaction_types |= other.transaction_types
+        self.weeks |= other.weeks
+        self.accounts |= other.accounts
+        self.bills |= other.bills
+        self.categories |= other.categories
+        self.add_date(other.start_date)
+        self.add_date(other.end_date)
+        self.everything = self.everything or other.everything
+        self.sources |= other.sources
+        return self
+
+    def overlaps(self, start: Optional[date], end: Optional[date]) -> bool:
+        """Whether the changed date range overlaps [start, end] (None = open-ended)"""
+        if self.start_date is None:
+            return True  # No dates recorded (e.g. an account rename) - can't rule it out
+        if start is not None and self.end_date < start:
+            return False
+        if end is not None and self.start_date > end:
+            return False
+        return True
+
+
+class Depends:
+    """
+    One reason a panel goes stale - used in a view's PANEL_DEPENDENCIES
+
+    Usage:
+        PANEL_DEPENDENCIES = {
+            "update_bills_status": [Depends(ChangeKind.BILLS)],
+            "update_week_info": [
+                Depends(ChangeKind.TRANSACTIONS, weeks=lambda view: view.get_selected_week_numbers()),
+            ],
+        }
+
+    A change matches when it touches one of the kinds and every given filter.
+    weeks/categories/dates are callables taking the view, so they follow the
+    current selection; dates returns a (start, end) tuple (either may be None);
+    when(view, change) is a last custom check.
+    """
+
+    def __init__(self, *kinds: ChangeKind, types: Optional[Iterable[str]] = None,
+                 weeks: Optional[Callable] = None, categories: Optional[Callable] = None,
+                 dates: Optional[Callable] = None, when: Optional[Callable] = None):
+        self.kinds = frozenset(kinds)
+        self.types = frozenset(types) if types is not None else None
+        self.weeks = weeks
+        self.categories = categories
+        self.dates = dates
+        self.when = when
+
+    def matches(self, view, change: DataChange) -> bool:
+        if change.everything:
+            return True
+        if not self.kinds & change.kinds:
+            return False
+        if self.types is not None and not self.types & change.transaction_types:
+            return False
+        if self.weeks is not None and not set(self.weeks(view) or ()) & change.weeks:
+            return False
+        if self.categories is not None and not set(self.categories(view) or ()) & change.categories:
+            return False
+        if self.dates is not None and not change.overlaps(*self.dates(view)):
+            return False
+        if self.when is not None and not self.when(view, change):
+            return False
+        return True
+
+
+def invalidated_panels(view, change: DataChange) -> List[str]:
+    """
+    Names of the view's panel methods (in declaration order) that this change makes stale
+
+    A stale "refresh" panel redraws the whole view, so it is returned on its own.
+    """
+    dependencies: Dict[str, List[Depends]] = getattr(view, "PANEL_DEPENDENCIES", {})
+    stale = []
+    for panel, reasons in dependencies.items():
+        try:
+            if any(reason.matches(view, change) for reason in reasons):
+                stale.append(panel)
+        except Exception as e:
+            print(f"Error checking {type(view).__name__}.{panel} dependencies: {e}")
+            stale.append(panel)  # When in doubt, redraw
+    if "refresh" in stale:
+        return ["refresh"]
+    return stale
+
+
+class ChangeBus:
+    """
+    Delivers DataChange events to subscribers (called right after the commit)
+
+    Usage:
+        from services.change_events import change_bus
+        change_bus.subscribe(self.on_data_changed)
+    """
+
+    def __init__(self):
+        self._subscribers: List[Callable[[DataChange], None]] = []
+
+    def subscribe(self, callback: Callable[[DataChange], None]):
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[DataChange], None]):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def emit(self, change: DataChange):
+        if change.is_empty():
+            return
+        for callback in list(self._subscribers):
+            try:
+                callback(change)
+            except Exception as e:
+                print(f"Error delivering data change: {e}")
+
+
+# Shared by every writer and the main window
+change_bus = ChangeBus()
+
+
+# === Change collection ===
+# Notes what each flush touched in session.info, then emits it once the commit
+# succeeds. Managers tag their session with session.info["change_source"].
+
+_TRANSACTION_FIELDS = ("transaction_type", "week_number", "category", "date", "account_id", "bill_id")
+
+
+def _pending(session) -> DataChange:
+    change = session.info.get("pending_data_change")
+    if change is None:
+        change = DataChange()
+        source = session.info.get("change_source")
+        if source:
+            change.sources.add(source)
+        session.info["pending_data_change"] = change
+    return change
+
+
+def _values(obj, key, include_history: bool) -> list:
+    """Current value, plus the old one when the attribute changed"""
+    if include_history:
+        return [value for value in attributes.get_history(obj, key).sum() if value is not None]
+    value = getattr(obj, key)
+    return [] if value is None else [value]
+
+
+def _record(change: DataChange, obj, include_history: bool):
+    if isinstance(obj, Transaction):
+        values = {key: _values(obj, key, include_history) for key in _TRANSACTION_FIELDS}
+        change.kinds.add(ChangeKind.TRANSACTIONS)
+        change.transaction_types.update(values["transaction_type"])
+        change.weeks.update(values["week_number"])
+        change.categories.update(values["category"])
+        for value in values["date"]:
+            change.add_date(value)
+        if values["account_id"]:
+            change.kinds.add(ChangeKind.ACCOUNTS)
+            change.accounts.update(values["account_id"])
+        if values["bill_id"]:
+            change.kinds.add(ChangeKind.BILLS)
+            change.bills.update(values["bill_id"])
+
+    elif isinstance(obj, AccountHistory):
+        kind = ChangeKind.BILLS if obj.account_type == "bill" else ChangeKind.ACCOUNTS
+        change.kinds.add(kind)
+        (change.bills if kind is ChangeKind.BILLS else change.accounts).add(obj.account_id)
+        for value in _values(obj, "transaction_date", include_history):
+            change.add_date(value)
+
+    elif isinstance(obj, Account):
+        change.kinds.add(ChangeKind.ACCOUNTS)
+        change.accounts.add(obj.id)
+
+    elif isinstance(obj, Bill):
+        change.kinds.add(ChangeKind.BILLS)
+        change.bills.add(obj.id)
+
+    elif isinstance(obj, Week):
+        change.kinds.add(ChangeKind.WEEKS)
+        change.weeks.update(_values(obj, "week_number", include_history))
+
+    elif isinstance(obj, Reimbursement):
+        change.kinds.add(ChangeKind.REIMBURSEMENTS)
+        for value in _values(obj, "date", include_history):
+            change.add_date(value)
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_changes_before_flush(session, flush_context, instances):
+    """Updated and deleted rows - read while their old values can still be loaded"""
+    for obj in session.deleted:
+        _record(_pending(session), obj, include_history=False)
+    for obj in session.dirty:
+        if session.is_modified(obj):
+            _record(_pending(session), obj, include_history=True)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes_after_flush(session, flush_context):
+    """New rows - after the flush so they have ids"""
+    for obj in session.new:
+        _record(_pending(session), obj, include_history=False)
+
+
+_BULK_KINDS = {
+    Transaction: ChangeKind.TRANSACTIONS,
+    Account: ChangeKind.ACCOUNTS,
+    Bill: ChangeKind.BILLS,
+    Week: ChangeKind.WEEKS,
+    Reimbursement: ChangeKind.REIMBURSEMENTS,
+}
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_changes(orm_execute_state):
+    """query(...).update()/delete() don't say which rows - treat the whole table as changed"""
+    if not (orm_execute_state.is_delete or orm_execute_state.is_update or orm_execute_state.is_insert):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None:
+        return
+    change = _pending(orm_execute_state.session)
+    if mapper.class_ is Transaction or mapper.class_ is AccountHistory:
+        change.merge(DataChange.everything_changed())
+    elif mapper.class_ in _BULK_KINDS:
+        change.kinds.add(_BULK_KINDS[mapper.class_])
+
+
+@event.listens_for(Session, "after_commit")
+def _emit_changes_after_commit(session):
+    change = session.info.pop("pending_data_change", None)
+    if change is not None:
+        change_bus.emit(change)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changes_after_rollback(session):
+    session.info.pop("pending_data_change", None)
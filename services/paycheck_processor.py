@@ -74,6 +74,9 @@ class PaycheckProcessor:
     def __init__(self):
         self.transaction_manager = TransactionManager()
         self.db = get_db()
+        # Tag the DataChange events of both sessions (see services/change_events.py)
+        self.transaction_manager.db.info["change_source"] = "paycheck_processor"
+        self.db.info["change_source"] = "paycheck_processor"
         
     def close(self):
         """Close database connections"""
@@ -0,0 +1,168 @@
+"""
+Range Aggregates - date-range spending/income totals and as-of balances for the Scratch Pad
+
+Backs the Scratch Pad's SPENT(category, start, end), INCOME(start, end) and
+BALANCE_AT(account, date) functions. Daily totals per (type, category) come
+from one GROUP BY over the ix_transactions_type_date index and are kept as
+running sums, so any date range is two bisections. Balances come from the
+in-memory balance index. Everything is kept until committed data changes,
+and answers are memoized for that data version.
+"""
+
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select, func, or_, and_
+
+from models import get_db, Transaction, TransactionType
+from models.account_history import AccountHistoryManager
+from models.database import get_data_version
+from services.account_properties import account_properties
+
+
+class _RunningTotals:
+    """Daily totals of one series as parallel arrays: day ordinal and total up to that day"""
+    __slots__ = ("days", "totals")
+
+    def __init__(self):
+        self.days: List[int] = []
+        self.totals: List[float] = []
+
+    def add(self, day: int, amount: float):
+        previous = self.totals[-1] if self.totals else 0.0
+        self.days.append(day)
+        self.totals.append(previous + amount)
+
+    def between(self, start: date, end: date) -> float:
+        """Sum of the days from start to end, inclusive"""
+        last = bisect_right(self.days, end.toordinal())
+        first = bisect_left(self.days, start.toordinal())
+        if last <= first:
+            return 0.0
+        # Rounded to cents so the running-sum subtraction doesn't leave float noise
+        return round(self.totals[last - 1] - (self.totals[first - 1] if first > 0 else 0.0), 2)
+
+
+class RangeAggregates:
+    """
+    Cached date-range totals, reloaded in one query when the data version changes
+
+    Usage:
+        from services.range_aggregates import range_aggregates
+        food = range_aggregates.spent("Food", date(2025, 1, 1), date(2025, 1, 31))
+        paid = range_aggregates.income(date(2025, 1, 1), date(2025, 12, 31))
+        saved = range_aggregates.balance_at("Safety Saving", date(2025, 6, 30))
+
+    Spending follows the spending aggregates: only amounts > 0, and a missing
+    category counts as "Uncategorized". Categories and names are case-insensitive.
+    """
+
+    def __init__(self):
+        self._version = None
+        self._spending: Dict[str, _RunningTotals] = {}  # category.lower() -> totals
+        self._income = _RunningTotals()
+        self._results: Dict[Tuple, Optional[float]] = {}  # (function, *args) -> answer at _version
+        self._lock = threading.Lock()  # Background loaders read it too
+
+    def invalidate(self):
+        """Force a reload on the next lookup"""
+        self._version = None
+
+    def _ensure_loaded(self):
+        version = get_data_version()
+        if self._version == version:
+            return
+
+        transactions = Transaction.__table__
+        category = func.coalesce(func.nullif(transactions.c.category, ""), "Uncategorized")
+        spending = TransactionType.SPENDING.value
+        income = TransactionType.INCOME.value
+
+        db = get_db()
+        try:
+            rows = db.execute(
+                select(
+                    transactions.c.transaction_type,
+                    category,
+                    transactions.c.date,
+                    func.sum(transactions.c.amount)
+                ).where(or_(
+                    and_(transactions.c.transaction_type == spending, transactions.c.amount > 0),
+                    transactions.c.transaction_type == income
+                )).group_by(
+                    transactions.c.transaction_type, category, transactions.c.date
+                ).order_by(transactions.c.date)
+            ).all()
+        finally:
+            db.close()
+
+        spending_totals = {}
+        income_totals = _RunningTotals()
+        daily_income = {}
+        for transaction_type, row_category, row_date, total in rows:
+            day = row_date.toordinal()
+            if transaction_type == income:
+                # Income is grouped by category too - fold those back into one total per day
+                daily_income[day] = daily_income.get(day, 0.0) + total
+            else:
+                series = spending_totals.get(row_category.lower())
+                if series is None:
+                    series = spending_totals[row_category.lower()] = _RunningTotals()
+                if series.days and series.days[-1] == day:
+                    # Categories differing only in case share a series
+                    series.totals[-1] += total
+                else:
+                    series.add(day, total)
+        for day, total in daily_income.items():
+            income_totals.add(day, total)
+
+        self._spending = spending_totals
+        self._income = income_totals
+        self._results = {}
+        self._version = version
+
+    def spent(self, category: str, start: date, end: date) -> float:
+        """Total spending in a category from start to end (inclusive)"""
+        key = ("spent", category.strip().lower(), start, end)
+        with self._lock:
+            self._ensure_loaded()
+            if key not in self._results:
+                series = self._spending.get(key[1])
+                self._results[key] = series.between(start, end) if series else 0.0
+            return self._results[key]
+
+    def income(self, start: date, end: date) -> float:
+        """Total income from start to end (inclusive)"""
+        key = ("income", start, end)
+        with self._lock:
+            self._ensure_loaded()
+            if key not in self._results:
+                self._results[key] = self._income.between(start, end)
+            return self._results[key]
+
+    def balance_at(self, name: str, day: date) -> Optional[float]:
+        """Balance of the account or bill with this name at the end of day, or None if there isn't one"""
+        key = ("balance_at", name.strip().lower(), day)
+        with self._lock:
+            self._ensure_loaded()
+            if key in self._results:
+                return self._results[key]
+
+            entry = account_properties.lookup(name)
+            if entry is None:
+                balance = None
+            else:
+                db = get_db()
+                try:
+                    balance = AccountHistoryManager(db).get_balance_as_of(entry["id"], entry["kind"], day)
+                finally:
+                    db.close()
+
+            self._results[key] = balance
+            return balance
+
+
+# Shared by every Scratch Pad - totals are keyed on the global data version
+range_aggregates = RangeAggregates()
@@ -8,6 +8,8 @@ from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, desc, asc
 
 from models import get_db, Reimbursement, ReimbursementState
+from models.search_index import SearchResult, search
+import services.change_events  # noqa: F401 - registers the change-event session hooks
 
 
 class ReimbursementManager:
@@ -15,6 +17,7 @@ class ReimbursementManager:
 
     def __init__(self):
         self.db = get_db()
+        self.db.info["change_source"] = "reimbursement_manager"  # Tags the DataChange events of this session
 
     def close(self):
         """Close database connection"""
@@ -112,6 +115,22 @@ class ReimbursementManager:
             )
         ).order_by(desc(Reimbursement.date)).all()
 
+    def search_reimbursements(self, query: str, start_date: Optional[date] = None, end_date: Optional[date] = None,
+                              limit: Optional[int] = None) -> SearchResult:
+        """
+        Full-text search over reimbursement notes, locations and categories (FTS5 index)
+
+        Args:
+            query: Free text - every word must match the start of a word ("conf hot" finds "Conference hotel")
+            start_date: Only purchases on/after this date
+            end_date: Only purchases on/before this date
+            limit: Return at most this many ids (the facets still count every match)
+
+        Returns:
+            SearchResult: reimbursement ids best match first, plus per-year/month match counts
+        """
+        return search(self.db, "reimbursements", query, start_date, end_date, limit)
+
     def get_pending_reimbursements(self) -> List[Reimbursement]:
         """Get all pending reimbursements (not yet submitted)"""
         return self.get_reimbursements_by_state(ReimbursementState.PENDING.value)
@@ -0,0 +1,107 @@
+"""
+Transaction Frame - columnar NumPy copy of the transaction snapshot for analytics
+
+Each column is one array (dates as datetime64[D], amounts as float64, types and
+categories as integer codes into a label tuple), so analyses are masks plus
+np.bincount group-bys instead of Python loops over dicts.
+"""
+
+import threading
+from typing import Optional, Tuple
+from datetime import date, timedelta
+import numpy as np
+
+from models import TransactionType
+from services.transaction_snapshot import transaction_snapshots
+
+DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()  # datetime64[D] counts days from here
+
+
+class TransactionFrame:
+    """
+    All transactions of one snapshot as parallel column arrays
+
+    Columns (same length, same row order as the snapshot - newest first):
+        ids                   int64
+        dates                 datetime64[D]
+        amounts               float64
+        type_codes            int8   -> type_labels[code]
+        category_codes        int32  -> category_labels[code] ("Uncategorized" when missing)
+        week_numbers          int32
+        include_in_analytics  bool   (NULL counts as False)
+        descriptions          object (kept for get_spending_data)
+    """
+
+    def __init__(self, snapshot):
+        rows = snapshot.transactions
+        self.version = snapshot.version
+
+        self.ids = np.fromiter((t.id for t in rows), dtype=np.int64, count=len(rows))
+        self.dates = (
+            np.fromiter((t.date.toordinal() for t in rows), dtype=np.int64, count=len(rows)) - _EPOCH_ORDINAL
+        ).astype('datetime64[D]')
+        self.amounts = np.fromiter((t.amount for t in rows), dtype=np.float64, count=len(rows))
+        self.week_numbers = np.fromiter((t.week_number or 0 for t in rows), dtype=np.int32, count=len(rows))
+        self.include_in_analytics = np.fromiter((bool(t.include_in_analytics) for t in rows), dtype=bool, count=len(rows))
+        self.descriptions = np.array([t.description or '' for t in rows], dtype=object)
+
+        self.type_labels, self.type_codes = self._encode([t.transaction_type for t in rows], np.int8)
+        self.category_labels, self.category_codes = self._encode(
+            [t.category or 'Uncategorized' for t in rows], np.int32
+        )
+
+    def __len__(self):
+        return len(self.ids)
+
+    @staticmethod
+    def _encode(values, dtype) -> Tuple[tuple, np.ndarray]:
+        """Dictionary-encode a list of strings into (labels, codes)"""
+        labels = {}
+        codes = np.fromiter((labels.setdefault(value, len(labels)) for value in values), dtype=dtype, count=len(values))
+        return tuple(labels), codes
+
+    def type_code(self, transaction_type: str) -> int:
+        """Code for a transaction type, or -1 if no row has it"""
+        try:
+            return self.type_labels.index(transaction_type)
+        except ValueError:
+            return -1
+
+    @property
+    def weekdays(self) -> np.ndarray:
+        """Day of week per row (Monday = 0), like date.weekday()"""
+        # 1970-01-01 (day 0) was a Thursday
+        return (self.dates.astype(np.int64) + 3) % 7
+
+    def spending_mask(self, include_analytics_only: bool = True, days_back: int = 0) -> np.ndarray:
+        """
+        Rows matching get_spending_transactions(): spending with amount > 0,
+        optionally analytics-only and within the last days_back days
+        """
+        mask = (self.type_codes == self.type_code(TransactionType.SPENDING.value)) & (self.amounts > 0)
+        if include_analytics_only:
+            mask &= self.include_in_analytics
+        if days_back > 0:
+            cutoff = np.datetime64(date.today() - timedelta(days=days_back), 'D')
+            mask &= self.dates >= cutoff
+        return mask
+
+    def sum_by(self, codes: np.ndarray, mask: np.ndarray, size: int) -> np.ndarray:
+        """Sum of amounts per code for the masked rows (index = code)"""
+        return np.bincount(codes[mask], weights=self.amounts[mask], minlength=size)
+
+
+_cached_frame: Optional[TransactionFrame] = None
+_frame_lock = threading.Lock()
+
+
+def get_transaction_frame() -> TransactionFrame:
+    """Get the frame for the current transaction snapshot (rebuilt only when data changes)"""
+    global _cached_frame
+    snapshot = transaction_snapshots.get()
+    with _frame_lock:
+        if _cached_frame is None or _cached_frame.version != snapshot.version:
+            _cached_frame = TransactionFrame(snapshot)
+        return _cached_frame
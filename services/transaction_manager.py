@@ -4,22 +4,113 @@ Transaction Manager - CRUD operations for all database entities
 
 from typing import List, Optional, Dict, Any
 from datetime import date, datetime, timedelta
+from contextlib import contextmanager
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, desc, asc
 
-from models import get_db, Account, Bill, Week, Transaction, TransactionType, AccountHistoryManager
+from models import get_db, Account, Bill, Week, Transaction, TransactionType, AccountHistoryManager, SpendingAggregate
+from models.account_history import balance_index
+from models.spending_aggregates import query_spending_totals, rebuild_spending_aggregates, ensure_spending_aggregates
+from models.search_index import SearchResult, search
+from services.transaction_snapshot import TransactionSnapshot, transaction_snapshots
+import services.change_events  # noqa: F401 - registers the change-event session hooks
 
 
 class TransactionManager:
     def __init__(self):
         self.db = get_db()
+        self.db.info["change_source"] = "transaction_manager"  # Tags the DataChange events of this session
         self.history_manager = AccountHistoryManager(self.db)
         from models.database import DATABASE_URL
         self._disable_auto_rollover = False  # Flag to disable automatic rollover recalculation
+        self._batch_depth = 0  # > 0 while inside batch()
+        self._batch_weeks = set()  # Weeks whose pay period needs rollover recalculation at batch exit
     
     def close(self):
         """Close database connection"""
         self.db.close()
+
+    @contextmanager
+    def batch(self):
+        """
+        Group many add/update/delete_transaction calls into one unit of work
+
+        Usage:
+            with transaction_manager.batch():
+                for trans_id, updates in edits:
+                    transaction_manager.update_transaction(trans_id, updates)
+
+        Inside the block the per-call commits, AccountHistory running-total propagation
+        and rollover recalculations are deferred. On exit each touched account is
+        recalculated once from its earliest touched date, everything is committed once,
+        then each touched pay period gets one rollover recalculation.
+
+        Rollovers run through a separate PaycheckProcessor session, so they happen after
+        the commit - SQLite won't let another session write while this one holds the batch.
+        Other sessions must not write inside the block for the same reason.
+
+        If the block raises, the batch is rolled back and nothing is recalculated.
+        """
+        if self._batch_depth:
+            # Nested batch - the outermost block does the work
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+            return
+
+        self._batch_depth = 1
+        try:
+            with self.history_manager.deferred_recalculation():
+                yield self
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            self._batch_weeks.clear()
+            raise
+        finally:
+            self._batch_depth = 0
+
+        weeks, self._batch_weeks = self._batch_weeks, set()
+        self._recalculate_rollovers_for_weeks(weeks)
+
+    @contextmanager
+    def savepoint(self):
+        """
+        Inside batch(), undo just this block's writes if it raises, keeping the rest of the batch
+
+        A failed flush would otherwise leave the batch's session unusable, failing every
+        later call and the final commit. Outside a batch each call commits on its own,
+        so this does nothing.
+
+        Usage:
+            with transaction_manager.batch():
+                for trans_id, updates in edits:
+                    try:
+                        with transaction_manager.savepoint():
+                            transaction_manager.update_transaction(trans_id, updates)
+                    except Exception as e:
+                        report(trans_id, e)
+        """
+        if not self._batch_depth:
+            yield self
+            return
+
+        try:
+            with self.db.begin_nested():  # Rolled back on its own if the block raises
+                yield self
+        except Exception:
+            # Balances indexed from the undone writes no longer match the database
+            balance_index.invalidate()
+            raise
+
+    def _commit(self):
+        """Commit now, or just flush (to get ids) when inside batch()"""
+        if self._batch_depth:
+            self.db.flush()
+        else:
+            self.db.commit()
     
     # Account operations
     def get_all_accounts(self) -> List[Account]:
@@ -218,7 +309,7 @@ class TransactionManager:
                     transaction_date=transaction.date
                 )
 
-        self.db.commit()
+        self._commit()
         self.db.refresh(transaction)
 
         # Trigger rollover recalculation for spending and saving transactions
@@ -243,11 +334,25 @@ class TransactionManager:
 
     def trigger_rollover_recalculation(self, week_number: int):
         """Trigger rollover recalculation when transactions are added to a week"""
+        if self._batch_depth:
+            self._batch_weeks.add(week_number)  # Recalculated once when the batch exits
+            return
+
+        self._recalculate_rollovers_for_weeks([week_number])
+
+    def _recalculate_rollovers_for_weeks(self, week_numbers):
+        """Recalculate rollovers once per bi-weekly pay period covering the given weeks"""
+        # Week 1 of a period is odd, Week 2 is even - both map to the same period
+        periods = sorted({week if week % 2 == 1 else week - 1 for week in week_numbers})
+        if not periods:
+            return
+
         try:
             from services.paycheck_processor import PaycheckProcessor
             processor = PaycheckProcessor()
             # Use the new dynamic recalculation system
-            processor.recalculate_period_rollovers(week_number)
+            for week_number in periods:
+                processor.recalculate_period_rollovers(week_number)
             processor.close()
         except Exception as e:
             print(f"Error triggering rollover recalculation: {e}")
@@ -256,6 +361,15 @@ class TransactionManager:
         """Get all transactions"""
         return self.db.query(Transaction).order_by(desc(Transaction.date)).all()
 
+    def get_transaction_snapshot(self) -> TransactionSnapshot:
+        """
+        Get the shared read-only snapshot of all transactions (plain tuples, newest first)
+
+        Loaded once per data version and shared by every view - use this for
+        display code and get_all_transactions() when the objects will be edited.
+        """
+        return transaction_snapshots.get()
+
     def get_transaction_by_id(self, transaction_id: int) -> Optional[Transaction]:
         """
         Get transaction by ID
@@ -311,6 +425,22 @@ class TransactionManager:
             )
         ).order_by(desc(Transaction.date)).all()
     
+    def search_transactions(self, query: str, start_date: Optional[date] = None, end_date: Optional[date] = None,
+                            limit: Optional[int] = None) -> SearchResult:
+        """
+        Full-text search over transaction descriptions and categories (FTS5 index)
+
+        Args:
+            query: Free text - every word must match the start of a word ("cof sta" finds "Coffee at Starbucks")
+            start_date: Only transactions on/after this date
+            end_date: Only transactions on/before this date
+            limit: Return at most this many ids (the facets still count every match)
+
+        Returns:
+            SearchResult: transaction ids best match first, plus per-year/month match counts
+        """
+        return search(self.db, "transactions", query, start_date, end_date, limit)
+
     def get_transactions_by_account(self, account_id: int, limit: Optional[int] = None) -> List[Transaction]:
         """Get transactions for a specific account"""
         query = self.db.query(Transaction).filter(Transaction.account_id == account_id).order_by(Transaction.date.desc())
@@ -332,7 +462,7 @@ class TransactionManager:
                 self.history_manager.delete_transaction_change(transaction_id)
 
             self.db.delete(transaction)
-            self.db.commit()
+            self._commit()
 
             # Trigger rollover recalculation if this was a spending/saving transaction
             if is_spending_or_saving and not is_rollover and not self._disable_auto_rollover:
@@ -400,7 +530,7 @@ class TransactionManager:
                     new_date=new_date
                 )
 
-        self.db.commit()
+        self._commit()
         self.db.refresh(transaction)
 
         # Trigger rollover recalculation if this is a spending/saving transaction
@@ -417,46 +547,26 @@ class TransactionManager:
     # Analytics and summary methods
     def get_spending_by_category(self, include_analytics_only: bool = True) -> Dict[str, float]:
         """Get total spending by category (excludes placeholder transactions)"""
-        query = self.db.query(Transaction).filter(
-            and_(
-                Transaction.transaction_type == TransactionType.SPENDING.value,
-                Transaction.amount > 0  # Exclude $0 placeholder transactions
-            )
-        )
-        
-        if include_analytics_only:
-            query = query.filter(Transaction.include_in_analytics == True)
-        
-        transactions = query.all()
-        
-        category_totals = {}
-        for transaction in transactions:
-            category = transaction.category or "Uncategorized"
-            category_totals[category] = category_totals.get(category, 0) + transaction.amount
-            
-        return category_totals
-    
+        return query_spending_totals(self.db, "category", include_analytics_only)
+
     def get_spending_by_week(self, include_analytics_only: bool = True) -> Dict[int, float]:
         """Get total spending by week (excludes placeholder transactions)"""
-        query = self.db.query(Transaction).filter(
-            and_(
-                Transaction.transaction_type == TransactionType.SPENDING.value,
-                Transaction.amount > 0  # Exclude $0 placeholder transactions
-            )
-        )
-        
+        return query_spending_totals(self.db, "week_number", include_analytics_only)
+
+    def get_spending_aggregates(self, include_analytics_only: bool = True) -> List[SpendingAggregate]:
+        """Get per week/category spending rows with total, count, min and max"""
+        if ensure_spending_aggregates(self.db.connection()):
+            self.db.commit()
+        query = self.db.query(SpendingAggregate)
         if include_analytics_only:
-            query = query.filter(Transaction.include_in_analytics == True)
-        
-        transactions = query.all()
-        
-        week_totals = {}
-        for transaction in transactions:
-            week_num = transaction.week_number
-            week_totals[week_num] = week_totals.get(week_num, 0) + transaction.amount
-            
-        return week_totals
-    
+            query = query.filter(SpendingAggregate.include_in_analytics == True)
+        return query.order_by(SpendingAggregate.week_number, SpendingAggregate.category).all()
+
+    def rebuild_spending_aggregates(self):
+        """Recompute the spending aggregate table from scratch (recovery)"""
+        rebuild_spending_aggregates(self.db.connection())
+        self.db.commit()
+
     def get_income_vs_spending_summary(self) -> Dict[str, float]:
         """Get summary of income vs spending"""
         income_total = sum(t.amount for t in self.get_transactions_by_type("income"))
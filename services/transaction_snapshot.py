@@ -0,0 +1,142 @@
+"""
+Transaction Snapshot - one shared, read-only copy of the transactions table per data version
+
+Views used to call get_all_transactions() in many places per refresh, each one
+loading every row as a tracked ORM object. The snapshot loads the table once
+as plain tuples and hands the same copy to every reader until a commit bumps
+the data version.
+"""
+
+import threading
+from typing import NamedTuple, Optional, Tuple
+from datetime import date
+from sqlalchemy import select, desc
+
+from models import get_db, Transaction, TransactionType
+from models.database import get_data_version
+
+
+class TransactionRow(NamedTuple):
+    """
+    Read-only transaction row - same attribute names and helper properties as Transaction
+
+    Relationships (bill, account, week) are not loaded; look names up by bill_id /
+    account_id instead. Use TransactionManager for anything that writes.
+    """
+    id: int
+    transaction_type: str
+    week_number: int
+    amount: float
+    date: date
+    description: Optional[str]
+    category: Optional[str]
+    include_in_analytics: Optional[bool]
+    bill_id: Optional[int]
+    bill_type: Optional[str]
+    account_id: Optional[int]
+    account_saved_to: Optional[str]
+    transfer_group_id: Optional[str]
+
+    @property
+    def is_spending(self):
+        return self.transaction_type == TransactionType.SPENDING.value
+
+    @property
+    def is_bill_pay(self):
+        return self.transaction_type == TransactionType.BILL_PAY.value
+
+    @property
+    def is_saving(self):
+        return self.transaction_type == TransactionType.SAVING.value
+
+    @property
+    def is_income(self):
+        return self.transaction_type == TransactionType.INCOME.value
+
+    @property
+    def is_rollover(self):
+        return self.transaction_type == TransactionType.ROLLOVER.value
+
+    @property
+    def affects_account(self):
+        return self.bill_id is not None or self.account_id is not None
+
+    @property
+    def account_type(self):
+        if self.bill_id:
+            return "bill"
+        elif self.account_id:
+            return "savings"
+        return None
+
+    @property
+    def affected_account_id(self):
+        if self.bill_id:
+            return self.bill_id
+        elif self.account_id:
+            return self.account_id
+        return None
+
+    @property
+    def is_paired_transfer(self):
+        return self.transfer_group_id is not None
+
+
+_ROW_COLUMNS = [getattr(Transaction, field) for field in TransactionRow._fields]
+
+
+class TransactionSnapshot:
+    """All transactions at one data version (newest first, like get_all_transactions)"""
+
+    def __init__(self, version: int, transactions: Tuple[TransactionRow, ...]):
+        self.version = version
+        self.transactions = transactions
+        self._spending = {}
+
+    def spending(self, include_analytics_only: bool = False) -> Tuple[TransactionRow, ...]:
+        """Spending rows excluding $0 placeholders (same filter as get_spending_transactions)"""
+        if include_analytics_only not in self._spending:
+            self._spending[include_analytics_only] = tuple(
+                t for t in self.transactions
+                if t.is_spending and t.amount > 0
+                and (not include_analytics_only or t.include_in_analytics == True)
+            )
+        return self._spending[include_analytics_only]
+
+
+class TransactionSnapshotService:
+    """
+    Hands out the current TransactionSnapshot, reloading only when the data version changes
+
+    Usage:
+        from services.transaction_snapshot import transaction_snapshots
+        for t in transaction_snapshots.get().transactions:
+            ...
+    """
+
+    def __init__(self):
+        self._snapshot: Optional[TransactionSnapshot] = None
+        self._lock = threading.Lock()  # Background loaders read it too
+
+    def invalidate(self):
+        """Force a reload on the next get()"""
+        self._snapshot = None
+
+    def get(self) -> TransactionSnapshot:
+        with self._lock:
+            version = get_data_version()
+            if self._snapshot is not None and self._snapshot.version == version:
+                return self._snapshot
+
+            db = get_db()
+            try:
+                rows = db.execute(select(*_ROW_COLUMNS).order_by(desc(Transaction.date))).all()
+            finally:
+                db.close()
+
+            self._snapshot = TransactionSnapshot(version, tuple(TransactionRow._make(row) for row in rows))
+            return self._snapshot
+
+
+# Shared by every view - the snapshot is keyed on the global data version
+transaction_snapshots = TransactionSnapshotService()
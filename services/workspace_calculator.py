@@ -2,20 +2,26 @@
 Workspace Calculator - Formula parsing and evaluation for Scratch Pad tab
 
 Supports:
-- Basic math: +, -, *, /
+- Basic math: +, -, *, /, % (remainder), ** (power)
 - Functions: SUM(range), AVERAGE(range)
 - Cell references: A1, B5, etc.
 - Cell ranges: A1:A10
 - External variables: GET(variable_name)
+- Live totals: SPENT(category, start, end), INCOME(start, end), BALANCE_AT(account, date)
 - Date arithmetic: 11/25/2025 - CURRENT_DATE
 - Current date: CURRENT_DATE
 
 Formula must start with = to be evaluated, otherwise treated as literal text/number/date.
+
+Formulas are parsed once per cell (compile_formula) into a tree of closures and
+evaluated with typed values: numbers, dates and text. date - date is a number
+of days, date + number is a date, and anything else that mixes types is an
+error. Nothing is ever passed to eval(), so cell text can't run code.
 """
 
 import re
-from datetime import datetime, date
-from typing import Dict, Any, Set, List, Tuple, Optional
+from datetime import datetime, date, timedelta
+from typing import Dict, Any, Callable, FrozenSet, NamedTuple, Set, List, Tuple, Optional
 
 
 class CircularReferenceError(Exception):
@@ -23,13 +29,389 @@ class CircularReferenceError(Exception):
     pass
 
 
+class FormulaError(Exception):
+    """Raised while compiling or evaluating a formula; becomes the cell's ("ERROR", message)"""
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+
+class CompiledFormula(NamedTuple):
+    """A cell's formula parsed once into a tree of closures"""
+    formula: str  # Source text (the cache key)
+    references: FrozenSet[str]  # Every cell the formula reads, ranges expanded
+    evaluate: Callable[[Set[str]], Any]  # visited -> value, raises FormulaError
+    volatile: bool = False  # Reads live data or today's date, so its value can change with no cell edited
+
+
+SYNTAX_ERROR = "Invalid formula syntax"
+TYPE_ERROR = "Type mismatch - check if you're mixing dates/numbers/strings incorrectly"
+
+
+def is_error(value) -> bool:
+    """True for the ("ERROR", message) tuples cells hold when evaluation fails"""
+    return isinstance(value, tuple) and len(value) == 2 and value[0] == "ERROR"
+
+
+_DATE_LITERAL = re.compile(r'\s*(\d{1,2}/\d{1,2}/\d{4})(?![\d.])')
+_TOKEN_PATTERN = re.compile(r"""
+    \s*(?:
+        (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+      | (?P<string>"[^"]*"|'[^']*')
+      | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+      | (?P<op>\*\*|[-+*/%(),:])
+    )""", re.VERBOSE)
+_GET_ARGUMENT = re.compile(r'\s*\(([^)]*)\)')
+_LABEL_ARGUMENT = re.compile(r'\s*\(([^,)]*)')
+
+# Functions over app data -> their parameters; "category" and "account" are free-text labels
+RANGE_FUNCTIONS = {
+    "SPENT": ("category", "start", "end"),
+    "INCOME": ("start", "end"),
+    "BALANCE_AT": ("account", "date"),
+}
+_LABEL_FUNCTIONS = {name for name, parameters in RANGE_FUNCTIONS.items() if parameters[0] in ("category", "account")}
+
+
+def tokenize_formula(expr: str) -> List[Tuple[str, Any]]:
+    """Split the text after = into (kind, value) tokens, ending with ("end", None)
+
+    GET(...) becomes a single ("get", argument) token because its argument is
+    free text (account names contain spaces) rather than an expression. For
+    the same reason the first argument of SPENT and BALANCE_AT becomes a
+    ("label", text) token.
+    """
+    tokens = []
+    pos = 0
+    expr = expr.rstrip()
+    while pos < len(expr):
+        date_match = _DATE_LITERAL.match(expr, pos)
+        if date_match:
+            try:
+                tokens.append(("date", datetime.strptime(date_match.group(1), "%m/%d/%Y").date()))
+                pos = date_match.end()
+                continue
+            except ValueError:
+                pass  # Not a real date (e.g. 13/45/2025) - read it as division like any other numbers
+
+        match = _TOKEN_PATTERN.match(expr, pos)
+        if not match:
+            raise FormulaError(SYNTAX_ERROR)
+        kind = match.lastgroup
+        text = match.group(kind)
+
+        if kind == "number":
+            tokens.append(("number", float(text) if any(c in text for c in ".eE") else int(text)))
+        elif kind == "string":
+            tokens.append(("string", text[1:-1]))
+        elif kind == "name" and text.upper() == "GET":
+            argument = _GET_ARGUMENT.match(expr, match.end())
+            if not argument:
+                raise FormulaError(SYNTAX_ERROR)
+            tokens.append(("get", argument.group(1).strip().strip('"\'')))
+            pos = argument.end()
+            continue
+        elif kind == "name" and text.upper() in _LABEL_FUNCTIONS and _LABEL_ARGUMENT.match(expr, match.end()):
+            argument = _LABEL_ARGUMENT.match(expr, match.end())
+            tokens.extend([("name", text), ("op", "("), ("label", argument.group(1).strip())])
+            pos = argument.end()
+            continue
+        else:
+            tokens.append((kind, text))
+        pos = match.end()
+
+    tokens.append(("end", None))
+    return tokens
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float))
+
+
+def _add(left, right):
+    if _is_number(left) and _is_number(right):
+        return left + right
+    if isinstance(left, date) and _is_number(right):
+        return left + timedelta(days=right)
+    if _is_number(left) and isinstance(right, date):
+        return right + timedelta(days=left)
+    if isinstance(left, str) and isinstance(right, str):
+        return left + right
+    raise FormulaError(TYPE_ERROR)
+
+
+def _subtract(left, right):
+    if _is_number(left) and _is_number(right):
+        return left - right
+    if isinstance(left, date) and _is_number(right):
+        return left - timedelta(days=right)
+    if isinstance(left, date) and isinstance(right, date):
+        return (left - right).days
+    raise FormulaError(TYPE_ERROR)
+
+
+def _multiply(left, right):
+    if _is_number(left) and _is_number(right):
+        return left * right
+    raise FormulaError(TYPE_ERROR)
+
+
+def _divide(left, right):
+    if _is_number(left) and _is_number(right):
+        return left / right
+    raise FormulaError(TYPE_ERROR)
+
+
+def _remainder(left, right):
+    if _is_number(left) and _is_number(right):
+        return left % right
+    raise FormulaError(TYPE_ERROR)
+
+
+def _power(left, right):
+    if _is_number(left) and _is_number(right):
+        return left ** right
+    raise FormulaError(TYPE_ERROR)
+
+
+_BINARY_OPERATORS = {"+": _add, "-": _subtract, "*": _multiply, "/": _divide, "%": _remainder, "**": _power}
+
+
+class _FormulaParser:
+    """Recursive-descent parser from tokens to closures over the calculator
+
+    expression := term (("+" | "-") term)*
+    term       := unary (("*" | "/" | "%") unary)*
+    unary      := ("+" | "-") unary | power
+    power      := primary ("**" unary)?
+    primary    := number | date | string | label | GET(...) | "(" expression ")"
+                | function "(" arguments ")" | cell | name
+
+    Precedence follows Python, as the old eval() path did: -2**2 is -4 and
+    2**3**2 is 2**9.
+
+    Each rule returns a function of the evaluation's visited set, so
+    evaluating a formula is plain Python calls with no parsing left to do.
+    Every cell the formula reads is added to references as it's parsed.
+    """
+
+    def __init__(self, calculator, tokens: List[Tuple[str, Any]], references: Set[str]):
+        self.calculator = calculator
+        self.tokens = tokens
+        self.pos = 0
+        self.references = references
+        self.volatile = False  # Set when the formula uses GET, SPENT, INCOME, BALANCE_AT or CURRENT_DATE
+
+    def peek(self) -> Tuple[str, Any]:
+        return self.tokens[self.pos]
+
+    def advance(self) -> Tuple[str, Any]:
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def expect(self, op: str):
+        if self.advance() != ("op", op):
+            raise FormulaError(SYNTAX_ERROR)
+
+    def parse(self) -> Callable:
+        # A formula that is just GET(...) may return text or dates as-is
+        if len(self.tokens) == 2 and self.tokens[0][0] == "get":
+            return self.external(self.tokens[0][1], in_calculation=False)
+
+        node = self.expression()
+        if self.peek()[0] != "end":
+            raise FormulaError(SYNTAX_ERROR)
+        return node
+
+    def expression(self) -> Callable:
+        node = self.term()
+        while self.peek() in (("op", "+"), ("op", "-")):
+            node = self.binary(node, _BINARY_OPERATORS[self.advance()[1]], self.term())
+        return node
+
+    def term(self) -> Callable:
+        node = self.unary()
+        while self.peek() in (("op", "*"), ("op", "/"), ("op", "%")):
+            node = self.binary(node, _BINARY_OPERATORS[self.advance()[1]], self.unary())
+        return node
+
+    def unary(self) -> Callable:
+        if self.peek() == ("op", "-"):
+            self.advance()
+            operand = self.unary()
+
+            def negate(visited):
+                value = operand(visited)
+                if not _is_number(value):
+                    raise FormulaError(TYPE_ERROR)
+                return -value
+            return negate
+        if self.peek() == ("op", "+"):
+            self.advance()
+            return self.unary()
+        return self.power()
+
+    def power(self) -> Callable:
+        node = self.primary()
+        if self.peek() == ("op", "**"):
+            self.advance()
+            node = self.binary(node, _power, self.unary())  # Right-associative, and 2**-1 is allowed
+        return node
+
+    def primary(self) -> Callable:
+        kind, value = self.advance()
+
+        if kind in ("number", "date", "string"):
+            return lambda visited: value
+        if kind == "get":
+            return self.external(value, in_calculation=True)
+        if kind == "label":
+            return self.label(value)
+        if (kind, value) == ("op", "("):
+            node = self.expression()
+            self.expect(")")
+            return node
+        if kind != "name":
+            raise FormulaError(SYNTAX_ERROR)
+
+        name = value.upper()
+        if name == "CURRENT_DATE":
+            # Both CURRENT_DATE and CURRENT_DATE()
+            if self.peek() == ("op", "("):
+                self.advance()
+                self.expect(")")
+            self.volatile = True
+            return lambda visited: datetime.now().date()
+        if self.peek() == ("op", "(") and name in ("SUM", "AVERAGE"):
+            self.advance()
+            return self.aggregate(name, self.arguments())
+        if self.peek() == ("op", "(") and name in RANGE_FUNCTIONS:
+            self.advance()
+            return self.range_function(name, self.call_arguments())
+
+        if self.calculator.parse_cell_reference(name) is None:
+            # Unknown function or variable, or a cell outside the grid
+            raise FormulaError(f"Cell or variable '{value}' not found")
+        return self.cell(name)
+
+    def cell(self, name: str) -> Callable:
+        self.references.add(name)
+        reference_value = self.calculator.reference_value
+
+        def cell(visited):
+            cell_value = reference_value(name, visited)
+            if is_error(cell_value):
+                raise FormulaError(cell_value[1])
+            return cell_value
+        return cell
+
+    def arguments(self) -> List[Any]:
+        """Arguments of SUM/AVERAGE: each a list of cells (range or single cell) or an expression"""
+        arguments = []
+        while True:
+            arguments.append(self.argument())
+            if self.peek() == ("op", ","):
+                self.advance()
+                continue
+            self.expect(")")
+            return arguments
+
+    def argument(self) -> Any:
+        kind, value = self.peek()
+        following = self.tokens[self.pos + 1]
+        if kind == "name" and self.calculator.parse_cell_reference(value.upper()) is not None:
+            if following == ("op", ":"):
+                start = value.upper()
+                self.pos += 2
+                end_kind, end = self.advance()
+                if end_kind != "name":
+                    raise FormulaError(SYNTAX_ERROR)
+                cells = self.calculator.parse_range(f"{start}:{end.upper()}")
+                self.references.update(cells)
+                return cells
+            if following in (("op", ","), ("op", ")")):
+                self.pos += 1
+                self.references.add(value.upper())
+                return [value.upper()]
+        return self.expression()
+
+    def label(self, text: str) -> Callable:
+        """A category/account argument: a cell holding the name, or the name itself (quotes optional)"""
+        if not text:
+            raise FormulaError(SYNTAX_ERROR)
+        if re.match(r'^[A-Za-z]+\d+$', text) and self.calculator.parse_cell_reference(text.upper()):
+            return self.cell(text.upper())
+        name = text.strip('"\'')
+        return lambda visited: name
+
+    def call_arguments(self) -> List[Callable]:
+        """Comma-separated expressions up to the closing parenthesis"""
+        arguments = [self.expression()]
+        while self.peek() == ("op", ","):
+            self.advance()
+            arguments.append(self.expression())
+        self.expect(")")
+        return arguments
+
+    def range_function(self, name: str, arguments: List[Callable]) -> Callable:
+        parameters = RANGE_FUNCTIONS[name]
+        if len(arguments) != len(parameters):
+            raise FormulaError(f"{name} requires format: {name}({', '.join(parameters)})")
+        self.volatile = True
+        range_value = self.calculator.range_value
+        return lambda visited: range_value(name, [argument(visited) for argument in arguments])
+
+    def aggregate(self, name: str, arguments: List[Any]) -> Callable:
+        """SUM / AVERAGE over ranges, cells and expressions - non-numeric cells are skipped"""
+        reference_value = self.calculator.reference_value
+
+        def collect(visited):
+            values = []
+            for argument in arguments:
+                if isinstance(argument, list):
+                    for cell_ref in argument:
+                        cell_value = reference_value(cell_ref, visited)
+                        if _is_number(cell_value):
+                            values.append(cell_value)
+                else:
+                    value = argument(visited)
+                    if not _is_number(value):
+                        raise FormulaError(TYPE_ERROR)
+                    values.append(value)
+            return values
+
+        if name == "SUM":
+            return lambda visited: sum(collect(visited))
+
+        def average(visited):
+            values = collect(visited)
+            return sum(values) / len(values) if values else 0
+        return average
+
+    def binary(self, left: Callable, operator: Callable, right: Callable) -> Callable:
+        return lambda visited: operator(left(visited), right(visited))
+
+    def external(self, var_name: str, in_calculation: bool) -> Callable:
+        self.volatile = True
+        external_value = self.calculator.external_value
+        return lambda visited: external_value(var_name, in_calculation)
+
+
 class WorkspaceCalculator:
     """Handles formula parsing, evaluation, and dependency tracking"""
 
+    # Sheet size: rows 1-10000, columns A-ZZ
+    MAX_ROWS = 10000
+    MAX_COLS = 702
+
     def __init__(self, transaction_manager=None):
         self.transaction_manager = transaction_manager
         self.cells = {}  # {cell_ref: {"formula": str, "value": Any, "type": str, "format": str}}
         self.dependencies = {}  # {cell_ref: set of cells this depends on}
+        self.dependents = {}  # {cell_ref: set of cells that depend on it} - the reverse graph
+        self.compiled_formulas = {}  # {cell_ref: CompiledFormula}
 
     def parse_cell_reference(self, ref: str) -> Optional[Tuple[int, int]]:
         """Convert A1 notation to (row, col) tuple. Returns None if invalid."""
@@ -39,15 +421,16 @@ class WorkspaceCalculator:
 
         col_str, row_str = match.groups()
 
-        # Convert column letters to number (A=0, B=1, ..., Z=25)
+        # Convert column letters to number (A=0, ..., Z=25, AA=26, ..., ZZ=701)
         col = 0
         for char in col_str:
-            col = col * 26 + (ord(char) - ord('A'))
+            col = col * 26 + (ord(char) - ord('A') + 1)
+        col -= 1
 
         row = int(row_str) - 1  # Convert to 0-indexed
 
-        # Validate bounds (A-Z = 0-25, rows 1-50 = 0-49)
-        if col > 25 or row > 49 or row < 0:
+        # Validate bounds
+        if col >= self.MAX_COLS or row >= self.MAX_ROWS or row < 0:
             return None
 
         return (row, col)
@@ -103,110 +486,90 @@ class WorkspaceCalculator:
         Properties:
             Accounts: balance, goal, auto_save
             Bills: balance, goal, auto_save, typical
+
+        Answered from the shared account_properties snapshot, so only the
+        first GET after a commit touches the database.
         """
         if not self.transaction_manager:
             return None
 
         try:
-            from models import get_db, Account, Bill, Week
-            db = get_db()
-
             # Special case: CURRENT_DATE (no comma)
             if var_name.strip().upper() == "CURRENT_DATE":
-                db.close()
                 return (datetime.now().date() - date(1970, 1, 1)).days
 
             # Parse the variable name - expect "account_name, property" format
             if ',' not in var_name:
-                db.close()
                 return None
 
             parts = [p.strip() for p in var_name.split(',', 1)]
             if len(parts) != 2:
-                db.close()
                 return None
 
             account_name, property_name = parts
-            account_name_lower = account_name.lower()
             property_lower = property_name.lower().replace('_', ' ')
 
-            # Try to find matching account (savings)
-            accounts = db.query(Account).all()
-            for account in accounts:
-                if account.name.lower() == account_name_lower:
-
-                    # Account balance
-                    if property_lower == "balance":
-                        balance = account.get_current_balance()
-                        db.close()
-                        return float(balance) if balance else 0.0
-
-                    # Account goal (field: goal_amount)
-                    elif property_lower in ["goal", "goal amount", "goal_amount"]:
-                        goal = account.goal_amount if account.goal_amount else 0
-                        db.close()
-                        return float(goal)
-
-                    # Account auto-save (field: auto_save_amount)
-                    elif property_lower in ["auto save", "auto_save", "auto save amount", "auto_save_amount"]:
-                        auto_save = account.auto_save_amount if account.auto_save_amount else 0
-                        db.close()
-                        return float(auto_save)
-
-                    else:
-                        valid_props = "balance, goal, auto_save"
-                        db.close()
-                        return ("ERROR", f"Property '{property_name}' not valid for account '{account.name}'. Valid properties: {valid_props}")
-
-            # Try to find matching bill
-            bills = db.query(Bill).all()
-            for bill in bills:
-                if bill.name.lower() == account_name_lower:
-
-                    # Bill balance
-                    if property_lower == "balance":
-                        balance = bill.get_current_balance()
-                        db.close()
-                        return float(balance) if balance else 0.0
-
-                    # Bill goal (field: amount_to_save)
-                    elif property_lower in ["goal", "auto save", "auto_save", "amount to save", "amount_to_save"]:
-                        goal = bill.amount_to_save if bill.amount_to_save else 0
-                        db.close()
-                        return float(goal)
-
-                    # Bill typical amount (field: typical_amount)
-                    elif property_lower in ["typical", "typical amount", "typical_amount", "amount"]:
-                        typical = bill.typical_amount if bill.typical_amount else 0
-                        db.close()
-                        return float(typical)
-
-                    # Bill payment frequency
-                    elif property_lower in ["frequency", "payment frequency", "payment_frequency"]:
-                        db.close()
-                        return bill.payment_frequency if bill.payment_frequency else ""
-
-                    # Bill last payment date
-                    elif property_lower in ["last payment", "last payment date", "last_payment_date"]:
-                        db.close()
-                        return bill.last_payment_date if bill.last_payment_date else None
-
-                    # Bill type
-                    elif property_lower in ["type", "bill type", "bill_type"]:
-                        db.close()
-                        return bill.bill_type if bill.bill_type else ""
-
-                    # Bill is_variable
-                    elif property_lower in ["variable", "is variable", "is_variable"]:
-                        db.close()
-                        return "Yes" if bill.is_variable else "No"
-
-                    else:
-                        valid_props = "balance, amount, frequency, type, auto_save, variable"
-                        db.close()
-                        return ("ERROR", f"Property '{property_name}' not valid for bill '{bill.name}'. Valid properties: {valid_props}")
-            db.close()
-            return None
+            from services.account_properties import account_properties
+            entry = account_properties.lookup(account_name)
+            if entry is None:
+                return None
+
+            # Savings account
+            if entry["kind"] == "savings":
+
+                # Account balance
+                if property_lower == "balance":
+                    balance = entry["balance"]
+                    return float(balance) if balance else 0.0
+
+                # Account goal (field: goal_amount)
+                elif property_lower in ["goal", "goal amount", "goal_amount"]:
+                    goal = entry["goal_amount"] if entry["goal_amount"] else 0
+                    return float(goal)
+
+                # Account auto-save (field: auto_save_amount)
+                elif property_lower in ["auto save", "auto_save", "auto save amount", "auto_save_amount"]:
+                    auto_save = entry["auto_save_amount"] if entry["auto_save_amount"] else 0
+                    return float(auto_save)
+
+                else:
+                    valid_props = "balance, goal, auto_save"
+                    return ("ERROR", f"Property '{property_name}' not valid for account '{entry['name']}'. Valid properties: {valid_props}")
+
+            # Bill balance
+            if property_lower == "balance":
+                balance = entry["balance"]
+                return float(balance) if balance else 0.0
+
+            # Bill goal (field: amount_to_save)
+            elif property_lower in ["goal", "auto save", "auto_save", "amount to save", "amount_to_save"]:
+                goal = entry["amount_to_save"] if entry["amount_to_save"] else 0
+                return float(goal)
+
+            # Bill typical amount (field: typical_amount)
+            elif property_lower in ["typical", "typical amount", "typical_amount", "amount"]:
+                typical = entry["typical_amount"] if entry["typical_amount"] else 0
+                return float(typical)
+
+            # Bill payment frequency
+            elif property_lower in ["frequency", "payment frequency", "payment_frequency"]:
+                return entry["payment_frequency"] if entry["payment_frequency"] else ""
+
+            # Bill last payment date
+            elif property_lower in ["last payment", "last payment date", "last_payment_date"]:
+                return entry["last_payment_date"] if entry["last_payment_date"] else None
+
+            # Bill type
+            elif property_lower in ["type", "bill type", "bill_type"]:
+                return entry["bill_type"] if entry["bill_type"] else ""
+
+            # Bill is_variable
+            elif property_lower in ["variable", "is variable", "is_variable"]:
+                return "Yes" if entry["is_variable"] else "No"
+
+            else:
+                valid_props = "balance, amount, frequency, type, auto_save, variable"
+                return ("ERROR", f"Property '{property_name}' not valid for bill '{entry['name']}'. Valid properties: {valid_props}")
 
         except Exception as e:
             return None
@@ -218,6 +581,46 @@ class WorkspaceCalculator:
         except:
             return None
 
+    def compile_formula(self, cell_ref: str, formula: str) -> CompiledFormula:
+        """Parse a cell's formula into an evaluation tree, reusing the last compile if unchanged"""
+        compiled = self.compiled_formulas.get(cell_ref)
+        if compiled is not None and compiled.formula == formula:
+            return compiled
+
+        if not formula.startswith('='):
+            value = self.parse_literal(formula)
+            compiled = CompiledFormula(formula, frozenset(), lambda visited: value)
+        else:
+            references = set()
+            volatile = False
+            try:
+                parser = _FormulaParser(self, tokenize_formula(formula[1:]), references)
+                evaluate = parser.parse()
+                volatile = parser.volatile
+            except FormulaError as e:
+                message = e.message
+                references = set()
+
+                def evaluate(visited):
+                    raise FormulaError(message)
+            compiled = CompiledFormula(formula, frozenset(references), evaluate, volatile)
+
+        self.compiled_formulas[cell_ref] = compiled
+        return compiled
+
+    def parse_literal(self, text: str) -> Any:
+        """Value of a cell that isn't a formula: number, then date, otherwise the text itself"""
+        try:
+            return float(text)
+        except ValueError:
+            pass
+
+        parsed_date = self.parse_date(text)
+        if parsed_date:
+            return parsed_date
+
+        return text
+
     def evaluate_formula(self, formula: str, cell_ref: str, visited: Set[str] = None) -> Any:
         """Evaluate a formula and return the result"""
         # Normalize cell reference to uppercase
@@ -232,174 +635,75 @@ class WorkspaceCalculator:
 
         visited.add(cell_ref)
 
-        # If doesn't start with =, it's a literal
-        if not formula.startswith('='):
-            # Try to parse as number
-            try:
-                return float(formula)
-            except:
-                pass
-
-            # Try to parse as date
-            parsed_date = self.parse_date(formula)
-            if parsed_date:
-                return parsed_date
-
-            # Otherwise it's a string
-            return formula
-
-        # Remove = and strip whitespace
-        expr = formula[1:].strip()
-
-        # Track dependencies for this cell
-        self.dependencies[cell_ref] = set()
-
-        # Handle CURRENT_DATE() - if it's the only thing in the formula, return date directly
-        if expr.upper().strip() == "CURRENT_DATE()":
-            return datetime.now().date()
-
-        # Replace CURRENT_DATE with actual date value for use in calculations
-        if "CURRENT_DATE" in expr.upper():
-            current = datetime.now().date()
-            days_since_epoch = (current - date(1970, 1, 1)).days
-            expr = re.sub(r'CURRENT_DATE\(\)', str(days_since_epoch), expr, flags=re.IGNORECASE)
-
-        # Replace GET() functions
-        get_pattern = r'GET\(([^)]+)\)'
-        get_matches = list(re.finditer(get_pattern, expr, re.IGNORECASE))
-
-        # Special case: if the entire expression is just a single GET call, return its value directly
-        if len(get_matches) == 1 and expr.strip() == get_matches[0].group(0):
-            var_name = get_matches[0].group(1).strip().strip('"\'')
-            value = self.get_external_variable(var_name)
-
-            # Check if it's an error tuple
-            if isinstance(value, tuple) and len(value) == 2 and value[0] == "ERROR":
-                return value  # Return the error as-is
-            elif value is not None:
-                return value  # Return string, number, or date directly
-            else:
-                # Better error message for GET failures
-                if ',' not in var_name:
-                    return ("ERROR", f"GET requires format: GET(account, property). Got: GET({var_name})")
-                else:
-                    parts = var_name.split(',', 1)
-                    account_name = parts[0].strip()
-                    return ("ERROR", f"Cannot find account or bill named '{account_name}'")
-
-        # Otherwise, replace GET calls with their values for calculation
-        for match in get_matches:
-            var_name = match.group(1).strip().strip('"\'')
-            value = self.get_external_variable(var_name)
-
-            # Check if it's an error tuple
-            if isinstance(value, tuple) and len(value) == 2 and value[0] == "ERROR":
-                return value  # Return the error as-is
-            elif value is not None:
-                # Only numeric values can be used in calculations
-                if isinstance(value, (int, float)):
-                    expr = expr.replace(match.group(0), str(value))
-                else:
-                    return ("ERROR", f"Cannot use non-numeric value '{value}' in calculation")
-            else:
-                # Better error message for GET failures
-                if ',' not in var_name:
-                    return ("ERROR", f"GET requires format: GET(account, property). Got: GET({var_name})")
-                else:
-                    parts = var_name.split(',', 1)
-                    account_name = parts[0].strip()
-                    return ("ERROR", f"Cannot find account or bill named '{account_name}'")
-
-        # Replace SUM() and AVERAGE() functions
-        sum_pattern = r'SUM\(([^)]+)\)'
-        for match in re.finditer(sum_pattern, expr, re.IGNORECASE):
-            range_or_cells = match.group(1).strip()
-
-            # Check if it's a range (A1:A10)
-            if ':' in range_or_cells:
-                cells = self.parse_range(range_or_cells)  # Already returns uppercase
-            else:
-                # Individual cells separated by comma - normalize to uppercase
-                cells = [c.strip().upper() for c in range_or_cells.split(',')]
-
-            # Get values and sum
-            total = 0
-            for cell in cells:
-                self.dependencies[cell_ref].add(cell)
-                cell_value = self.get_cell_value(cell, visited.copy())
-                if isinstance(cell_value, (int, float)):
-                    total += cell_value
-
-            expr = expr.replace(match.group(0), str(total))
-
-        avg_pattern = r'AVERAGE\(([^)]+)\)'
-        for match in re.finditer(avg_pattern, expr, re.IGNORECASE):
-            range_or_cells = match.group(1).strip()
-
-            # Check if it's a range (A1:A10)
-            if ':' in range_or_cells:
-                cells = self.parse_range(range_or_cells)  # Already returns uppercase
-            else:
-                # Individual cells separated by comma - normalize to uppercase
-                cells = [c.strip().upper() for c in range_or_cells.split(',')]
-
-            # Get values and average
-            values = []
-            for cell in cells:
-                self.dependencies[cell_ref].add(cell)
-                cell_value = self.get_cell_value(cell, visited.copy())
-                if isinstance(cell_value, (int, float)):
-                    values.append(cell_value)
-
-            avg = sum(values) / len(values) if values else 0
-            expr = expr.replace(match.group(0), str(avg))
-
-        # Replace individual cell references (case-insensitive)
-        cell_pattern = r'\b([A-Za-z]+\d+)\b'
-        for match in re.finditer(cell_pattern, expr):
-            cell = match.group(1).upper()  # Normalize to uppercase
-            original_match = match.group(1)  # Keep original for replacement
-            if self.parse_cell_reference(cell):  # Validate it's a real cell
-                self.dependencies[cell_ref].add(cell)
-                cell_value = self.get_cell_value(cell, visited.copy())
-
-                # Replace with value (use original match text to ensure correct replacement)
-                if isinstance(cell_value, (int, float)):
-                    expr = expr.replace(original_match, str(cell_value), 1)
-                elif isinstance(cell_value, date):
-                    # Convert date to days since epoch for calculations
-                    days = (cell_value - date(1970, 1, 1)).days
-                    expr = expr.replace(original_match, str(days), 1)
-
-        # Evaluate the expression
-        try:
-            result = eval(expr)
+        compiled = self.compile_formula(cell_ref, formula)
 
-            # Convert back from days to date if appropriate
-            if isinstance(result, float) and result > 10000:  # Likely a date value
-                try:
-                    result_date = date(1970, 1, 1) + __import__('datetime').timedelta(days=int(result))
-                    return result_date
-                except:
-                    pass
+        # Track dependencies for this cell (known from the parse, before evaluating)
+        self.link_cell(cell_ref, compiled.references)
 
-            return result
+        try:
+            return compiled.evaluate(visited)
+        except FormulaError as e:
+            return ("ERROR", e.message)
         except ZeroDivisionError:
             return ("ERROR", "Division by zero")
-        except NameError as e:
-            # Extract variable name from error message
-            error_str = str(e)
-            if "'" in error_str:
-                var_name = error_str.split("'")[1]
-                return ("ERROR", f"Cell or variable '{var_name}' not found")
-            return ("ERROR", "Invalid cell reference or variable name")
-        except TypeError as e:
-            return ("ERROR", "Type mismatch - check if you're mixing dates/numbers/strings incorrectly")
-        except SyntaxError:
-            return ("ERROR", "Invalid formula syntax")
+        except CircularReferenceError:
+            raise
         except Exception as e:
             return ("ERROR", f"Unexpected error: {str(e)}")
 
+    def reference_value(self, cell_ref: str, visited: Set[str]) -> Any:
+        """Value of a cell referenced from a formula (empty cells are 0)"""
+        cell_data = self.cells.get(cell_ref)
+        if cell_data is None:
+            return 0
+
+        value = cell_data.get("value")
+        if value is None:
+            value = self.evaluate_formula(cell_data.get("formula", ""), cell_ref, visited.copy())
+        return value
+
+    def range_value(self, name: str, values: List[Any]) -> float:
+        """Value of SPENT / INCOME / BALANCE_AT for evaluated arguments (see services.range_aggregates)"""
+        if not self.transaction_manager:
+            raise FormulaError(f"{name} is only available with app data")
+
+        for parameter, value in zip(RANGE_FUNCTIONS[name], values):
+            if parameter in ("category", "account"):
+                if not isinstance(value, str):
+                    raise FormulaError(f"{name} expects a name for {parameter}, got '{value}'")
+            elif not isinstance(value, date):
+                raise FormulaError(f"{name} expects a date (MM/DD/YYYY) for {parameter}, got '{value}'")
+
+        from services.range_aggregates import range_aggregates
+
+        if name == "SPENT":
+            return range_aggregates.spent(*values)
+        if name == "INCOME":
+            return range_aggregates.income(*values)
+
+        balance = range_aggregates.balance_at(*values)
+        if balance is None:
+            raise FormulaError(f"Cannot find account or bill named '{values[0]}'")
+        return balance
+
+    def external_value(self, var_name: str, in_calculation: bool) -> Any:
+        """Value of a GET() call, raising FormulaError for anything that can't be used where it appears"""
+        value = self.get_external_variable(var_name)
+
+        if is_error(value):
+            raise FormulaError(value[1])
+        if value is None:
+            # Better error message for GET failures
+            if ',' not in var_name:
+                raise FormulaError(f"GET requires format: GET(account, property). Got: GET({var_name})")
+            account_name = var_name.split(',', 1)[0].strip()
+            raise FormulaError(f"Cannot find account or bill named '{account_name}'")
+
+        # A formula that is just GET(...) shows the value as-is, anything else needs a number or date
+        if in_calculation and not isinstance(value, (int, float, date)):
+            raise FormulaError(f"Cannot use non-numeric value '{value}' in calculation")
+        return value
+
     def get_cell_value(self, cell_ref: str, visited: Set[str] = None) -> Any:
         """Get the evaluated value of a cell"""
         # Normalize cell reference to uppercase for consistent lookups
@@ -421,6 +725,9 @@ class WorkspaceCalculator:
     def set_cell_formula(self, cell_ref: str, formula: str, format_type: str = "P"):
         """Set a cell's formula and evaluate it
 
+        Only this cell is evaluated - call recalculate_dependents() afterwards
+        to update the cells that read it.
+
         Args:
             cell_ref: Cell reference like "A1"
             formula: The formula or value
@@ -429,63 +736,247 @@ class WorkspaceCalculator:
         # Normalize cell reference to uppercase for consistent storage
         cell_ref = cell_ref.upper()
 
+        compiled = self.compile_formula(cell_ref, formula)
+        self.link_cell(cell_ref, compiled.references)
+
+        # Only a cell that reads other cells can close a cycle
+        circular = bool(compiled.references) and cell_ref in self.downstream_cells(cell_ref)
+        return self.store_cell(cell_ref, formula, format_type, circular)
+
+    def store_cell(self, cell_ref: str, formula: str, format_type: str, circular: bool = False):
+        """Evaluate a cell whose graph edges are already linked and store the result"""
+        if circular:
+            return self.store_circular(cell_ref, formula, format_type)
+
         # Evaluate the formula
         try:
             value = self.evaluate_formula(formula, cell_ref)
-
-            # Check if value is an error tuple
-            if isinstance(value, tuple) and len(value) == 2 and value[0] == "ERROR":
-                cell_type = "error"
-                error_message = value[1]
-
-                self.cells[cell_ref] = {
-                    "formula": formula,
-                    "value": value,  # Store tuple
-                    "error_message": error_message,
-                    "type": cell_type,
-                    "format": format_type
-                }
-                return value
-
-            # Determine type
-            if formula.startswith('='):
-                cell_type = "formula"
-            elif isinstance(value, date):
-                cell_type = "date"
-            elif isinstance(value, (int, float)):
-                cell_type = "number"
-            else:
-                cell_type = "string"
-
-            self.cells[cell_ref] = {
+        except CircularReferenceError:
+            return self.store_circular(cell_ref, formula, format_type)
+
+        self.cells[cell_ref] = self.cell_record(formula, value, format_type)
+        return value
+
+    def store_circular(self, cell_ref: str, formula: str, format_type: str):
+        error_message = f"Circular reference involving {cell_ref}"
+        self.cells[cell_ref] = self.cell_record(formula, ("ERROR", error_message), format_type)
+        return ("ERROR", error_message)
+
+    def cell_record(self, formula: str, value: Any, format_type: str) -> Dict[str, Any]:
+        """The entry kept in self.cells for a formula and its value"""
+        # Check if value is an error tuple
+        if is_error(value):
+            return {
                 "formula": formula,
-                "value": value,
-                "type": cell_type,
+                "value": value,  # Store tuple
+                "error_message": value[1],
+                "type": "error",
                 "format": format_type
             }
 
-            return value
+        # Determine type
+        if formula.startswith('='):
+            cell_type = "formula"
+        elif isinstance(value, date):
+            cell_type = "date"
+        elif isinstance(value, (int, float)):
+            cell_type = "number"
+        else:
+            cell_type = "string"
+
+        return {
+            "formula": formula,
+            "value": value,
+            "type": cell_type,
+            "format": format_type
+        }
+
+    def restore_cells(self, saved: Dict[str, Tuple[str, str, Any]]) -> Set[str]:
+        """Load saved cells with their last computed values, without evaluating anything
 
-        except CircularReferenceError as e:
-            error_message = f"Circular reference involving {cell_ref}"
-            self.cells[cell_ref] = {
-                "formula": formula,
-                "value": ("ERROR", error_message),
-                "error_message": error_message,
-                "type": "error"
-            }
-            return ("ERROR", error_message)
+        Args:
+            saved: {cell_ref: (formula, format_type, value)} - value None if it wasn't saved
+
+        Returns:
+            The cells whose value may be stale: those that read live data
+            (GET, SPENT, INCOME, BALANCE_AT, CURRENT_DATE) or had no saved
+            value. Pass them to recalculate_stale() when the values are needed.
+        """
+        stale = set()
+        for cell_ref, (formula, format_type, value) in saved.items():
+            cell_ref = cell_ref.upper()
+            if not self.parse_cell_reference(cell_ref):
+                continue
+
+            compiled = self.compile_formula(cell_ref, formula)
+            self.link_cell(cell_ref, compiled.references)
+
+            if value is None or compiled.volatile:
+                # A None value is also evaluated on demand if another cell reads it first
+                stale.add(cell_ref)
+            self.cells[cell_ref] = self.cell_record(formula, value, format_type)
+        return stale
+
+    def volatile_cells(self) -> Set[str]:
+        """Cells whose formula reads live data or today's date"""
+        return {
+            ref for ref in self.cells
+            if ref in self.compiled_formulas and self.compiled_formulas[ref].volatile
+        }
+
+    def recalculate_stale(self, cells: Set[str]) -> List[str]:
+        """Recalculate cells whose inputs changed outside the sheet, and everything downstream of them
+
+        Returns:
+            The recalculated cells, in the order they were evaluated
+        """
+        affected = set(cells)
+        for cell_ref in cells:
+            affected |= self.downstream_cells(cell_ref)
+        return self.recalculate_cells(affected)
+
+    def clear_cell(self, cell_ref: str) -> List[str]:
+        """Empty a cell and recalculate the cells that read it
+
+        Returns:
+            The recalculated cells, in the order they were evaluated
+        """
+        cell_ref = cell_ref.upper()
+        self.cells.pop(cell_ref, None)
+        self.compiled_formulas.pop(cell_ref, None)
+        self.link_cell(cell_ref, frozenset())
+        return self.recalculate_dependents(cell_ref)
+
+    def clear(self):
+        """Remove every cell"""
+        self.cells = {}
+        self.dependencies = {}
+        self.dependents = {}
+        self.compiled_formulas = {}
+
+    # ------------------------------------------------------------------
+    # Dependency graph
+    #
+    # dependencies maps each formula cell to the cells it reads and
+    # dependents is the same graph reversed (cell -> formula cells that
+    # read it, including cells that are still empty). Both are kept in
+    # step by link_cell whenever a formula is compiled, so an edit only
+    # walks the part of the sheet downstream of the edited cell.
+    # ------------------------------------------------------------------
+
+    def link_cell(self, cell_ref: str, references: FrozenSet[str]):
+        """Point cell_ref's edges at the cells its formula now reads"""
+        old_references = self.dependencies.get(cell_ref, set())
+        if old_references == references:
+            return
+
+        for ref in old_references - references:
+            readers = self.dependents.get(ref)
+            if readers is not None:
+                readers.discard(cell_ref)
+                if not readers:
+                    del self.dependents[ref]
+        for ref in references - old_references:
+            self.dependents.setdefault(ref, set()).add(cell_ref)
+
+        if references:
+            self.dependencies[cell_ref] = set(references)
+        else:
+            self.dependencies.pop(cell_ref, None)
 
     def get_dependent_cells(self, cell_ref: str) -> Set[str]:
         """Get all cells that depend on this cell"""
         # Normalize cell reference to uppercase
         cell_ref = cell_ref.upper()
 
-        dependents = set()
-        for cell, deps in self.dependencies.items():
-            if cell_ref in deps:
-                dependents.add(cell)
-        return dependents
+        return set(self.dependents.get(cell_ref, ()))
+
+    def downstream_cells(self, cell_ref: str) -> Set[str]:
+        """Every cell that reads cell_ref, directly or through other cells"""
+        found = set()
+        pending = [cell_ref]
+        while pending:
+            for reader in self.dependents.get(pending.pop(), ()):
+                if reader not in found:
+                    found.add(reader)
+                    pending.append(reader)
+        return found
+
+    def upstream_cells(self, cell_ref: str) -> Set[str]:
+        """Every cell cell_ref reads, directly or through other cells"""
+        found = set()
+        pending = [cell_ref]
+        while pending:
+            for dep in self.dependencies.get(pending.pop(), ()):
+                if dep not in found:
+                    found.add(dep)
+                    pending.append(dep)
+        return found
+
+    def topological_order(self, cells: Set[str], sources: Set[str] = frozenset()) -> List[str]:
+        """cells ordered so each comes after every cell of the set it reads (Kahn's algorithm)
+
+        Cells on a cycle never become ready and are left out. Cells in
+        sources are treated as already ready, ignoring what they read.
+        """
+        waiting_on = {}
+        for ref in cells:
+            if ref in sources:
+                waiting_on[ref] = 0
+            else:
+                waiting_on[ref] = sum(1 for dep in self.dependencies.get(ref, ()) if dep in cells)
+
+        ready = [ref for ref, count in waiting_on.items() if count == 0]
+        order = []
+        while ready:
+            ref = ready.pop()
+            order.append(ref)
+            for reader in self.dependents.get(ref, ()):
+                if reader in waiting_on and reader not in sources:
+                    waiting_on[reader] -= 1
+                    if waiting_on[reader] == 0:
+                        ready.append(reader)
+        return order
+
+    def recalculation_order(self, cells: Set[str], circular: Set[str] = frozenset()) -> Tuple[List[str], Set[str]]:
+        """Evaluation order for cells plus the ones that are on a cycle
+
+        Cells on a cycle are placed before the cells that read them so
+        their errors propagate downstream. circular names cells already
+        known to be on one.
+        """
+        circular = set(circular) & cells
+        order = self.topological_order(cells, sources=circular)
+        if len(order) == len(cells):
+            return order, circular
+
+        leftover = cells - set(order)
+        found = {ref for ref in leftover if ref in self.downstream_cells(ref)}
+        return order + self.topological_order(leftover, sources=found), circular | found
+
+    def recalculate_cells(self, cells: Set[str], circular: Set[str] = frozenset()) -> List[str]:
+        """Re-evaluate cells once each, upstream first; returns them in evaluation order"""
+        order, circular = self.recalculation_order({ref for ref in cells if ref in self.cells}, circular)
+        for ref in order:
+            cell_data = self.cells[ref]
+            self.store_cell(ref, cell_data["formula"], cell_data.get("format", "P"), ref in circular)
+        return order
+
+    def recalculate_dependents(self, cell_ref: str) -> List[str]:
+        """Recalculate everything downstream of a cell that just changed
+
+        Returns:
+            The recalculated cells, in the order they were evaluated
+        """
+        cell_ref = cell_ref.upper()
+        affected = self.downstream_cells(cell_ref)
+        circular = set()
+        if cell_ref in affected:
+            # The cell is on a cycle: so is everything both downstream and upstream of it.
+            # Without cell_ref the rest of the cycle would look acyclic
+            circular = affected & self.upstream_cells(cell_ref)
+        affected.discard(cell_ref)  # Already evaluated by set_cell_formula
+        return self.recalculate_cells(affected, circular)
 
     def recalculate_cell(self, cell_ref: str):
         """Recalculate a cell and all cells that depend on it"""
@@ -495,20 +986,11 @@ class WorkspaceCalculator:
         if cell_ref not in self.cells:
             return
 
-        # Recalculate this cell
-        formula = self.cells[cell_ref]["formula"]
-        self.set_cell_formula(cell_ref, formula)
-
-        # Recursively recalculate dependent cells
-        for dependent in self.get_dependent_cells(cell_ref):
-            self.recalculate_cell(dependent)
+        # Recalculate this cell, then everything downstream of it
+        cell_data = self.cells[cell_ref]
+        self.set_cell_formula(cell_ref, cell_data["formula"], cell_data.get("format", "P"))
+        self.recalculate_dependents(cell_ref)
 
     def recalculate_all(self):
         """Recalculate all cells (useful after external variable changes)"""
-        # Clear all dependencies and recalculate in order
-        self.dependencies = {}
-
-        for cell_ref in list(self.cells.keys()):
-            formula = self.cells[cell_ref]["formula"]
-            format_type = self.cells[cell_ref].get("format", "P")  # Preserve existing format
-            self.set_cell_formula(cell_ref, formula, format_type)
+        self.recalculate_cells(set(self.cells))
@@ -0,0 +1,98 @@
+"""
+Workspace Store - reads and writes the Scratch Pad's workspace file
+
+The file holds each cell's formula, format and last computed value, so a
+workspace opens showing its values without evaluating anything; only cells
+that read live data (see CompiledFormula.volatile) are recalculated.
+
+Format (version 2), written without indentation:
+
+    {"version": 2, "cells": {"A1": ["=B1*2", "P", 84.0], ...}}
+
+Values are stored as JSON numbers and strings, dates as {"d": "YYYY-MM-DD"}
+and errors as {"e": message}. A value of null means "recalculate". Version 1
+files ({"cells": {"A1": {"formula", "type", "format"}}}) load with every
+value null.
+"""
+
+import json
+import os
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from services.workspace_calculator import is_error
+
+
+WORKSPACE_VERSION = 2
+
+# cell_ref -> (formula, format_type, cached value or None)
+SavedCells = Dict[str, Tuple[str, str, Any]]
+
+
+def encode_value(value) -> Any:
+    """A cell value as JSON"""
+    if is_error(value):
+        return {"e": value[1]}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, (int, float, str)):
+        return value
+    return None  # Anything else is recalculated on load
+
+
+def decode_value(data) -> Any:
+    """Inverse of encode_value"""
+    if isinstance(data, dict):
+        if "e" in data:
+            return ("ERROR", data["e"])
+        if "d" in data:
+            return date.fromisoformat(data["d"])
+        return None
+    return data
+
+
+class WorkspaceStore:
+    """
+    The workspace file
+
+    Usage:
+        store = WorkspaceStore(Path("scratch_pad_workspace.json"))
+        saved = store.load()  # None if there is no file yet
+        store.save(calculator.cells)
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def load(self) -> Optional[SavedCells]:
+        """Cells saved in the file (either version), or None if it doesn't exist"""
+        if not self.path.exists():
+            return None
+
+        with open(self.path, 'r') as f:
+            save_data = json.load(f)
+
+        saved = {}
+        if save_data.get("version", 1) >= 2:
+            for cell_ref, (formula, format_type, value) in save_data.get("cells", {}).items():
+                saved[cell_ref] = (formula, format_type, decode_value(value))
+        else:
+            for cell_ref, cell_data in save_data.get("cells", {}).items():
+                saved[cell_ref] = (cell_data["formula"], cell_data.get("format", "P"), None)
+        return saved
+
+    def save(self, cells: Dict[str, Dict[str, Any]]):
+        """Write every cell, replacing the file in one step so a crash mid-write can't truncate it"""
+        save_data = {
+            "version": WORKSPACE_VERSION,
+            "cells": {
+                ref: [data["formula"], data.get("format", "P"), encode_value(data.get("value"))]
+                for ref, data in cells.items()
+            }
+        }
+
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(temp_path, 'w') as f:
+            json.dump(save_data, f, separators=(",", ":"))
+        os.replace(temp_path, self.path)
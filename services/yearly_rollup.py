@@ -0,0 +1,145 @@
+"""
+Yearly Rollup - per year/month transaction totals from a single aggregated query
+
+The Yearly and Taxes tabs used to run several full-row queries per year (income,
+spending, bill_pay, saving, spending_from_savings) and sum them in Python. This
+service loads every (year, month, type, ...) total and count in one GROUP BY
+and keeps it until committed data changes.
+"""
+
+import threading
+from typing import Dict, List, Optional, Tuple
+from collections import defaultdict
+from sqlalchemy import select, func, extract, case
+
+from models import get_db, Transaction
+from models.database import get_data_version
+
+
+class YearlyRollup:
+    """
+    Cached transaction totals grouped by year, month, type, analytics flag, bill and sign
+
+    Usage:
+        from services.yearly_rollup import yearly_rollup
+        income, paychecks = yearly_rollup.totals(2024, "income")
+        spending, _ = yearly_rollup.totals(2024, "spending", include_in_analytics=True)
+        tax_saved, _ = yearly_rollup.totals(2024, "saving", bill_id=tax_bill.id, positive_only=True)
+
+    The first call after any commit reloads everything in one round trip; later
+    calls are dictionary lookups.
+    """
+
+    def __init__(self):
+        self._version = None
+        # year -> list of (month, type, include_in_analytics, bill_id, is_positive, total, count)
+        self._cells_by_year: Dict[int, List[Tuple]] = {}
+        self._lock = threading.Lock()  # Background loaders read it too
+
+    def invalidate(self):
+        """Force a reload on the next lookup"""
+        self._version = None
+
+    def _ensure_loaded(self):
+        with self._lock:
+            version = get_data_version()
+            if self._version == version:
+                return
+
+            year = extract("year", Transaction.date)
+            month = extract("month", Transaction.date)
+            is_positive = case((Transaction.amount > 0, True), else_=False)
+
+            db = get_db()
+            try:
+                rows = db.execute(
+                    select(
+                        year, month,
+                        Transaction.transaction_type,
+                        Transaction.include_in_analytics,
+                        Transaction.bill_id,
+                        is_positive,
+                        func.sum(Transaction.amount),
+                        func.count(Transaction.id)
+                    ).where(
+                        Transaction.date.isnot(None)
+                    ).group_by(
+                        year, month, Transaction.transaction_type, Transaction.include_in_analytics,
+                        Transaction.bill_id, is_positive
+                    )
+                ).all()
+            finally:
+                db.close()
+
+            cells_by_year = defaultdict(list)
+            for row_year, row_month, *cell in rows:
+                cells_by_year[int(row_year)].append((int(row_month), *cell))
+
+            self._cells_by_year = dict(cells_by_year)
+            self._version = version
+
+    def years(self) -> List[int]:
+        """Get every year that has transactions (ascending)"""
+        self._ensure_loaded()
+        return sorted(self._cells_by_year)
+
+    def totals(self, year: int, transaction_type: str, month: Optional[int] = None,
+               include_in_analytics: Optional[bool] = None, bill_id: Optional[int] = None,
+               positive_only: bool = False) -> Tuple[float, int]:
+        """
+        Get (sum of amounts, transaction count) for a year (optionally one month)
+
+        Args:
+            include_in_analytics: True/False to match that flag exactly, None for all
+            bill_id: Only transactions for this bill
+            positive_only: Only transactions with amount > 0
+        """
+        self._ensure_loaded()
+
+        total = 0.0
+        count = 0
+        for cell_month, cell_type, cell_analytics, cell_bill, cell_positive, cell_total, cell_count in \
+                self._cells_by_year.get(year, ()):
+            if cell_type != transaction_type:
+                continue
+            if month is not None and cell_month != month:
+                continue
+            if include_in_analytics is not None and cell_analytics != include_in_analytics:
+                continue
+            if bill_id is not None and cell_bill != bill_id:
+                continue
+            if positive_only and not cell_positive:
+                continue
+            total += cell_total or 0.0
+            count += cell_count
+        return total, count
+
+    def monthly_totals(self, year: int, transaction_type: str,
+                       include_in_analytics: Optional[bool] = None) -> List[float]:
+        """Get a 12-item list of totals (January first) for one type in a year"""
+        self._ensure_loaded()
+
+        months = [0.0] * 12
+        for cell_month, cell_type, cell_analytics, _bill, _positive, cell_total, _count in \
+                self._cells_by_year.get(year, ()):
+            if cell_type != transaction_type:
+                continue
+            if include_in_analytics is not None and cell_analytics != include_in_analytics:
+                continue
+            months[cell_month - 1] += cell_total or 0.0
+        return months
+
+    def months_with_data(self, year: int, transaction_type: str,
+                         include_in_analytics: Optional[bool] = None) -> set:
+        """Get the month numbers (1-12) that have any transaction of one type in a year"""
+        self._ensure_loaded()
+        return {
+            cell_month
+            for cell_month, cell_type, cell_analytics, *_rest in self._cells_by_year.get(year, ())
+            if cell_type == transaction_type
+            and (include_in_analytics is None or cell_analytics == include_in_analytics)
+        }
+
+
+# Shared by every view - the cache is keyed on the global data version
+yearly_rollup = YearlyRollup()
@@ -8,9 +8,15 @@ from PyQt6.QtCore import Qt
 from themes import theme_manager
 from widgets import BillRowWidget
 from views.dialogs.settings_dialog import get_setting, save_setting
+from services.change_events import ChangeKind, Depends, invalidated_panels
 
 
 class BillsView(QWidget):
+    # Which data changes make which panel stale (panel update method -> reasons)
+    PANEL_DEPENDENCIES = {
+        "refresh": [Depends(ChangeKind.BILLS)],
+    }
+
     def __init__(self, transaction_manager=None):
         super().__init__()
         self.transaction_manager = transaction_manager
@@ -358,6 +364,11 @@ class BillsView(QWidget):
             inactive = [b for b in bills if not b.is_currently_active]
             return sorted(active, key=lambda b: (b.name or "").lower()) + sorted(inactive, key=lambda b: (b.name or "").lower())
     
+    def apply_change(self, change):
+        """Refresh what a DataChange made stale (see PANEL_DEPENDENCIES)"""
+        for panel in invalidated_panels(self, change):
+            getattr(self, panel)()
+
     def refresh(self):
         """Refresh bills view with current bill data"""
         if not self.transaction_manager:
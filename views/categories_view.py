@@ -13,15 +13,45 @@ from matplotlib.figure import Figure
 import numpy as np
 from scipy.stats import pearsonr
 from views.dialogs.settings_dialog import get_setting
+from services.change_events import ChangeKind, Depends, invalidated_panels
+from services.transaction_snapshot import TransactionSnapshot, transaction_snapshots
+from models import get_data_version
+from typing import FrozenSet, NamedTuple
 from datetime import datetime, date
 
 
+_SPENDING = ("spending",)
+
+
+class CategoriesData(NamedTuple):
+    """Everything the Categories view paints, gathered off the UI thread (treat as read-only)"""
+    version: int
+    snapshot: TransactionSnapshot        # Shared read-only transactions, newest first
+    spending_categories: FrozenSet[str]  # Categories with spending - the category list
+
+
 class CategoriesView(QWidget):
+    # Which data changes make which panel stale (panel update method -> reasons)
+    PANEL_DEPENDENCIES = {
+        # The list re-selects its first category, so only rebuild it when the set of categories changed
+        "populate_category_list": [
+            Depends(ChangeKind.TRANSACTIONS, types=_SPENDING, when=lambda view, change: view.category_list_changed()),
+        ],
+        "update_category_stats": [Depends(ChangeKind.TRANSACTIONS, types=_SPENDING)],
+        "update_box_plot": [Depends(ChangeKind.TRANSACTIONS, types=_SPENDING)],
+        "update_main_pie_chart": [Depends(ChangeKind.TRANSACTIONS, types=_SPENDING)],
+        "update_color_key": [Depends(ChangeKind.TRANSACTIONS, types=_SPENDING)],
+        "update_category_details": [
+            Depends(ChangeKind.TRANSACTIONS, types=_SPENDING, categories=lambda view: [view.selected_category]),
+        ],
+    }
+
     def __init__(self, transaction_manager=None, analytics_engine=None):
         super().__init__()
         self.transaction_manager = transaction_manager
         self.analytics_engine = analytics_engine
         self.selected_category = None
+        self.data = None  # CategoriesData being shown - see gather_data
         
         self.init_ui()
         
@@ -104,7 +134,7 @@ class CategoriesView(QWidget):
         self.refresh_button.setText("🔄")
         self.refresh_button.setToolTip("Refresh Categories")
         self.refresh_button.setFixedSize(40, 30)
-        self.refresh_button.clicked.connect(self.refresh)
+        self.refresh_button.clicked.connect(lambda: self.refresh())
         # Styling applied in apply_header_theme method
         header_layout.addWidget(self.refresh_button)
 
@@ -605,8 +635,9 @@ class CategoriesView(QWidget):
         
     def on_include_abnormal_changed(self, state):
         """Handle include abnormal checkbox state change"""
-        # Refresh all data when checkbox changes
-        self.refresh()
+        # The snapshot holds abnormal spending too - repaint without reloading
+        if self.data is not None:
+            self.refresh(data=self.data)
 
     def on_category_selected(self, item):
         """Handle category selection from list"""
@@ -624,7 +655,7 @@ class CategoriesView(QWidget):
         
     def update_category_details(self):
         """Update the bottom section with selected category details"""
-        if not self.selected_category or not self.transaction_manager:
+        if not self.selected_category or self.data is None:
             # No category selected - show default state
             self.category_details_title.setText("Select a Category")
             self.avg_cost_value.setText("$0.00")
@@ -635,7 +666,7 @@ class CategoriesView(QWidget):
 
         try:
             # Get all transactions for this category
-            all_transactions = self.transaction_manager.get_all_transactions()
+            all_transactions = self.data.snapshot.transactions
             include_abnormal = self.include_abnormal_checkbox.isChecked()
             category_transactions = [
                 t for t in all_transactions
@@ -718,14 +749,14 @@ class CategoriesView(QWidget):
         
     def update_category_histogram(self):
         """Update histogram with purchase size distribution for selected category"""
-        if not self.selected_category or not self.transaction_manager or not self.category_histogram:
+        if not self.selected_category or self.data is None or not self.category_histogram:
             if self.category_histogram:
                 self.category_histogram.update_data([])
             return
 
         try:
             # Get all transactions for this category
-            all_transactions = self.transaction_manager.get_all_transactions()
+            all_transactions = self.data.snapshot.transactions
             include_abnormal = self.include_abnormal_checkbox.isChecked()
             category_transactions = [
                 t for t in all_transactions
@@ -753,14 +784,14 @@ class CategoriesView(QWidget):
     
     def update_category_weekly_trends(self):
         """Update weekly spending trend chart for selected category"""
-        if not self.selected_category or not self.transaction_manager or not self.category_trend_chart:
+        if not self.selected_category or self.data is None or not self.category_trend_chart:
             if self.category_trend_chart:
                 self.category_trend_chart.update_data({})
             return
 
         try:
             # Get all transactions for this category
-            all_transactions = self.transaction_manager.get_all_transactions()
+            all_transactions = self.data.snapshot.transactions
             include_abnormal = self.include_abnormal_checkbox.isChecked()
             category_transactions = [
                 t for t in all_transactions
@@ -812,13 +843,13 @@ class CategoriesView(QWidget):
     
     def update_correlation_plots(self):
         """Create correlation scatter plots between selected category and all other categories"""
-        if not self.selected_category or not self.transaction_manager:
+        if not self.selected_category or self.data is None:
             self.clear_correlation_plots()
             return
 
         try:
             # Get all spending transactions
-            all_transactions = self.transaction_manager.get_all_transactions()
+            all_transactions = self.data.snapshot.transactions
             include_abnormal = self.include_abnormal_checkbox.isChecked()
             spending_transactions = [
                 t for t in all_transactions
@@ -1023,20 +1054,12 @@ class CategoriesView(QWidget):
         
     def populate_category_list(self):
         """Populate the category list with all available categories"""
-        if not self.transaction_manager:
+        if self.data is None:
             return
             
         try:
-            # Get all transactions and extract unique categories
-            all_transactions = self.transaction_manager.get_all_transactions()
-            categories = set()
-            
-            for transaction in all_transactions:
-                if transaction.category and transaction.is_spending:
-                    categories.add(transaction.category)
-            
             # Sort categories alphabetically
-            sorted_categories = sorted(categories)
+            sorted_categories = sorted(self.data.spending_categories)
             
             self.category_list.clear()
             
@@ -1073,12 +1096,12 @@ class CategoriesView(QWidget):
                   Currently: Alphabetical ordering (A-Z) for consistent user experience
                   Future: Custom user-defined ordering when custom_order parameter is provided
         """
-        if not self.transaction_manager:
+        if self.data is None:
             return []
 
         try:
             # Get all spending transactions
-            all_transactions = self.transaction_manager.get_all_transactions()
+            all_transactions = self.data.snapshot.transactions
             include_abnormal = self.include_abnormal_checkbox.isChecked()
             spending_transactions = [t for t in all_transactions if t.is_spending and (include_abnormal or t.include_in_analytics)]
 
@@ -1153,12 +1176,12 @@ class CategoriesView(QWidget):
 
     def update_category_stats(self):
         """Update category overview statistics"""
-        if not self.transaction_manager:
+        if self.data is None:
             return
 
         try:
             # Get all spending transactions
-            all_transactions = self.transaction_manager.get_all_transactions()
+            all_transactions = self.data.snapshot.transactions
             include_abnormal = self.include_abnormal_checkbox.isChecked()
             spending_transactions = [t for t in all_transactions if t.is_spending and (include_abnormal or t.include_in_analytics)]
             
@@ -1186,7 +1209,7 @@ class CategoriesView(QWidget):
             
     def update_box_plot(self):
         """Update box plot with purchase value distribution by category"""
-        if not self.transaction_manager or not self.box_plot_widget:
+        if self.data is None or not self.box_plot_widget:
             return
 
         try:
@@ -1195,7 +1218,7 @@ class CategoriesView(QWidget):
 
             if sorted_categories:
                 # Group transactions by category
-                all_transactions = self.transaction_manager.get_all_transactions()
+                all_transactions = self.data.snapshot.transactions
                 include_abnormal = self.include_abnormal_checkbox.isChecked()
                 spending_transactions = [t for t in all_transactions if t.is_spending and (include_abnormal or t.include_in_analytics)]
 
@@ -1238,7 +1261,7 @@ class CategoriesView(QWidget):
             
     def update_main_pie_chart(self):
         """Update main pie chart with all-time category spending"""
-        if not self.transaction_manager or not self.main_pie_chart:
+        if self.data is None or not self.main_pie_chart:
             return
 
         try:
@@ -1339,8 +1362,43 @@ class CategoriesView(QWidget):
                 }}
             """)
 
-    def refresh(self):
-        """Refresh categories view with current data"""
+    def category_list_changed(self):
+        """Whether the spending categories differ from the ones listed"""
+        listed = {self.category_list.item(row).data(Qt.ItemDataRole.UserRole) for row in range(self.category_list.count())}
+        return listed != self.data.spending_categories
+
+    def gather_data(self, ticket=None):
+        """
+        Load everything the view paints into a CategoriesData
+
+        Safe to run on a background thread (BudgetApp's BackgroundLoader): it
+        touches no widgets and reads through the shared snapshot's own session.
+        """
+        version = get_data_version()
+        snapshot = transaction_snapshots.get()
+        return CategoriesData(
+            version=version,
+            snapshot=snapshot,
+            spending_categories=frozenset(t.category for t in snapshot.transactions if t.category and t.is_spending),
+        )
+
+    def apply_change(self, change, data=None):
+        """Refresh what a DataChange made stale (see PANEL_DEPENDENCIES)"""
+        self.data = data if data is not None else self.gather_data()
+        panels = invalidated_panels(self, change)
+        if "populate_category_list" in panels and "update_category_details" in panels:
+            panels.remove("update_category_details")  # The list refreshes the selected category itself
+        for panel in panels:
+            getattr(self, panel)()
+
+    def refresh(self, data=None):
+        """
+        Paint the categories view
+
+        Args:
+            data: CategoriesData from gather_data (loaded here, on the UI thread, if not given)
+        """
+        self.data = data if data is not None else self.gather_data()
         self.populate_category_list()
         self.update_category_stats()
         self.update_box_plot()
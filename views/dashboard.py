@@ -11,6 +11,13 @@ from widgets import (PieChartWidget, LineChartWidget, BarChartWidget,
 from views.dialogs.account_selector_dialog import AccountSelectorDialog
 from views.dialogs.hour_calculator_dialog import HourCalculatorDialog
 from views.dialogs.settings_dialog import get_setting
+from services.change_events import ChangeKind, Depends, invalidated_panels
+from services.transaction_snapshot import TransactionSnapshot, transaction_snapshots
+from models import get_db, get_data_version, Account, Bill, Week
+from models.account_history import AccountHistoryManager
+from typing import NamedTuple, Optional, Tuple
+from datetime import date
+from sqlalchemy import desc
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
@@ -43,9 +50,15 @@ class RingChartWidget(QWidget):
         
         # Make rings half the size but square for just the ring: 50x50
         self.setFixedSize(50, 50)
+        self._wedges = None  # Persistent ring artists - updated in place after the first draw
+        self._centre_circle = None
         
     def update_data(self, percentage: float, label: str = ""):
         """Update ring chart with percentage data"""
+        if self._wedges is not None:
+            self._update_ring_in_place(percentage)
+            return
+
         self.figure.clear()
         ax = self.figure.add_subplot(111)
         
@@ -67,6 +80,26 @@ class RingChartWidget(QWidget):
         #        fontsize=12, fontweight='bold', color=colors['text_primary'])
         
         ax.axis('equal')
+        self._wedges = wedges
+        self._centre_circle = centre_circle
+        self.canvas.draw()
+
+    def _update_ring_in_place(self, percentage: float):
+        """Re-angle the two existing wedges and recolor them (same geometry as ax.pie, clockwise from 12 o'clock)"""
+        sizes = np.array([percentage, 100 - percentage], dtype=float)
+        if np.any(sizes < 0):
+            raise ValueError("Wedge sizes 'x' must be non negative values")
+
+        colors = theme_manager.get_colors()
+        theta1 = 90 / 360
+        for wedge, fraction, color in zip(self._wedges, sizes / sizes.sum(),
+                                          (colors['primary'], colors['surface_variant'])):
+            theta2 = theta1 - fraction
+            wedge.set_theta1(360 * theta2)
+            wedge.set_theta2(360 * theta1)
+            wedge.set_facecolor(color)
+            theta1 = theta2
+        self._centre_circle.set_facecolor(colors['surface'])
         self.canvas.draw()
 
 
@@ -319,7 +352,66 @@ class StackedAreaWidget(QWidget):
         self.canvas.draw()
 
 
+_SPENDING = ("spending",)
+
+
+class DashboardAccount(NamedTuple):
+    """A savings account as the Dashboard paints it"""
+    id: int
+    name: str
+    running_total: float
+    goal_amount: float
+
+
+class DashboardBill(NamedTuple):
+    """A bill as the Dashboard paints it"""
+    id: int
+    name: str
+    running_total: float
+    typical_amount: float
+
+
+class DashboardWeek(NamedTuple):
+    """The most recent pay week"""
+    week_number: int
+    start_date: date
+    end_date: date
+    running_total: float
+
+
+class DashboardData(NamedTuple):
+    """Everything the Dashboard paints, gathered off the UI thread (treat as read-only)"""
+    version: int
+    snapshot: TransactionSnapshot           # Shared read-only transactions, newest first
+    accounts: Tuple[DashboardAccount, ...]  # By id, like get_all_accounts()
+    bills: Tuple[DashboardBill, ...]        # By id, like get_all_bills()
+    current_week: Optional[DashboardWeek]   # None before the first paycheck
+    total_income: float
+
+
 class DashboardView(QWidget):
+    # Which data changes make which panel stale (panel update method -> reasons)
+    PANEL_DEPENDENCIES = {
+        "update_total_accounted": [Depends(ChangeKind.ACCOUNTS, ChangeKind.BILLS)],
+        "update_accounts_display": [Depends(ChangeKind.ACCOUNTS)],
+        "update_weekly_status": [
+            Depends(ChangeKind.WEEKS),
+            Depends(ChangeKind.TRANSACTIONS, types=_SPENDING, dates=lambda view: view.get_weekly_status_dates()),
+        ],
+        "update_bills_status": [Depends(ChangeKind.BILLS)],
+        "update_category_key": [Depends(ChangeKind.TRANSACTIONS, types=_SPENDING)],
+        "update_pie_charts": [Depends(ChangeKind.WEEKS), Depends(ChangeKind.TRANSACTIONS, types=_SPENDING)],
+        "update_stacked_area_chart": [Depends(ChangeKind.TRANSACTIONS, types=_SPENDING)],
+        "update_savings_line_charts": [Depends(ChangeKind.ACCOUNTS, ChangeKind.BILLS)],
+        "update_ring_charts": [Depends(ChangeKind.BILLS)],
+        "update_heatmap": [Depends(ChangeKind.TRANSACTIONS, types=_SPENDING)],
+        "update_savings_progress": [Depends(ChangeKind.ACCOUNTS)],
+        "update_purchase_histogram": [Depends(ChangeKind.TRANSACTIONS, types=_SPENDING)],
+        "update_weekly_spending_trends": [Depends(ChangeKind.TRANSACTIONS, types=_SPENDING)],
+        "update_category_boxplot": [Depends(ChangeKind.TRANSACTIONS, types=_SPENDING)],
+        "update_hour_calc_display": [Depends(ChangeKind.TRANSACTIONS, types=("spending", "income"))],
+    }
+
     def __init__(self, transaction_manager=None, analytics_engine=None):
         super().__init__()
         self.transaction_manager = transaction_manager
@@ -345,6 +437,8 @@ class DashboardView(QWidget):
         self.purchase_histogram = None
         self.weekly_trend_chart = None
         self.category_boxplot = None
+
+        self.data = None  # DashboardData being shown - see gather_data
         
         self.init_ui()
 
@@ -364,12 +458,12 @@ class DashboardView(QWidget):
                   Currently: Alphabetical ordering (A-Z) for consistent user experience
                   Future: Custom user-defined ordering when custom_order parameter is provided
         """
-        if not self.transaction_manager:
+        if self.data is None:
             return []
 
         try:
             # Get all spending transactions
-            all_transactions = getattr(self, '_cached_all_transactions', None) or self.transaction_manager.get_all_transactions()
+            all_transactions = self.data.snapshot.transactions
             spending_transactions = [t for t in all_transactions if t.is_spending and t.include_in_analytics]
 
             # Calculate spending by category
@@ -474,7 +568,7 @@ class DashboardView(QWidget):
         self.refresh_button.setText("🔄")
         self.refresh_button.setToolTip("Refresh Dashboard")
         self.refresh_button.setFixedSize(40, 30)
-        self.refresh_button.clicked.connect(self.refresh)
+        self.refresh_button.clicked.connect(lambda: self.refresh())
         # Styling applied in apply_header_theme method
         header_layout.addWidget(self.refresh_button)
 
@@ -655,9 +749,7 @@ class DashboardView(QWidget):
         
         self.setLayout(main_layout)
         
-        # Initial refresh to populate data and auto-select for line charts
-        if self.transaction_manager and self.analytics_engine:
-            self.refresh()
+        # No initial refresh - BudgetApp loads the data in the background when the tab is shown
         
         # Apply theme to hour calculator button
         self.apply_hour_calc_button_theme()
@@ -860,7 +952,8 @@ class DashboardView(QWidget):
     def toggle_analytics_mode(self, checked):
         """Toggle between normal and all spending analytics"""
         self.include_analytics_only = checked
-        self.refresh()
+        if self.data is not None:
+            self.refresh(data=self.data)  # The snapshot holds both filters - repaint without reloading
 
     def apply_time_frame_filter(self, transactions):
         """Apply time frame filtering to a list of transactions"""
@@ -891,7 +984,7 @@ class DashboardView(QWidget):
         Use this for summary charts like pie charts, heatmaps, histograms, etc.
         For timeline charts, use get_timeline_filtered_spending_transactions() instead.
         """
-        transactions = getattr(self, '_cached_spending', None) or self.transaction_manager.get_spending_transactions(self.include_analytics_only)
+        transactions = self.data.snapshot.spending(self.include_analytics_only)
 
         # Filter out rollover transactions (category = "Rollover" or description contains "rollover")
         filtered_transactions = []
@@ -982,7 +1075,7 @@ class DashboardView(QWidget):
                 days_left_in_week = 7 - (today.weekday() + 1)
                 
                 # Get current week spending using analytics and rollover filtering (ignore time frame)
-                spending_transactions = getattr(self, '_cached_spending', None) or self.transaction_manager.get_spending_transactions(self.include_analytics_only)
+                spending_transactions = self.data.snapshot.spending(self.include_analytics_only)
 
                 # Filter out rollover transactions and get current week data
                 current_week_spending = []
@@ -1000,8 +1093,7 @@ class DashboardView(QWidget):
                 week_spent = sum(t.amount for t in current_week_spending)
                 
                 # Estimate weekly budget
-                income_summary = self.transaction_manager.get_income_vs_spending_summary()
-                estimated_weekly_budget = income_summary.get('total_income', 400) / 4
+                estimated_weekly_budget = self.data.total_income / 4
                 week_remaining = max(0, estimated_weekly_budget - week_spent)
                 
                 target_amount = week_remaining
@@ -1022,8 +1114,13 @@ class DashboardView(QWidget):
         except Exception as e:
             print(f"Error opening hour calculator dialog: {e}")
     
-    def refresh(self):
-        """Refresh all dashboard data and charts"""
+    def refresh(self, data=None):
+        """
+        Paint all dashboard data and charts
+
+        Args:
+            data: DashboardData from gather_data (loaded here, on the UI thread, if not given)
+        """
         if not self.transaction_manager or not self.analytics_engine:
             self.set_error_state("Services not available")
             return
@@ -1033,13 +1130,9 @@ class DashboardView(QWidget):
             from views.dialogs.settings_dialog import get_setting
             self.time_frame_filter = get_setting("time_frame_filter", "All Time")
 
-            # Cache frequently-used data at start to avoid multiple DB queries
-            self._cached_accounts = self.transaction_manager.get_all_accounts()
-            self._cached_bills = self.transaction_manager.get_all_bills()
-            self._cached_spending = self.transaction_manager.get_spending_transactions(self.include_analytics_only)
-            self._cached_all_transactions = self.transaction_manager.get_all_transactions()
+            self.data = data if data is not None else self.gather_data()
 
-            # Update all sections (they can now use cached data)
+            # Update all sections
             self.update_total_accounted()
             self.update_accounts_display()
             self.update_weekly_status()
@@ -1060,17 +1153,74 @@ class DashboardView(QWidget):
             if hasattr(self, 'gif_widget') and self.gif_widget:
                 self.gif_widget.load_gif()
 
-            # Clear cache after refresh to free memory
-            self._cached_accounts = None
-            self._cached_bills = None
-            self._cached_spending = None
-            self._cached_all_transactions = None
-
         except Exception as e:
             error_msg = f"Error refreshing dashboard: {str(e)}"
             print(error_msg)
             self.set_error_state(error_msg)
     
+    def gather_data(self, ticket=None):
+        """
+        Load everything the dashboard paints into a DashboardData
+
+        Safe to run on a background thread (BudgetApp's BackgroundLoader): it
+        touches no widgets and uses its own session. Returns None if the ticket
+        was cancelled part way.
+        """
+        version = get_data_version()
+        snapshot = transaction_snapshots.get()
+        if ticket is not None and ticket.cancelled:
+            return None
+
+        db = get_db()
+        try:
+            # Every balance from the in-memory index - one history query, not one per account
+            history_manager = AccountHistoryManager(db)
+            history_manager.prime_balance_index()
+
+            accounts = tuple(
+                DashboardAccount(row.id, row.name, history_manager.get_current_balance(row.id, "savings"), row.goal_amount)
+                for row in db.query(Account.id, Account.name, Account.goal_amount).order_by(Account.id)
+            )
+            bills = tuple(
+                DashboardBill(row.id, row.name, history_manager.get_current_balance(row.id, "bill"), row.typical_amount)
+                for row in db.query(Bill.id, Bill.name, Bill.typical_amount).order_by(Bill.id)
+            )
+            week = db.query(
+                Week.week_number, Week.start_date, Week.end_date, Week.running_total
+            ).order_by(desc(Week.week_number)).first()
+        finally:
+            db.close()
+
+        return DashboardData(
+            version=version,
+            snapshot=snapshot,
+            accounts=accounts,
+            bills=bills,
+            current_week=DashboardWeek(*week) if week else None,
+            total_income=sum(t.amount for t in snapshot.transactions if t.is_income),
+        )
+
+    def apply_change(self, change, data=None):
+        """Redraw only the panels a DataChange made stale (see PANEL_DEPENDENCIES)"""
+        if not self.transaction_manager or not self.analytics_engine:
+            return
+
+        try:
+            self.data = data if data is not None else self.gather_data()
+            for panel in invalidated_panels(self, change):
+                getattr(self, panel)()
+        except Exception as e:
+            print(f"Error updating dashboard panels: {e}")
+
+    def get_weekly_status_dates(self):
+        """(start, end) of the spending the Week card sums - this calendar week, or the last tracked week when stale"""
+        from datetime import date, timedelta
+        today = date.today()
+        current_week = self.data.current_week if self.data is not None else None
+        if current_week and today > current_week.end_date:
+            return current_week.start_date, current_week.end_date
+        return today - timedelta(days=today.weekday()), None
+
     def set_error_state(self, error_msg: str):
         """Set all display areas to show error message"""
         if hasattr(self, 'account_summary_label'):
@@ -1093,8 +1243,7 @@ class DashboardView(QWidget):
     def update_accounts_display(self):
         """Update account summary display"""
         try:
-            # Use cached data if available, otherwise fetch
-            accounts = getattr(self, '_cached_accounts', None) or self.transaction_manager.get_all_accounts()
+            accounts = self.data.accounts
             
             if not accounts:
                 self.account_summary_label.setText("No accounts found")
@@ -1119,17 +1268,13 @@ class DashboardView(QWidget):
         try:
             total = 0.0
 
-            # Sum all savings account balances (using cached data)
-            accounts = getattr(self, '_cached_accounts', None) or self.transaction_manager.get_all_accounts()
-            for account in accounts:
-                balance = account.get_current_balance()
-                total += balance
+            # Sum all savings account balances
+            for account in self.data.accounts:
+                total += account.running_total
 
-            # Sum all bill account balances (using cached data)
-            bills = getattr(self, '_cached_bills', None) or self.transaction_manager.get_all_bills()
-            for bill in bills:
-                balance = bill.get_current_balance()
-                total += balance
+            # Sum all bill account balances
+            for bill in self.data.bills:
+                total += bill.running_total
 
             # Update label with formatted total (includes negative balances)
             self.total_accounted_label.setText(f"Total: ${total:,.2f}")
@@ -1146,8 +1291,8 @@ class DashboardView(QWidget):
             days_into_week = today.weekday() + 1  # 1-7 (Monday = 1)
             days_left_in_week = 7 - days_into_week
 
-            # Get the most recent week from the database
-            current_week = self.transaction_manager.get_current_week()
+            # The most recent week
+            current_week = self.data.current_week
 
             # STALE DATA DETECTION (Added 2024-10-20):
             # If user hasn't added their latest paycheck, show warning in Week card
@@ -1180,7 +1325,7 @@ class DashboardView(QWidget):
                     week_started = 0
 
                 # Get spending from the last tracked week
-                spending_transactions = self.transaction_manager.get_spending_transactions(self.include_analytics_only)
+                spending_transactions = self.data.snapshot.spending(self.include_analytics_only)
                 week_spent = 0
                 if current_week:
                     for t in spending_transactions:
@@ -1203,7 +1348,7 @@ class DashboardView(QWidget):
             else:
                 # Normal case: data is current
                 # Get current week transactions using analytics and rollover filtering (ignore time frame)
-                spending_transactions = self.transaction_manager.get_spending_transactions(self.include_analytics_only)
+                spending_transactions = self.data.snapshot.spending(self.include_analytics_only)
 
                 # Filter out rollover transactions and get current week data
                 current_week_spending = []
@@ -1253,7 +1398,7 @@ class DashboardView(QWidget):
     def update_bills_status(self):
         """Update bills status display"""
         try:
-            bills = getattr(self, '_cached_bills', None) or self.transaction_manager.get_all_bills()
+            bills = self.data.bills
             
             if not bills:
                 self.bills_status_label.setText("No bills configured")
@@ -1350,13 +1495,13 @@ class DashboardView(QWidget):
             week_start = today - timedelta(days=today.weekday())  # Monday of current week
 
             # Check if data is stale (same logic as Week card)
-            current_week_db = self.transaction_manager.get_current_week()
+            current_week_db = self.data.current_week
             data_is_stale = False
             if current_week_db and today.date() > current_week_db.end_date:
                 data_is_stale = True
 
             # Get spending transactions using ONLY analytics filtering (ignore time frame for current week)
-            spending_transactions = self.transaction_manager.get_spending_transactions(self.include_analytics_only)
+            spending_transactions = self.data.snapshot.spending(self.include_analytics_only)
 
             # Filter out rollover transactions and get current week data
             current_week_transactions = []
@@ -1481,8 +1626,8 @@ class DashboardView(QWidget):
     def update_ring_charts(self):
         """Update ring charts showing account progress"""
         try:
-            # Get all bills from database (rings now represent bills)
-            bills = getattr(self, '_cached_bills', None) or self.transaction_manager.get_all_bills()
+            # Rings represent bills, in the order setup_bill_rings created them
+            bills = self.data.bills
             
             # Update each ring with bill progress (running_total / typical_amount)
             for i, ring_chart in enumerate(self.ring_charts):
@@ -1554,11 +1699,8 @@ class DashboardView(QWidget):
     def update_savings_progress(self):
         """Update savings progress chart with real account data"""
         try:
-            # Get all savings accounts from database
-            accounts = getattr(self, '_cached_accounts', None) or self.transaction_manager.get_all_accounts()
-            
             if self.savings_progress_chart:
-                self.savings_progress_chart.update_data(accounts)
+                self.savings_progress_chart.update_data(self.data.accounts)
                 
         except Exception as e:
             print(f"Error updating savings progress: {e}")
@@ -1687,6 +1829,9 @@ class DashboardView(QWidget):
             self.apply_hour_calc_button_theme()
             self.apply_header_theme()  # Update LCD date and checkbox styling
 
+            if self.data is None:
+                return  # Not loaded yet - the first refresh paints with the new theme
+
             # Update visual theme elements without recalculating data
             self.update_category_key()  # Only updates colors, not data
 
@@ -1788,8 +1933,8 @@ class DashboardView(QWidget):
     def setup_bill_rings(self):
         """Setup dynamic bill rings based on available bills"""
         try:
-            # Get all bills from database
-            bills = getattr(self, '_cached_bills', None) or self.transaction_manager.get_all_bills()
+            # Built once with the view, so read the bills directly
+            bills = self.transaction_manager.get_all_bills()
             
             # Limit to max 7 rings to better utilize space
             max_rings = 7
@@ -1889,7 +2034,11 @@ class DashboardView(QWidget):
             if not selected_account or not chart:
                 return
             
+            # Re-read the selection from the loaded data - the selector dialog hands over an
+            # ORM object, and rows from an earlier load hold old balances
             account_type, account_obj = selected_account
+            account_obj = self.find_loaded_account(account_type, account_obj.id) or account_obj
+            self.selected_accounts[chart_index] = (account_type, account_obj)
             running_total_data = self.get_account_running_totals(account_type, account_obj)
             
             if running_total_data:
@@ -1899,13 +2048,20 @@ class DashboardView(QWidget):
         except Exception as e:
             print(f"Error updating single savings chart: {e}")
     
+    def find_loaded_account(self, account_type, account_id):
+        """The DashboardAccount ('account') or DashboardBill with this id, or None"""
+        if self.data is None:
+            return None
+        rows = self.data.accounts if account_type == 'account' else self.data.bills
+        return next((row for row in rows if row.id == account_id), None)
+
     def get_account_running_totals(self, account_type, account_obj):
         """Get running totals for an account over time"""
         try:
             from datetime import datetime, timedelta
             
             # Get transactions for this account
-            all_transactions = getattr(self, '_cached_all_transactions', None) or self.transaction_manager.get_all_transactions()
+            all_transactions = self.data.snapshot.transactions
 
             # Apply time filtering to all transactions
             all_transactions = self.apply_time_frame_filter(all_transactions)
@@ -1982,8 +2138,8 @@ class DashboardView(QWidget):
             import random
 
             # Get available accounts and bills
-            accounts = getattr(self, '_cached_accounts', None) or self.transaction_manager.get_all_accounts()
-            bills = getattr(self, '_cached_bills', None) or self.transaction_manager.get_all_bills()
+            accounts = self.data.accounts
+            bills = self.data.bills
 
             # Get setting for this chart
             setting_key = f"dashboard_chart{chart_index + 1}_account"
@@ -1897,83 +1897,21 @@ class SettingsDialog(QDialog):
             transaction_skipped = 0
             negative_count = 0
 
-            for idx, row in spending_df.iterrows():
-                if pd.isna(row["Date"]) or pd.isna(row["Catigorie"]) or pd.isna(row["Amount"]):
-                    continue
-
-                transaction_date = pd.to_datetime(row["Date"]).date()
-                category = str(row["Catigorie"]).strip()
-                amount = float(row["Amount"])
-
-                # For merge mode, skip if transaction already exists
-                if import_mode == "merge":
-                    txn_key = (transaction_date, abs(amount), category)
-                    if txn_key in existing_transactions:
-                        transaction_skipped += 1
-                        continue
-
-                # Determine which week this transaction belongs to
-                week_number = transaction_manager.get_week_number_for_date(transaction_date)
-                if week_number is None:
-                    continue
-
-                # Determine include_in_analytics flag (negative amounts excluded from plotting)
-                include_in_analytics = amount >= 0
-                if amount < 0:
-                    negative_count += 1
-
-                transaction_data = {
-                    "transaction_type": "spending",
-                    "week_number": week_number,
-                    "amount": abs(amount),
-                    "date": transaction_date,
-                    "description": f"{category} transaction",
-                    "category": category,
-                    "include_in_analytics": include_in_analytics
-                }
-
-                try:
-                    transaction_manager.add_transaction(transaction_data)
-                    transaction_count += 1
-                except Exception as e:
-                    continue
-
-                # Update progress
-                items_processed += 1
-                if total_items > 0:
-                    progress_bar.setValue(int((items_processed / total_items) * 100))
-                    if idx % 20 == 0:  # Process events every 20 transactions to reduce overhead
-                        QCoreApplication.processEvents()
-
-            # Import bill payments FIFTH
-            billpay_count = 0
-            billpay_skipped = 0
-            unmatched_bills = set()
-
-            if not billpays_df.empty:
-                existing_bills = {bill.name.lower(): bill for bill in db.query(Bill).all()}
-
-                for idx, row in billpays_df.iterrows():
-                    if pd.isna(row["Date.1"]) or pd.isna(row["Bill"]) or pd.isna(row["Amount.2"]):
+            # One batch: history is recalculated once per account and rollovers once per pay period
+            with transaction_manager.batch():
+                for idx, row in spending_df.iterrows():
+                    if pd.isna(row["Date"]) or pd.isna(row["Catigorie"]) or pd.isna(row["Amount"]):
                         continue
 
-                    transaction_date = pd.to_datetime(row["Date.1"]).date()
-                    bill_name = str(row["Bill"]).strip()
-                    amount = float(row["Amount.2"])
+                    transaction_date = pd.to_datetime(row["Date"]).date()
+                    category = str(row["Catigorie"]).strip()
+                    amount = float(row["Amount"])
 
-                    # Find matching bill (case-insensitive)
-                    bill_name_lower = bill_name.lower()
-                    if bill_name_lower not in existing_bills:
-                        unmatched_bills.add(bill_name)
-                        continue
-
-                    matched_bill = existing_bills[bill_name_lower]
-
-                    # For merge mode, skip if bill transaction already exists
+                    # For merge mode, skip if transaction already exists
                     if import_mode == "merge":
-                        txn_key = (transaction_date, abs(amount), matched_bill.bill_type)
+                        txn_key = (transaction_date, abs(amount), category)
                         if txn_key in existing_transactions:
-                            billpay_skipped += 1
+                            transaction_skipped += 1
                             continue
 
                     # Determine which week this transaction belongs to
@@ -1981,31 +1919,25 @@ class SettingsDialog(QDialog):
                     if week_number is None:
                         continue
 
-                    # Determine transaction type based on amount sign
+                    # Determine include_in_analytics flag (negative amounts excluded from plotting)
+                    include_in_analytics = amount >= 0
                     if amount < 0:
-                        transaction_data = {
-                            "transaction_type": "bill_pay",
-                            "week_number": week_number,
-                            "amount": abs(amount),
-                            "date": transaction_date,
-                            "description": f"Payment for {bill_name}",
-                            "bill_id": matched_bill.id,
-                            "bill_type": matched_bill.bill_type
-                        }
-                    else:
-                        transaction_data = {
-                            "transaction_type": "saving",
-                            "week_number": week_number,
-                            "amount": amount,
-                            "date": transaction_date,
-                            "description": f"Manual savings for {bill_name}",
-                            "bill_id": matched_bill.id,
-                            "bill_type": matched_bill.bill_type
-                        }
+                        negative_count += 1
+
+                    transaction_data = {
+                        "transaction_type": "spending",
+                        "week_number": week_number,
+                        "amount": abs(amount),
+                        "date": transaction_date,
+                        "description": f"{category} transaction",
+                        "category": category,
+                        "include_in_analytics": include_in_analytics
+                    }
 
                     try:
-                        transaction_manager.add_transaction(transaction_data)
-                        billpay_count += 1
+                        with transaction_manager.savepoint():  # A bad row is undone without failing the batch
+                            transaction_manager.add_transaction(transaction_data)
+                        transaction_count += 1
                     except Exception as e:
                         continue
 
@@ -2013,9 +1945,82 @@ class SettingsDialog(QDialog):
                     items_processed += 1
                     if total_items > 0:
                         progress_bar.setValue(int((items_processed / total_items) * 100))
-                        if idx % 10 == 0:  # Process events every 10 bill payments to reduce overhead
+                        if idx % 20 == 0:  # Process events every 20 transactions to reduce overhead
                             QCoreApplication.processEvents()
 
+            # Import bill payments FIFTH
+            billpay_count = 0
+            billpay_skipped = 0
+            unmatched_bills = set()
+
+            if not billpays_df.empty:
+                existing_bills = {bill.name.lower(): bill for bill in db.query(Bill).all()}
+
+                with transaction_manager.batch():
+                    for idx, row in billpays_df.iterrows():
+                        if pd.isna(row["Date.1"]) or pd.isna(row["Bill"]) or pd.isna(row["Amount.2"]):
+                            continue
+
+                        transaction_date = pd.to_datetime(row["Date.1"]).date()
+                        bill_name = str(row["Bill"]).strip()
+                        amount = float(row["Amount.2"])
+
+                        # Find matching bill (case-insensitive)
+                        bill_name_lower = bill_name.lower()
+                        if bill_name_lower not in existing_bills:
+                            unmatched_bills.add(bill_name)
+                            continue
+
+                        matched_bill = existing_bills[bill_name_lower]
+
+                        # For merge mode, skip if bill transaction already exists
+                        if import_mode == "merge":
+                            txn_key = (transaction_date, abs(amount), matched_bill.bill_type)
+                            if txn_key in existing_transactions:
+                                billpay_skipped += 1
+                                continue
+
+                        # Determine which week this transaction belongs to
+                        week_number = transaction_manager.get_week_number_for_date(transaction_date)
+                        if week_number is None:
+                            continue
+
+                        # Determine transaction type based on amount sign
+                        if amount < 0:
+                            transaction_data = {
+                                "transaction_type": "bill_pay",
+                                "week_number": week_number,
+                                "amount": abs(amount),
+                                "date": transaction_date,
+                                "description": f"Payment for {bill_name}",
+                                "bill_id": matched_bill.id,
+                                "bill_type": matched_bill.bill_type
+                            }
+                        else:
+                            transaction_data = {
+                                "transaction_type": "saving",
+                                "week_number": week_number,
+                                "amount": amount,
+                                "date": transaction_date,
+                                "description": f"Manual savings for {bill_name}",
+                                "bill_id": matched_bill.id,
+                                "bill_type": matched_bill.bill_type
+                            }
+
+                        try:
+                            with transaction_manager.savepoint():  # A bad row is undone without failing the batch
+                                transaction_manager.add_transaction(transaction_data)
+                            billpay_count += 1
+                        except Exception as e:
+                            continue
+
+                        # Update progress
+                        items_processed += 1
+                        if total_items > 0:
+                            progress_bar.setValue(int((items_processed / total_items) * 100))
+                            if idx % 10 == 0:  # Process events every 10 bill payments to reduce overhead
+                                QCoreApplication.processEvents()
+
             transaction_manager.close()
             paycheck_processor.close()
             db.close()
@@ -391,10 +391,10 @@ class TransferDialog(QDialog):
                                              amount, transfer_date, week_number,
                                              from_notes, to_notes)
 
-            # Trigger parent refresh BEFORE showing success message (hides the processing delay)
+            # Redraw the visible tab BEFORE showing success message (hides the processing delay)
             if self.parent():
-                if hasattr(self.parent(), 'refresh_all_views'):
-                    self.parent().refresh_all_views()
+                if hasattr(self.parent(), 'refresh_visible_tab'):
+                    self.parent().refresh_visible_tab()
 
             # Show success message after refresh is done
             QMessageBox.information(self, "Success", f"Transfer of ${amount:.2f} completed successfully!")
@@ -25,11 +25,17 @@ import openpyxl
 from openpyxl.styles import Font as ExcelFont, Alignment
 from widgets.chart_widget import (ReimbursementStatsWidget, ReimbursementProgressWidget,
                                   ReimbursementDotPlotWidget, ReimbursementHeatmapWidget)
+from services.change_events import ChangeKind, Depends, invalidated_panels
 
 
 class ReimbursementsView(QWidget):
     """Reimbursements tab for tracking expenses awaiting reimbursement"""
 
+    # Which data changes make which panel stale (panel update method -> reasons)
+    PANEL_DEPENDENCIES = {
+        "refresh": [Depends(ChangeKind.REIMBURSEMENTS)],
+    }
+
     def __init__(self, transaction_manager, parent=None):
         super().__init__(parent)
         self.transaction_manager = transaction_manager
@@ -937,6 +943,11 @@ class ReimbursementsView(QWidget):
             import traceback
             traceback.print_exc()
 
+    def apply_change(self, change):
+        """Refresh what a DataChange made stale (see PANEL_DEPENDENCIES)"""
+        for panel in invalidated_panels(self, change):
+            getattr(self, panel)()
+
     def refresh(self):
         """Refresh the entire view (tag list and table)"""
         self.populate_tag_list()
@@ -8,9 +8,15 @@ from PyQt6.QtCore import Qt
 from themes import theme_manager
 from widgets import AccountRowWidget
 from views.dialogs.settings_dialog import get_setting, save_setting
+from services.change_events import ChangeKind, Depends, invalidated_panels
 
 
 class SavingsView(QWidget):
+    # Which data changes make which panel stale (panel update method -> reasons)
+    PANEL_DEPENDENCIES = {
+        "refresh": [Depends(ChangeKind.ACCOUNTS)],
+    }
+
     def __init__(self, transaction_manager=None):
         super().__init__()
         self.transaction_manager = transaction_manager
@@ -333,6 +339,11 @@ class SavingsView(QWidget):
             inactive = [a for a in accounts if not a.is_currently_active]
             return sorted(active, key=lambda a: (a.name or "").lower()) + sorted(inactive, key=lambda a: (a.name or "").lower())
     
+    def apply_change(self, change):
+        """Refresh what a DataChange made stale (see PANEL_DEPENDENCIES)"""
+        for panel in invalidated_panels(self, change):
+            getattr(self, panel)()
+
     def refresh(self):
         """Refresh savings view with current account data"""
         if not self.transaction_manager:
@@ -0,0 +1,290 @@
+"""
+Scratch Pad Grid - sparse spreadsheet view over WorkspaceCalculator.cells
+
+The grid is a QTableView over ScratchPadModel, which reads straight from the
+calculator's cells dict: an empty cell has no item, no widget and no stored
+format, so the sheet can be 10,000 rows x 702 columns (A-ZZ) while only the
+cells in use take memory. The view asks the model for the cells it is
+painting, so formatting a value (number, date, error) and its style (H1, H2,
+notes) happens only for visible cells. ScratchPadDelegate applies the styles.
+
+ScratchPadGrid keeps the QTableWidget calls ScratchPadView relies on
+(currentCellChanged, selectedRanges, setCurrentCell).
+"""
+
+from PyQt6.QtWidgets import (QTableView, QHeaderView, QAbstractItemView, QStyledItemDelegate,
+                             QStyleOptionViewItem, QTableWidgetSelectionRange)
+from PyQt6.QtCore import Qt, pyqtSignal, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QColor, QPalette, QFontMetrics
+from themes import theme_manager
+from datetime import date
+
+
+# Item data role beyond Qt's own
+CELL_FORMAT_ROLE = Qt.ItemDataRole.UserRole  # (format_type, is_error) for the delegate's styling
+
+HIGHLIGHT_COLOR = QColor(173, 216, 230, 100)  # Light blue - cells the selected cell depends on
+
+
+def format_cell_value(value) -> str:
+    """Text shown in the grid for a cell's value"""
+    if value is None:
+        return ""  # Restored but not yet evaluated
+    if isinstance(value, tuple) and len(value) == 2 and value[0] == "ERROR":
+        return "ERROR"
+    if isinstance(value, date):
+        return value.strftime("%m/%d/%Y")
+    if isinstance(value, float):
+        # Format numbers nicely
+        if value.is_integer():
+            return str(int(value))
+        return f"{value:.2f}"
+    return str(value)
+
+
+class ScratchPadModel(QAbstractTableModel):
+    """
+    Read-only table model over a WorkspaceCalculator's cells
+
+    Nothing is copied out of the calculator - data() looks cells up by
+    reference as they are painted. Call refresh_cells() after changing
+    cells so the view repaints them.
+    """
+
+    def __init__(self, calculator, num_rows: int, num_cols: int, parent=None):
+        super().__init__(parent)
+        self.calculator = calculator
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self.column_names = [calculator.cell_ref_to_str(0, col)[:-1] for col in range(num_cols)]
+        self.highlighted = set()  # Cell refs painted with HIGHLIGHT_COLOR
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.num_rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.num_cols
+
+    def cell_ref(self, row: int, col: int) -> str:
+        return f"{self.column_names[col]}{row + 1}"
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        cell_ref = self.cell_ref(index.row(), index.column())
+
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return HIGHLIGHT_COLOR if cell_ref in self.highlighted else None
+
+        cell_data = self.calculator.cells.get(cell_ref)
+        if cell_data is None:
+            return None
+        value = cell_data.get("value")
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return format_cell_value(value)
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            # Right-align numbers and dates
+            if isinstance(value, (int, float, date)):
+                return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+            return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        if role == CELL_FORMAT_ROLE:
+            is_error = isinstance(value, tuple) and len(value) == 2 and value[0] == "ERROR"
+            return (cell_data.get("format", "P"), is_error)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.column_names[section]
+        return str(section + 1)
+
+    def flags(self, index):
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def index_of(self, cell_ref: str) -> QModelIndex:
+        """Model index of a cell reference (invalid if it's outside the grid)"""
+        pos = self.calculator.parse_cell_reference(cell_ref)
+        if not pos:
+            return QModelIndex()
+        return self.index(*pos)
+
+    def refresh_cells(self, cell_refs):
+        """Repaint these cells (if they are visible)"""
+        for cell_ref in cell_refs:
+            index = self.index_of(cell_ref)
+            if index.isValid():
+                self.dataChanged.emit(index, index)
+
+    def refresh_all(self):
+        """Repaint every visible cell"""
+        self.dataChanged.emit(self.index(0, 0), self.index(self.num_rows - 1, self.num_cols - 1))
+
+    def set_highlights(self, cell_refs):
+        """Highlight exactly these cells"""
+        previous = self.highlighted
+        self.highlighted = set(cell_refs)
+        self.refresh_cells(previous ^ self.highlighted)
+
+
+class ScratchPadDelegate(QStyledItemDelegate):
+    """
+    Applies a cell's text format
+
+    Format types:
+    - H1: Primary color, bold, +4pt font size
+    - H2: Secondary color, bold, +1pt font size
+    - P: Normal (text_primary, regular)
+    - n: Note (text_secondary, italic)
+    Errors always use the theme's error color.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.styles = {}  # (format_type, is_error) -> (QColor, QFont, QFontMetrics), reset on theme change
+
+    def reset_styles(self):
+        self.styles = {}
+
+    def style_for(self, format_type: str, is_error: bool):
+        key = (format_type, is_error)
+        style = self.styles.get(key)
+        if style is not None:
+            return style
+
+        colors = theme_manager.get_colors()
+        font = theme_manager.get_font("main")
+
+        if format_type == "H1":
+            color = colors['primary']
+            font.setBold(True)
+            font.setPointSize(font.pointSize() + 4)  # SETTING: H1 size increase
+        elif format_type == "H2":
+            color = colors['secondary']
+            font.setBold(True)
+            font.setPointSize(font.pointSize() + 1)  # SETTING: H2 size increase
+        elif format_type == "n":
+            color = colors['text_secondary']
+            font.setItalic(True)
+        else:  # "P" or default
+            color = colors['text_primary']
+
+        # Don't override error color
+        if is_error:
+            color = colors['error']
+
+        style = self.styles[key] = (QColor(color), font, QFontMetrics(font))
+        return style
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        cell_format = index.data(CELL_FORMAT_ROLE)
+        if not cell_format:
+            return
+        color, font, metrics = self.style_for(*cell_format)
+        option.palette.setColor(QPalette.ColorRole.Text, color)
+        option.font = font
+        option.fontMetrics = metrics  # sizeHint (header row heights) measures with these
+
+
+class ScratchPadGrid(QTableView):
+    """
+    Spreadsheet grid for ScratchPadView
+
+    Selection and editing behave like the QTableWidget it replaces: contiguous
+    selection, no in-cell editing (the formula bar edits), and the same
+    currentCellChanged / selectedRanges / setCurrentCell calls.
+    """
+
+    # Signal emitted when the current cell changes: row, column, previous row, previous column
+    currentCellChanged = pyqtSignal(int, int, int, int)
+
+    def __init__(self, calculator, num_rows: int, num_cols: int, parent=None):
+        super().__init__(parent)
+
+        self.grid_model = ScratchPadModel(calculator, num_rows, num_cols, self)
+        self.setModel(self.grid_model)
+        self.grid_delegate = ScratchPadDelegate(self)
+        self.setItemDelegate(self.grid_delegate)
+        self.fitted_rows = set()  # Rows taller than the default (they hold a header)
+        self.header_heights = {}  # format_type -> row height, reset on theme change
+        self.selectionModel().currentChanged.connect(self._emit_current_cell_changed)
+
+        self.init_table()
+
+    def init_table(self):
+        """Initialize table settings"""
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.horizontalHeader().setDefaultSectionSize(100)
+
+        # Uniform row heights - measuring 702 cells per row for 10,000 rows would
+        # defeat the point. Rows holding headers are fitted one at a time (see fit_row)
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.setWordWrap(False)  # One line per cell, so a row's height depends only on its fonts
+
+        # CHANGED: Allow multiple cell selection (was SingleSelection)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.ContiguousSelection)
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)  # Keep selection visible
+
+        # Disable in-cell editing - all editing happens in formula bar
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+
+    def _emit_current_cell_changed(self, current, previous):
+        self.currentCellChanged.emit(current.row(), current.column(), previous.row(), previous.column())
+
+    def selectedRanges(self):
+        """Selected blocks as QTableWidgetSelectionRange (topRow, leftColumn, bottomRow, rightColumn)"""
+        return [
+            QTableWidgetSelectionRange(block.top(), block.left(), block.bottom(), block.right())
+            for block in self.selectionModel().selection()
+        ]
+
+    def setCurrentCell(self, row: int, col: int):
+        self.setCurrentIndex(self.grid_model.index(row, col))
+
+    def fit_row(self, row: int):
+        """Resize one row to fit its H1/H2 cells (header text needs more than the default height)"""
+        model = self.grid_model
+        cells = model.calculator.cells
+        height = self.verticalHeader().defaultSectionSize()
+        for col in range(model.num_cols):
+            cell_data = cells.get(model.cell_ref(row, col))
+            if cell_data and cell_data.get("format") in ("H1", "H2"):
+                height = max(height, self.header_height(cell_data["format"], model.index(row, col)))
+
+        self.verticalHeader().resizeSection(row, height)
+        if height > self.verticalHeader().defaultSectionSize():
+            self.fitted_rows.add(row)
+        else:
+            self.fitted_rows.discard(row)
+
+    def header_height(self, format_type: str, index) -> int:
+        """Row height a single line of H1/H2 text needs (measured once per theme)"""
+        height = self.header_heights.get(format_type)
+        if height is None:
+            option = QStyleOptionViewItem()
+            self.initViewItemOption(option)
+            height = self.header_heights[format_type] = self.grid_delegate.sizeHint(option, index).height()
+        return height
+
+    def reset_rows(self):
+        """Put every fitted row back to the default height"""
+        default = self.verticalHeader().defaultSectionSize()
+        for row in self.fitted_rows:
+            self.verticalHeader().resizeSection(row, default)
+        self.fitted_rows.clear()
+
+    def refresh_theme(self):
+        """Drop cached fonts/colors and repaint"""
+        self.grid_delegate.reset_styles()
+        self.header_heights = {}
+        self.grid_model.refresh_all()
+
+        # Header fonts (and so their rows) changed size
+        calculator = self.grid_model.calculator
+        header_rows = {
+            calculator.parse_cell_reference(cell_ref)[0]
+            for cell_ref, cell_data in calculator.cells.items()
+            if cell_data.get("format") in ("H1", "H2")
+        }
+        for row in header_rows | self.fitted_rows:
+            self.fit_row(row)
@@ -2,22 +2,24 @@
 Scratch Pad View - Excel-like workspace for user calculations
 
 Features:
-- 26x50 grid (A-Z columns, 1-50 rows)
+- 702x10,000 grid (A-ZZ columns, 1-10,000 rows), stored sparsely
 - Formula support: =A1+B2, =SUM(A1:A10), =AVERAGE(B1:B10)
 - External variables: =GET(emergency fund balance)
+- Live totals: =SPENT(Food, 1/1/2025, 1/31/2025), =INCOME(...), =BALANCE_AT(...)
 - Date arithmetic: =11/25/2025 - CURRENT_DATE
-- Auto-save to JSON
+- Auto-save to JSON (debounced; values are cached so the sheet opens without recalculating)
 - Cell highlighting when dependencies are selected
 """
 
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
-                             QTableWidgetItem, QHeaderView, QToolButton, QLabel,
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QToolButton, QLabel,
                              QLineEdit, QPushButton, QCompleter, QComboBox)
-from PyQt6.QtCore import Qt, QStringListModel
-from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtCore import Qt, QStringListModel, QTimer
+from PyQt6.QtGui import QFont
 from themes import theme_manager
 from services.workspace_calculator import WorkspaceCalculator, CircularReferenceError
-from datetime import date
+from services.workspace_store import WorkspaceStore
+from models.database import get_data_version
+from views.scratch_pad_grid import ScratchPadGrid
 import json
 from pathlib import Path
 
@@ -25,6 +27,8 @@ from pathlib import Path
 class ScratchPadView(QWidget):
     """Scratch Pad tab for user calculations and planning"""
 
+    SAVE_DELAY_MS = 1000  # save_workspace waits this long after the last edit
+
     def __init__(self, transaction_manager, parent=None):
         super().__init__(parent)
         self.transaction_manager = transaction_manager
@@ -34,8 +38,20 @@ class ScratchPadView(QWidget):
         self.inserting_cell_ref = False  # Flag for cell reference insertion mode
 
         # Grid dimensions
-        self.num_rows = 50
-        self.num_cols = 26  # A-Z
+        self.num_rows = WorkspaceCalculator.MAX_ROWS
+        self.num_cols = WorkspaceCalculator.MAX_COLS  # A-ZZ
+
+        # Persistence - edits are written together once they pause
+        self.workspace_store = WorkspaceStore(Path("scratch_pad_workspace.json"))
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.flush_workspace)
+        self._save_pending = False
+
+        # Cells reading live data: recalculated when the tab is shown, not at startup
+        self.stale_cells = set()
+        self.live_version = None  # Data version the live cells were last calculated at
 
         self.init_ui()
         self.setup_completer()
@@ -123,31 +139,8 @@ class ScratchPadView(QWidget):
         self.error_label.setVisible(False)  # Hidden by default
         main_layout.addWidget(self.error_label)
 
-        # Grid table
-        self.table = QTableWidget()
-        self.table.setRowCount(self.num_rows)
-        self.table.setColumnCount(self.num_cols)
-
-        # Set column headers (A-Z)
-        headers = [chr(ord('A') + i) for i in range(self.num_cols)]
-        self.table.setHorizontalHeaderLabels(headers)
-
-        # Set row headers (1-50)
-        self.table.setVerticalHeaderLabels([str(i + 1) for i in range(self.num_rows)])
-
-        # Configure table
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
-        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
-        # CHANGED: Allow multiple cell selection (was SingleSelection)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.ContiguousSelection)
-        self.table.setFocusPolicy(Qt.FocusPolicy.StrongFocus)  # Keep selection visible
-
-        # Disable in-cell editing - all editing happens in formula bar
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-
-        # Set default column width
-        for col in range(self.num_cols):
-            self.table.setColumnWidth(col, 100)
+        # Grid table - a view over the calculator's cells, so only cells in use take memory
+        self.table = ScratchPadGrid(self.calculator, self.num_rows, self.num_cols)
 
         # Connect signals
         self.table.currentCellChanged.connect(self.on_cell_selected)
@@ -161,6 +154,7 @@ class ScratchPadView(QWidget):
         help_text = QLabel(
             "💡 Quick Guide: Numbers, text, dates (MM/DD/YYYY) | Formulas start with = | "
             "Functions: SUM(A1:A10), AVERAGE(B1:B5), GET(account_name balance) | "
+            "Live totals: SPENT(Food, A1, A2), INCOME(A1, A2), BALANCE_AT(account_name, A1) | "
             "Cell refs: A1, B2 | Date math: =12/25/2025 - CURRENT_DATE"
         )
         help_text.setWordWrap(True)
@@ -287,7 +281,8 @@ class ScratchPadView(QWidget):
             # Check if we're starting to type a function (no open parens yet, or just typed one)
             else:
                 # Suggest functions when user is typing at formula level
-                functions = ["SUM()", "AVERAGE()", "GET()", "CURRENT_DATE"]
+                functions = ["SUM()", "AVERAGE()", "GET()", "CURRENT_DATE",
+                             "SPENT()", "INCOME()", "BALANCE_AT()"]
                 suggestions = functions
 
             # If we typed something, filter suggestions
@@ -410,31 +405,11 @@ class ScratchPadView(QWidget):
         self.update_format_dropdown()
 
         # Highlight cells this cell depends on
-        if cell_ref in self.calculator.dependencies:
-            for dep_ref in self.calculator.dependencies[cell_ref]:
-                self.highlight_cell(dep_ref, QColor(173, 216, 230, 100))  # Light blue
+        self.table.grid_model.set_highlights(self.calculator.dependencies.get(cell_ref, ()))
 
     def clear_highlights(self):
         """Clear all cell highlighting"""
-        for row in range(self.num_rows):
-            for col in range(self.num_cols):
-                item = self.table.item(row, col)
-                if item:
-                    item.setBackground(QColor(255, 255, 255, 0))  # Transparent
-
-    def highlight_cell(self, cell_ref: str, color: QColor):
-        """Highlight a specific cell"""
-        pos = self.calculator.parse_cell_reference(cell_ref)
-        if not pos:
-            return
-
-        row, col = pos
-        item = self.table.item(row, col)
-        if not item:
-            item = QTableWidgetItem()
-            self.table.setItem(row, col, item)
-
-        item.setBackground(color)
+        self.table.grid_model.set_highlights(())
 
     def on_formula_entered(self):
         """Handle Enter key in formula bar"""
@@ -446,63 +421,16 @@ class ScratchPadView(QWidget):
                 existing_format = self.calculator.cells[self.current_cell].get("format", "P")
             self.set_cell_formula(self.current_cell, formula, format_type=existing_format)
 
-    def on_cell_edited(self, row: int, col: int):
-        """Handle direct cell editing"""
-        cell_ref = self.get_cell_ref(row, col)
-        item = self.table.item(row, col)
-
-        if item:
-            text = item.text().strip()
-
-            # Check if we already have a formula for this cell
-            # If we do, and the text matches the displayed value, ignore this edit
-            # (it's just from programmatic display update)
-            if cell_ref in self.calculator.cells:
-                stored_value = self.calculator.cells[cell_ref]["value"]
-
-                # Format the stored value the same way we display it
-                # Check for error tuple
-                is_error = isinstance(stored_value, tuple) and len(stored_value) == 2 and stored_value[0] == "ERROR"
-
-                if is_error:
-                    display_text = "ERROR"
-                elif isinstance(stored_value, date):
-                    display_text = stored_value.strftime("%m/%d/%Y")
-                elif isinstance(stored_value, float):
-                    if stored_value == int(stored_value):
-                        display_text = str(int(stored_value))
-                    else:
-                        display_text = f"{stored_value:.2f}"
-                else:
-                    display_text = str(stored_value)
-
-                # If the text matches what we would display, it's not a real edit
-                if text == display_text:
-                    return
-
-            # This is a real user edit
-            if text:
-                # Preserve existing format if cell already exists
-                existing_format = "P"
-                if cell_ref in self.calculator.cells:
-                    existing_format = self.calculator.cells[cell_ref].get("format", "P")
-                self.set_cell_formula(cell_ref, text, update_display=True, format_type=existing_format)
-
     def set_cell_formula(self, cell_ref: str, formula: str, update_display: bool = True, format_type: str = "P"):
         """Set a cell's formula and recalculate"""
         if not formula:
-            # Clear cell
-            if cell_ref in self.calculator.cells:
-                del self.calculator.cells[cell_ref]
-            if cell_ref in self.calculator.dependencies:
-                del self.calculator.dependencies[cell_ref]
-
-            pos = self.calculator.parse_cell_reference(cell_ref)
-            if pos:
-                row, col = pos
-                item = self.table.item(row, col)
-                if item:
-                    item.setText("")
+            # Clear cell (cells that read it fall back to treating it as 0)
+            recalculated = self.calculator.clear_cell(cell_ref)
+
+            self.display_cell_value(cell_ref, None)
+
+            for dependent in recalculated:
+                self.display_cell_value(dependent, self.calculator.cells[dependent]["value"])
 
             # Save the workspace to persist the deletion
             self.save_workspace()
@@ -516,9 +444,8 @@ class ScratchPadView(QWidget):
             if update_display:
                 self.display_cell_value(cell_ref, value)
 
-            # Recalculate dependent cells
-            for dependent in self.calculator.get_dependent_cells(cell_ref):
-                self.calculator.recalculate_cell(dependent)
+            # Recalculate dependent cells (each once, upstream first)
+            for dependent in self.calculator.recalculate_dependents(cell_ref):
                 dep_value = self.calculator.cells[dependent]["value"]
                 self.display_cell_value(dependent, dep_value)
 
@@ -529,91 +456,19 @@ class ScratchPadView(QWidget):
             print(f"Error setting cell formula: {e}")
 
     def display_cell_value(self, cell_ref: str, value):
-        """Display value in the table"""
+        """Repaint a cell after its value or format changed"""
         pos = self.calculator.parse_cell_reference(cell_ref)
         if not pos:
             return
 
         row, col = pos
+        # The grid reads value and format from the calculator as it paints
+        self.table.grid_model.refresh_cells((cell_ref,))
 
-        # Block signals to prevent triggering on_cell_edited
-        self.table.blockSignals(True)
-
-        # Get or create item
-        item = self.table.item(row, col)
-        if not item:
-            item = QTableWidgetItem()
-            self.table.setItem(row, col, item)
-
-        # Check for error tuple
-        is_error = isinstance(value, tuple) and len(value) == 2 and value[0] == "ERROR"
-
-        # Format value for display
-        if is_error:
-            # Display just "ERROR" in the cell
-            display_text = "ERROR"
-
-            # Use theme's error color directly
-            colors = theme_manager.get_colors()
-            item.setForeground(QColor(colors['error']))
-
-        elif isinstance(value, date):
-            display_text = value.strftime("%m/%d/%Y")
-            item.setForeground(QColor(theme_manager.get_colors()['text_primary']))
-        elif isinstance(value, float):
-            # Format numbers nicely
-            if value == int(value):
-                display_text = str(int(value))
-            else:
-                display_text = f"{value:.2f}"
-            item.setForeground(QColor(theme_manager.get_colors()['text_primary']))
-        else:
-            display_text = str(value)
-            item.setForeground(QColor(theme_manager.get_colors()['text_primary']))
-
-        item.setText(display_text)
-
-        # Apply formatting based on format type
+        # Headers need taller rows; fit rows holding one (or that used to)
         format_type = self.calculator.cells.get(cell_ref, {}).get("format", "P")
-        self.apply_cell_format(item, format_type, is_error)
-
-        # Right-align numbers and dates
-        if isinstance(value, (int, float, date)):
-            item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        else:
-            item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-
-        self.table.blockSignals(False)
-
-    def apply_cell_format(self, item, format_type, is_error=False):
-        """Apply formatting to a table cell based on format type
-
-        Format types:
-        - H1: Primary color, bold, +10px font size
-        - H2: Secondary color, bold, +2px font size
-        - P: Normal (text_primary, regular)
-        - n: Note (text_secondary, italic)
-        """
-        colors = theme_manager.get_colors()
-        font = theme_manager.get_font("main")
-
-        # Don't override error color
-        if not is_error:
-            if format_type == "H1":
-                item.setForeground(QColor(colors['primary']))
-                font.setBold(True)
-                font.setPointSize(font.pointSize() + 4)  # SETTING: H1 size increase
-            elif format_type == "H2":
-                item.setForeground(QColor(colors['secondary']))
-                font.setBold(True)
-                font.setPointSize(font.pointSize() + 1)  # SETTING: H2 size increase
-            elif format_type == "n":
-                item.setForeground(QColor(colors['text_secondary']))
-                font.setItalic(True)
-            else:  # "P" or default
-                item.setForeground(QColor(colors['text_primary']))
-
-        item.setFont(font)
+        if format_type in ("H1", "H2") or row in self.table.fitted_rows:
+            self.table.fit_row(row)
 
     def update_format_dropdown(self):
         """Update format dropdown to show current cell's format"""
@@ -650,6 +505,29 @@ class ScratchPadView(QWidget):
         self.format_combo.setCurrentText(display_text)
         self.format_combo.blockSignals(False)
 
+    def selected_cells(self, selected_ranges):
+        """Refs of the non-empty cells inside the selected ranges
+
+        A selection can cover millions of empty cells (e.g. Ctrl+A), so large
+        ranges are answered from the calculator's cells instead of cell by cell.
+        """
+        refs = []
+        for sel_range in selected_ranges:
+            area = (sel_range.bottomRow() - sel_range.topRow() + 1) * (sel_range.rightColumn() - sel_range.leftColumn() + 1)
+            if area <= len(self.calculator.cells):
+                for row in range(sel_range.topRow(), sel_range.bottomRow() + 1):
+                    for col in range(sel_range.leftColumn(), sel_range.rightColumn() + 1):
+                        cell_ref = self.get_cell_ref(row, col)
+                        if cell_ref in self.calculator.cells:
+                            refs.append(cell_ref)
+            else:
+                for cell_ref in self.calculator.cells:
+                    row, col = self.calculator.parse_cell_reference(cell_ref)
+                    if (sel_range.topRow() <= row <= sel_range.bottomRow()
+                            and sel_range.leftColumn() <= col <= sel_range.rightColumn()):
+                        refs.append(cell_ref)
+        return refs
+
     def on_format_changed(self, format_text):
         """Handle format dropdown change"""
         # Map display text to format code
@@ -667,27 +545,23 @@ class ScratchPadView(QWidget):
         if not selected_ranges:
             return
 
-        # Apply format to all selected cells
-        for sel_range in selected_ranges:
-            for row in range(sel_range.topRow(), sel_range.bottomRow() + 1):
-                for col in range(sel_range.leftColumn(), sel_range.rightColumn() + 1):
-                    cell_ref = self.get_cell_ref(row, col)
-
-                    # Only update if cell exists
-                    if cell_ref in self.calculator.cells:
-                        # Update format in calculator
-                        self.calculator.cells[cell_ref]["format"] = format_code
+        # Apply format to all selected cells (only cells that exist have a format)
+        for cell_ref in self.selected_cells(selected_ranges):
+            # Update format in calculator
+            self.calculator.cells[cell_ref]["format"] = format_code
 
-                        # Refresh display
-                        value = self.calculator.cells[cell_ref]["value"]
-                        self.display_cell_value(cell_ref, value)
+            # Refresh display
+            value = self.calculator.cells[cell_ref]["value"]
+            self.display_cell_value(cell_ref, value)
 
         # Save changes
         self.save_workspace()
 
     def refresh_all(self):
         """Refresh all cells (recalculate with updated external variables)"""
+        self.live_version = get_data_version()
         self.calculator.recalculate_all()
+        self.stale_cells = set()
 
         # Update display for all cells
         for cell_ref in self.calculator.cells:
@@ -709,17 +583,11 @@ class ScratchPadView(QWidget):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            self.calculator.cells = {}
-            self.calculator.dependencies = {}
+            self.calculator.clear()
 
             # Clear table
-            self.table.blockSignals(True)
-            for row in range(self.num_rows):
-                for col in range(self.num_cols):
-                    item = self.table.item(row, col)
-                    if item:
-                        item.setText("")
-            self.table.blockSignals(False)
+            self.table.reset_rows()
+            self.table.grid_model.refresh_all()
 
             self.save_workspace()
 
@@ -737,17 +605,11 @@ class ScratchPadView(QWidget):
 
         if reply == QMessageBox.StandardButton.Yes:
             # Clear current data (both calculator and visual table)
-            self.calculator.cells = {}
-            self.calculator.dependencies = {}
+            self.calculator.clear()
 
             # Clear the visual table
-            self.table.blockSignals(True)
-            for row in range(self.num_rows):
-                for col in range(self.num_cols):
-                    item = self.table.item(row, col)
-                    if item:
-                        item.setText("")
-            self.table.blockSignals(False)
+            self.table.reset_rows()
+            self.table.grid_model.refresh_all()
 
             # Load from test data file
             test_data_path = Path("scratch_pad_test_data.json")
@@ -786,45 +648,58 @@ class ScratchPadView(QWidget):
                 )
 
     def save_workspace(self):
-        """Save workspace to JSON file"""
-        try:
-            save_data = {
-                "cells": {
-                    ref: {
-                        "formula": data["formula"],
-                        "type": data["type"],
-                        "format": data.get("format", "P")  # Default to P if not set
-                    }
-                    for ref, data in self.calculator.cells.items()
-                }
-            }
-
-            save_path = Path("scratch_pad_workspace.json")
-            with open(save_path, 'w') as f:
-                json.dump(save_data, f, indent=2)
+        """Schedule a save - edits within SAVE_DELAY_MS of each other are written together"""
+        self._save_pending = True
+        self._save_timer.start()
 
+    def flush_workspace(self):
+        """Write any scheduled save now (called on the timer and when the app closes)"""
+        if not self._save_pending:
+            return
+        self._save_pending = False
+        self._save_timer.stop()
+        try:
+            self.workspace_store.save(self.calculator.cells)
         except Exception as e:
             print(f"Error saving workspace: {e}")
 
     def load_workspace(self):
-        """Load workspace from JSON file"""
+        """Load workspace from JSON file, showing the saved values without recalculating"""
         try:
-            save_path = Path("scratch_pad_workspace.json")
-            if not save_path.exists():
+            saved = self.workspace_store.load()
+            if saved is None:
                 return
 
-            with open(save_path, 'r') as f:
-                save_data = json.load(f)
-
-            # Load cells
-            for cell_ref, cell_data in save_data.get("cells", {}).items():
-                formula = cell_data["formula"]
-                format_type = cell_data.get("format", "P")  # Default to P if not in JSON
-                self.set_cell_formula(cell_ref, formula, format_type=format_type)
+            # Cells reading live data are recalculated when the tab is first shown
+            self.stale_cells = self.calculator.restore_cells(saved)
+            self.table.grid_model.refresh_all()
 
         except Exception as e:
             print(f"Error loading workspace: {e}")
 
+    def showEvent(self, event):
+        """Bring live-data cells up to date when the tab is shown"""
+        super().showEvent(event)
+        self.refresh_live_cells()
+
+    def refresh_live_cells(self):
+        """Recalculate GET/SPENT/INCOME/BALANCE_AT/CURRENT_DATE cells if they may be stale"""
+        version = get_data_version()
+        if version != self.live_version:
+            self.stale_cells |= self.calculator.volatile_cells()
+        self.live_version = version
+        if not self.stale_cells:
+            return
+
+        stale, self.stale_cells = self.stale_cells, set()
+        changed = False
+        for cell_ref in self.calculator.recalculate_stale(stale):
+            cell_data = self.calculator.cells[cell_ref]
+            self.display_cell_value(cell_ref, cell_data["value"])
+            changed = True
+        if changed:
+            self.save_workspace()
+
     def eventFilter(self, source, event):
         """Event filter to handle keyboard input in table and redirect to formula bar"""
         from PyQt6.QtCore import QEvent
@@ -1124,12 +999,14 @@ class ScratchPadView(QWidget):
                 self.formula_edit.clear()
             return
 
-        # Clear all cells in selection
-        for sel_range in selected_ranges:
-            for row in range(sel_range.topRow(), sel_range.bottomRow() + 1):
-                for col in range(sel_range.leftColumn(), sel_range.rightColumn() + 1):
-                    cell_ref = self.get_cell_ref(row, col)
-                    self.set_cell_formula(cell_ref, "")
+        # Clear all cells in selection (empty cells have nothing to clear)
+        recalculated = set()
+        for cell_ref in self.selected_cells(selected_ranges):
+            recalculated.update(self.calculator.clear_cell(cell_ref))
+            self.display_cell_value(cell_ref, None)
+        for dependent in recalculated:
+            if dependent in self.calculator.cells:
+                self.display_cell_value(dependent, self.calculator.cells[dependent]["value"])
 
         # Clear formula bar
         self.formula_edit.clear()
@@ -1152,19 +1029,19 @@ class ScratchPadView(QWidget):
 
             # Update table styling
             self.table.setStyleSheet(f"""
-                QTableWidget {{
+                QTableView {{
                     background-color: {colors['surface']};
                     border: 1px solid {colors['border']};
                     gridline-color: {colors['border']};
                 }}
-                QTableWidget::item {{
+                QTableView::item {{
                     padding: 5px;
                 }}
-                QTableWidget::item:selected {{
+                QTableView::item:selected {{
                     background-color: {colors['primary']};
                     color: {colors['background']};
                 }}
-                QTableWidget::item:selected:!active {{
+                QTableView::item:selected:!active {{
                     background-color: {colors['primary']};
                     color: {colors['background']};
                 }}
@@ -1176,6 +1053,7 @@ class ScratchPadView(QWidget):
                     font-weight: bold;
                 }}
             """)
+            self.table.refresh_theme()
 
             # Update title and error label
             for child in self.findChildren(QLabel):
@@ -8,7 +8,9 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QPainter, QColor
 from datetime import datetime, date
 from themes import theme_manager
-from models import get_db, Bill, Transaction
+from models import get_db, get_data_version, Bill, Transaction
+from services.yearly_rollup import yearly_rollup
+from services.change_events import ChangeKind, Depends, invalidated_panels
 
 # Matplotlib imports for plotting
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
@@ -85,12 +87,18 @@ class DualProgressBar(QProgressBar):
 class TaxesView(QWidget):
     """View for tax tracking and management features"""
 
+    # Which data changes make which panel stale (panel update method -> reasons)
+    PANEL_DEPENDENCIES = {
+        "refresh": [Depends(ChangeKind.TRANSACTIONS, ChangeKind.BILLS)],
+    }
+
     def __init__(self, transaction_manager, analytics_engine=None):
         super().__init__()
         self.transaction_manager = transaction_manager
         self.analytics_engine = analytics_engine
         self.year_boxes = []  # Store references to year boxes for refresh
         self.first_year = None  # Will be set to earliest year with data
+        self._tax_payments_cache = None  # (data version, tax bill id, {year: total}) - see get_tax_payments_by_year
 
         self.init_ui()
         self.refresh()
@@ -344,35 +352,22 @@ class TaxesView(QWidget):
     def calculate_expected_yearly_income(self):
         """Calculate expected yearly income based on past years average"""
         try:
-            db = get_db()
             current_year = datetime.now().year
 
             # Get past years income data (not current year)
             past_years_data = []
             for year in range(current_year - 5, current_year):
-                # Get income transactions for this year
-                year_start = date(year, 1, 1)
-                year_end = date(year, 12, 31)
-
-                income_transactions = db.query(Transaction).filter(
-                    Transaction.date >= year_start,
-                    Transaction.date <= year_end,
-                    Transaction.transaction_type == "income"
-                ).all()
+                total_income, num_paychecks = yearly_rollup.totals(year, "income")
 
-                if income_transactions:
+                if num_paychecks:
                     # Calculate average income per paycheck
-                    total_income = sum(t.amount for t in income_transactions)
-                    num_paychecks = len(income_transactions)
-                    avg_paycheck = total_income / num_paychecks if num_paychecks > 0 else 0
+                    avg_paycheck = total_income / num_paychecks
 
                     past_years_data.append({
                         'avg_paycheck': avg_paycheck,
                         'num_paychecks': num_paychecks
                     })
 
-            db.close()
-
             if not past_years_data:
                 return 0
 
@@ -421,44 +416,21 @@ class TaxesView(QWidget):
     def get_historical_average_spending(self):
         """Get historical average spending without fallback calculation"""
         try:
-            db = get_db()
             current_year = datetime.now().year
 
-            # Find the Taxes bill
-            tax_bill = db.query(Bill).filter(Bill.name == "Taxes").first()
-            if not tax_bill:
-                db.close()
+            tax_bill_id, payments_by_year = self.get_tax_payments_by_year()
+            if tax_bill_id is None:
                 return 0
 
             # Get all years before current year that have spending data
             past_years_spending = []
 
-            # Check years going back up to 5 years
+            # Check years going back up to 5 years (taxes saved in 'year' are paid in year+1)
             for year in range(current_year - 5, current_year):
-                next_year_start = date(year + 1, 1, 1)
-                next_year_end = date(year + 1, 12, 31)
-
-                # Get bill_pay transactions in year+1 for taxes saved in 'year'
-                spending_transactions = db.query(Transaction).filter(
-                    Transaction.date >= next_year_start,
-                    Transaction.date <= next_year_end,
-                    Transaction.transaction_type == "bill_pay",
-                    Transaction.bill_id == tax_bill.id
-                ).all()
-
-                # Filter to only tax payments (federal, state, service) - exclude rebalancing
-                tax_keywords = ['federal', 'state', 'service']
-                tax_payment_transactions = [
-                    t for t in spending_transactions
-                    if t.description and any(keyword in t.description.lower() for keyword in tax_keywords)
-                ]
-
-                year_spending = sum(t.amount for t in tax_payment_transactions)
+                year_spending = payments_by_year.get(year + 1, 0)
                 if year_spending > 0:
                     past_years_spending.append(year_spending)
 
-            db.close()
-
             # Calculate average from historical data only (no fallback)
             if past_years_spending:
                 return sum(past_years_spending) / len(past_years_spending)
@@ -472,13 +444,11 @@ class TaxesView(QWidget):
     def get_historical_average_percentage(self):
         """Get historical average tax percentage (spending/income ratio averaged across years)"""
         try:
-            db = get_db()
             current_year = datetime.now().year
 
             # Find the Taxes bill
-            tax_bill = db.query(Bill).filter(Bill.name == "Taxes").first()
-            if not tax_bill:
-                db.close()
+            tax_bill_id, _ = self.get_tax_payments_by_year()
+            if tax_bill_id is None:
                 return 0
 
             # Get percentages for each year with spending data
@@ -494,8 +464,6 @@ class TaxesView(QWidget):
                     percentage = (year_data['total_spending'] / year_data['total_income']) * 100
                     yearly_percentages.append(percentage)
 
-            db.close()
-
             # Calculate average percentage
             if yearly_percentages:
                 return sum(yearly_percentages) / len(yearly_percentages)
@@ -520,46 +488,24 @@ class TaxesView(QWidget):
     def calculate_average_past_spending(self):
         """Calculate average spending from past years for current year tax estimation"""
         try:
-            db = get_db()
             current_year = datetime.now().year
 
-            # Find the Taxes bill
-            tax_bill = db.query(Bill).filter(Bill.name == "Taxes").first()
-            if not tax_bill:
-                db.close()
+            tax_bill_id, payments_by_year = self.get_tax_payments_by_year()
+            if tax_bill_id is None:
                 return 0
 
             # Get all years before current year that have spending data
             past_years_spending = []
 
-            # Check years going back up to 5 years
+            # Check years going back up to 5 years (taxes saved in 'year' are paid in year+1)
             for year in range(current_year - 5, current_year):
-                next_year_start = date(year + 1, 1, 1)
-                next_year_end = date(year + 1, 12, 31)
-
-                # Get bill_pay transactions in year+1 for taxes saved in 'year'
-                spending_transactions = db.query(Transaction).filter(
-                    Transaction.date >= next_year_start,
-                    Transaction.date <= next_year_end,
-                    Transaction.transaction_type == "bill_pay",
-                    Transaction.bill_id == tax_bill.id
-                ).all()
-
-                # Filter to only tax payments (federal, state, service) - exclude rebalancing
-                tax_keywords = ['federal', 'state', 'service']
-                tax_payment_transactions = [
-                    t for t in spending_transactions
-                    if t.description and any(keyword in t.description.lower() for keyword in tax_keywords)
-                ]
-
-                year_spending = sum(t.amount for t in tax_payment_transactions)
+                year_spending = payments_by_year.get(year + 1, 0)
                 if year_spending > 0:
                     past_years_spending.append(year_spending)
 
             # Calculate average from historical data
             if past_years_spending:
                 avg_spending = sum(past_years_spending) / len(past_years_spending)
-                db.close()
                 return avg_spending
             else:
                 # FALLBACK: Use 33% of current year's average paycheck * number of pay periods
@@ -573,10 +519,8 @@ class TaxesView(QWidget):
 
                     # 33% of annual income (avg_paycheck * pay_periods * 0.33)
                     fallback_estimate = avg_paycheck * pay_periods_per_year * 0.33
-                    db.close()
                     return fallback_estimate
                 else:
-                    db.close()
                     return 0
 
         except Exception as e:
@@ -704,70 +648,62 @@ class TaxesView(QWidget):
             print(f"Error checking for Taxes bill: {e}")
             return False
 
-    def get_year_data(self, year):
-        """Calculate tax data for a specific year"""
-        try:
-            db = get_db()
+    def get_tax_payments_by_year(self):
+        """
+        Get the Taxes bill id and its tax payments (federal, state, service) summed by year
 
-            year_start = date(year, 1, 1)
-            year_end = date(year, 12, 31)
+        Loaded in one query and cached until data changes, since get_year_data and
+        the historical averages all need the same per-year payment totals.
 
-            # Get income transactions directly by date (not by weeks)
-            income_transactions = db.query(Transaction).filter(
-                Transaction.date >= year_start,
-                Transaction.date <= year_end,
-                Transaction.transaction_type == "income"
-            ).all()
-
-            # Calculate total income from paychecks
-            total_income = 0
-            paycheck_count = len(income_transactions)
+        Returns:
+            (tax_bill_id or None, {year: total}) - only years with at least one payment
+        """
+        version = get_data_version()
+        if self._tax_payments_cache and self._tax_payments_cache[0] == version:
+            return self._tax_payments_cache[1], self._tax_payments_cache[2]
 
-            for transaction in income_transactions:
-                total_income += transaction.amount
-
-            avg_income = total_income / paycheck_count if paycheck_count > 0 else 0
-
-            # Get ONLY Taxes bill saving transactions in this year (only positive amounts)
-            # Find the Taxes bill first
+        db = get_db()
+        try:
             tax_bill = db.query(Bill).filter(Bill.name == "Taxes").first()
+            payments_by_year = {}
 
             if tax_bill:
-                tax_saving_transactions = db.query(Transaction).filter(
-                    Transaction.date >= year_start,
-                    Transaction.date <= year_end,
-                    Transaction.transaction_type == "saving",
-                    Transaction.bill_id == tax_bill.id,
-                    Transaction.amount > 0  # Only positive deposits
-                ).all()
-
-                total_savings = sum(t.amount for t in tax_saving_transactions)
-            else:
-                total_savings = 0
-
-            # Get bill_pay transactions in year+1 (tax payments from Taxes bill account)
-            next_year_start = date(year + 1, 1, 1)
-            next_year_end = date(year + 1, 12, 31)
-
-            if tax_bill:
-                spending_transactions = db.query(Transaction).filter(
-                    Transaction.date >= next_year_start,
-                    Transaction.date <= next_year_end,
+                bill_pay_transactions = db.query(Transaction.date, Transaction.description, Transaction.amount).filter(
                     Transaction.transaction_type == "bill_pay",
                     Transaction.bill_id == tax_bill.id
                 ).all()
 
                 # Filter to only tax payments (federal, state, service) - exclude rebalancing
                 tax_keywords = ['federal', 'state', 'service']
-                tax_payment_transactions = [
-                    t for t in spending_transactions
-                    if t.description and any(keyword in t.description.lower() for keyword in tax_keywords)
-                ]
+                for payment_date, description, amount in bill_pay_transactions:
+                    if description and any(keyword in description.lower() for keyword in tax_keywords):
+                        payments_by_year[payment_date.year] = payments_by_year.get(payment_date.year, 0) + amount
 
-                total_spending = sum(t.amount for t in tax_payment_transactions) if tax_payment_transactions else None
+            tax_bill_id = tax_bill.id if tax_bill else None
+        finally:
+            db.close()
+
+        self._tax_payments_cache = (version, tax_bill_id, payments_by_year)
+        return tax_bill_id, payments_by_year
+
+    def get_year_data(self, year):
+        """Calculate tax data for a specific year"""
+        try:
+            # Income from paychecks, by date (not by weeks) - from the cached yearly rollup
+            total_income, paycheck_count = yearly_rollup.totals(year, "income")
+
+            avg_income = total_income / paycheck_count if paycheck_count > 0 else 0
+
+            tax_bill_id, payments_by_year = self.get_tax_payments_by_year()
+
+            # Get ONLY Taxes bill saving transactions in this year (only positive amounts)
+            if tax_bill_id is not None:
+                total_savings, _ = yearly_rollup.totals(year, "saving", bill_id=tax_bill_id, positive_only=True)
             else:
-                spending_transactions = []
-                total_spending = None
+                total_savings = 0
+
+            # Tax payments from the Taxes bill account in year+1 (None if there were none)
+            total_spending = payments_by_year.get(year + 1)
 
             # Calculate average saved amount per paycheck
             avg_saved_amount = total_savings / paycheck_count if paycheck_count > 0 else 0
@@ -780,8 +716,6 @@ class TaxesView(QWidget):
             if total_spending is not None and total_spending > 0:
                 remaining_amount = total_savings - total_spending
 
-            db.close()
-
             return {
                 'year': year,
                 'avg_income': avg_income,
@@ -1215,15 +1149,11 @@ class TaxesView(QWidget):
             from PyQt6.QtCore import Qt
 
             # Get all years with data
-            db = get_db()
-            min_date = db.query(Transaction.date).order_by(Transaction.date).first()
-            max_date = db.query(Transaction.date).order_by(Transaction.date.desc()).first()
-            db.close()
-
-            if not min_date or not max_date:
+            years_with_data = yearly_rollup.years()
+            if not years_with_data:
                 return
 
-            min_year = min_date[0].year
+            min_year = years_with_data[0]
             current_year = datetime.now().year
 
             # Get data for each year
@@ -1232,6 +1162,9 @@ class TaxesView(QWidget):
                 year_data = self.get_year_data(year)
                 years_data.append(year_data)
 
+            # Tax payments by type and year (same for every row)
+            tax_data = self.get_tax_spending_data()
+
             # Populate table
             self.summary_table.setRowCount(len(years_data))
 
@@ -1253,7 +1186,6 @@ class TaxesView(QWidget):
 
                 # Get breakdown by payment type
                 year = year_data['year']
-                tax_data = self.get_tax_spending_data()
 
                 # Federal
                 federal = tax_data.get('Federal', {}).get(year + 1, 0)  # Payments in year+1
@@ -1418,6 +1350,22 @@ class TaxesView(QWidget):
                 }}
             """)
 
+    def gather_data(self, ticket=None):
+        """
+        Warm the yearly rollup and tax payment totals off the UI thread
+
+        Run by BudgetApp's BackgroundLoader before refresh/apply_change; returns
+        None since the panels read the warmed caches themselves.
+        """
+        yearly_rollup.years()
+        self.get_tax_payments_by_year()
+        return None
+
+    def apply_change(self, change):
+        """Refresh what a DataChange made stale (see PANEL_DEPENDENCIES)"""
+        for panel in invalidated_panels(self, change):
+            getattr(self, panel)()
+
     def refresh(self):
         """Refresh the tax view data"""
         # Update progress bars and summary
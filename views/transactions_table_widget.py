@@ -1,14 +1,480 @@
 """
 Transaction Table Widget - Reusable table component for transaction viewing/editing
+
+The table is a QTableView over TransactionTableModel. The view only asks the
+model for the cells it is painting, so tens of thousands of transactions load
+and scroll without an item or widget per cell. Sorting, searching and marking
+rows for deletion change the model's row order or repaint the visible rows -
+nothing is rebuilt. The Abnormal checkbox, the dropdown editors and the
+locked/deleted/edited styling are drawn by TransactionItemDelegate.
+
+Search matches against one casefolded string per row, built on the first
+search after a load. A query that extends the previous one only rechecks the
+previous matches, and typing is debounced (see queue_search).
 """
 
-from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView, QCheckBox, QWidget, QHBoxLayout
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtWidgets import (QTableView, QHeaderView, QAbstractItemView, QStyledItemDelegate,
+                             QStyleOptionViewItem, QStyleOptionButton, QStyle, QApplication, QComboBox)
+from PyQt6.QtCore import Qt, pyqtSignal, QAbstractTableModel, QModelIndex, QEvent, QRect, QTimer
+from PyQt6.QtGui import QColor, QBrush, QPalette
 from themes import theme_manager
+from datetime import date
+import math
+
+
+# Item data roles beyond Qt's own
+DATA_ROW_ROLE = Qt.ItemDataRole.UserRole  # Data row index of a cell (its index in load_data's rows_data)
+CELL_STATE_ROLE = Qt.ItemDataRole.UserRole + 1  # (is_locked, is_deleted, is_edited) for the delegate's styling
+
+
+def sort_key(value) -> tuple:
+    """
+    Typed sort key for a displayed cell value
+
+    Blanks sort first, then numbers (in cents - "$1,234.56", "-$5.00", "12"),
+    then M/D/YYYY dates (as ordinals), then text (casefolded). Keys of
+    different kinds never compare their second items, so a column mixing
+    numbers and text ("12", "?", "") still sorts.
+    """
+    text = str(value).strip()
+    if not text:
+        return (0, 0)
+
+    # M/D/YYYY dates
+    if text.count("/") == 2:
+        month, day, year = text.split("/")
+        if month.isdigit() and day.isdigit() and year.isdigit():
+            try:
+                return (2, date(int(year), int(month), int(day)).toordinal())
+            except ValueError:
+                pass
+
+    # Numbers and dollar amounts (checked for a leading digit first - float() failing on text is slow)
+    number = text.replace(",", "")
+    negative = number.startswith("-")
+    if negative:
+        number = number[1:]
+    if number.startswith("$"):
+        number = number[1:]
+    if number[:1].isdigit() or number[:1] == ".":
+        try:
+            amount = float(number)
+        except ValueError:
+            pass
+        else:
+            if math.isfinite(amount):
+                cents = round(amount * 100)
+                return (1, -cents if negative else cents)
+
+    return (3, text.casefold())
+
+
+class TransactionTableModel(QAbstractTableModel):
+    """
+    Transaction rows and their edit state, for TransactionTableWidget
+
+    A data row keeps its load_data index for as long as it is loaded -
+    deleted_rows, edited_rows and the widget's transaction_ids all use it.
+    The model shows the rows listed in self.order (sorted and search-filtered),
+    so a display row maps to a data row with self.order[display_row].
+    self.sorted_rows holds every data row in the current sort order, so a
+    search result keeps the sort without sorting again. Sorting compares
+    typed keys parsed once per column per load (see sort_key), not the
+    display strings.
+    """
+
+    # Emitted with the data row index when a row first gets an edited cell
+    row_edited = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.column_names = []  # Keys into the row dicts
+        self.headers = []  # Header text shown for each column
+        self.all_rows_data = []  # Row dicts as loaded (before filtering) - cells are read from them on demand
+        self.changed_values = {}  # (data_row_idx, col_idx) -> current value of cells changed since load_data
+        self.original_values = {}  # (data_row_idx, col_idx) -> value edits are compared to, if not the loaded one
+        self.order = []  # Data row index of each displayed row
+        self.sorted_rows = []  # Every data row index, in the current sort order
+        self.search_text = ""  # Current search query ("" = show all rows)
+        self.search_strings = None  # Per data row: its casefolded values, built on the first search
+        self.sort_keys = {}  # Column index -> sort_key of every data row, built on the column's first sort
+        self.locked_rows = set()  # Data row indices that are locked
+        self.deleted_rows = set()  # Data row indices marked for deletion
+        self.edited_rows = set()  # Data row indices with at least one edited cell
+        self.edited_cells = set()  # (data_row_idx, col_idx) of cells that differ from their original value
+        self.sort_column = -1  # Column showing the sort indicator (-1 = none)
+        self.sort_order = Qt.SortOrder.AscendingOrder
+
+        # Special columns
+        self.lock_column_index = -1  # Index of lock/editable column
+        self.abnormal_column_index = -1  # Index of abnormal checkbox column
+        self.non_editable_columns = set()  # Column indices that are never editable
+        self.dropdown_columns = {}  # Column index -> list of allowed values (fixed options)
+        self.editable_dropdown_columns = {}  # Column index -> list of suggested values (user can type new)
+
+    def set_columns(self, column_headers, non_editable_columns=None, dropdown_columns=None, editable_dropdown_columns=None):
+        """Set the columns (see TransactionTableWidget.set_columns)"""
+        self.beginResetModel()
+        self.column_names = list(column_headers)
+        self.headers = []
+        self.non_editable_columns = set()
+        self.dropdown_columns = {}
+        self.editable_dropdown_columns = {}
+        self.lock_column_index = -1
+        self.abnormal_column_index = -1
+        self.sort_column = -1
+
+        for i, header in enumerate(column_headers):
+            # Replace 🔒 with "Editable" in headers and track special columns
+            if header == "🔒":
+                self.headers.append("Editable")
+                self.lock_column_index = i
+            else:
+                self.headers.append(header)
+                if header == "Abnormal":
+                    self.abnormal_column_index = i
+
+            if non_editable_columns and header in non_editable_columns:
+                self.non_editable_columns.add(i)
+            if dropdown_columns and header in dropdown_columns:
+                self.dropdown_columns[i] = dropdown_columns[header]
+            if editable_dropdown_columns and header in editable_dropdown_columns:
+                self.editable_dropdown_columns[i] = editable_dropdown_columns[header]
+
+        self.endResetModel()
+
+    def load_data(self, rows_data, locked_row_indices=None):
+        """Replace the rows (see TransactionTableWidget.load_data)"""
+        self.beginResetModel()
+        self.all_rows_data = rows_data
+        self.changed_values = {}
+        self.original_values = {}
+        self.sorted_rows = list(range(len(rows_data)))
+        self.search_strings = None
+        self.sort_keys = {}
+        self.order = self._search_matches(self.search_text, self.sorted_rows)  # Keep the current search
+        self.locked_rows = set(locked_row_indices) if locked_row_indices else set()
+        self.deleted_rows = set()
+        self.edited_rows = set()
+        self.edited_cells = set()
+        self.endResetModel()
+
+    def _loaded_value(self, data_row_idx, col_idx):
+        """A cell's value as loaded - str, or a bool in the Abnormal column"""
+        value = self.all_rows_data[data_row_idx].get(self.column_names[col_idx], "")
+        if col_idx == self.abnormal_column_index:
+            return str(value) == "☑"
+        return str(value)
+
+    def cell_value(self, data_row_idx, col_idx):
+        """A cell's current value (including unsaved edits)"""
+        cell_key = (data_row_idx, col_idx)
+        if cell_key in self.changed_values:
+            return self.changed_values[cell_key]
+        return self._loaded_value(data_row_idx, col_idx)
+
+    def _original_value(self, data_row_idx, col_idx):
+        cell_key = (data_row_idx, col_idx)
+        if cell_key in self.original_values:
+            return self.original_values[cell_key]
+        return self._loaded_value(data_row_idx, col_idx)
+
+    # --- QAbstractTableModel ---
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.order)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        data_row_idx = self.order[index.row()]
+        col_idx = index.column()
+
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if col_idx == self.abnormal_column_index:
+                return None  # Drawn as a checkbox
+            return self.cell_value(data_row_idx, col_idx)
+        if role == Qt.ItemDataRole.CheckStateRole and col_idx == self.abnormal_column_index:
+            return Qt.CheckState.Checked if self.cell_value(data_row_idx, col_idx) else Qt.CheckState.Unchecked
+        if role == DATA_ROW_ROLE:
+            return data_row_idx
+        if role == CELL_STATE_ROLE:
+            return (
+                data_row_idx in self.locked_rows,
+                data_row_idx in self.deleted_rows,
+                (data_row_idx, col_idx) in self.edited_cells,
+            )
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Vertical:
+            return str(section + 1)
+        if section >= len(self.headers):
+            return None
+        text = self.headers[section]
+        if section == self.sort_column:
+            text += " ▲" if self.sort_order == Qt.SortOrder.AscendingOrder else " ▼"
+        return text
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        data_row_idx = self.order[index.row()]
+        col_idx = index.column()
+
+        # Locked and deleted rows, the lock column and non-editable columns are read-only
+        if (data_row_idx in self.locked_rows or data_row_idx in self.deleted_rows
+                or col_idx == self.lock_column_index or col_idx in self.non_editable_columns):
+            return flags
+        if col_idx == self.abnormal_column_index:
+            return flags | Qt.ItemFlag.ItemIsUserCheckable
+        return flags | Qt.ItemFlag.ItemIsEditable
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid():
+            return False
+        flags = self.flags(index)
+        data_row_idx = self.order[index.row()]
+        col_idx = index.column()
+
+        if col_idx == self.abnormal_column_index:
+            if role != Qt.ItemDataRole.CheckStateRole or not flags & Qt.ItemFlag.ItemIsUserCheckable:
+                return False
+            new_value = Qt.CheckState(value) == Qt.CheckState.Checked
+        else:
+            if role != Qt.ItemDataRole.EditRole or not flags & Qt.ItemFlag.ItemIsEditable:
+                return False
+            new_value = str(value)
+
+        if new_value == self._loaded_value(data_row_idx, col_idx):
+            self.changed_values.pop((data_row_idx, col_idx), None)
+        else:
+            self.changed_values[(data_row_idx, col_idx)] = new_value
+        self._track_edit(data_row_idx, col_idx)
+        self.dataChanged.emit(index, index)
+        return True
+
+    def _track_edit(self, data_row_idx, col_idx):
+        """Mark a cell edited if it differs from its original value, unmark it if it was changed back"""
+        cell_key = (data_row_idx, col_idx)
+        if self.cell_value(data_row_idx, col_idx) != self._original_value(data_row_idx, col_idx):
+            if cell_key not in self.edited_cells:
+                self.edited_cells.add(cell_key)
+                self.edited_rows.add(data_row_idx)
+                self.row_edited.emit(data_row_idx)
+        elif cell_key in self.edited_cells:
+            self.edited_cells.discard(cell_key)
+            # Check if any cells in this row are still edited
+            if not any(r == data_row_idx for r, c in self.edited_cells):
+                self.edited_rows.discard(data_row_idx)
+
+    # --- Sorting, filtering and deletion ---
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Reorder the displayed rows by one column"""
+        if not 0 <= column < len(self.column_names):
+            return
+        sort_keys = self.sort_keys.get(column)
+        if sort_keys is None:
+            column_name = self.column_names[column]
+            sort_keys = [sort_key(row_data.get(column_name, "")) for row_data in self.all_rows_data]
+            self.sort_keys[column] = sort_keys
+
+        self.beginResetModel()
+        self.sorted_rows.sort(key=sort_keys.__getitem__, reverse=(order == Qt.SortOrder.DescendingOrder))
+        if self.search_text:
+            visible = set(self.order)
+            self.order = [row_idx for row_idx in self.sorted_rows if row_idx in visible]
+        else:
+            self.order = list(self.sorted_rows)
+        self.sort_column = column
+        self.sort_order = order
+        self.endResetModel()
+
+    def filter_rows(self, search_text):
+        """Show only rows with search_text in any field (case-insensitive; empty shows all)"""
+        query = search_text.casefold()
+        if query == self.search_text:
+            return
+
+        # A longer query can only match rows the shorter one matched
+        if self.search_text and self.search_text in query:
+            candidates = self.order
+        else:
+            candidates = self.sorted_rows
+
+        self.beginResetModel()
+        self.search_text = query
+        self.order = self._search_matches(query, candidates)
+        self.endResetModel()
+
+    def _search_matches(self, query, candidates) -> list:
+        """The candidate data rows (in order) with query in one of their fields"""
+        if not query:
+            return list(candidates)
+        if self.search_strings is None:
+            # Fields joined with a separator no query contains, so a match can't span two fields
+            self.search_strings = [
+                "\x1f".join(str(value) for value in row_data.values()).casefold()
+                for row_data in self.all_rows_data
+            ]
+        search_strings = self.search_strings
+        return [row_idx for row_idx in candidates if query in search_strings[row_idx]]
+
+    def mark_deleted(self, data_row_indices) -> int:
+        """Mark rows for deletion (locked rows are skipped); returns how many were marked"""
+        marked = {row_idx for row_idx in data_row_indices if row_idx not in self.locked_rows}
+        self.deleted_rows.update(marked)
+        self._repaint_all()
+        return len(marked)
+
+    def clear_change_tracking(self):
+        """Forget edits and deletion marks - the current values become the originals"""
+        self.original_values = dict(self.changed_values)
+        self.edited_rows = set()
+        self.edited_cells = set()
+        self.deleted_rows = set()
+        self._repaint_all()
+
+    def row_values(self, data_row_idx) -> dict:
+        """Current values of a data row, keyed by header"""
+        return {header: self.cell_value(data_row_idx, col_idx) for col_idx, header in enumerate(self.headers)}
+
+    def _repaint_all(self):
+        """Tell the view every cell's state may have changed (it only repaints what is visible)"""
+        if self.order and self.headers:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self.order) - 1, len(self.headers) - 1))
 
 
-class TransactionTableWidget(QTableWidget):
+class TransactionItemDelegate(QStyledItemDelegate):
+    """
+    Draws and edits TransactionTableModel cells
+
+    - Abnormal column: a centered checkbox, toggled by clicking it
+    - Dropdown columns: a combobox editor (typing allowed for editable dropdowns)
+    - Deleted rows: red strike-through text
+    - Locked rows: gray italic text (the lock column is not italic)
+    - Edited cells: warning background (not on locked or deleted rows)
+    """
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        state = index.data(CELL_STATE_ROLE)
+        if not state:
+            return
+        is_locked, is_deleted, is_edited = state
+        colors = theme_manager.get_colors()
+
+        if is_deleted:
+            # Deleted rows: red text (deleted overrides edited state)
+            option.palette.setColor(QPalette.ColorRole.Text, QColor(colors['error']))
+            option.font.setStrikeOut(True)
+        elif is_locked:
+            option.palette.setColor(QPalette.ColorRole.Text, QColor(colors['text_secondary']))
+            if index.column() != index.model().lock_column_index:
+                option.font.setItalic(True)
+        elif is_edited:
+            option.backgroundBrush = QBrush(QColor(colors['warning']))
+
+    def paint(self, painter, option, index):
+        if index.column() != index.model().abnormal_column_index:
+            super().paint(painter, option, index)
+            return
+
+        # Background, selection and edited highlight without the default left-aligned indicator
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.features &= ~QStyleOptionViewItem.ViewItemFeature.HasCheckIndicator
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget)
+
+        checkbox = QStyleOptionButton()
+        checkbox.rect = self._checkbox_rect(option)
+        checkbox.state = QStyle.StateFlag.State_On if opt.checkState == Qt.CheckState.Checked else QStyle.StateFlag.State_Off
+        if index.flags() & Qt.ItemFlag.ItemIsUserCheckable:
+            checkbox.state |= QStyle.StateFlag.State_Enabled  # Disabled if locked/deleted
+        style.drawControl(QStyle.ControlElement.CE_CheckBox, checkbox, painter, opt.widget)
+
+    def _checkbox_rect(self, option) -> QRect:
+        """Indicator-sized rect centered in the cell"""
+        style = option.widget.style() if option.widget else QApplication.style()
+        indicator = style.subElementRect(QStyle.SubElement.SE_CheckBoxIndicator, QStyleOptionButton(), option.widget)
+        rect = QRect(0, 0, indicator.width(), indicator.height())
+        rect.moveCenter(option.rect.center())
+        return rect
+
+    def editorEvent(self, event, model, option, index):
+        if index.column() != model.abnormal_column_index:
+            return super().editorEvent(event, model, option, index)
+        if not index.flags() & Qt.ItemFlag.ItemIsUserCheckable:
+            return False
+
+        if event.type() in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonDblClick):
+            # Swallow presses on the checkbox so they don't also start an edit
+            return (event.button() == Qt.MouseButton.LeftButton
+                    and self._checkbox_rect(option).contains(event.position().toPoint()))
+        if event.type() == QEvent.Type.MouseButtonRelease:
+            if (event.button() != Qt.MouseButton.LeftButton
+                    or not self._checkbox_rect(option).contains(event.position().toPoint())):
+                return False
+        elif event.type() == QEvent.Type.KeyPress:
+            if event.key() not in (Qt.Key.Key_Space, Qt.Key.Key_Select):
+                return False
+        else:
+            return False
+
+        checked = index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+        new_state = Qt.CheckState.Unchecked if checked else Qt.CheckState.Checked
+        return model.setData(index, new_state, Qt.ItemDataRole.CheckStateRole)
+
+    def createEditor(self, parent, option, index):
+        model = index.model()
+        col_idx = index.column()
+        if col_idx in model.editable_dropdown_columns:
+            # Editable dropdown - user can type new values or select from suggestions
+            combo = QComboBox(parent)
+            combo.setEditable(True)
+            combo.addItems(model.editable_dropdown_columns[col_idx])
+            return combo
+        if col_idx in model.dropdown_columns:
+            # Fixed dropdown - picking an option commits it
+            combo = QComboBox(parent)
+            combo.addItems(model.dropdown_columns[col_idx])
+            combo.activated.connect(lambda _i, editor=combo: self._commit_and_close(editor))
+            return combo
+        return super().createEditor(parent, option, index)
+
+    def _commit_and_close(self, editor):
+        self.commitData.emit(editor)
+        self.closeEditor.emit(editor)
+
+    def setEditorData(self, editor, index):
+        if isinstance(editor, QComboBox):
+            current_text = index.data(Qt.ItemDataRole.EditRole) or ""
+            combo_index = editor.findText(current_text)
+            if combo_index >= 0:
+                editor.setCurrentIndex(combo_index)
+            else:
+                editor.setCurrentText(current_text)
+            return
+        super().setEditorData(editor, index)
+
+    def setModelData(self, editor, model, index):
+        if isinstance(editor, QComboBox):
+            model.setData(index, editor.currentText(), Qt.ItemDataRole.EditRole)
+            return
+        super().setModelData(editor, model, index)
+
+
+class TransactionTableWidget(QTableView):
     """
     Reusable table widget for displaying and editing transactions
 
@@ -18,38 +484,40 @@ class TransactionTableWidget(QTableWidget):
     - Row selection (single + multi)
     - Delete marking (red text)
     - Locked row styling (grayed + lock icon)
+
+    Row indices in the public methods are data row indices - positions in the
+    rows_data passed to load_data - whatever the current sort or filter.
     """
 
     # Signal emitted when a row is edited
-    row_edited = pyqtSignal(int)  # row index
+    row_edited = pyqtSignal(int)  # data row index
+
+    SEARCH_DELAY_MS = 150  # queue_search waits this long after the last keystroke
 
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        # Track state
-        self.all_rows_data = []  # Store all data (before filtering)
-        self.filtered_rows = []  # Currently visible rows after filtering
-        self.deleted_rows = set()  # Set of row indices marked for deletion
-        self.locked_rows = set()  # Set of row indices that are locked
-        self.edited_rows = set()  # Set of row indices that have been edited (for get_edited_rows())
-        self.edited_cells = set()  # Set of (row_idx, col_idx) tuples for cell-level warning styling
-        self.original_values = {}  # Map (row_idx, col_idx) -> original value for change detection
-        self.transaction_ids = {}  # Map row index -> transaction ID
+        self.table_model = TransactionTableModel(self)
+        self.table_model.row_edited.connect(self.row_edited)
+        self.setModel(self.table_model)
+        self.setItemDelegate(TransactionItemDelegate(self))
+
+        self.transaction_ids = {}  # Map data row index -> transaction ID
         self.current_sort_column = 0  # Column currently sorted by
         self.current_sort_order = Qt.SortOrder.AscendingOrder  # Current sort direction
 
-        # Track special columns
-        self.lock_column_index = -1  # Index of lock/editable column
-        self.abnormal_column_index = -1  # Index of abnormal checkbox column
-        self.non_editable_columns = set()  # Set of column indices that are never editable
-        self.dropdown_columns = {}  # Map column index -> list of allowed values (fixed options)
-        self.editable_dropdown_columns = {}  # Map column index -> list of suggested values (user can type new)
+        # Debounce for queue_search
+        self._pending_search = ""
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(lambda: self.filter_by_search(self._pending_search))
 
         self.init_table()
+        self.apply_theme()
 
     def init_table(self):
         """Initialize table settings"""
-        # Enable sorting
         self.setSortingEnabled(False)  # We'll handle sorting manually for more control
 
         # Selection behavior
@@ -57,20 +525,24 @@ class TransactionTableWidget(QTableWidget):
         self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)  # Multi-select with Ctrl
 
         # Editing
-        self.setEditTriggers(QAbstractItemView.EditTrigger.DoubleClicked)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.DoubleClicked | QAbstractItemView.EditTrigger.EditKeyPressed)
 
         # Alternating row colors
         self.setAlternatingRowColors(True)
 
+        # Uniform row heights - the view never measures rows it doesn't show
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+
         # Stretch last column
         self.horizontalHeader().setStretchLastSection(True)
 
+        # Size "resize to content" columns from the visible rows only, not a 1000-row sample per reset
+        self.horizontalHeader().setResizeContentsPrecision(0)
+
         # Click header to sort
+        self.horizontalHeader().setSectionsClickable(True)
         self.horizontalHeader().sectionClicked.connect(self.on_header_clicked)
 
-        # Track edits
-        self.itemChanged.connect(self.on_item_changed)
-
     def set_columns(self, column_headers, non_editable_columns=None, dropdown_columns=None, editable_dropdown_columns=None):
         """
         Set table columns
@@ -81,45 +553,14 @@ class TransactionTableWidget(QTableWidget):
             dropdown_columns: Dict mapping column name -> list of allowed values (fixed, non-editable)
             editable_dropdown_columns: Dict mapping column name -> list of suggested values (user can type new)
         """
-        self.setColumnCount(len(column_headers))
-
-        # Reset tracking
-        self.non_editable_columns = set()
-        self.dropdown_columns = {}
-        self.editable_dropdown_columns = {}
-
-        # Replace 🔒 with "Editable" in headers and track special columns
-        display_headers = []
-        for i, header in enumerate(column_headers):
-            if header == "🔒":
-                display_headers.append("Editable")
-                self.lock_column_index = i
-            elif header == "Abnormal":
-                display_headers.append("Abnormal")
-                self.abnormal_column_index = i
-            else:
-                display_headers.append(header)
-
-            # Track non-editable columns by index
-            if non_editable_columns and header in non_editable_columns:
-                self.non_editable_columns.add(i)
-
-            # Track dropdown columns by index (fixed options)
-            if dropdown_columns and header in dropdown_columns:
-                self.dropdown_columns[i] = dropdown_columns[header]
-
-            # Track editable dropdown columns by index (user can type new values)
-            if editable_dropdown_columns and header in editable_dropdown_columns:
-                self.editable_dropdown_columns[i] = editable_dropdown_columns[header]
-
-        self.setHorizontalHeaderLabels(display_headers)
+        self.table_model.set_columns(column_headers, non_editable_columns, dropdown_columns, editable_dropdown_columns)
 
         # Configure column resize modes
         # - Editable column: fixed tight width
         # - Last 1-2 columns (Notes): stretch to fill available space
         # - Other columns: resize to content
         for i in range(len(column_headers)):
-            if i == self.lock_column_index:
+            if i == self.table_model.lock_column_index:
                 # Lock column: fixed width (tight)
                 self.horizontalHeader().setSectionResizeMode(i, QHeaderView.ResizeMode.Fixed)
                 self.setColumnWidth(i, 70)  # Fixed width for "Editable" column
@@ -140,179 +581,13 @@ class TransactionTableWidget(QTableWidget):
             locked_row_indices: Set of row indices that should be locked (non-editable)
             transaction_ids: Dict mapping row index -> transaction ID for saving changes
         """
-        self.all_rows_data = rows_data
-        self.filtered_rows = list(range(len(rows_data)))  # Initially show all rows
-        self.deleted_rows = set()
-        self.edited_rows = set()
-        self.edited_cells = set()
-        self.original_values = {}  # Will be populated during refresh_display
-        self.locked_rows = locked_row_indices if locked_row_indices else set()
         self.transaction_ids = transaction_ids if transaction_ids else {}
-
-        self.refresh_display()
+        self.table_model.load_data(rows_data, locked_row_indices)
 
     def refresh_display(self):
-        """Refresh table display based on current filtered rows"""
-        # Block signals while populating to avoid triggering itemChanged
-        self.blockSignals(True)
-
-        # Get theme colors for styling
-        colors = theme_manager.get_colors()
-
-        # Clear table
-        self.setRowCount(0)
-
-        # Populate with filtered rows
-        for display_row_idx, data_row_idx in enumerate(self.filtered_rows):
-            self.insertRow(display_row_idx)
-            row_data = self.all_rows_data[data_row_idx]
-
-            # Populate cells
-            for col_idx, (key, value) in enumerate(row_data.items()):
-                # Apply styling based on state
-                is_locked = data_row_idx in self.locked_rows
-                is_deleted = data_row_idx in self.deleted_rows
-
-                # Handle special columns
-                if col_idx == self.lock_column_index:
-                    # Lock/Editable column - always non-editable, show icon
-                    item = QTableWidgetItem(str(value))
-                    item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)  # Always non-editable
-                    item.setData(Qt.ItemDataRole.UserRole, data_row_idx)
-                    # Don't make it italic even if row is locked
-                    if is_deleted:
-                        item.setForeground(QColor(colors['error']))  # Use theme error color
-                        font = item.font()
-                        font.setStrikeOut(True)
-                        item.setFont(font)
-                    elif is_locked:
-                        # Still gray but not italic - use theme text_secondary color
-                        item.setForeground(QColor(colors['text_secondary']))
-                    self.setItem(display_row_idx, col_idx, item)
-
-                elif col_idx == self.abnormal_column_index:
-                    # Abnormal column - use checkbox widget
-                    checkbox_widget = QWidget()
-                    checkbox_layout = QHBoxLayout(checkbox_widget)
-                    checkbox_layout.setContentsMargins(0, 0, 0, 0)
-                    checkbox_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-                    checkbox = QCheckBox()
-                    original_checked = str(value) == "☑"
-                    checkbox.setChecked(original_checked)
-                    checkbox.setEnabled(not is_locked and not is_deleted)  # Disable if locked/deleted
-
-                    # Store original value for change detection
-                    cell_key = (data_row_idx, col_idx)
-                    if cell_key not in self.original_values:
-                        self.original_values[cell_key] = original_checked
-
-                    # Track checkbox changes as edits (pass original value for comparison)
-                    checkbox.stateChanged.connect(lambda state, r=data_row_idx, c=col_idx: self._on_checkbox_changed(r, c))
-
-                    # Apply warning background if THIS CELL is edited (but not deleted or locked)
-                    is_cell_edited = (data_row_idx, col_idx) in self.edited_cells
-                    if is_cell_edited and not is_deleted and not is_locked:
-                        checkbox_widget.setStyleSheet(f"background-color: {colors['warning']};")
-
-                    checkbox_layout.addWidget(checkbox)
-                    self.setCellWidget(display_row_idx, col_idx, checkbox_widget)
-
-                elif col_idx in self.dropdown_columns and not is_locked and not is_deleted:
-                    # Fixed dropdown column - use non-editable combobox
-                    from PyQt6.QtWidgets import QComboBox
-                    combo = QComboBox()
-                    combo.addItems(self.dropdown_columns[col_idx])
-                    # Set current value
-                    current_text = str(value)
-                    index = combo.findText(current_text)
-                    if index >= 0:
-                        combo.setCurrentIndex(index)
-                    else:
-                        combo.setCurrentText(current_text)
-
-                    # Store original value for change detection
-                    cell_key = (data_row_idx, col_idx)
-                    if cell_key not in self.original_values:
-                        self.original_values[cell_key] = current_text
-
-                    # Store data row index for change tracking
-                    combo.setProperty("data_row_idx", data_row_idx)
-                    combo.setProperty("col_idx", col_idx)
-                    combo.currentTextChanged.connect(lambda text, r=data_row_idx, c=col_idx: self._on_dropdown_changed(r, c, text))
-                    # Apply warning background if THIS CELL is edited
-                    is_cell_edited = (data_row_idx, col_idx) in self.edited_cells
-                    if is_cell_edited:
-                        combo.setStyleSheet(f"QComboBox {{ background-color: {colors['warning']}; }}")
-                    self.setCellWidget(display_row_idx, col_idx, combo)
-
-                elif col_idx in self.editable_dropdown_columns and not is_locked and not is_deleted:
-                    # Editable dropdown column - user can type new values or select from suggestions
-                    from PyQt6.QtWidgets import QComboBox
-                    combo = QComboBox()
-                    combo.setEditable(True)  # Allow typing custom values
-                    combo.addItems(self.editable_dropdown_columns[col_idx])
-                    # Set current value
-                    current_text = str(value)
-                    combo.setCurrentText(current_text)
-
-                    # Store original value for change detection
-                    cell_key = (data_row_idx, col_idx)
-                    if cell_key not in self.original_values:
-                        self.original_values[cell_key] = current_text
-
-                    # Store data row index for change tracking
-                    combo.setProperty("data_row_idx", data_row_idx)
-                    combo.setProperty("col_idx", col_idx)
-                    combo.currentTextChanged.connect(lambda text, r=data_row_idx, c=col_idx: self._on_dropdown_changed(r, c, text))
-                    # Also track when user finishes editing (for typed values) - get current text from combo
-                    combo.lineEdit().editingFinished.connect(lambda r=data_row_idx, c=col_idx, cb=combo: self._on_dropdown_changed(r, c, cb.currentText()))
-                    # Apply warning background if THIS CELL is edited
-                    is_cell_edited = (data_row_idx, col_idx) in self.edited_cells
-                    if is_cell_edited:
-                        combo.setStyleSheet(f"QComboBox {{ background-color: {colors['warning']}; }} QComboBox QLineEdit {{ background-color: {colors['warning']}; }}")
-                    self.setCellWidget(display_row_idx, col_idx, combo)
-
-                else:
-                    # Regular column
-                    item = QTableWidgetItem(str(value))
-                    item.setData(Qt.ItemDataRole.UserRole, data_row_idx)
-
-                    # Store original value for change detection
-                    cell_key = (data_row_idx, col_idx)
-                    if cell_key not in self.original_values:
-                        self.original_values[cell_key] = str(value)
-
-                    # Check if column is non-editable
-                    is_non_editable_column = col_idx in self.non_editable_columns
-                    is_cell_edited = (data_row_idx, col_idx) in self.edited_cells
-
-                    if is_locked or is_non_editable_column:
-                        # Locked rows or non-editable columns: grayed out and non-editable
-                        item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                        if is_locked:
-                            item.setForeground(QColor(colors['text_secondary']))  # Use theme secondary text
-                            font = item.font()
-                            font.setItalic(True)
-                            item.setFont(font)
-
-                    if is_deleted:
-                        # Deleted rows: red text (deleted overrides edited state)
-                        item.setForeground(QColor(colors['error']))  # Use theme error color
-                        font = item.font()
-                        font.setStrikeOut(True)
-                        item.setFont(font)
-                    elif is_cell_edited and not is_locked:
-                        # Edited cell: warning background color (but not if locked or deleted)
-                        item.setBackground(QColor(colors['warning']))
-
-                    self.setItem(display_row_idx, col_idx, item)
-
-        # Restore signals
-        self.blockSignals(False)
-
-        # Apply theme
-        self.apply_theme()
+        """Repaint the visible rows (e.g. after a theme change)"""
+        self.viewport().update()
+        self.horizontalHeader().viewport().update()
 
     def on_header_clicked(self, logical_index):
         """Handle column header click for sorting"""
@@ -327,9 +602,6 @@ class TransactionTableWidget(QTableWidget):
             self.current_sort_column = logical_index
             self.current_sort_order = Qt.SortOrder.AscendingOrder
 
-        # Update header to show sort indicator
-        self.horizontalHeader().setSortIndicator(logical_index, self.current_sort_order)
-
         # Perform sort
         self.sort_data(logical_index, self.current_sort_order)
 
@@ -341,48 +613,7 @@ class TransactionTableWidget(QTableWidget):
             column_index: Column to sort by
             sort_order: Qt.SortOrder.AscendingOrder or DescendingOrder
         """
-        # Get column header name
-        column_name = self.horizontalHeaderItem(column_index).text()
-        # Remove sort indicator (▲/▼) if present
-        column_name = column_name.replace(" ▲", "").replace(" ▼", "")
-
-        # Sort filtered rows based on data
-        reverse = (sort_order == Qt.SortOrder.DescendingOrder)
-
-        def get_sort_key(row_idx):
-            row_data = self.all_rows_data[row_idx]
-            value = row_data.get(column_name, "")
-            # Try to convert to number for numeric sorting
-            try:
-                # Remove $ and , for dollar amounts
-                if isinstance(value, str) and value.startswith("$"):
-                    return float(value.replace("$", "").replace(",", ""))
-                return float(value)
-            except (ValueError, AttributeError):
-                # Check if this is a date column (format: M/D/YYYY or MM/DD/YYYY)
-                if isinstance(value, str) and "/" in value and column_name.lower() in ("date", "earned", "start"):
-                    try:
-                        from datetime import datetime
-                        # Parse M/D/YYYY format and return sortable tuple (year, month, day)
-                        date_obj = datetime.strptime(value, "%m/%d/%Y")
-                        return (date_obj.year, date_obj.month, date_obj.day)
-                    except ValueError:
-                        pass
-                return str(value).lower()
-
-        self.filtered_rows.sort(key=get_sort_key, reverse=reverse)
-
-        # Update header to show sort indicator
-        for i in range(self.columnCount()):
-            header_item = self.horizontalHeaderItem(i)
-            if header_item:
-                text = header_item.text().replace(" ▲", "").replace(" ▼", "")
-                if i == column_index:
-                    text += " ▲" if sort_order == Qt.SortOrder.AscendingOrder else " ▼"
-                header_item.setText(text)
-
-        # Refresh display
-        self.refresh_display()
+        self.table_model.sort(column_index, sort_order)
 
     def filter_by_search(self, search_text):
         """
@@ -391,61 +622,45 @@ class TransactionTableWidget(QTableWidget):
         Args:
             search_text: Text to search for (case-insensitive, searches all fields)
         """
-        if not search_text:
-            # Show all rows if search is empty
-            self.filtered_rows = list(range(len(self.all_rows_data)))
-        else:
-            search_lower = search_text.lower()
-            self.filtered_rows = []
+        self._search_timer.stop()  # Supersedes any queued search
+        self.table_model.filter_rows(search_text)
 
-            for row_idx, row_data in enumerate(self.all_rows_data):
-                # Check if search text appears in any field
-                for value in row_data.values():
-                    if search_lower in str(value).lower():
-                        self.filtered_rows.append(row_idx)
-                        break  # Found match, move to next row
+    def queue_search(self, search_text):
+        """
+        Filter by search text once typing pauses (for textChanged)
 
-        # Refresh display
-        self.refresh_display()
+        Clearing the search applies at once; other text waits SEARCH_DELAY_MS
+        after the last call, so a burst of keystrokes filters once.
+        """
+        if not search_text:
+            self.filter_by_search(search_text)
+            return
+        self._pending_search = search_text
+        self._search_timer.start()
 
     def mark_selected_for_deletion(self):
         """Mark currently selected rows for deletion (turn red)"""
-        selected_items = self.selectedItems()
-
-        if not selected_items:
+        selected_indexes = self.selectionModel().selectedIndexes()
+        if not selected_indexes:
             return
 
-        # Get unique row indices from selected items
-        selected_rows = set()
-        for item in selected_items:
-            data_row_idx = item.data(Qt.ItemDataRole.UserRole)
-
-            # Don't allow deleting locked rows
-            if data_row_idx not in self.locked_rows:
-                selected_rows.add(data_row_idx)
+        # Get unique data row indices from selected cells
+        selected_rows = {index.data(DATA_ROW_ROLE) for index in selected_indexes}
 
-        # Add to deleted set
-        self.deleted_rows.update(selected_rows)
-
-        # Refresh display to show red text
-        self.refresh_display()
-
-        return len(selected_rows)  # Return count of rows marked
+        # Locked rows are skipped by the model
+        return self.table_model.mark_deleted(selected_rows)  # Return count of rows marked
 
     def get_deleted_rows(self):
         """Get list of data row indices marked for deletion"""
-        return list(self.deleted_rows)
+        return list(self.table_model.deleted_rows)
 
     def get_edited_rows(self):
         """Get list of row indices that have been edited"""
-        return list(self.edited_rows)
+        return list(self.table_model.edited_rows)
 
     def clear_change_tracking(self):
         """Clear all change tracking (called when switching tabs)"""
-        self.edited_rows = set()
-        self.edited_cells = set()
-        self.original_values = {}
-        self.deleted_rows = set()
+        self.table_model.clear_change_tracking()
 
     def get_row_data(self, row_index):
         """
@@ -455,210 +670,31 @@ class TransactionTableWidget(QTableWidget):
             row_index: The data row index (not display row index)
 
         Returns:
-            Dict with column names as keys and current cell values
+            Dict with column names as keys and current cell values (the
+            Abnormal column as a bool), or None if there is no such row
         """
-        # Find this data row in the displayed rows
-        try:
-            display_row = self.filtered_rows.index(row_index)
-        except ValueError:
-            # Row not currently visible (filtered out)
+        if not 0 <= row_index < len(self.table_model.all_rows_data):
             return None
-
-        row_data = {}
-        for col_idx in range(self.columnCount()):
-            header = self.horizontalHeaderItem(col_idx).text()
-            # Remove sort indicators from header
-            header = header.replace(" ▲", "").replace(" ▼", "")
-
-            # Get cell value
-            if col_idx == self.abnormal_column_index:
-                # Get checkbox state
-                widget = self.cellWidget(display_row, col_idx)
-                if widget:
-                    checkbox = widget.findChild(QCheckBox)
-                    row_data[header] = checkbox.isChecked() if checkbox else False
-            elif col_idx in self.dropdown_columns or col_idx in self.editable_dropdown_columns:
-                # Get combobox value (works for both fixed and editable dropdowns)
-                from PyQt6.QtWidgets import QComboBox
-                widget = self.cellWidget(display_row, col_idx)
-                if widget and isinstance(widget, QComboBox):
-                    row_data[header] = widget.currentText()
-                else:
-                    # Fallback to item if dropdown not shown (locked row)
-                    item = self.item(display_row, col_idx)
-                    row_data[header] = item.text() if item else ""
-            else:
-                item = self.item(display_row, col_idx)
-                row_data[header] = item.text() if item else ""
-
-        return row_data
-
-    def _apply_warning_to_cell(self, data_row_idx, col_idx):
-        """Apply warning background color to a specific cell"""
-        # Find display row index for this data row
-        try:
-            display_row = self.filtered_rows.index(data_row_idx)
-        except ValueError:
-            return  # Row not visible
-
-        colors = theme_manager.get_colors()
-        warning_color = colors['warning']
-
-        # Check if cell has a widget (dropdown/checkbox)
-        widget = self.cellWidget(display_row, col_idx)
-        if widget:
-            from PyQt6.QtWidgets import QComboBox
-            if isinstance(widget, QComboBox):
-                # Apply to combobox
-                if widget.isEditable():
-                    widget.setStyleSheet(f"QComboBox {{ background-color: {warning_color}; }} QComboBox QLineEdit {{ background-color: {warning_color}; }}")
-                else:
-                    widget.setStyleSheet(f"QComboBox {{ background-color: {warning_color}; }}")
-            else:
-                # Checkbox widget container
-                widget.setStyleSheet(f"background-color: {warning_color};")
-        else:
-            # Regular table item
-            item = self.item(display_row, col_idx)
-            if item:
-                # Don't override locked rows styling
-                if data_row_idx not in self.locked_rows:
-                    item.setBackground(QColor(warning_color))
-
-    def _remove_warning_from_cell(self, data_row_idx, col_idx):
-        """Remove warning background color from a specific cell (when value reverted to original)"""
-        # Find display row index for this data row
-        try:
-            display_row = self.filtered_rows.index(data_row_idx)
-        except ValueError:
-            return  # Row not visible
-
-        colors = theme_manager.get_colors()
-
-        # Check if cell has a widget (dropdown/checkbox)
-        widget = self.cellWidget(display_row, col_idx)
-        if widget:
-            # Clear stylesheet to remove warning color
-            widget.setStyleSheet("")
-        else:
-            # Regular table item - reset to default background
-            item = self.item(display_row, col_idx)
-            if item:
-                item.setBackground(QColor(colors['surface']))
-
-    def _on_dropdown_changed(self, data_row_idx, col_idx, new_value):
-        """Handle when a dropdown value is changed"""
-        if data_row_idx not in self.locked_rows and data_row_idx not in self.deleted_rows:
-            cell_key = (data_row_idx, col_idx)
-            original_value = self.original_values.get(cell_key, "")
-
-            # Only mark as edited if value actually changed from original
-            if new_value != original_value:
-                if cell_key not in self.edited_cells:
-                    self.edited_rows.add(data_row_idx)
-                    self.edited_cells.add(cell_key)
-                    self.row_edited.emit(data_row_idx)
-                    self._apply_warning_to_cell(data_row_idx, col_idx)
-            else:
-                # Value changed back to original - remove edited state
-                if cell_key in self.edited_cells:
-                    self.edited_cells.discard(cell_key)
-                    self._remove_warning_from_cell(data_row_idx, col_idx)
-                    # Check if any cells in this row are still edited
-                    if not any(r == data_row_idx for r, c in self.edited_cells):
-                        self.edited_rows.discard(data_row_idx)
-
-    def _on_checkbox_changed(self, data_row_idx, col_idx):
-        """Handle when a checkbox (abnormal) is changed"""
-        if data_row_idx not in self.locked_rows and data_row_idx not in self.deleted_rows:
-            cell_key = (data_row_idx, col_idx)
-            original_value = self.original_values.get(cell_key, False)
-
-            # Get current checkbox value
-            try:
-                display_row = self.filtered_rows.index(data_row_idx)
-                widget = self.cellWidget(display_row, col_idx)
-                if widget:
-                    checkbox = widget.findChild(QCheckBox)
-                    new_value = checkbox.isChecked() if checkbox else False
-                else:
-                    return
-            except ValueError:
-                return
-
-            # Only mark as edited if value actually changed from original
-            if new_value != original_value:
-                if cell_key not in self.edited_cells:
-                    self.edited_rows.add(data_row_idx)
-                    self.edited_cells.add(cell_key)
-                    self.row_edited.emit(data_row_idx)
-                    self._apply_warning_to_cell(data_row_idx, col_idx)
-            else:
-                # Value changed back to original - remove edited state
-                if cell_key in self.edited_cells:
-                    self.edited_cells.discard(cell_key)
-                    self._remove_warning_from_cell(data_row_idx, col_idx)
-                    # Check if any cells in this row are still edited
-                    if not any(r == data_row_idx for r, c in self.edited_cells):
-                        self.edited_rows.discard(data_row_idx)
-
-    def on_item_changed(self, item):
-        """Handle when an item is edited"""
-        # Get original data row index
-        data_row_idx = item.data(Qt.ItemDataRole.UserRole)
-
-        # data_row_idx might be None if UserRole wasn't set
-        if data_row_idx is None:
-            return
-
-        # Don't allow editing locked or deleted rows
-        if data_row_idx in self.locked_rows or data_row_idx in self.deleted_rows:
-            return
-
-        # Get column index and new value
-        col_idx = item.column()
-        cell_key = (data_row_idx, col_idx)
-        new_value = item.text()
-        original_value = self.original_values.get(cell_key, "")
-
-        colors = theme_manager.get_colors()
-
-        # Only mark as edited if value actually changed from original
-        if new_value != original_value:
-            # Add to edited tracking
-            self.edited_rows.add(data_row_idx)
-            self.edited_cells.add(cell_key)
-            self.row_edited.emit(data_row_idx)
-            # Apply warning directly to the item being edited
-            item.setBackground(QColor(colors['warning']))
-        else:
-            # Value changed back to original - remove edited state
-            if cell_key in self.edited_cells:
-                self.edited_cells.discard(cell_key)
-                # Reset background to default
-                item.setBackground(QColor(colors['surface']))
-                # Check if any cells in this row are still edited
-                if not any(r == data_row_idx for r, c in self.edited_cells):
-                    self.edited_rows.discard(data_row_idx)
+        return self.table_model.row_values(row_index)
 
     def apply_theme(self):
         """Apply current theme colors to table"""
         colors = theme_manager.get_colors()
 
-        # Note: Do NOT set background-color on QTableWidget::item - it overrides
-        # programmatic item.setBackground() calls needed for warning highlighting
+        # Note: Do NOT set background-color on QTableView::item - it overrides
+        # the delegate's warning background for edited cells
         self.setStyleSheet(f"""
-            QTableWidget {{
+            QTableView {{
                 background-color: {colors['surface']};
                 color: {colors['text_primary']};
                 border: 1px solid {colors['border']};
                 gridline-color: {colors['border']};
                 selection-background-color: {colors['primary']};
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: 4px;
             }}
-            QTableWidget::item:selected {{
+            QTableView::item:selected {{
                 background-color: {colors['primary']};
                 color: {colors['background']};
             }}
@@ -9,6 +9,8 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 from themes import theme_manager
 from views.transactions_table_widget import TransactionTableWidget
+from utils.error_handler import show_error
+from services.change_events import ChangeKind, Depends, invalidated_panels
 
 
 class TransactionsView(QWidget):
@@ -17,6 +19,14 @@ class TransactionsView(QWidget):
     Provides advanced search, filtering, and bulk editing capabilities
     """
 
+    # Which data changes make which panel stale (panel update method -> reasons)
+    PANEL_DEPENDENCIES = {
+        "load_accounts_data": [Depends(ChangeKind.ACCOUNTS, ChangeKind.BILLS)],
+        "load_paycheck_data": [Depends(ChangeKind.TRANSACTIONS, types=("income",))],
+        "load_spending_data": [Depends(ChangeKind.TRANSACTIONS, types=("spending", "rollover", "income"))],
+        "load_transfers_data": [Depends(ChangeKind.ACCOUNTS, ChangeKind.BILLS)],
+    }
+
     # Field descriptions for each sub-tab (used in info button tooltip)
     # NOTE: If a row is LOCKED (🔒), NO fields in that row can be edited.
     # The descriptions below apply to non-locked rows only.
@@ -226,7 +236,7 @@ class TransactionsView(QWidget):
         from models.transactions import Transaction, TransactionType
 
         # Get all transactions that involve an account or bill
-        all_transactions = self.transaction_manager.get_all_transactions()
+        all_transactions = self.transaction_manager.get_transaction_snapshot().transactions
 
         # Filter for transactions with account_id or bill_id set
         # Exclude Account-to-Account transfers (transfer_group_id is set)
@@ -284,7 +294,7 @@ class TransactionsView(QWidget):
             amount_display = f"${abs(amount_value):,.2f}"
 
             # Generate auto-notes
-            auto_notes = self.generate_auto_notes(trans, amount_value)
+            auto_notes = self.generate_auto_notes(trans, amount_value, account_names)
 
             row = {
                 "ID": str(trans.id),
@@ -320,7 +330,7 @@ class TransactionsView(QWidget):
         from models.transactions import Transaction, TransactionType
 
         # Get all INCOME transactions (paychecks)
-        all_transactions = self.transaction_manager.get_all_transactions()
+        all_transactions = self.transaction_manager.get_transaction_snapshot().transactions
         paychecks = [
             t for t in all_transactions
             if t.transaction_type == TransactionType.INCOME.value
@@ -403,7 +413,7 @@ class TransactionsView(QWidget):
         import calendar
 
         # Get all transactions
-        all_transactions = self.transaction_manager.get_all_transactions()
+        all_transactions = self.transaction_manager.get_transaction_snapshot().transactions
 
         # Filter for spending-related transactions:
         # 1. SPENDING transactions (regular spending)
@@ -513,7 +523,7 @@ class TransactionsView(QWidget):
         from models.transactions import Transaction, TransactionType
 
         # Get all transactions
-        all_transactions = self.transaction_manager.get_all_transactions()
+        all_transactions = self.transaction_manager.get_transaction_snapshot().transactions
 
         # Filter for Account-to-Account transfers ONLY (have transfer_group_id)
         transfer_transactions = [
@@ -656,13 +666,14 @@ class TransactionsView(QWidget):
         # Everything else is editable
         return False
 
-    def generate_auto_notes(self, transaction, amount_value=None):
+    def generate_auto_notes(self, transaction, amount_value=None, account_names=None):
         """
         Generate auto-notes for a transaction
 
         Args:
-            transaction: Transaction object
+            transaction: Transaction or TransactionRow
             amount_value: Optional amount value (from AccountHistory.change_amount) for deposit/withdrawal detection
+            account_names: Optional {account_id: name} map (TransactionRow has no account relationship)
         """
         from models.transactions import TransactionType
 
@@ -681,7 +692,7 @@ class TransactionsView(QWidget):
             # Rollover transaction - check if it's week-to-week or week-to-account
             if transaction.account_id:
                 # Week 2 → Savings account rollover
-                account_name = transaction.account.name if transaction.account else "account"
+                account_name = (account_names or {}).get(transaction.account_id, "account")
                 return f"{prefix} Rollover into {account_name} from payweek {payweek}"
             else:
                 # Week 1 → Week 2 rollover
@@ -718,7 +729,7 @@ class TransactionsView(QWidget):
         """Handle search text change"""
         table = getattr(self, f"{tab_name}_table", None)
         if table:
-            table.filter_by_search(search_text)
+            table.queue_search(search_text)
 
     def on_delete_clicked(self, tab_name):
         """Handle delete button click"""
@@ -733,6 +744,7 @@ class TransactionsView(QWidget):
         from PyQt6.QtWidgets import QMessageBox
         from models.transactions import Transaction
         from datetime import datetime
+        from contextlib import nullcontext
 
         table = getattr(self, f"{tab_name}_table", None)
         if not table:
@@ -750,109 +762,125 @@ class TransactionsView(QWidget):
         successes = []
         failures = []
 
-        # Process deletions
-        for row_idx in deleted_rows:
-            trans_id = table.transaction_ids.get(row_idx)
-            if trans_id is None:
-                failures.append((row_idx, "No transaction ID found"))
-                continue
+        # Save everything as one batch: history and rollovers are recalculated once, with a single commit
+        # Paycheck edits rebuild auto-saves through a separate PaycheckProcessor session,
+        # which can't write while this session holds an open batch, so they save one by one
+        batch = self.transaction_manager.batch() if tab_name != "paycheck" else nullcontext()
+        try:
+            with batch:
+                # Process deletions
+                for row_idx in deleted_rows:
+                    trans_id = table.transaction_ids.get(row_idx)
+                    if trans_id is None:
+                        failures.append((row_idx, "No transaction ID found"))
+                        continue
 
-            # Handle transfers tab - has tuple of (source_id, dest_id)
-            if tab_name == "transfers" and isinstance(trans_id, tuple):
-                source_id, dest_id = trans_id
-                try:
-                    success1 = self.transaction_manager.delete_transaction(source_id)
-                    success2 = self.transaction_manager.delete_transaction(dest_id)
-                    if success1 and success2:
-                        successes.append((f"{source_id}/{dest_id}", "Deleted (both sides)"))
+                    # Handle transfers tab - has tuple of (source_id, dest_id)
+                    if tab_name == "transfers" and isinstance(trans_id, tuple):
+                        source_id, dest_id = trans_id
+                        try:
+                            with self.transaction_manager.savepoint():
+                                success1 = self.transaction_manager.delete_transaction(source_id)
+                                success2 = self.transaction_manager.delete_transaction(dest_id)
+                                if success1 and success2:
+                                    successes.append((f"{source_id}/{dest_id}", "Deleted (both sides)"))
+                                else:
+                                    failures.append((f"{source_id}/{dest_id}", "Delete failed"))
+                        except Exception as e:
+                            failures.append((f"{source_id}/{dest_id}", f"Delete error: {str(e)}"))
                     else:
-                        failures.append((f"{source_id}/{dest_id}", "Delete failed"))
-                except Exception as e:
-                    failures.append((f"{source_id}/{dest_id}", f"Delete error: {str(e)}"))
-            else:
-                try:
-                    success = self.transaction_manager.delete_transaction(trans_id)
-                    if success:
-                        successes.append((trans_id, "Deleted"))
-                    else:
-                        failures.append((trans_id, "Delete failed"))
-                except Exception as e:
-                    failures.append((trans_id, f"Delete error: {str(e)}"))
-
-        # Process edits
-        for row_idx in edited_rows:
-            if row_idx in deleted_rows:
-                continue  # Already deleted, skip
-
-            trans_id = table.transaction_ids.get(row_idx)
-            if trans_id is None:
-                failures.append((row_idx, "No transaction ID found"))
-                continue
-
-            # Get current row data from table
-            row_data = table.get_row_data(row_idx)
-            if not row_data:
-                failures.append((trans_id, "Could not read row data"))
-                continue
-
-            # Validate and convert data
-            updates, validation_error = self._validate_and_convert_row_data(row_data, tab_name)
-            if validation_error:
-                failures.append((trans_id, validation_error))
-                continue
+                        try:
+                            with self.transaction_manager.savepoint():
+                                success = self.transaction_manager.delete_transaction(trans_id)
+                                if success:
+                                    successes.append((trans_id, "Deleted"))
+                                else:
+                                    failures.append((trans_id, "Delete failed"))
+                        except Exception as e:
+                            failures.append((trans_id, f"Delete error: {str(e)}"))
+
+                # Process edits
+                for row_idx in edited_rows:
+                    if row_idx in deleted_rows:
+                        continue  # Already deleted, skip
+
+                    trans_id = table.transaction_ids.get(row_idx)
+                    if trans_id is None:
+                        failures.append((row_idx, "No transaction ID found"))
+                        continue
 
-            # Handle paycheck tab - special recalculation logic for start date/amount changes
-            if tab_name == "paycheck" and updates.get("_needs_recalculation"):
-                try:
-                    # Get the original paycheck transaction
-                    original_paycheck = self.transaction_manager.get_transaction_by_id(trans_id)
-                    if not original_paycheck:
-                        failures.append((trans_id, "Could not find original paycheck"))
+                    # Get current row data from table
+                    row_data = table.get_row_data(row_idx)
+                    if not row_data:
+                        failures.append((trans_id, "Could not read row data"))
                         continue
 
-                    # Apply paycheck recalculation
-                    success, message = self._apply_paycheck_recalculation(
-                        original_paycheck, updates, row_data
-                    )
+                    # Validate and convert data
+                    updates, validation_error = self._validate_and_convert_row_data(row_data, tab_name)
+                    if validation_error:
+                        failures.append((trans_id, validation_error))
+                        continue
 
-                    if success:
-                        successes.append((trans_id, message))
+                    # Handle paycheck tab - special recalculation logic for start date/amount changes
+                    if tab_name == "paycheck" and updates.get("_needs_recalculation"):
+                        try:
+                            with self.transaction_manager.savepoint():
+                                # Get the original paycheck transaction
+                                original_paycheck = self.transaction_manager.get_transaction_by_id(trans_id)
+                                if not original_paycheck:
+                                    failures.append((trans_id, "Could not find original paycheck"))
+                                    continue
+
+                                # Apply paycheck recalculation
+                                success, message = self._apply_paycheck_recalculation(
+                                    original_paycheck, updates, row_data
+                                )
+
+                                if success:
+                                    successes.append((trans_id, message))
+                                else:
+                                    failures.append((trans_id, message))
+                        except Exception as e:
+                            failures.append((trans_id, f"Recalculation error: {str(e)}"))
+                        continue  # Skip normal update flow
+
+                    # Handle transfers tab - update BOTH transactions
+                    elif tab_name == "transfers" and isinstance(trans_id, tuple):
+                        source_id, dest_id = trans_id
+                        try:
+                            with self.transaction_manager.savepoint():
+                                # Build updates for source (negative amount, From account)
+                                source_updates = self._build_transfer_source_updates(updates, row_data)
+                                # Build updates for dest (positive amount, To account)
+                                dest_updates = self._build_transfer_dest_updates(updates, row_data)
+
+                                updated_source = self.transaction_manager.update_transaction(source_id, source_updates)
+                                updated_dest = self.transaction_manager.update_transaction(dest_id, dest_updates)
+
+                                if updated_source and updated_dest:
+                                    changes = self._format_changes(row_data, updates)
+                                    successes.append((f"{source_id}/{dest_id}", changes))
+                                else:
+                                    failures.append((f"{source_id}/{dest_id}", "Update failed"))
+                        except Exception as e:
+                            failures.append((f"{source_id}/{dest_id}", f"Update error: {str(e)}"))
                     else:
-                        failures.append((trans_id, message))
-                except Exception as e:
-                    failures.append((trans_id, f"Recalculation error: {str(e)}"))
-                continue  # Skip normal update flow
-
-            # Handle transfers tab - update BOTH transactions
-            elif tab_name == "transfers" and isinstance(trans_id, tuple):
-                source_id, dest_id = trans_id
-                try:
-                    # Build updates for source (negative amount, From account)
-                    source_updates = self._build_transfer_source_updates(updates, row_data)
-                    # Build updates for dest (positive amount, To account)
-                    dest_updates = self._build_transfer_dest_updates(updates, row_data)
-
-                    updated_source = self.transaction_manager.update_transaction(source_id, source_updates)
-                    updated_dest = self.transaction_manager.update_transaction(dest_id, dest_updates)
-
-                    if updated_source and updated_dest:
-                        changes = self._format_changes(row_data, updates)
-                        successes.append((f"{source_id}/{dest_id}", changes))
-                    else:
-                        failures.append((f"{source_id}/{dest_id}", "Update failed"))
-                except Exception as e:
-                    failures.append((f"{source_id}/{dest_id}", f"Update error: {str(e)}"))
-            else:
-                # Regular single transaction update
-                try:
-                    updated_trans = self.transaction_manager.update_transaction(trans_id, updates)
-                    if updated_trans:
-                        changes = self._format_changes(row_data, updates)
-                        successes.append((trans_id, changes))
-                    else:
-                        failures.append((trans_id, "Update failed"))
-                except Exception as e:
-                    failures.append((trans_id, f"Update error: {str(e)}"))
+                        # Regular single transaction update
+                        try:
+                            with self.transaction_manager.savepoint():
+                                updated_trans = self.transaction_manager.update_transaction(trans_id, updates)
+                                if updated_trans:
+                                    changes = self._format_changes(row_data, updates)
+                                    successes.append((trans_id, changes))
+                                else:
+                                    failures.append((trans_id, "Update failed"))
+                        except Exception as e:
+                            failures.append((trans_id, f"Update error: {str(e)}"))
+        except Exception as e:
+            # The batch couldn't commit - none of its changes were saved
+            show_error(self, "Save Error", e, "saving transaction changes")
+            self.refresh()
+            return
 
         # Show results dialog only in testing mode
         from views.dialogs.settings_dialog import get_setting
@@ -1466,6 +1494,11 @@ class TransactionsView(QWidget):
         msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
         msg_box.exec()
 
+    def apply_change(self, change):
+        """Refresh what a DataChange made stale (see PANEL_DEPENDENCIES)"""
+        for panel in invalidated_panels(self, change):
+            getattr(self, panel)()
+
     def refresh(self):
         """Refresh all sub-tabs with real data"""
         try:
@@ -11,6 +11,8 @@ from PyQt6.QtGui import QColor
 from themes import theme_manager
 from widgets import PieChartWidget
 from datetime import datetime, timedelta
+from models.account_history import AccountHistoryManager
+from services.change_events import ChangeKind, Depends, invalidated_panels
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
@@ -53,8 +55,8 @@ class WeekDetailWidget(QWidget):
             return []
 
         try:
-            # Get all spending transactions
-            all_transactions = self.transaction_manager.get_all_transactions()
+            # Get all spending transactions (shared snapshot - loaded once per data change)
+            all_transactions = self.transaction_manager.get_transaction_snapshot().transactions
             spending_transactions = [t for t in all_transactions if t.is_spending and t.include_in_analytics]
 
             # Calculate spending by category
@@ -1073,27 +1075,30 @@ class WeekDetailWidget(QWidget):
     def apply_changes(self, changes):
         """Apply the changes to the database"""
         try:
-            # Apply modifications
-            for change in changes['modified']:
-                transaction = change['transaction']
-                new_values = change['new_values']
-                
-                # Update transaction in database
-                self.transaction_manager.update_transaction(
-                    transaction.id,
-                    {
-                        'category': new_values['category'],
-                        'amount': new_values['amount'], 
-                        'description': new_values['description'],
-                        'include_in_analytics': new_values['include_in_analytics']
-                    }
-                )
-                print(f"Updated transaction {transaction.id}: {change['description']}")
-            
-            # Apply deletions
-            for transaction in changes['deleted']:
-                self.transaction_manager.delete_transaction(transaction.id)
-                print(f"Deleted transaction {transaction.id}: {transaction.description}")
+            # One batch: history and rollovers are recalculated once, with a single commit
+            with self.transaction_manager.batch():
+                # Apply modifications
+                for change in changes['modified']:
+                    transaction = change['transaction']
+                    new_values = change['new_values']
+
+                    # Update transaction in database
+                    self.transaction_manager.update_transaction(
+                        transaction.id,
+                        {
+                            'category': new_values['category'],
+                            'amount': new_values['amount'],
+                            'description': new_values['description'],
+                            'include_in_analytics': new_values['include_in_analytics']
+                        }
+                    )
+                    print(f"Updated transaction {transaction.id}: {change['description']}")
+
+                # Apply deletions
+                for transaction in changes['deleted']:
+                    transaction_id, description = transaction.id, transaction.description
+                    self.transaction_manager.delete_transaction(transaction_id)
+                    print(f"Deleted transaction {transaction_id}: {description}")
             
             # Reload the table and refresh the parent view
             self.load_week_data()
@@ -1260,6 +1265,18 @@ class WeekDetailWidget(QWidget):
 
 
 class WeeklyView(QWidget):
+    # Which data changes make which panel stale (panel update method -> reasons)
+    PANEL_DEPENDENCIES = {
+        "refresh": [Depends(ChangeKind.WEEKS)],  # Week list - new or changed pay periods
+        "update_week_info": [
+            Depends(ChangeKind.TRANSACTIONS, weeks=lambda view: view.get_selected_week_numbers()),
+            # Starting/final savings values are balances as of the period's dates
+            Depends(ChangeKind.ACCOUNTS, dates=lambda view: (None, view.get_selected_period_dates()[1])),
+            # Reimbursements are listed under each week's transactions
+            Depends(ChangeKind.REIMBURSEMENTS, dates=lambda view: view.get_selected_period_dates()),
+        ],
+    }
+
     def __init__(self, transaction_manager=None, paycheck_processor=None):
         super().__init__()
         self.transaction_manager = transaction_manager
@@ -1873,7 +1890,13 @@ class WeeklyView(QWidget):
             period_end_date = self.selected_week['end_date']
 
 
-            # Display values for each account using AccountHistory
+            # Display values for each account from the month-end balance checkpoints
+            # (two bounded queries cover every account regardless of history length)
+            history_manager = AccountHistoryManager(self.transaction_manager.db)
+            day_before_period = period_start_date - timedelta(days=1)
+            starting_balances = history_manager.balances_as_of(day_before_period)
+            final_balances = history_manager.balances_as_of(period_end_date)
+
             start_account_text = ""
             final_account_text = ""
             amount_paid_text = ""
@@ -1881,15 +1904,11 @@ class WeeklyView(QWidget):
             for account in accounts:
                 name = account.name[:14] + "..." if len(account.name) > 14 else account.name
 
-                # Get AccountHistory for this account
-                account_history = account.get_account_history(self.transaction_manager.db)
-
-                # Find starting balance (latest entry BEFORE period start date - not including start date)
-                day_before_period = period_start_date - timedelta(days=1)
-                starting_balance = self._find_balance_on_or_before_date(account_history, day_before_period)
+                # Starting balance: everything BEFORE the period start date (not including start date)
+                starting_balance = starting_balances.get((account.id, "savings"), 0.0)
 
-                # Find final balance (latest entry between period start and end dates)
-                final_balance = self._find_balance_between_dates(account_history, period_start_date, period_end_date, starting_balance)
+                # Final balance: everything on or before the period end date
+                final_balance = final_balances.get((account.id, "savings"), 0.0)
 
                 # Calculate amount paid to savings (final - starting)
                 amount_paid = final_balance - starting_balance
@@ -1919,40 +1938,6 @@ class WeeklyView(QWidget):
             self.start_savings_label.setText("Error loading data")
             self.final_savings_label.setText("Error loading data")
 
-    def _find_balance_on_or_before_date(self, account_history, target_date):
-        """Find the running total from the latest AccountHistory entry on or before target_date"""
-        if not account_history:
-            return 0.0
-
-        # Find the latest entry on or before the target date
-        latest_entry = None
-        for entry in account_history:
-            if entry.transaction_date <= target_date:
-                if latest_entry is None or entry.transaction_date > latest_entry.transaction_date:
-                    latest_entry = entry
-                elif entry.transaction_date == latest_entry.transaction_date and entry.id > latest_entry.id:
-                    # Same date, take the later entry by ID
-                    latest_entry = entry
-
-        return latest_entry.running_total if latest_entry else 0.0
-
-    def _find_balance_between_dates(self, account_history, start_date, end_date, fallback_balance):
-        """Find the running total from the latest AccountHistory entry between start_date and end_date"""
-        if not account_history:
-            return fallback_balance
-
-        # Find the latest entry between start and end dates (inclusive)
-        latest_entry = None
-        for entry in account_history:
-            if start_date <= entry.transaction_date <= end_date:
-                if latest_entry is None or entry.transaction_date > latest_entry.transaction_date:
-                    latest_entry = entry
-                elif entry.transaction_date == latest_entry.transaction_date and entry.id > latest_entry.id:
-                    # Same date, take the later entry by ID
-                    latest_entry = entry
-
-        return latest_entry.running_total if latest_entry else fallback_balance
-
     def update_progress_bars(self, transactions):
         """Update progress bars for money spent and time progress"""
         try:
@@ -2150,6 +2135,24 @@ class WeeklyView(QWidget):
                 }}
             """)
 
+    def get_selected_week_numbers(self):
+        """Week numbers of the selected pay period"""
+        if not self.selected_week:
+            return []
+        weeks = [self.selected_week['week1'], self.selected_week['week2']]
+        return [week.week_number for week in weeks if week]
+
+    def get_selected_period_dates(self):
+        """(start, end) dates of the selected pay period"""
+        if not self.selected_week:
+            return None, None
+        return self.selected_week['start_date'], self.selected_week['end_date']
+
+    def apply_change(self, change):
+        """Refresh what a DataChange made stale (see PANEL_DEPENDENCIES)"""
+        for panel in invalidated_panels(self, change):
+            getattr(self, panel)()
+
     def refresh(self):
         """Refresh weekly data"""
         self.populate_week_list()
@@ -35,10 +35,14 @@ MONTHLY AVERAGING:
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QGroupBox, QScrollArea, QFrame, QToolButton, QCheckBox)
 from PyQt6.QtCore import Qt
+from typing import Dict, NamedTuple, Tuple
 from datetime import datetime, date, timedelta
 from themes import theme_manager
-from models import get_db, Transaction
+from models import get_db, get_data_version, Transaction
+from services.yearly_rollup import yearly_rollup
+from services.change_events import ChangeKind, Depends, invalidated_panels
 from views.dialogs.settings_dialog import get_setting
+from widgets.chart_downsample import downsample_xy
 
 # Matplotlib imports for plotting
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
@@ -49,22 +53,46 @@ from scipy import stats
 import numpy as np
 
 
+_PLOTTED_TYPES = ("income", "spending", "bill_pay", "saving")
+
+
+class YearOverviewData(NamedTuple):
+    """
+    Everything the Year Overview paints, gathered off the UI thread (treat as read-only)
+
+    Keyed by include_analytics_only where the analytics toggle changes the
+    numbers, so flipping the toggle repaints without reloading.
+    """
+    version: int
+    years: Tuple[int, ...]                                  # Ascending
+    year_data: Dict[int, dict]                              # year -> get_year_data() totals
+    rows_by_type: Dict[str, Tuple[Tuple[date, float], ...]]  # income/bill_pay/saving (date, amount), oldest first
+    violin_amounts: Dict[bool, Tuple[tuple, ...]]           # -> (income, spending, bill_pay, saving) amounts
+    daily_spending: Dict[bool, Dict[int, Tuple[float, ...]]]  # -> year -> total per day from Jan 1
+
+
 class YearOverviewView(QWidget):
     """View for year-over-year financial overview and analysis"""
 
+    # Which data changes make which panel stale (panel update method -> reasons)
+    PANEL_DEPENDENCIES = {
+        "refresh": [Depends(ChangeKind.TRANSACTIONS, ChangeKind.ACCOUNTS, ChangeKind.BILLS)],
+    }
+
     def __init__(self, transaction_manager, analytics_engine=None):
         super().__init__()
         self.transaction_manager = transaction_manager
         self.analytics_engine = analytics_engine
         self.year_boxes = []  # Store references to year boxes for refresh
         self.first_year = None  # Will be set to earliest year with data
+        self.data = None  # YearOverviewData being shown - see gather_data
 
         # Analytics toggle - load from settings (only affects right panel visualizations)
         self.include_analytics_only = get_setting("default_analytics_only", True)
 
         self.init_ui()
-        self.refresh()
         self.apply_theme()
+        # No initial refresh - BudgetApp loads the data in the background when the tab is shown
 
         # Connect to theme changes
         theme_manager.theme_changed.connect(self.apply_theme)
@@ -103,7 +131,7 @@ class YearOverviewView(QWidget):
         self.left_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
 
         # Placeholder text
-        placeholder = QLabel("Year overview details will appear here")
+        placeholder = QLabel("Loading year overview...")
         placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
         placeholder.setFont(theme_manager.get_font("subtitle"))
         self.left_layout.addWidget(placeholder)
@@ -133,7 +161,7 @@ class YearOverviewView(QWidget):
         self.refresh_button.setText("🔄")
         self.refresh_button.setToolTip("Refresh Year Overview")
         self.refresh_button.setFixedSize(40, 30)
-        self.refresh_button.clicked.connect(self.refresh)
+        self.refresh_button.clicked.connect(lambda: self.refresh())
         header.addWidget(self.refresh_button)
 
         # Analytics toggle - styled checkbox (only affects right panel charts)
@@ -185,6 +213,11 @@ class YearOverviewView(QWidget):
 
         return chart_colors[color_index]
 
+    @staticmethod
+    def thin_line(figure, x_vals, y_vals):
+        """Thin a line's points to about one per pixel of the figure's width before plotting"""
+        return downsample_xy(x_vals, y_vals, figure.get_figwidth() * figure.dpi)
+
     def get_year_data(self, year):
         """
         Calculate financial data for a specific year
@@ -228,67 +261,32 @@ class YearOverviewView(QWidget):
             c) Everything else stays in savings/bills (Savings)
         """
         try:
-            db = get_db()
-
-            year_start = date(year, 1, 1)
-            year_end = date(year, 12, 31)
+            # All totals come from the cached yearly rollup (one GROUP BY for every year)
 
             # ===== INCOME: All paychecks =====
-            income_transactions = db.query(Transaction).filter(
-                Transaction.date >= year_start,
-                Transaction.date <= year_end,
-                Transaction.transaction_type == "income"
-            ).all()
-
-            total_income = sum(t.amount for t in income_transactions)
+            total_income, _ = yearly_rollup.totals(year, "income")
 
             # ===== SPENT: All weekly budget spending =====
             # This includes EVERYTHING spent from weekly budget (normal + abnormal)
-            spending_transactions = db.query(Transaction).filter(
-                Transaction.date >= year_start,
-                Transaction.date <= year_end,
-                Transaction.transaction_type == "spending"
-            ).all()
-
-            total_spending = sum(t.amount for t in spending_transactions)
+            total_spending, _ = yearly_rollup.totals(year, "spending")
 
             # ===== BILLS: Money actually paid from bill accounts =====
             # These are bill_pay transactions (negative from bill accounts)
-            bill_pay_transactions = db.query(Transaction).filter(
-                Transaction.date >= year_start,
-                Transaction.date <= year_end,
-                Transaction.transaction_type == "bill_pay"
-            ).all()
-
-            total_bills = sum(t.amount for t in bill_pay_transactions)
+            total_bills, _ = yearly_rollup.totals(year, "bill_pay")
 
             # ===== SAVINGS: Net increase in savings/bill balances =====
-            # Step 1: Get all deposits TO savings and bill accounts (positive = saving)
-            saving_deposits = db.query(Transaction).filter(
-                Transaction.date >= year_start,
-                Transaction.date <= year_end,
-                Transaction.transaction_type == "saving"
-            ).all()
+            # Step 1: All deposits TO savings and bill accounts (positive = saving)
+            total_deposits, _ = yearly_rollup.totals(year, "saving")
 
-            total_deposits = sum(t.amount for t in saving_deposits)
-
-            # Step 2: Get all withdrawals FROM savings accounts (negative = unsaving)
+            # Step 2: All withdrawals FROM savings accounts (negative = unsaving)
             # These are spending_from_savings type or negative saving transactions
-            withdrawal_transactions = db.query(Transaction).filter(
-                Transaction.date >= year_start,
-                Transaction.date <= year_end,
-                Transaction.transaction_type == "spending_from_savings"
-            ).all()
-
-            total_withdrawals = sum(t.amount for t in withdrawal_transactions)
+            total_withdrawals, _ = yearly_rollup.totals(year, "spending_from_savings")
 
             # Step 3: Calculate net savings
             # Net Savings = (Deposits to savings/bills) - (Bills paid) - (Withdrawals from savings)
             # Note: total_bills already calculated above (money paid from bill accounts)
             total_savings = total_deposits - total_bills - total_withdrawals
 
-            db.close()
-
             return {
                 'year': year,
                 'total_income': total_income,
@@ -476,14 +474,10 @@ class YearOverviewView(QWidget):
             self.correlation_figure.clear()
 
             # Get data for all years
-            db = get_db()
-            all_years = db.query(Transaction.date).all()
-            if not all_years:
-                db.close()
+            unique_years = self.data.years
+            if not unique_years:
                 return
 
-            unique_years = sorted(set(d[0].year for d in all_years if d[0]))
-
             # Collect data points for each year
             year_incomes = []
             year_spendings = []
@@ -492,18 +486,10 @@ class YearOverviewView(QWidget):
             years_list = []
 
             for year in unique_years:
-                year_data = self.get_year_data(year)
-
-                # Calculate averages (per paycheck or per month)
-                year_start = date(year, 1, 1)
-                year_end = date(year, 12, 31)
+                year_data = self.data.year_data[year]
 
-                # Count paychecks
-                paycheck_count = db.query(Transaction).filter(
-                    Transaction.date >= year_start,
-                    Transaction.date <= year_end,
-                    Transaction.transaction_type == "income"
-                ).count()
+                # Calculate averages (per paycheck)
+                _, paycheck_count = yearly_rollup.totals(year, "income")
 
                 if paycheck_count > 0:
                     avg_income = year_data['total_income'] / paycheck_count
@@ -517,8 +503,6 @@ class YearOverviewView(QWidget):
                     year_savings.append(avg_savings)
                     years_list.append(year)
 
-            db.close()
-
             if len(years_list) < 2:
                 # Not enough data for correlation
                 ax = self.correlation_figure.add_subplot(111)
@@ -606,14 +590,10 @@ class YearOverviewView(QWidget):
             ax = self.yoy_figure.add_subplot(111)
 
             # Get data for all years
-            db = get_db()
-            all_years = db.query(Transaction.date).all()
-            if not all_years:
-                db.close()
+            unique_years = self.data.years
+            if not unique_years:
                 return
 
-            unique_years = sorted(set(d[0].year for d in all_years if d[0]))
-
             # Calculate monthly averages - track count per month to average correctly
             monthly_income = [0] * 12
             monthly_spending = [0] * 12
@@ -621,63 +601,31 @@ class YearOverviewView(QWidget):
             monthly_savings = [0] * 12
             monthly_counts = [0] * 12  # Track how many years have data for each month
 
+            spending_filter = True if self.include_analytics_only else None
+            series = [
+                ("income", None, monthly_income),
+                ("spending", spending_filter, monthly_spending),
+                ("bill_pay", None, monthly_bills),
+                ("saving", None, monthly_savings),
+            ]
+
             # Aggregate data by month across all years
             for year in unique_years:
-                year_start = date(year, 1, 1)
-                year_end = date(year, 12, 31)
-
                 # Track which months have data in this year
                 months_with_data = set()
 
-                # Income by month
-                income_txns = db.query(Transaction).filter(
-                    Transaction.date >= year_start,
-                    Transaction.date <= year_end,
-                    Transaction.transaction_type == "income"
-                ).all()
-                for t in income_txns:
-                    monthly_income[t.date.month - 1] += t.amount
-                    months_with_data.add(t.date.month - 1)
-
-                # Spending by month
-                spending_query = db.query(Transaction).filter(
-                    Transaction.date >= year_start,
-                    Transaction.date <= year_end,
-                    Transaction.transaction_type == "spending"
-                )
-                if self.include_analytics_only:
-                    spending_query = spending_query.filter(Transaction.include_in_analytics == True)
-                spending_txns = spending_query.all()
-                for t in spending_txns:
-                    monthly_spending[t.date.month - 1] += t.amount
-                    months_with_data.add(t.date.month - 1)
-
-                # Bills by month
-                bill_txns = db.query(Transaction).filter(
-                    Transaction.date >= year_start,
-                    Transaction.date <= year_end,
-                    Transaction.transaction_type == "bill_pay"
-                ).all()
-                for t in bill_txns:
-                    monthly_bills[t.date.month - 1] += t.amount
-                    months_with_data.add(t.date.month - 1)
-
-                # Savings by month
-                saving_txns = db.query(Transaction).filter(
-                    Transaction.date >= year_start,
-                    Transaction.date <= year_end,
-                    Transaction.transaction_type == "saving"
-                ).all()
-                for t in saving_txns:
-                    monthly_savings[t.date.month - 1] += t.amount
-                    months_with_data.add(t.date.month - 1)
+                for transaction_type, analytics_filter, monthly_values in series:
+                    year_months = yearly_rollup.monthly_totals(year, transaction_type, analytics_filter)
+                    for month_idx in range(12):
+                        monthly_values[month_idx] += year_months[month_idx]
+                    months_with_data |= {
+                        month - 1 for month in yearly_rollup.months_with_data(year, transaction_type, analytics_filter)
+                    }
 
                 # Increment count for months that had data this year
                 for month_idx in months_with_data:
                     monthly_counts[month_idx] += 1
 
-            db.close()
-
             # Calculate averages - only divide by count of years with data for that month
             for i in range(12):
                 if monthly_counts[i] > 0:
@@ -733,14 +681,10 @@ class YearOverviewView(QWidget):
             ax = self.pie_figure.add_subplot(111)
 
             # Get data for all years
-            db = get_db()
-            all_years = db.query(Transaction.date).all()
-            if not all_years:
-                db.close()
+            unique_years = self.data.years
+            if not unique_years:
                 return
 
-            unique_years = sorted(set(d[0].year for d in all_years if d[0]))
-
             # Calculate totals across all years (respecting analytics toggle)
             total_income = 0
             total_normal_spending = 0
@@ -749,52 +693,12 @@ class YearOverviewView(QWidget):
             total_savings = 0
 
             for year in unique_years:
-                year_start = date(year, 1, 1)
-                year_end = date(year, 12, 31)
-
-                # Total income
-                income_txns = db.query(Transaction).filter(
-                    Transaction.date >= year_start,
-                    Transaction.date <= year_end,
-                    Transaction.transaction_type == "income"
-                ).all()
-                total_income += sum(t.amount for t in income_txns)
-
-                # Normal spending (analytics only)
-                normal_spending_txns = db.query(Transaction).filter(
-                    Transaction.date >= year_start,
-                    Transaction.date <= year_end,
-                    Transaction.transaction_type == "spending",
-                    Transaction.include_in_analytics == True
-                ).all()
-                total_normal_spending += sum(t.amount for t in normal_spending_txns)
-
-                # Abnormal spending (excluded from analytics)
-                abnormal_spending_txns = db.query(Transaction).filter(
-                    Transaction.date >= year_start,
-                    Transaction.date <= year_end,
-                    Transaction.transaction_type == "spending",
-                    Transaction.include_in_analytics == False
-                ).all()
-                total_abnormal_spending += sum(t.amount for t in abnormal_spending_txns)
-
-                # Bills
-                bill_txns = db.query(Transaction).filter(
-                    Transaction.date >= year_start,
-                    Transaction.date <= year_end,
-                    Transaction.transaction_type == "bill_pay"
-                ).all()
-                total_bills += sum(t.amount for t in bill_txns)
-
-                # Savings
-                saving_txns = db.query(Transaction).filter(
-                    Transaction.date >= year_start,
-                    Transaction.date <= year_end,
-                    Transaction.transaction_type == "saving"
-                ).all()
-                total_savings += sum(t.amount for t in saving_txns)
-
-            db.close()
+                total_income += yearly_rollup.totals(year, "income")[0]
+                # Normal spending (analytics only) / abnormal spending (excluded from analytics)
+                total_normal_spending += yearly_rollup.totals(year, "spending", include_in_analytics=True)[0]
+                total_abnormal_spending += yearly_rollup.totals(year, "spending", include_in_analytics=False)[0]
+                total_bills += yearly_rollup.totals(year, "bill_pay")[0]
+                total_savings += yearly_rollup.totals(year, "saving")[0]
 
             num_years = len(unique_years) if unique_years else 1
 
@@ -856,61 +760,12 @@ class YearOverviewView(QWidget):
             self.violin_figure.clear()
             ax = self.violin_figure.add_subplot(111)
 
-            # Get data for all years
-            db = get_db()
-            all_years = db.query(Transaction.date).all()
-            if not all_years:
-                db.close()
+            # Transaction amounts by category (gathered in gather_data)
+            data_to_plot = self.data.violin_amounts[bool(self.include_analytics_only)]
+            if not any(data_to_plot):
                 return
 
-            unique_years = sorted(set(d[0].year for d in all_years if d[0]))
-
-            # Collect all transaction amounts by category
-            income_amounts = []
-            spending_amounts = []
-            bill_amounts = []
-            saving_amounts = []
-
-            for year in unique_years:
-                year_start = date(year, 1, 1)
-                year_end = date(year, 12, 31)
-
-                # Get all transactions
-                income_txns = db.query(Transaction).filter(
-                    Transaction.date >= year_start,
-                    Transaction.date <= year_end,
-                    Transaction.transaction_type == "income"
-                ).all()
-                income_amounts.extend([t.amount for t in income_txns])
-
-                spending_query = db.query(Transaction).filter(
-                    Transaction.date >= year_start,
-                    Transaction.date <= year_end,
-                    Transaction.transaction_type == "spending"
-                )
-                if self.include_analytics_only:
-                    spending_query = spending_query.filter(Transaction.include_in_analytics == True)
-                spending_txns = spending_query.all()
-                spending_amounts.extend([t.amount for t in spending_txns])
-
-                bill_txns = db.query(Transaction).filter(
-                    Transaction.date >= year_start,
-                    Transaction.date <= year_end,
-                    Transaction.transaction_type == "bill_pay"
-                ).all()
-                bill_amounts.extend([t.amount for t in bill_txns])
-
-                saving_txns = db.query(Transaction).filter(
-                    Transaction.date >= year_start,
-                    Transaction.date <= year_end,
-                    Transaction.transaction_type == "saving"
-                ).all()
-                saving_amounts.extend([t.amount for t in saving_txns])
-
-            db.close()
-
             # Create violin plot
-            data_to_plot = [income_amounts, spending_amounts, bill_amounts, saving_amounts]
             labels = ['Income', 'Spending', 'Bills', 'Savings']
 
             colors = theme_manager.get_colors()
@@ -954,25 +809,18 @@ class YearOverviewView(QWidget):
             self.income_figure.clear()
             ax = self.income_figure.add_subplot(111)
 
-            db = get_db()
-            income_transactions = db.query(Transaction).filter(
-                Transaction.transaction_type == "income"
-            ).order_by(Transaction.date).all()
+            income_transactions = self.data.rows_by_type["income"]
 
             if not income_transactions:
                 ax.text(0.5, 0.5, "No income data available",
                        ha='center', va='center', transform=ax.transAxes)
                 self.income_canvas.draw()
-                db.close()
                 return
 
             # Group by year
             years_data = {}
-            for t in income_transactions:
-                year = t.date.year
-                if year not in years_data:
-                    years_data[year] = []
-                years_data[year].append({'date': t.date, 'amount': t.amount})
+            for transaction_date, amount in income_transactions:
+                years_data.setdefault(transaction_date.year, []).append({'date': transaction_date, 'amount': amount})
 
             current_year = date.today().year
 
@@ -1009,7 +857,6 @@ class YearOverviewView(QWidget):
 
             self.income_figure.tight_layout()
             self.income_canvas.draw()
-            db.close()
 
         except Exception as e:
             print(f"Error updating income plot: {e}")
@@ -1020,49 +867,23 @@ class YearOverviewView(QWidget):
             self.spending_figure.clear()
             ax = self.spending_figure.add_subplot(111)
 
-            db = get_db()
-
             # Get all years with data
-            all_years = db.query(Transaction.date).all()
-            if not all_years:
-                db.close()
+            unique_years = self.data.years
+            if not unique_years:
                 ax.text(0.5, 0.5, "No spending data available",
                        ha='center', va='center', transform=ax.transAxes)
                 self.spending_canvas.draw()
                 return
 
-            unique_years = sorted(set(d[0].year for d in all_years if d[0]))
             current_year = date.today().year
+            daily_spending_by_year = self.data.daily_spending[bool(self.include_analytics_only)]
 
             # Plot each year
             for year in unique_years:
+                # Daily spending (including $0 days), summed in gather_data
+                amounts = list(daily_spending_by_year[year])
                 year_start = date(year, 1, 1)
-                year_end = date(year, 12, 31)
-
-                # Create daily spending data (including $0 days)
-                daily_spending = {}
-                current_date = year_start
-                while current_date <= year_end:
-                    daily_spending[current_date] = 0
-                    current_date = current_date + timedelta(days=1)
-
-                # Get spending transactions
-                spending_query = db.query(Transaction).filter(
-                    Transaction.date >= year_start,
-                    Transaction.date <= year_end,
-                    Transaction.transaction_type == "spending"
-                )
-                if self.include_analytics_only:
-                    spending_query = spending_query.filter(Transaction.include_in_analytics == True)
-
-                spending_txns = spending_query.all()
-                for t in spending_txns:
-                    if t.date in daily_spending:
-                        daily_spending[t.date] += t.amount
-
-                # Convert to lists
-                dates = sorted(daily_spending.keys())
-                amounts = [daily_spending[d] for d in dates]
+                dates = [year_start + timedelta(days=i) for i in range(len(amounts))]
 
                 if not dates:
                     continue
@@ -1113,11 +934,14 @@ class YearOverviewView(QWidget):
                         date_indices = np.linspace(0, len(smooth_dates)-1, len(x_smooth))
                         smooth_dates_interp = [smooth_dates[int(i)] for i in date_indices]
 
-                        ax.plot(smooth_dates_interp, y_smooth, color=year_color, linewidth=2.5, label=str(year), alpha=0.8)
+                        ax.plot(*self.thin_line(self.spending_figure, smooth_dates_interp, y_smooth),
+                                color=year_color, linewidth=2.5, label=str(year), alpha=0.8)
                     else:
-                        ax.plot(smooth_dates, smoothed, color=year_color, linewidth=2, label=str(year))
+                        ax.plot(*self.thin_line(self.spending_figure, smooth_dates, smoothed),
+                                color=year_color, linewidth=2, label=str(year))
                 else:
-                    ax.plot(aligned_dates, amounts, color=year_color, linewidth=2, label=str(year))
+                    ax.plot(*self.thin_line(self.spending_figure, aligned_dates, amounts),
+                            color=year_color, linewidth=2, label=str(year))
 
             # Format
             ax.set_xlim(date(current_year, 1, 1), date(current_year, 12, 31))
@@ -1137,7 +961,6 @@ class YearOverviewView(QWidget):
 
             self.spending_figure.tight_layout()
             self.spending_canvas.draw()
-            db.close()
 
         except Exception as e:
             print(f"Error updating spending plot: {e}")
@@ -1150,25 +973,18 @@ class YearOverviewView(QWidget):
             self.bills_figure.clear()
             ax = self.bills_figure.add_subplot(111)
 
-            db = get_db()
-            bill_transactions = db.query(Transaction).filter(
-                Transaction.transaction_type == "bill_pay"
-            ).order_by(Transaction.date).all()
+            bill_transactions = self.data.rows_by_type["bill_pay"]
 
             if not bill_transactions:
                 ax.text(0.5, 0.5, "No bill payment data available",
                        ha='center', va='center', transform=ax.transAxes)
                 self.bills_canvas.draw()
-                db.close()
                 return
 
             # Group by year
             years_data = {}
-            for t in bill_transactions:
-                year = t.date.year
-                if year not in years_data:
-                    years_data[year] = []
-                years_data[year].append({'date': t.date, 'amount': t.amount})
+            for transaction_date, amount in bill_transactions:
+                years_data.setdefault(transaction_date.year, []).append({'date': transaction_date, 'amount': amount})
 
             current_year = date.today().year
 
@@ -1214,7 +1030,8 @@ class YearOverviewView(QWidget):
                     date_indices = np.linspace(0, len(sorted_dates)-1, len(x_smooth))
                     smooth_dates_interp = [sorted_dates[int(i)] for i in date_indices]
 
-                    ax.plot(smooth_dates_interp, y_smooth, color=year_color, linewidth=2.5, label=str(year), alpha=0.7)
+                    ax.plot(*self.thin_line(self.bills_figure, smooth_dates_interp, y_smooth),
+                            color=year_color, linewidth=2.5, label=str(year), alpha=0.7)
                 elif len(dates) >= 2:
                     ax.plot(dates, amounts, color=year_color, linewidth=2, label=str(year))
                 else:
@@ -1238,7 +1055,6 @@ class YearOverviewView(QWidget):
 
             self.bills_figure.tight_layout()
             self.bills_canvas.draw()
-            db.close()
 
         except Exception as e:
             print(f"Error updating bills plot: {e}")
@@ -1249,25 +1065,18 @@ class YearOverviewView(QWidget):
             self.savings_figure.clear()
             ax = self.savings_figure.add_subplot(111)
 
-            db = get_db()
-            saving_transactions = db.query(Transaction).filter(
-                Transaction.transaction_type == "saving"
-            ).order_by(Transaction.date).all()
+            saving_transactions = self.data.rows_by_type["saving"]
 
             if not saving_transactions:
                 ax.text(0.5, 0.5, "No savings data available",
                        ha='center', va='center', transform=ax.transAxes)
                 self.savings_canvas.draw()
-                db.close()
                 return
 
             # Group by year
             years_data = {}
-            for t in saving_transactions:
-                year = t.date.year
-                if year not in years_data:
-                    years_data[year] = []
-                years_data[year].append({'date': t.date, 'amount': t.amount})
+            for transaction_date, amount in saving_transactions:
+                years_data.setdefault(transaction_date.year, []).append({'date': transaction_date, 'amount': amount})
 
             current_year = date.today().year
 
@@ -1327,7 +1136,8 @@ class YearOverviewView(QWidget):
                     date_indices = np.linspace(0, len(aligned_dates)-1, len(x_smooth))
                     smooth_dates_interp = [aligned_dates[int(i)] for i in date_indices]
 
-                    ax.plot(smooth_dates_interp, y_smooth, color=year_color, linewidth=2.5, label=str(year), alpha=0.7)
+                    ax.plot(*self.thin_line(self.savings_figure, smooth_dates_interp, y_smooth),
+                            color=year_color, linewidth=2.5, label=str(year), alpha=0.7)
                 elif len(aligned_dates) >= 2:
                     ax.plot(aligned_dates, amounts, marker='o', markersize=4, color=year_color,
                            label=str(year), linewidth=2)
@@ -1353,14 +1163,85 @@ class YearOverviewView(QWidget):
 
             self.savings_figure.tight_layout()
             self.savings_canvas.draw()
-            db.close()
 
         except Exception as e:
             print(f"Error updating savings plot: {e}")
 
-    def refresh(self):
-        """Refresh all data and visualizations"""
+    def gather_data(self, ticket=None):
+        """
+        Load everything the view paints into a YearOverviewData
+
+        Safe to run on a background thread (BudgetApp's BackgroundLoader): it
+        touches no widgets and uses its own session. Returns None if the ticket
+        was cancelled part way.
+        """
+        version = get_data_version()
+        years = tuple(yearly_rollup.years())
+        year_data = {year: self.get_year_data(year) for year in years}
+        if ticket is not None and ticket.cancelled:
+            return None
+
+        # One query for every plotted row (the plots used to query per type and per year)
+        db = get_db()
+        try:
+            rows = db.query(
+                Transaction.transaction_type, Transaction.date, Transaction.amount, Transaction.include_in_analytics
+            ).filter(
+                Transaction.date.isnot(None),
+                Transaction.transaction_type.in_(_PLOTTED_TYPES)
+            ).order_by(Transaction.date).all()
+        finally:
+            db.close()
+        if ticket is not None and ticket.cancelled:
+            return None
+
+        rows_by_type = {transaction_type: [] for transaction_type in _PLOTTED_TYPES}
+        analytic_spending = []
+        for transaction_type, transaction_date, amount, include_in_analytics in rows:
+            rows_by_type[transaction_type].append((transaction_date, amount))
+            if transaction_type == "spending" and include_in_analytics == True:
+                analytic_spending.append((transaction_date, amount))
+
+        def amounts(type_rows):
+            return tuple(amount for _date, amount in type_rows)
+
+        def daily_totals(spending_rows):
+            totals = {year: [0.0] * ((date(year, 12, 31) - date(year, 1, 1)).days + 1) for year in years}
+            for transaction_date, amount in spending_rows:
+                if transaction_date.year in totals:
+                    totals[transaction_date.year][(transaction_date - date(transaction_date.year, 1, 1)).days] += amount
+            return {year: tuple(days) for year, days in totals.items()}
+
+        income, spending, bill_pay, saving = (rows_by_type[t] for t in _PLOTTED_TYPES)
+        return YearOverviewData(
+            version=version,
+            years=years,
+            year_data=year_data,
+            rows_by_type={t: tuple(rows_by_type[t]) for t in _PLOTTED_TYPES if t != "spending"},
+            violin_amounts={
+                False: (amounts(income), amounts(spending), amounts(bill_pay), amounts(saving)),
+                True: (amounts(income), amounts(analytic_spending), amounts(bill_pay), amounts(saving)),
+            },
+            daily_spending={False: daily_totals(spending), True: daily_totals(analytic_spending)},
+        )
+
+    def apply_change(self, change, data=None):
+        """Refresh what a DataChange made stale (see PANEL_DEPENDENCIES)"""
+        for panel in invalidated_panels(self, change):
+            if panel == "refresh":
+                self.refresh(data=data)
+            else:
+                getattr(self, panel)()
+
+    def refresh(self, data=None):
+        """
+        Paint all data and visualizations
+
+        Args:
+            data: YearOverviewData from gather_data (loaded here, on the UI thread, if not given)
+        """
         try:
+            self.data = data if data is not None else self.gather_data()
             # Clear existing year boxes
             while self.left_layout.count():
                 child = self.left_layout.takeAt(0)
@@ -1369,38 +1250,30 @@ class YearOverviewView(QWidget):
 
             self.year_boxes = []
 
-            # Get all years with transaction data
-            db = get_db()
-            years_with_data = db.query(Transaction.date).all()
+            # Get all years with transaction data (newest first)
+            unique_years = sorted(self.data.years, reverse=True)
 
-            if not years_with_data:
+            if not unique_years:
                 # No data - show placeholder
                 placeholder = QLabel("No financial data available yet")
                 placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
                 placeholder.setFont(theme_manager.get_font("subtitle"))
                 self.left_layout.addWidget(placeholder)
-                db.close()
                 return
 
-            # Extract unique years
-            unique_years = sorted(set(d[0].year for d in years_with_data if d[0]), reverse=True)
-
-            if unique_years:
-                self.first_year = min(unique_years)
-
-            db.close()
+            self.first_year = min(unique_years)
 
             # Create year boxes (newest first)
             prev_year_data = None
             for i, year in enumerate(unique_years):
-                year_data = self.get_year_data(year)
+                year_data = self.data.year_data[year]
 
                 # For year-over-year comparison, use previous year in chronological order
                 # Since we're iterating newest to oldest, we need to look forward in the list
                 if i < len(unique_years) - 1:
                     # Get the previous year's data (chronologically)
                     prev_year = unique_years[i + 1]
-                    prev_year_data = self.get_year_data(prev_year)
+                    prev_year_data = self.data.year_data[prev_year]
                 else:
                     prev_year_data = None
 
@@ -1421,6 +1294,8 @@ class YearOverviewView(QWidget):
     def toggle_analytics_mode(self, checked):
         """Toggle between normal and all spending analytics (only affects right panel visualizations)"""
         self.include_analytics_only = checked
+        if self.data is None:
+            return  # Not loaded yet - the first refresh uses the new setting
         # Refresh only the right panel charts (not year boxes)
         self.update_yoy_growth_bars()
         self.update_master_pie_chart()
@@ -1497,5 +1372,6 @@ class YearOverviewView(QWidget):
     def on_theme_changed(self, theme_id):
         """Handle theme changes"""
         self.apply_theme()
-        # Refresh all charts with new theme colors
-        self.refresh()
+        # Repaint all charts with new theme colors
+        if self.data is not None:
+            self.refresh(data=self.data)
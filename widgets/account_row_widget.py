@@ -700,10 +700,6 @@ class AccountRowWidget(QWidget):
                     # Take last 20 entries
                     balance_points = balance_points[-20:]
 
-            # Legacy fallback: If more than 50 entries and no time filter, show the most recent 50 for performance
-            if time_frame_filter == "All Time" and len(balance_points) > 50:
-                balance_points = balance_points[-50:]
-
             # Build chart data
             chart_data = {"Account Balance": balance_points} if balance_points else {}
 
@@ -0,0 +1,149 @@
+"""
+Chart Downsample - thins long line series down to what a chart can show
+
+A balance history can hold thousands of points while the chart drawing it is
+a few hundred pixels wide. Largest-Triangle-Three-Buckets (LTTB) keeps about
+one point per pixel column, choosing in each column the point that spans the
+largest triangle with its neighbours - so peaks and troughs survive and the
+line looks the same, but drawing cost depends on the chart's width instead of
+the history's length.
+
+On top of LTTB the series' overall minimum and maximum, and the points on
+either side of every activation-period boundary, are always kept, so dashed
+(inactive) segments start and stop exactly where they did before thinning.
+"""
+
+import datetime
+
+import numpy as np
+import matplotlib.dates as mdates
+
+
+# Never thin below this many points, even for charts that aren't laid out yet
+MIN_POINTS = 200
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Indices of the points LTTB keeps when thinning (x, y) to threshold points
+
+    Args:
+        x: ascending numeric x values
+        y: numeric y values (same length as x)
+        threshold: number of points to keep (first and last are always kept)
+
+    Returns:
+        ascending int array of indices into x / y
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # threshold - 2 buckets over the points between the first and the last
+    every = (n - 2) / (threshold - 2)
+    edges = (np.arange(threshold - 1) * every).astype(np.int64) + 1
+    edges[-1] = n - 1
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):
+            next_start, next_end = edges[bucket + 1], edges[bucket + 2]
+        else:
+            next_start, next_end = n - 1, n  # The last bucket looks ahead to the last point
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        # Twice the triangle area (a, candidate, next bucket's average) - the scale doesn't matter for argmax
+        areas = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(areas))
+        selected[bucket + 1] = a
+    return selected
+
+
+def _numeric_x(x_vals) -> np.ndarray:
+    """x values as floats (dates become Matplotlib date numbers), or None if they can't be"""
+    if len(x_vals) and isinstance(x_vals[0], (datetime.date, datetime.datetime)):
+        return np.asarray(mdates.date2num(x_vals), dtype=float)
+    try:
+        return np.asarray(x_vals, dtype=float)
+    except (TypeError, ValueError):
+        return None
+
+
+def date_value(value) -> float:
+    """Matplotlib date number of an ISO date string or date"""
+    if isinstance(value, str):
+        value = datetime.date.fromisoformat(value)
+    return float(mdates.date2num(value))
+
+
+def _boundary_indices(x: np.ndarray, activation_periods) -> np.ndarray:
+    """The points on either side of every activation period start and end"""
+    starts = []
+    ends = []
+    for period in activation_periods or []:
+        for value, bucket in ((period.get('start'), starts), (period.get('end'), ends)):
+            if value:
+                bucket.append(date_value(value))
+    if not starts and not ends:
+        return np.empty(0, dtype=np.int64)
+
+    # A period covers start..end inclusive: split before the first point >= start
+    # and after the last point <= end
+    after_start = np.searchsorted(x, np.array(starts, dtype=float), side='left')
+    after_end = np.searchsorted(x, np.array(ends, dtype=float), side='right')
+    around = np.concatenate([after_start - 1, after_start, after_end - 1, after_end])
+    return around[(around >= 0) & (around < len(x))]
+
+
+def downsample_indices(x: np.ndarray, y: np.ndarray, max_points: int, activation_periods=None) -> np.ndarray:
+    """LTTB indices for (x, y) plus the extremes and activation boundaries (see module docstring)"""
+    keep = lttb_indices(x, y, max_points)
+    if len(keep) == len(x):
+        return keep
+    forced = [keep, np.array([np.argmin(y), np.argmax(y)], dtype=np.int64)]
+    if activation_periods:
+        forced.append(_boundary_indices(x, activation_periods))
+    return np.unique(np.concatenate(forced))
+
+
+def downsample_points(points: list, max_points: int, activation_periods=None) -> list:
+    """Thin a list of (x, y) tuples to about max_points, for LineChartWidget-style series
+
+    Series that are short enough, not sorted by x, or whose values aren't
+    numeric (or dates) are returned unchanged.
+
+    Args:
+        points: list of (x, y) tuples, x ascending (dates or numbers)
+        max_points: target point count - usually the chart's width in pixels
+        activation_periods: optional list of {start, end} dicts whose boundaries must be kept
+
+    Returns:
+        list of (x, y) tuples, a subset of points in the same order
+    """
+    max_points = max(MIN_POINTS, int(max_points))
+    if len(points) <= max_points:
+        return points
+
+    x_vals, y_vals = zip(*points)
+    x = _numeric_x(x_vals)
+    try:
+        y = np.asarray(y_vals, dtype=float)
+    except (TypeError, ValueError):
+        return points
+    if x is None or np.any(np.diff(x) < 0) or not np.all(np.isfinite(y)):
+        return points
+
+    return [points[i] for i in downsample_indices(x, y, max_points, activation_periods)]
+
+
+def downsample_xy(x_vals, y_vals, max_points: int):
+    """Thin parallel x / y sequences (for plain ax.plot calls); returns the thinned (x, y) lists"""
+    points = downsample_points(list(zip(x_vals, y_vals)), max_points)
+    if not points:
+        return list(x_vals), list(y_vals)
+    x_out, y_out = zip(*points)
+    return list(x_out), list(y_out)
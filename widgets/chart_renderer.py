@@ -0,0 +1,294 @@
+"""
+Chart Renderer - draws chart figures with Agg on worker threads into cached pixmaps
+
+BaseChartWidget used to rebuild and synchronously draw its figure on every
+update_data. Now:
+- update_data is skipped entirely when called again with the same data under
+  the same theme (see cached_chart)
+- the figure is drawn with Agg on a QThreadPool worker, so several changed
+  charts render concurrently while the UI thread keeps running
+- finished images are kept as QPixmaps keyed by (widget, data, theme, size), so
+  flipping back to data or a theme drawn before shows the cached pixmap
+
+A figure is only ever touched by one thread at a time: the UI thread waits for
+(or cancels) a chart's pending render before it changes that chart's figure.
+"""
+
+import functools
+import hashlib
+import itertools
+import threading
+import traceback
+from collections import OrderedDict
+from datetime import date, time, timedelta
+from decimal import Decimal
+from enum import Enum
+
+import numpy as np
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QRunnable, QThread, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QImage, QPainter, QPixmap
+
+from themes import theme_manager
+
+
+# Values whose repr describes everything about them
+_PLAIN_TYPES = (type(None), bool, int, float, complex, str, bytes, date, time, timedelta, Decimal, Enum, np.generic)
+
+# Fresh tokens for values that can't be described (see _fingerprint_parts)
+_unknown_values = itertools.count()
+
+
+def _fingerprint_parts(value):
+    """Yield stable byte strings describing value (dicts keep their order - it changes the plot)"""
+    if isinstance(value, dict):
+        yield b"{"
+        for key, item in value.items():
+            yield from _fingerprint_parts(key)
+            yield b":"
+            yield from _fingerprint_parts(item)
+        yield b"}"
+    elif isinstance(value, (list, tuple)):
+        yield b"["
+        for item in value:
+            yield from _fingerprint_parts(item)
+            yield b","
+        yield b"]"
+    elif isinstance(value, np.ndarray):
+        yield f"nd{value.dtype}{value.shape}".encode()
+        yield np.ascontiguousarray(value).tobytes() if value.dtype != object else repr(value.tolist()).encode()
+    elif isinstance(value, _PLAIN_TYPES):
+        # Scalars, dates and strings
+        yield f"{type(value).__name__}:{value!r}".encode()
+    elif hasattr(value, "__table__"):
+        # ORM objects - their repr leaves fields out, so describe every column
+        yield f"{type(value).__name__}(".encode()
+        for column in value.__table__.columns:
+            yield from _fingerprint_parts(getattr(value, column.key, None))
+            yield b","
+        yield b")"
+    else:
+        # Nothing reliable to go on - never match, so the chart is always rebuilt
+        yield f"{type(value).__name__}#{next(_unknown_values)}".encode()
+
+
+def fingerprint(value) -> str:
+    """Hash of a chart's input data (dicts, lists, numbers, dates, strings, NumPy arrays)"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in _fingerprint_parts(value):
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def theme_fingerprint() -> str:
+    """Hash of the active theme's colors (custom themes can change colors under the same id)"""
+    return fingerprint((theme_manager.current_theme, theme_manager.get_colors()))
+
+
+def cached_chart(update_data):
+    """
+    Decorator for BaseChartWidget.update_data - skip rebuilding when nothing changed
+
+    The call is skipped when its arguments, the chart title and the theme all
+    match the last call, since the figure would come out identical.
+    """
+    @functools.wraps(update_data)
+    def wrapper(self, *args, **kwargs):
+        build_key = fingerprint((args, kwargs, self.title, theme_fingerprint()))
+        if build_key == self._build_key:
+            return None
+        self._build_key = build_key
+        try:
+            return update_data(self, *args, **kwargs)
+        except Exception:
+            self._build_key = None  # Don't skip the retry
+            raise
+    return wrapper
+
+
+class _RenderTask(QRunnable):
+    """Draws one chart's figure with Agg on a pool thread"""
+
+    def __init__(self, renderer: "ChartRenderer", canvas: "CachedFigureCanvas", key):
+        super().__init__()
+        self.setAutoDelete(False)  # Kept by the canvas until delivered (tryTake needs it alive)
+        self.renderer = renderer
+        self.canvas = canvas
+        self.key = key
+        self.pixel_ratio = canvas.device_pixel_ratio
+        self.done = threading.Event()
+
+    def run(self):
+        image = None
+        try:
+            agg = self.canvas.get_renderer()  # FigureCanvasAgg's renderer - plain Python, no Qt calls
+            agg.clear()
+            self.canvas.figure.draw(agg)
+            width, height = int(agg.width), int(agg.height)
+            image = QImage(bytes(agg.buffer_rgba()), width, height, width * 4, QImage.Format.Format_RGBA8888).copy()
+        except Exception as e:
+            print(f"Error rendering chart: {e}")
+            traceback.print_exc()
+        finally:
+            self.done.set()
+        self.renderer._rendered.emit(self, image)
+
+
+class ChartRenderer(QObject):
+    """
+    Shared render pool and pixmap cache for all chart widgets
+
+    Usage:
+        from widgets.chart_renderer import chart_renderer
+        pixmap = chart_renderer.cached(key)
+    """
+
+    # (task, QImage or None) - emitted from a worker, received on the UI thread
+    _rendered = pyqtSignal(object, object)
+
+    CACHE_BYTES = 128 * 1024 * 1024
+
+    def __init__(self):
+        super().__init__()
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(max(1, min(4, QThread.idealThreadCount() - 1)))
+        self._pixmaps = OrderedDict()  # key -> QPixmap, least recently used first
+        self._cache_bytes = 0
+        self._rendered.connect(self._on_rendered)
+
+    def cached(self, key):
+        """Get the pixmap rendered for key, if it is still cached"""
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+        return pixmap
+
+    def render(self, canvas: "CachedFigureCanvas", key) -> _RenderTask:
+        """Queue an Agg render of canvas.figure; the canvas shows the result when it arrives"""
+        task = _RenderTask(self, canvas, key)
+        self.pool.start(task)
+        return task
+
+    def shutdown(self, timeout_ms: int = 5000):
+        """Drop queued renders and wait for running ones (call before the app exits)"""
+        self.pool.clear()
+        self.pool.waitForDone(timeout_ms)
+
+    def _store(self, key, pixmap: QPixmap):
+        if key in self._pixmaps:
+            self._cache_bytes -= self._pixmap_bytes(self._pixmaps.pop(key))
+        self._pixmaps[key] = pixmap
+        self._cache_bytes += self._pixmap_bytes(pixmap)
+        while self._cache_bytes > self.CACHE_BYTES and len(self._pixmaps) > 1:
+            _old_key, old_pixmap = self._pixmaps.popitem(last=False)
+            self._cache_bytes -= self._pixmap_bytes(old_pixmap)
+
+    @staticmethod
+    def _pixmap_bytes(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * 4
+
+    def _on_rendered(self, task: _RenderTask, image):
+        canvas = task.canvas
+        if sip.isdeleted(canvas):
+            return
+        if image is None:
+            if canvas._task is task:
+                canvas._task = None
+            return
+
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(task.pixel_ratio)
+        self._store(task.key, pixmap)
+        if canvas._task is task:
+            canvas._task = None
+            canvas.show_pixmap(task.key, pixmap)
+
+
+_render_ids = itertools.count()
+
+
+class CachedFigureCanvas(FigureCanvasQTAgg):
+    """
+    Qt canvas that paints a cached pixmap instead of drawing its figure on the UI thread
+
+    draw() looks the render key up in the pixmap cache and only queues an Agg
+    render on a miss; paintEvent just blits the current pixmap.
+
+    Args:
+        figure: The chart's figure
+        data_key: Callable returning what the figure currently shows (changes
+            whenever the figure is rebuilt with different data)
+    """
+
+    def __init__(self, figure, data_key):
+        self._task = None
+        self._pixmap = None
+        self._shown_key = None
+        self._data_key = data_key
+        self._render_id = next(_render_ids)
+        super().__init__(figure)
+
+    def render_key(self):
+        """Everything the rendered image depends on"""
+        return (
+            self._render_id, self._data_key(), theme_fingerprint(),
+            self.get_width_height(physical=True), self.figure.dpi,
+        )
+
+    def draw(self):
+        """Show the cached image for the figure's current state, rendering it off-thread if needed"""
+        key = self.render_key()
+        if key == self._shown_key and self._task is None:
+            return
+        if self._task is not None and self._task.key == key:
+            return  # Already rendering this state
+
+        pixmap = chart_renderer.cached(key)
+        if pixmap is not None:
+            self.wait_for_render()
+            self._task = None
+            self.show_pixmap(key, pixmap)
+            return
+
+        self.wait_for_render()
+        self._task = chart_renderer.render(self, key)
+
+    def wait_for_render(self):
+        """Make the figure safe to change - cancel its queued render or wait for the running one"""
+        task = getattr(self, "_task", None)
+        if task is None or task.done.is_set():
+            return
+        if chart_renderer.pool.tryTake(task):
+            self._task = None
+            self.draw_idle()  # Render again once the caller has finished changing the figure
+        else:
+            task.done.wait()
+
+    def show_pixmap(self, key, pixmap: QPixmap):
+        self._shown_key = key
+        self._pixmap = pixmap
+        self.update()
+
+    def paintEvent(self, event):
+        self._draw_idle()  # Only does something if a draw is pending
+        if self._pixmap is None:
+            return
+        painter = QPainter(self)
+        try:
+            painter.eraseRect(event.rect())
+            painter.drawPixmap(0, 0, self._pixmap)
+        finally:
+            painter.end()
+
+    def resizeEvent(self, event):
+        self.wait_for_render()  # Resizing changes the figure size
+        super().resizeEvent(event)
+
+    def _set_device_pixel_ratio(self, ratio):
+        self.wait_for_render()  # Changes the figure dpi
+        return super()._set_device_pixel_ratio(ratio)
+
+
+# Shared by every chart widget
+chart_renderer = ChartRenderer()
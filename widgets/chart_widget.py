@@ -3,16 +3,25 @@ Chart Widget - Matplotlib integration with PyQt6 and theme support
 """
 
 import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
 from PyQt6.QtCore import Qt, pyqtSignal
 from themes import theme_manager
+from widgets.chart_renderer import CachedFigureCanvas, cached_chart
+from widgets.chart_downsample import downsample_points
 import numpy as np
+import itertools
 
 
 class BaseChartWidget(QWidget):
-    """Base class for matplotlib chart widgets with theme support"""
+    """
+    Base class for matplotlib chart widgets with theme support
+
+    Subclasses build their figure in an update_data decorated with
+    @cached_chart and finish with self.canvas.draw(). The canvas renders the
+    figure with Agg on a worker thread and paints the cached pixmap (see
+    widgets/chart_renderer.py); an update_data call with unchanged data is skipped.
+    """
     
     # Signal emitted when title is clicked (for savings rate charts)
     title_clicked = pyqtSignal()
@@ -22,15 +31,17 @@ class BaseChartWidget(QWidget):
         self.title = title
         self.title_label = None
         self.is_savings_rate_chart = "Savings Rate" in title  # Track savings rate charts permanently
+        self._build_key = None  # Fingerprint of the data the figure was last built from (see cached_chart)
+        self._structure = None  # Series layout of the persistent artists - None forces a full rebuild
         
         # Create matplotlib figure and canvas
-        self.figure = Figure(figsize=(8, 6), tight_layout=True)
+        self._figure = Figure(figsize=(8, 6), tight_layout=True)
         # Extra tight margins for heatmap, normal for others
         if "Spending Heatmap" in title or title == "":
             self.figure.subplots_adjust(left=0.15, right=0.99, top=0.99, bottom=0.01)
         else:
             self.figure.subplots_adjust(left=0.02, right=0.98, top=0.98, bottom=0.02)
-        self.canvas = FigureCanvas(self.figure)
+        self.canvas = CachedFigureCanvas(self._figure, lambda: self._build_key)
         
         self.init_ui()
         self.apply_theme()
@@ -38,6 +49,14 @@ class BaseChartWidget(QWidget):
         # Connect to theme changes
         theme_manager.theme_changed.connect(self.on_theme_changed)
     
+    @property
+    def figure(self) -> Figure:
+        """The chart's figure - waits for any off-thread render of it first, so it is safe to change"""
+        canvas = getattr(self, "canvas", None)
+        if canvas is not None:
+            canvas.wait_for_render()
+        return self._figure
+
     def init_ui(self):
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)  # Remove all margins to eliminate white borders
@@ -195,6 +214,8 @@ class BaseChartWidget(QWidget):
     def clear_chart(self):
         """Clear the chart"""
         self.figure.clear()
+        self._build_key = "cleared"
+        self._structure = None
         self.canvas.draw()
 
 
@@ -205,6 +226,7 @@ class PieChartWidget(BaseChartWidget):
         self.transparent_background = transparent_background
         super().__init__(title, parent)
     
+    @cached_chart
     def update_data(self, data: dict, total_label: str = "Total", highlight_category: str = None, custom_colors: list = None):
         """Update pie chart with new data
 
@@ -214,7 +236,20 @@ class PieChartWidget(BaseChartWidget):
             highlight_category: category name to highlight (will explode and have thicker border)
             custom_colors: list of hex colors to use instead of theme colors (for consistency)
         """
+        # Same categories as last time - re-angle the existing wedges instead of rebuilding
+        if data and any(data.values()):
+            highlighted = highlight_category if highlight_category in data else None
+            structure = ("pie", tuple(data), highlighted)
+        else:
+            structure = None
+        if structure is not None and structure == self._structure:
+            self._update_wedges_in_place(data, highlight_category, custom_colors)
+            self.apply_theme()
+            self.canvas.draw()
+            return
+
         self.figure.clear()
+        self._structure = structure
         
         if not data or not any(data.values()):
             # Show completely blank chart - no text
@@ -231,10 +266,7 @@ class PieChartWidget(BaseChartWidget):
             sizes = list(data.values())
 
             # Use custom colors if provided, otherwise use theme colors
-            if custom_colors and len(custom_colors) >= len(labels):
-                colors = custom_colors[:len(labels)]
-            else:
-                colors = theme_manager.get_chart_colors()[:len(labels)]
+            colors = self._pie_colors(len(labels), custom_colors)
 
             # Prepare explode values for highlighting
             explode = None
@@ -266,6 +298,40 @@ class PieChartWidget(BaseChartWidget):
         
         self.apply_theme()
         self.canvas.draw()
+
+    def _pie_colors(self, count: int, custom_colors: list = None) -> list:
+        """Custom colors if there are enough of them, otherwise theme colors"""
+        if custom_colors and len(custom_colors) >= count:
+            return custom_colors[:count]
+        return theme_manager.get_chart_colors()[:count]
+
+    def _update_wedges_in_place(self, data: dict, highlight_category: str = None, custom_colors: list = None):
+        """Re-angle the existing wedges for new amounts (same categories as the last build)"""
+        labels = list(data.keys())
+        sizes = np.asarray(list(data.values()), dtype=float)
+        if np.any(sizes < 0):
+            raise ValueError("Wedge sizes 'x' must be non negative values")
+        colors = itertools.cycle(self._pie_colors(len(labels), custom_colors))  # ax.pie cycles short palettes too
+        ax = self.figure.axes[0]  # Waits for any off-thread render before the wedges change
+
+        # Same geometry as ax.pie(startangle=90): counterclockwise from 12 o'clock
+        theta1 = 90 / 360
+        for label, fraction, wedge, color in zip(labels, sizes / sizes.sum(), self.pie_wedges, colors):
+            theta2 = theta1 + fraction
+            explode = 0.1 if label == highlight_category else 0
+            middle = np.pi * (theta1 + theta2)
+            wedge.set_center((explode * np.cos(middle), explode * np.sin(middle)))
+            wedge.set_theta1(360 * theta1)
+            wedge.set_theta2(360 * theta2)
+            wedge.set_facecolor(color)
+            theta1 = theta2
+
+        self.pie_data = list(zip(labels, data.values()))
+
+        # Drawing fitted the limits to the old wedges - redo ax.pie's limits and the equal aspect
+        ax.relim()
+        ax.set(xlim=(-1.25, 1.25), ylim=(-1.25, 1.25))
+        ax.axis('equal')
     
     def apply_theme(self):
         """Apply current theme to the chart, with optional transparency"""
@@ -303,51 +369,59 @@ class LineChartWidget(BaseChartWidget):
     def __init__(self, title: str = "Spending Trends", parent=None):
         super().__init__(title, parent)
 
-    def _is_segment_active(self, start_date, end_date, activation_periods) -> bool:
-        """Check if a line segment between two dates is entirely within an active period.
+    @staticmethod
+    def _classify_segments(x_vals, activation_periods) -> np.ndarray:
+        """Classify every segment between consecutive dates as active (solid) or inactive (dashed).
 
-        A segment is considered inactive (dashed) if there's any gap between the two dates
-        where the account was not active.
+        A segment is active only if BOTH of its dates fall within one single
+        activation period, so a segment that crosses an inactive gap is dashed.
+        All segments are checked against all periods in one vectorized pass.
 
         Args:
-            start_date: start date of the segment
-            end_date: end date of the segment
-            activation_periods: list of {start, end} dicts
+            x_vals: sequence of dates (the line's x values)
+            activation_periods: list of {start, end} dicts (ISO strings or dates, end=None means ongoing)
 
         Returns:
-            True if the entire segment is within active periods, False otherwise
+            bool array of length len(x_vals) - 1, True where the segment is active
         """
-        from datetime import date, timedelta
+        from datetime import date
 
-        # For each activation period, check if the segment is fully contained
-        for period in activation_periods:
-            period_start_str = period.get('start')
-            period_end_str = period.get('end')
+        def to_ordinal(value):
+            return (date.fromisoformat(value) if isinstance(value, str) else value).toordinal()
 
-            if not period_start_str:
+        period_starts = []
+        period_ends = []
+        for period in activation_periods:
+            if not period.get('start'):
                 continue
+            period_starts.append(to_ordinal(period['start']))
+            period_ends.append(to_ordinal(period['end']) if period.get('end') else np.inf)  # Ongoing period
 
-            period_start = date.fromisoformat(period_start_str) if isinstance(period_start_str, str) else period_start_str
+        days = np.fromiter((d.toordinal() for d in x_vals), dtype=np.int64, count=len(x_vals))
+        if not period_starts:
+            return np.zeros(max(len(days) - 1, 0), dtype=bool)
 
-            if period_end_str:
-                period_end = date.fromisoformat(period_end_str) if isinstance(period_end_str, str) else period_end_str
-            else:
-                period_end = None  # Ongoing period
+        # segment x period matrix: start_date >= period_start and end_date <= period_end
+        segment_starts = days[:-1, np.newaxis]
+        segment_ends = days[1:, np.newaxis]
+        inside = (segment_starts >= np.array(period_starts)) & (segment_ends <= np.array(period_ends, dtype=float))
+        return inside.any(axis=1)
 
-            # Check if BOTH dates are within this single period
-            # start_date must be >= period_start
-            # end_date must be <= period_end (or period has no end)
-            if start_date >= period_start:
-                if period_end is None or end_date <= period_end:
-                    return True
+    @staticmethod
+    def _segment_lines(x_vals, y_vals, active: np.ndarray):
+        """Split a date series into (active, inactive) segment arrays for LineCollection.set_segments"""
+        import matplotlib.dates as mdates
 
-        return False
+        points = np.column_stack([mdates.date2num(x_vals), np.asarray(y_vals, dtype=float)])
+        segments = np.stack([points[:-1], points[1:]], axis=1)
+        return segments[active], segments[~active]
 
     def _plot_with_activity_segments(self, ax, x_vals, y_vals, color, activation_periods,
                                      linewidth=2, markersize=3, use_markers=False):
         """Plot line data with dashed segments for inactive periods.
 
-        Solid lines for active periods, dashed lines for inactive periods.
+        Solid lines for active periods, dashed lines for inactive periods - drawn
+        as two LineCollections however long the history is.
         Markers are placed on all data points regardless of activity status.
 
         Args:
@@ -359,34 +433,148 @@ class LineChartWidget(BaseChartWidget):
             linewidth: line width
             markersize: marker size
             use_markers: whether to show markers on data points
+
+        Returns:
+            (markers Line2D or None, active LineCollection or None, inactive LineCollection or None)
         """
+        from matplotlib.collections import LineCollection
+
         if len(x_vals) < 2:
             # Single point - just plot it
+            markers = None
             if use_markers:
-                ax.plot(x_vals, y_vals, marker='o', linestyle='', color=color, markersize=markersize)
-            return
+                markers, = ax.plot(x_vals, y_vals, marker='o', linestyle='', color=color, markersize=markersize)
+            return markers, None, None
 
         # Plot markers for all points first (if using markers)
+        markers = None
         if use_markers:
-            ax.plot(x_vals, y_vals, marker='o', linestyle='', color=color, markersize=markersize, zorder=3)
+            markers, = ax.plot(x_vals, y_vals, marker='o', linestyle='', color=color, markersize=markersize, zorder=3)
 
         # Now plot line segments with appropriate styles
-        # Go through consecutive pairs of points
-        for idx in range(len(x_vals) - 1):
-            x1, x2 = x_vals[idx], x_vals[idx + 1]
-            y1, y2 = y_vals[idx], y_vals[idx + 1]
-
-            # Determine if this segment is entirely within an active period
-            # If the segment crosses an inactive gap, it should be dashed
-            is_active = self._is_segment_active(x1, x2, activation_periods)
-
-            if is_active:
-                # Solid line for active periods
-                ax.plot([x1, x2], [y1, y2], linestyle='-', color=color, linewidth=linewidth, zorder=2)
-            else:
-                # Dashed line for inactive periods
-                ax.plot([x1, x2], [y1, y2], linestyle='--', color=color, linewidth=linewidth, zorder=2)
+        active_segments, inactive_segments = self._segment_lines(
+            x_vals, y_vals, self._classify_segments(x_vals, activation_periods)
+        )
+        active_lines = LineCollection(active_segments, colors=color, linewidths=linewidth,
+                                      linestyles='-', capstyle='projecting', zorder=2)
+        inactive_lines = LineCollection(inactive_segments, colors=color, linewidths=linewidth,
+                                        linestyles='--', capstyle='butt', zorder=2)
+        ax.add_collection(active_lines)
+        ax.add_collection(inactive_lines)
+        ax.xaxis_date()  # Collections don't register date units the way ax.plot does
+        return markers, active_lines, inactive_lines
+
+    def _select_date_ticks(self, x_vals) -> list:
+        """Pick evenly spaced date ticks (snapped to data points) for the chart's width"""
+        from datetime import timedelta
+
+        chart_width_pixels = self.figure.get_figwidth() * self.figure.dpi
+        max_ticks = max(10, min(30, int(chart_width_pixels // 50)))
+
+        # Calculate time intervals
+        first_date = x_vals[0]
+        last_date = x_vals[-1]
+        total_days = (last_date - first_date).days
+
+        if total_days <= 0 or max_ticks <= 1:
+            # Single day or single tick - show all
+            return list(x_vals)
+
+        # Create evenly spaced target times
+        interval_days = total_days / (max_ticks - 1)
+        target_dates = [first_date + timedelta(days=i * interval_days) for i in range(max_ticks)]
+
+        # Find closest actual data point to each target
+        selected_dates = []
+        for target_date in target_dates:
+            closest_date = min(x_vals, key=lambda d: abs((d - target_date).days))
+            if closest_date not in selected_dates:
+                selected_dates.append(closest_date)
+
+        # Ensure first and last dates are included
+        if first_date not in selected_dates:
+            selected_dates.insert(0, first_date)
+        if last_date not in selected_dates:
+            selected_dates.append(last_date)
+        return selected_dates
+
+    def _downsample(self, data: dict, activation_periods: list = None) -> dict:
+        """Thin every series to about one point per pixel of the chart's width (see widgets/chart_downsample.py)"""
+        if not data:
+            return data
+        width_pixels = self.figure.get_figwidth() * self.figure.dpi
+        return {
+            series_name: downsample_points(series_data, width_pixels, activation_periods) if series_data else series_data
+            for series_name, series_data in data.items()
+        }
+
+    @staticmethod
+    def _series_color(index: int, series_name: str, colors: list) -> str:
+        """Main lines take the series' palette color; secondary lines alternate two other palette colors"""
+        if series_name in ("Running Total", "Bill Balance", "Account Balance"):
+            return colors[index % len(colors)]
+        secondary_colors = [colors[3], colors[4]]  # Use different colors from chart palette
+        return secondary_colors[(index - 1) % len(secondary_colors)]
+
+    def _line_structure(self, data: dict, xlabel: str, ylabel: str, activation_periods):
+        """
+        What the persistent artists depend on - same structure means update_data can
+        move the existing lines instead of rebuilding the figure (None = always rebuild)
+        """
+        import datetime
+        if not data or not any(data.values()):
+            return None
+        series = []
+        for series_name, series_data in data.items():
+            has_dates = bool(series_data) and isinstance(series_data[0][0], (datetime.date, datetime.datetime))
+            segmented = bool(activation_periods) and has_dates and series_name in ("Running Total", "Bill Balance", "Account Balance")
+            series.append((series_name, bool(series_data), has_dates, len(series_data) > 1, segmented))
+        return ("line", tuple(series), xlabel, ylabel, self.is_savings_rate_chart)
+
+    def _update_lines_in_place(self, data: dict, custom_colors: list = None, activation_periods: list = None):
+        """Move the existing lines to new data (same series as the last build)"""
+        ax = self.figure.axes[0]
+        colors = custom_colors if custom_colors else theme_manager.get_chart_colors()
+
+        for i, (series_name, series_data) in enumerate(data.items()):
+            if not series_data:
+                continue
+            x_vals, y_vals = zip(*series_data)
+            color = self._series_color(i, series_name, colors)
+
+            line = self._series_lines.get(series_name)
+            if line is not None:
+                line.set_data(x_vals, y_vals)
+                line.set_color(color)
+
+            segment_artists = self._segment_artists.get(series_name)
+            if segment_artists is not None:
+                markers, active_lines, inactive_lines = segment_artists
+                if markers is not None:
+                    markers.set_data(x_vals, y_vals)
+                    markers.set_color(color)
+                if active_lines is not None:
+                    active_segments, inactive_segments = self._segment_lines(
+                        x_vals, y_vals, self._classify_segments(x_vals, activation_periods)
+                    )
+                    active_lines.set_segments(active_segments)
+                    inactive_lines.set_segments(inactive_segments)
+                    active_lines.set_color(color)
+                    inactive_lines.set_color(color)
+
+            # Same tick selection as the build (dates only on the main and account lines)
+            import datetime
+            if (len(x_vals) > 1 and isinstance(x_vals[0], (datetime.date, datetime.datetime))
+                    and series_name in ("Running Total", "Bill Balance", "Account Balance")):
+                ax.set_xticks(self._select_date_ticks(x_vals))
+
+        ax.relim()
+        ax.autoscale_view()
+        if self.is_savings_rate_chart:
+            ax.set_xticks([])
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
 
+    @cached_chart
     def update_data(self, data: dict, xlabel: str = "Time", ylabel: str = "Amount ($)", custom_colors: list = None, custom_axis_color: str = None, activation_periods: list = None):
         """Update line chart with new data
 
@@ -399,7 +587,22 @@ class LineChartWidget(BaseChartWidget):
         """
         self._custom_axis_color = custom_axis_color  # Store for apply_theme
         self._activation_periods = activation_periods  # Store for segment plotting
+
+        # Long histories cost as much to draw as the chart is wide, not as long as they are
+        data = self._downsample(data, activation_periods)
+
+        # Same series as last time - update the existing lines instead of rebuilding
+        structure = self._line_structure(data, xlabel, ylabel, activation_periods)
+        if structure is not None and structure == self._structure:
+            self._update_lines_in_place(data, custom_colors, activation_periods)
+            self.apply_theme()
+            self.canvas.draw()
+            return
+
         self.figure.clear()
+        self._structure = structure
+        self._series_lines = {}
+        self._segment_artists = {}
 
         if not data or not any(data.values()):
             # Show "No data" message
@@ -418,7 +621,7 @@ class LineChartWidget(BaseChartWidget):
             for i, (series_name, series_data) in enumerate(data.items()):
                 if series_data:
                     x_vals, y_vals = zip(*series_data)
-                    color = colors[i % len(colors)]
+                    color = self._series_color(i, series_name, colors)
 
                     # Check if x-axis contains dates (for bill charts)
                     import datetime
@@ -428,25 +631,25 @@ class LineChartWidget(BaseChartWidget):
                     # If activation_periods provided, plot segments with dashed lines for inactive periods
                     if series_name == "Running Total" or series_name == "Bill Balance":
                         if activation_periods and has_dates:
-                            self._plot_with_activity_segments(ax, x_vals, y_vals, color, activation_periods,
-                                                             linewidth=3, markersize=4, use_markers=True)
+                            self._segment_artists[series_name] = self._plot_with_activity_segments(
+                                ax, x_vals, y_vals, color, activation_periods,
+                                linewidth=3, markersize=4, use_markers=True)
                         else:
-                            ax.plot(x_vals, y_vals, marker='o', label=series_name,
-                                   color=color, linewidth=3, markersize=4)
+                            self._series_lines[series_name], = ax.plot(x_vals, y_vals, marker='o', label=series_name,
+                                                                      color=color, linewidth=3, markersize=4)
                     # Account Balance lines (savings accounts) get clean line style without markers
                     elif series_name == "Account Balance":
                         if activation_periods and has_dates:
-                            self._plot_with_activity_segments(ax, x_vals, y_vals, color, activation_periods,
-                                                             linewidth=2, markersize=3, use_markers=False)
+                            self._segment_artists[series_name] = self._plot_with_activity_segments(
+                                ax, x_vals, y_vals, color, activation_periods,
+                                linewidth=2, markersize=3, use_markers=False)
                         else:
-                            ax.plot(x_vals, y_vals, marker='', label=series_name,
-                                   color=color, linewidth=2)
+                            self._series_lines[series_name], = ax.plot(x_vals, y_vals, marker='', label=series_name,
+                                                                      color=color, linewidth=2)
                     else:
                         # Secondary lines (Weekly Saved, Weekly Paycheck) get thinner, different colors
-                        secondary_colors = [colors[3], colors[4]]  # Use different colors from chart palette
-                        secondary_color = secondary_colors[(i-1) % len(secondary_colors)]
-                        ax.plot(x_vals, y_vals, marker='', label=series_name,
-                               color=secondary_color, linewidth=1, alpha=0.7)
+                        self._series_lines[series_name], = ax.plot(x_vals, y_vals, marker='', label=series_name,
+                                                                  color=color, linewidth=1, alpha=0.7)
                     
                     # Format x-axis for dates (for Running Total, Bill Balance, and Account Balance)
                     if has_dates and (series_name == "Running Total" or series_name == "Bill Balance" or series_name == "Account Balance"):
@@ -454,85 +657,8 @@ class LineChartWidget(BaseChartWidget):
                         
                         # Handle date formatting differently for each series type
                         if len(x_vals) > 1:
-                            if series_name == "Running Total" or series_name == "Bill Balance":
-                                # Dynamic tick selection based on chart width
-                                chart_width_pixels = self.figure.get_figwidth() * self.figure.dpi
-                                max_ticks = max(10, min(30, int(chart_width_pixels // 50)))
-
-                                # Calculate time intervals
-                                from datetime import timedelta
-                                first_date = x_vals[0]
-                                last_date = x_vals[-1]
-                                total_days = (last_date - first_date).days
-
-                                if total_days > 0 and max_ticks > 1:
-                                    # Create evenly spaced target times
-                                    interval_days = total_days / (max_ticks - 1)
-                                    target_dates = []
-
-                                    for i in range(max_ticks):
-                                        target_date = first_date + timedelta(days=i * interval_days)
-                                        target_dates.append(target_date)
-
-                                    # Find closest actual data point to each target
-                                    selected_dates = []
-                                    for target_date in target_dates:
-                                        # Find closest date in x_vals
-                                        closest_date = min(x_vals, key=lambda d: abs((d - target_date).days))
-                                        if closest_date not in selected_dates:
-                                            selected_dates.append(closest_date)
-
-                                    # Ensure first and last dates are included
-                                    if first_date not in selected_dates:
-                                        selected_dates.insert(0, first_date)
-                                    if last_date not in selected_dates:
-                                        selected_dates.append(last_date)
-
-                                    # Set custom tick locations
-                                    ax.set_xticks(selected_dates)
-                                else:
-                                    # Single day or single tick - show all
-                                    ax.set_xticks(x_vals)
-                            
-                            elif series_name == "Account Balance":
-                                # Dynamic tick selection based on chart width (same as Bill Balance)
-                                chart_width_pixels = self.figure.get_figwidth() * self.figure.dpi
-                                max_ticks = max(10, min(30, int(chart_width_pixels // 50)))
-
-                                # Calculate time intervals
-                                from datetime import timedelta
-                                first_date = x_vals[0]
-                                last_date = x_vals[-1]
-                                total_days = (last_date - first_date).days
-
-                                if total_days > 0 and max_ticks > 1:
-                                    # Create evenly spaced target times
-                                    interval_days = total_days / (max_ticks - 1)
-                                    target_dates = []
-
-                                    for i in range(max_ticks):
-                                        target_date = first_date + timedelta(days=i * interval_days)
-                                        target_dates.append(target_date)
-
-                                    # Find closest actual data point to each target
-                                    selected_dates = []
-                                    for target_date in target_dates:
-                                        # Find closest date in x_vals
-                                        closest_date = min(x_vals, key=lambda d: abs((d - target_date).days))
-                                        if closest_date not in selected_dates:
-                                            selected_dates.append(closest_date)
-
-                                    # Ensure first and last dates are included
-                                    if first_date not in selected_dates:
-                                        selected_dates.insert(0, first_date)
-                                    if last_date not in selected_dates:
-                                        selected_dates.append(last_date)
-
-                                    # Set custom tick locations
-                                    ax.set_xticks(selected_dates)
-                                else:
-                                    # Single day or single tick - show all
-                                    ax.set_xticks(x_vals)
+                            # Dynamic tick selection based on chart width
+                            ax.set_xticks(self._select_date_ticks(x_vals))
                             
                             # Apply date formatting to both
                             ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d/%Y'))
@@ -573,10 +699,20 @@ class BarChartWidget(BaseChartWidget):
     def __init__(self, title: str = "Spending Analysis", parent=None):
         super().__init__(title, parent)
     
+    @cached_chart
     def update_data(self, data: dict, xlabel: str = "Category", ylabel: str = "Amount ($)", 
                    horizontal: bool = False):
         """Update bar chart with new data"""
+        # Same bars as last time - resize them instead of rebuilding
+        structure = ("bar", tuple(data), xlabel, ylabel, horizontal) if data and any(data.values()) else None
+        if structure is not None and structure == self._structure:
+            self._update_bars_in_place(list(data.values()), horizontal)
+            self.apply_theme()
+            self.canvas.draw()
+            return
+
         self.figure.clear()
+        self._structure = structure
         
         if not data or not any(data.values()):
             # Show "No data" message
@@ -607,19 +743,41 @@ class BarChartWidget(BaseChartWidget):
                 plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
             
             # Add value labels on bars
+            self._bars = bars
+            self._bar_labels = []
             for bar, value in zip(bars, values):
                 if horizontal:
-                    ax.text(value + max(values) * 0.01, bar.get_y() + bar.get_height()/2, 
-                           f'${value:.0f}', ha='left', va='center', fontsize=9)
+                    label = ax.text(value + max(values) * 0.01, bar.get_y() + bar.get_height()/2, 
+                                   f'${value:.0f}', ha='left', va='center', fontsize=9)
                 else:
-                    ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + max(values) * 0.01,
-                           f'${value:.0f}', ha='center', va='bottom', fontsize=9)
+                    label = ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + max(values) * 0.01,
+                                   f'${value:.0f}', ha='center', va='bottom', fontsize=9)
+                self._bar_labels.append(label)
             
             ax.grid(True, alpha=0.3, axis='y' if not horizontal else 'x')
         
         self.apply_theme()
         self.canvas.draw()
 
+    def _update_bars_in_place(self, values: list, horizontal: bool):
+        """Resize the existing bars and move their value labels (same categories as the last build)"""
+        ax = self.figure.axes[0]
+        colors = itertools.cycle(theme_manager.get_chart_colors()[:len(values)])  # ax.bar cycles short palettes too
+        offset = max(values) * 0.01
+
+        for bar, label, value, color in zip(self._bars, self._bar_labels, values, colors):
+            if horizontal:
+                bar.set_width(value)
+                label.set_position((value + offset, bar.get_y() + bar.get_height()/2))
+            else:
+                bar.set_height(value)
+                label.set_position((bar.get_x() + bar.get_width()/2, value + offset))
+            label.set_text(f'${value:.0f}')
+            bar.set_facecolor(color)
+
+        ax.relim()
+        ax.autoscale_view()
+
 
 class ProgressChartWidget(BaseChartWidget):
     """Progress chart for account goals"""
@@ -627,6 +785,7 @@ class ProgressChartWidget(BaseChartWidget):
     def __init__(self, title: str = "Account Goals", parent=None):
         super().__init__(title, parent)
     
+    @cached_chart
     def update_data(self, accounts_data: list):
         """Update progress chart with account goal data
         
@@ -695,6 +854,7 @@ class HeatmapWidget(BaseChartWidget):
     def __init__(self, title: str = "Spending Heatmap", parent=None):
         super().__init__(title, parent)
     
+    @cached_chart
     def update_data(self, data: dict, xlabel: str = "Day", ylabel: str = "Category"):
         """Update heatmap with spending data
         
@@ -766,6 +926,7 @@ class HistogramWidget(BaseChartWidget):
         # Override figure settings for better histogram display with minimal padding
         self.figure.subplots_adjust(left=0.05, right=0.95, top=0.90, bottom=0.20)
     
+    @cached_chart
     def update_data(self, purchase_amounts: list, num_buckets: int = 10):
         """Update histogram with purchase amounts
         
@@ -773,7 +934,16 @@ class HistogramWidget(BaseChartWidget):
             purchase_amounts: list of purchase amounts (floats)
             num_buckets: number of histogram buckets
         """
+        # Same bucket count as last time - reshape the existing bars instead of rebuilding
+        structure = ("histogram", num_buckets) if purchase_amounts else None
+        if structure is not None and structure == self._structure:
+            self._update_histogram_in_place(purchase_amounts, num_buckets)
+            self.apply_theme()
+            self.canvas.draw()
+            return
+
         self.figure.clear()
+        self._structure = structure
         
         if not purchase_amounts or len(purchase_amounts) == 0:
             # Show empty chart with just axes
@@ -798,39 +968,60 @@ class HistogramWidget(BaseChartWidget):
             counts, bin_edges, patches = ax.hist(purchase_amounts, bins=bins, 
                                                color=theme_manager.get_color('primary'), 
                                                alpha=0.7, edgecolor='none')
+            self._histogram_patches = patches
             
             # Clean formatting - minimal labels
             ax.grid(True, alpha=0.3, axis='both')
-            
-            # X-axis with ticks at bucket edges (start/end of each bucket)
-            if num_buckets == 20:  # Special handling for 20 buckets to show all edges
-                # Show ticks at every bucket edge
-                ax.set_xticks(bin_edges)
-                # Only label every few ticks to avoid crowding
-                tick_labels = []
-                for i, edge in enumerate(bin_edges):
-                    if i % 4 == 0 or i == len(bin_edges) - 1:  # Show every 4th tick and the last one
-                        tick_labels.append(f"${int(edge)}")
-                    else:
-                        tick_labels.append("")
-                ax.set_xticklabels(tick_labels, fontsize=8, rotation=0)
-            else:
-                # Original behavior for other bucket counts
-                x_ticks = [min_amount, max_amount/2, max_amount]
-                x_labels = [f"${int(x)}" for x in x_ticks]
-                ax.set_xticks(x_ticks)
-                ax.set_xticklabels(x_labels, fontsize=9)
-            
-            # No y-axis labels or ticks
-            ax.set_yticks([])
-            
-            # Set limits with small padding
-            ax.set_xlim(min_amount - max_amount*0.02, max_amount + max_amount*0.02)
-            ax.set_ylim(0, max(counts) * 1.05 if len(counts) > 0 else 1)
+            self._format_histogram_axes(ax, counts, bin_edges, num_buckets, max_amount, min_amount)
         
         self.apply_theme()
         self.canvas.draw()
 
+    def _update_histogram_in_place(self, purchase_amounts: list, num_buckets: int):
+        """Move the existing bucket bars to new amounts (same bucket count as the last build)"""
+        ax = self.figure.axes[0]
+        max_amount = max(purchase_amounts)
+        min_amount = 0
+        counts, bin_edges = np.histogram(purchase_amounts, bins=np.linspace(min_amount, max_amount, num_buckets + 1))
+
+        color = theme_manager.get_color('primary')
+        for patch, left, width, count in zip(self._histogram_patches, bin_edges[:-1], np.diff(bin_edges), counts):
+            patch.set_x(left)
+            patch.set_width(width)
+            patch.set_height(count)
+            patch.set_facecolor(color)
+            patch.set_alpha(0.7)
+
+        self._format_histogram_axes(ax, counts, bin_edges, num_buckets, max_amount, min_amount)
+
+    def _format_histogram_axes(self, ax, counts, bin_edges, num_buckets, max_amount, min_amount):
+        """Bucket-edge ticks and padded limits"""
+        # X-axis with ticks at bucket edges (start/end of each bucket)
+        if num_buckets == 20:  # Special handling for 20 buckets to show all edges
+            # Show ticks at every bucket edge
+            ax.set_xticks(bin_edges)
+            # Only label every few ticks to avoid crowding
+            tick_labels = []
+            for i, edge in enumerate(bin_edges):
+                if i % 4 == 0 or i == len(bin_edges) - 1:  # Show every 4th tick and the last one
+                    tick_labels.append(f"${int(edge)}")
+                else:
+                    tick_labels.append("")
+            ax.set_xticklabels(tick_labels, fontsize=8, rotation=0)
+        else:
+            # Original behavior for other bucket counts
+            x_ticks = [min_amount, max_amount/2, max_amount]
+            x_labels = [f"${int(x)}" for x in x_ticks]
+            ax.set_xticks(x_ticks)
+            ax.set_xticklabels(x_labels, fontsize=9)
+        
+        # No y-axis labels or ticks
+        ax.set_yticks([])
+        
+        # Set limits with small padding
+        ax.set_xlim(min_amount - max_amount*0.02, max_amount + max_amount*0.02)
+        ax.set_ylim(0, max(counts) * 1.05 if len(counts) > 0 else 1)
+
 
 class WeeklySpendingTrendWidget(BaseChartWidget):
     """Weekly spending trend widget showing daily spending patterns across weeks"""
@@ -840,6 +1031,7 @@ class WeeklySpendingTrendWidget(BaseChartWidget):
         # Override figure settings for clean trend display
         self.figure.subplots_adjust(left=0.05, right=0.95, top=0.95, bottom=0.10)
     
+    @cached_chart
     def update_data(self, weekly_spending_data: dict, average_line_color: str = None):
         """Update with weekly spending data
 
@@ -940,6 +1132,7 @@ class BoxPlotWidget(BaseChartWidget):
         # Override figure settings for horizontal box plot
         self.figure.subplots_adjust(left=0.05, right=0.95, top=0.95, bottom=0.10)
     
+    @cached_chart
     def update_data(self, category_spending_data: dict, highlight_category: str = None, color_map: dict = None):
         """Update with category spending distributions
 
@@ -1091,6 +1284,7 @@ class ReimbursementStatsWidget(BaseChartWidget):
         # Add small padding for axis labels
         self.figure.subplots_adjust(left=0.05, right=0.95, top=0.85, bottom=0.05)
 
+    @cached_chart
     def update_data(self, reimbursements: list):
         """Update with filtered reimbursement data
 
@@ -1207,6 +1401,7 @@ class ReimbursementProgressWidget(BaseChartWidget):
         # Add padding for labels below/above bars
         self.figure.subplots_adjust(left=0.15, right=0.85, top=0.95, bottom=0.05)
 
+    @cached_chart
     def update_data(self, reimbursements: list):
         """Update with filtered reimbursement data
 
@@ -1326,6 +1521,7 @@ class ReimbursementDotPlotWidget(BaseChartWidget):
         # Add small padding for axis labels
         self.figure.subplots_adjust(left=0.12, right=0.98, top=0.98, bottom=0.12)
 
+    @cached_chart
     def update_data(self, reimbursements: list):
         """Update with filtered reimbursement data
 
@@ -1431,6 +1627,7 @@ class ReimbursementHeatmapWidget(BaseChartWidget):
         # Remove all padding to maximize chart area within widget bounds
         self.figure.subplots_adjust(left=0.0, right=1.0, top=1.0, bottom=0.0)
 
+    @cached_chart
     def update_data(self, reimbursements: list):
         """Update with ALL reimbursement data (ignores current tag filter)
 